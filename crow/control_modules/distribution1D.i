@@ -24,3 +24,9 @@ namespace std {
    %template(vectori_cxx) vector<int>;
 };
 
+// array evaluation, wrapped after the vector templates so python sequences convert directly
+%inline %{
+std::vector<double> pdfVector(BasicDistribution & distribution, const std::vector<double> & x) { return distribution.pdfVector(x); }
+std::vector<double> cdfVector(BasicDistribution & distribution, const std::vector<double> & x) { return distribution.cdfVector(x); }
+std::vector<double> inverseCdfVector(BasicDistribution & distribution, const std::vector<double> & x) { return distribution.inverseCdfVector(x); }
+%}
@@ -3,8 +3,53 @@
 #include "ND_Interpolation_Functions.h"
 #define SWIG_FILE_WITH_INIT
 #define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#include <cstring>
+
+/* holds a view on the memory of a Python buffer (e.g. a numpy array), released when the wrapper returns */
+class BufferView {
+public:
+  Py_buffer view;
+  bool acquired;
+  BufferView() : acquired(false) {}
+  ~BufferView() { if (acquired) PyBuffer_Release(&view); }
+  /* gets a C-contiguous buffer of doubles with the requested number of dimensions, or sets a Python error */
+  bool acquire(PyObject * object, int ndim, bool writable) {
+    int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0);
+    if (PyObject_GetBuffer(object, &view, flags) != 0) return false;
+    acquired = true;
+    const char * format = view.format;
+    bool nativeDouble = format != NULL && (std::strcmp(format, "d") == 0 || std::strcmp(format, "@d") == 0 || std::strcmp(format, "=d") == 0);
+    if (view.ndim != ndim || view.itemsize != sizeof(double) || !nativeDouble) {
+      PyErr_Format(PyExc_ValueError, "expected a C-contiguous %d-dimensional buffer of float64", ndim);
+      return false;
+    }
+    return true;
+  }
+};
 %}
 %include "std_vector.i"
+
+/* interpolateAtPoints: the points (2-D) and the values (1-D) are read and written in place from/into buffers (e.g. numpy arrays) */
+%typemap(in) (const double * points, int number_of_points, int number_of_dimensions) (BufferView buffer) {
+  if (!buffer.acquire($input, 2, false)) SWIG_fail;
+  $1 = (double *) buffer.view.buf;
+  $2 = (int) buffer.view.shape[0];
+  $3 = (int) buffer.view.shape[1];
+}
+%typemap(in) (double * values, int number_of_values) (BufferView buffer) {
+  if (!buffer.acquire($input, 1, true)) SWIG_fail;
+  $1 = (double *) buffer.view.buf;
+  $2 = (int) buffer.view.shape[0];
+}
+%exception interpolateAtPoints {
+  try {
+    $action
+  } catch (const char * message) {
+    PyErr_SetString(PyExc_RuntimeError, message);
+    SWIG_fail;
+  }
+}
+
 %include "ND_Interpolation_Functions.h"
 
 namespace std {
@@ -42,6 +42,10 @@ public:
    virtual double  cdf(double x) = 0; ///< cdf function at coordinate x
    virtual double  inverseCdf(double x) = 0; ///< x
 
+   std::vector<double> pdfVector(const std::vector<double> & x); ///< pdf at each coordinate in x
+   std::vector<double> cdfVector(const std::vector<double> & x); ///< cdf at each coordinate in x
+   std::vector<double> inverseCdfVector(const std::vector<double> & x); ///< inverse cdf at each probability in x
+
    virtual double untrPdf(double x) = 0;
    virtual double untrCdf(double x) = 0;
    virtual double untrCdfComplement(double x)  = 0;
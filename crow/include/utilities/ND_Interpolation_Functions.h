@@ -44,6 +44,7 @@ public:
   virtual double interpolateAt(std::vector<double> point_coordinate);
   virtual double getGradientAt(std::vector<double> point_coordinate);
   virtual void   fit(std::vector< std::vector<double> > coordinates, std::vector<double> values);
+  void interpolateAtPoints(const double * points, int number_of_points, int number_of_dimensions, double * values, int number_of_values);
   //std::vector<double> NDinverseFunction(double f_min, double f_max);
   std::vector<double> ndInverseFunctionGrid(double f, double g);
 
@@ -76,7 +77,7 @@ protected:
   std::vector<double> _upper_bound;
   std::vector<double> _lower_bound;
 
-  double minkowskiDistance(std::vector<double> point1, std::vector<double> point2, double p);
+  double minkowskiDistance(const std::vector<double> & point1, const std::vector<double> & point2, double p);
   double vectorNorm(std::vector<double> point, double p);
 
   bool pivotCellCheck(std::vector<std::vector<double> >& cell, double f);
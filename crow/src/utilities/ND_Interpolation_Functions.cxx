@@ -47,6 +47,20 @@ void NDInterpolation::fit(std::vector< std::vector<double> > /* coordinates */,
   throw ("Error in fit: NOT IMPLEMENTED!!!!");
 }
 
+void NDInterpolation::interpolateAtPoints(const double * points, int number_of_points, int number_of_dimensions, double * values, int number_of_values){
+  /**
+   * Interpolates at many points at once: points is a row-major (number_of_points x number_of_dimensions) array,
+   * the interpolated values are written in values (number_of_values = number_of_points)
+   */
+  if (number_of_values != number_of_points)
+    throw ("Error in interpolateAtPoints: the number of values differs from the number of points");
+  std::vector<double> point_coordinate (number_of_dimensions);
+  for (int n=0; n<number_of_points; n++){
+    point_coordinate.assign(points + n*number_of_dimensions, points + (n+1)*number_of_dimensions);
+    values[n] = interpolateAt(point_coordinate);
+  }
+}
+
 void NDInterpolation::updateRNGParameters(double tolerance, double initial_divisions){
         _tolerance = tolerance;
         _initial_divisions = (int)initial_divisions;
@@ -109,7 +123,7 @@ bool NDSpline::checkLB(double lower_bound){
  return checkLowerBound(lower_bound, _values);
 }
 
-double NDInterpolation::minkowskiDistance (std::vector<double> point1, std::vector<double> point2, double p){
+double NDInterpolation::minkowskiDistance (const std::vector<double> & point1, const std::vector<double> & point2, double p){
  double distance;
 
  if (point1.size() == point1.size()){
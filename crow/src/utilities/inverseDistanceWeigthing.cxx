@@ -80,7 +80,8 @@ InverseDistanceWeighting::InverseDistanceWeighting(double p){
 double InverseDistanceWeighting::interpolateAt(std::vector<double> point){
  double value = 0;
  double weightsCumulativeSum = 0;
- std::vector<double> weights (_number_of_points);
+ double distance;
+ double weight;
 
  if (not _completed_init)
  {
@@ -88,14 +89,15 @@ double InverseDistanceWeighting::interpolateAt(std::vector<double> point){
  }
 
  for (int i=0; i<_number_of_points; i++){
-  if (minkowskiDistance(point, _point_coordinates.at(i),_p) == 0.0){
-   value = _values.at(i);
+  distance = minkowskiDistance(point, _point_coordinates[i],_p);
+  if (distance == 0.0){
+   value = _values[i];
    weightsCumulativeSum = 1.0;
    break;
   } else {
-   weights.at(i)= std::pow(1.0/minkowskiDistance(point, _point_coordinates.at(i),_p),_dimensions+1);
-   weightsCumulativeSum += weights.at(i);
-   value += weights.at(i) * _values.at(i);
+   weight = std::pow(1.0/distance,_dimensions+1);
+   weightsCumulativeSum += weight;
+   value += weight * _values[i];
   }
  }
 
@@ -0,0 +1,69 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the reading of a large code output (a time-history CSV with full precision values).
+  Times numpy.loadtxt (how the Code model used to read the outputs), utils.csvUtils.loadNumericCsv
+  (how it reads them now) and pandas.read_csv (how the DataObjects read their CSVs), and checks that
+  the values read by loadNumericCsv are the same as the ones read by numpy.loadtxt.
+
+  usage: python csvIngest.py [sizeMB] [numColumns]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+def makeHistory(fileName,sizeMB,numColumns):
+  """
+    Writes a time history of about sizeMB megabytes.
+    @ In, fileName, string, the file to write
+    @ In, sizeMB, float, the size of the file
+    @ In, numColumns, int, the number of columns (the first is the time)
+    @ Out, None
+  """
+  numRows = int(sizeMB*1024*1024/(20*numColumns))
+  np.random.seed(42)
+  with open(fileName,'w') as history:
+    history.write(','.join(['time']+list('var'+str(i) for i in range(1,numColumns)))+'\n')
+    for start in range(0,numRows,10000):
+      rows = np.random.randn(min(10000,numRows-start),numColumns)
+      rows[:,0] = 0.01*np.arange(start,start+len(rows))
+      history.write(''.join(','.join(repr(float(x)) for x in row)+'\n' for row in rows))
+
+if __name__ == '__main__':
+  from utils import csvUtils
+  sizeMB = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+  numColumns = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+  fileName = os.path.join(tempfile.mkdtemp(),'history.csv')
+  makeHistory(fileName,sizeMB,numColumns)
+  try:
+    print('{:.1f} MB, {} columns'.format(os.path.getsize(fileName)/1024./1024.,numColumns))
+    start = time.time()
+    reference = np.loadtxt(fileName,dtype=float,delimiter=',',ndmin=2,skiprows=1)
+    print('numpy.loadtxt           : {:8.3f} s'.format(time.time()-start))
+    start = time.time()
+    _,data = csvUtils.loadNumericCsv(fileName)
+    print('csvUtils.loadNumericCsv : {:8.3f} s, same values as numpy.loadtxt: {}'.format(time.time()-start,np.array_equal(data,reference)))
+    start = time.time()
+    frame = pd.read_csv(fileName)
+    print('pandas.read_csv         : {:8.3f} s, same values as numpy.loadtxt: {}'.format(time.time()-start,np.array_equal(frame.values,reference)))
+  finally:
+    os.remove(fileName)
+    os.rmdir(os.path.dirname(fileName))
@@ -0,0 +1,132 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks realization collection in the DataObjects.
+  Compares the object-row cNDarray collector (as used by DataSet.addRealization through 2018)
+  with the columnar cColumnarArray collector, for PointSet-like and HistorySet-like realizations,
+  and times the full PointSet/HistorySet addRealization + asDataset path.
+
+  usage: python dataObjectCollection.py [numRealizations] [historyLength]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import copy
+import time
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import cached_ndarray
+
+def makeRealizations(num,histLength):
+  """
+    Creates PointSet-like and HistorySet-like realizations.
+    @ In, num, int, number of realizations
+    @ In, histLength, int, length of each history
+    @ Out, points, list(dict), scalar realizations
+    @ Out, histories, list(dict), history realizations
+  """
+  time = np.linspace(0,1,histLength)
+  points = []
+  histories = []
+  for i in range(num):
+    a,b = np.random.rand(2)
+    points.append({'a':np.array([a]),'b':np.array([b]),'x':np.array([a+b]),'z':np.array([a*b]),'prefix':np.array([str(i)])})
+    histories.append({'a':np.array([a]),'b':np.array([b]),'x':a*time,'y':b*time,'Timelike':time})
+  return points,histories
+
+def collectObjectRows(rlzs,order):
+  """
+    Collects realizations the way DataSet.addRealization did with the object cNDarray collector.
+    @ In, rlzs, list(dict), realizations
+    @ In, order, list(str), variables in collector order
+    @ Out, collector, cached_ndarray.cNDarray, filled collector
+  """
+  collector = cached_ndarray.cNDarray(width=len(order),length=100,dtype=object)
+  for rlz in rlzs:
+    rlz = copy.deepcopy(rlz)
+    row = np.array(list(rlz[var] if len(rlz[var]) > 1 else rlz[var][0] for var in order)+[0.0],dtype=object)[:-1]
+    collector.append(row)
+  return collector
+
+def collectColumns(rlzs,order):
+  """
+    Collects realizations into the columnar collector.
+    @ In, rlzs, list(dict), realizations
+    @ In, order, list(str), variables in collector order
+    @ Out, collector, cached_ndarray.cColumnarArray, filled collector
+  """
+  collector = cached_ndarray.cColumnarArray(width=len(order),length=100)
+  for rlz in rlzs:
+    collector.append(list(rlz[var] if len(rlz[var]) > 1 else rlz[var][0] for var in order))
+  return collector
+
+def timeIt(func,*args):
+  """
+    Times a single call.
+    @ In, func, callable, what to time
+    @ In, args, list, arguments
+    @ Out, seconds, float, wall time
+    @ Out, result, object, return value
+  """
+  start = time.time()
+  result = func(*args)
+  return time.time()-start,result
+
+def dataObjectRun(typ,rlzs):
+  """
+    Adds realizations to a DataObject and collapses them.
+    @ In, typ, str, PointSet or HistorySet
+    @ In, rlzs, list(dict), realizations
+    @ Out, seconds, tuple(float,float), time to add and time to collapse
+  """
+  import MessageHandler
+  import DataObjects
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+  xml = ET.Element(typ,{'name':'bench'})
+  inp = ET.SubElement(xml,'Input')
+  inp.text = 'a,b'
+  out = ET.SubElement(xml,'Output')
+  out.text = 'x,z' if typ == 'PointSet' else 'x,y'
+  if typ == 'HistorySet':
+    options = ET.SubElement(xml,'options')
+    ET.SubElement(options,'pivotParameter').text = 'Timelike'
+  data = getattr(DataObjects,typ)()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  add,_ = timeIt(lambda: [data.addRealization(rlz) for rlz in rlzs])
+  collapse,_ = timeIt(data.asDataset)
+  return add,collapse
+
+if __name__ == '__main__':
+  num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  histLength = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+  points,histories = makeRealizations(num,histLength)
+  print('Realizations: {}, history length: {}'.format(num,histLength))
+  for name,rlzs,order in [('PointSet',points,['a','b','x','z','prefix']),('HistorySet',histories,['a','b','x','y','Timelike'])]:
+    old,_ = timeIt(collectObjectRows,rlzs,order)
+    new,_ = timeIt(collectColumns,rlzs,order)
+    print('{:10s} collector only: object rows {:8.3f} s, columnar {:8.3f} s, ratio {:5.2f}'.format(name,old,new,old/new))
+  try:
+    from utils.utils import find_crow
+    find_crow(frameworkDir)
+  except IOError:
+    print('Crow not found; skipping full DataObject timing.')
+    sys.exit(0)
+  for name,rlzs in [('PointSet',[dict((k,v) for k,v in p.items() if k != 'prefix') for p in points]),('HistorySet',histories)]:
+    add,collapse = dataObjectRun(name,rlzs)
+    print('{:10s} DataObject: addRealization {:8.3f} s, asDataset {:8.3f} s'.format(name,add,collapse))
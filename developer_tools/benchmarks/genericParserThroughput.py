@@ -0,0 +1,102 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the input generation of the GenericCode interface for a large template.
+  For each sample it does what the Code model and the GenericParser do: copy the template
+  and an auxiliary file into a new run directory, parse the template copy, fill in the
+  sampled values and write the new input. The auxiliary file is copied and then hard-linked
+  (the Code model "linkAuxiliaryFiles" option), so both times are reported.
+
+  usage: python genericParserThroughput.py [numSamples] [templateMB] [numVariables]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+sys.path.append(os.path.join(frameworkDir,'CodeInterfaces','Generic'))
+
+def makeTemplate(directory,templateMB,numVariables):
+  """
+    Writes a template with numVariables wildcards spread over about templateMB megabytes,
+    and an auxiliary file of the same size.
+    @ In, directory, string, where to write the files
+    @ In, templateMB, float, the size of the template
+    @ In, numVariables, int, the number of wildcards
+    @ Out, template, string, the template file name
+    @ Out, auxiliary, string, the auxiliary file name
+  """
+  line = 'filler line of a large input deck, with some numbers 1.0 2.0 3.0 4.0\n'
+  numLines = int(templateMB*1024*1024/len(line))
+  every = max(numLines//numVariables,1)
+  with open(os.path.join(directory,'template.i'),'w') as template:
+    for i in range(numLines):
+      if i % every == 0 and i//every < numVariables:
+        template.write('  x{0} = $RAVEN-x{0}$\n'.format(i//every))
+      else:
+        template.write(line)
+  with open(os.path.join(directory,'table.dat'),'w') as auxiliary:
+    auxiliary.write(line*numLines)
+  return 'template.i','table.dat'
+
+def run(numSamples,templateMB,numVariables,link):
+  """
+    Generates numSamples inputs from a template.
+    @ In, numSamples, int, number of samples
+    @ In, templateMB, float, size of the template (and of the auxiliary file)
+    @ In, numVariables, int, number of wildcards in the template
+    @ In, link, bool, True to hard-link the auxiliary file rather than copy it
+    @ Out, seconds, float, wall time to generate all the inputs
+  """
+  import Files
+  import GenericParser
+  workingDir = tempfile.mkdtemp()
+  try:
+    templateName,auxiliaryName = makeTemplate(workingDir,templateMB,numVariables)
+    origFiles = []
+    for name in templateName,auxiliaryName:
+      origFile = Files.File()
+      origFile.setAbsFile(os.path.join(workingDir,name))
+      origFiles.append(origFile)
+    start = time.time()
+    for sample in range(numSamples):
+      subDirectory = os.path.join(workingDir,str(sample))
+      os.mkdir(subDirectory)
+      shutil.copy(origFiles[0].getAbsFile(),subDirectory)
+      if link:
+        os.link(origFiles[1].getAbsFile(),os.path.join(subDirectory,auxiliaryName))
+      else:
+        shutil.copy(origFiles[1].getAbsFile(),subDirectory)
+      newFile = Files.File()
+      newFile.setAbsFile(os.path.join(subDirectory,templateName))
+      parser = GenericParser.GenericParser([newFile])
+      parser.modifyInternalDictionary(SampledVars=dict(('x'+str(i),sample+i/10.) for i in range(numVariables)))
+      parser.writeNewInput([newFile],[origFiles[0]])
+    seconds = time.time()-start
+  finally:
+    shutil.rmtree(workingDir)
+  return seconds
+
+if __name__ == '__main__':
+  numSamples = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+  templateMB = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+  numVariables = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+  for link in False,True:
+    seconds = run(numSamples,templateMB,numVariables,link)
+    print('{} samples, {} MB template with {} variables, auxiliary file {}: {:8.3f} s, {:8.1f} ms/sample'.format(numSamples,
+          templateMB,numVariables,'linked' if link else 'copied',seconds,1000*seconds/numSamples))
@@ -0,0 +1,124 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the start-up cost of RAVEN, i.e. the time spent importing modules before the input is read.
+  Every RAVEN module listed below is imported in a fresh interpreter (so that nothing is already cached)
+  and the script reports its cumulative import time and the number of modules it loads.
+  For the entry point (Simulation) the time is also split by top-level package (self time of the
+  modules of the package, excluding the time spent importing other packages), which tells where
+  the start-up time goes (RAVEN itself, numpy, scipy, sklearn, ...). The split needs Python 3.
+
+  usage: python importTime.py [numPackages] [module1 module2 ...]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import json
+import time
+import subprocess
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+
+#modules timed by default: the entry point, then the entity modules it is made of
+defaultModules = ['Simulation', 'Steps', 'DataObjects', 'Samplers', 'Optimizers', 'Models', 'Distributions',
+                  'Databases', 'OutStreams', 'PostProcessors', 'Metrics', 'SupervisedLearning', 'CodeInterfaces']
+
+def setupPaths():
+  """
+    Sets the paths as the RAVEN driver does.
+    @ In, None
+    @ Out, None
+  """
+  sys.path.insert(0,frameworkDir)
+  from utils.utils import find_crow
+  find_crow(frameworkDir)
+  from utils import utils
+  if sys.version_info.major == 2:
+    utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+  else:
+    utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+  utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+  utils.add_path(os.path.join(frameworkDir,'contrib'))
+
+def timeImport(moduleName):
+  """
+    Imports moduleName (in the current interpreter) timing it.
+    @ In, moduleName, str, the module to import
+    @ Out, result, dict, {'seconds':cumulative time, 'modules':modules loaded, 'packages':{package:self time}}
+  """
+  setupPaths()
+  selfTime = {}
+  initialModules = len(sys.modules)
+  if sys.version_info.major > 2:
+    # time every module load, removing from the parent the time spent loading its children
+    import importlib._bootstrap as bootstrap
+    originalLoad = bootstrap._load_unlocked
+    stack = []
+    def timedLoad(spec):
+      """
+        Loads a module, recording its self time.
+        @ In, spec, ModuleSpec, the module specification
+        @ Out, module, module, the loaded module
+      """
+      start = time.time()
+      stack.append(0.0)
+      try:
+        return originalLoad(spec)
+      finally:
+        elapsed = time.time() - start
+        children = stack.pop()
+        package = spec.name.split('.')[0]
+        selfTime[package] = selfTime.get(package,0.0) + elapsed - children
+        if stack:
+          stack[-1] += elapsed
+    bootstrap._load_unlocked = timedLoad
+  start = time.time()
+  __import__(moduleName)
+  seconds = time.time() - start
+  return {'seconds':seconds, 'modules':len(sys.modules)-initialModules, 'packages':selfTime}
+
+def run(moduleName):
+  """
+    Times the import of moduleName in a fresh interpreter.
+    @ In, moduleName, str, the module to import
+    @ Out, result, dict, see timeImport (None if the import failed)
+  """
+  process = subprocess.Popen([sys.executable,os.path.abspath(__file__),'--child',moduleName],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  out, err = process.communicate()
+  if process.returncode != 0:
+    print(err.decode(errors='replace') if sys.version_info.major > 2 else err)
+    return None
+  return json.loads(out.decode().strip().splitlines()[-1])
+
+if __name__ == '__main__':
+  if len(sys.argv) > 2 and sys.argv[1] == '--child':
+    print(json.dumps(timeImport(sys.argv[2])))
+    sys.exit(0)
+  numPackages = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+  modules = sys.argv[2:] if len(sys.argv) > 2 else defaultModules
+  results = {}
+  print('{:<20s} {:>9s} {:>9s}'.format('module','seconds','modules'))
+  for moduleName in modules:
+    results[moduleName] = run(moduleName)
+    if results[moduleName] is None:
+      print('{:<20s} {:>9s}'.format(moduleName,'failed'))
+    else:
+      print('{:<20s} {:9.3f} {:9d}'.format(moduleName,results[moduleName]['seconds'],results[moduleName]['modules']))
+  packages = results[modules[0]]['packages'] if results[modules[0]] is not None else {}
+  if packages:
+    print()
+    print('import time of {} by top-level package (self time):'.format(modules[0]))
+    for package, seconds in sorted(packages.items(),key=lambda x:-x[1])[:numPackages]:
+      print('  {:<30s} {:9.3f}'.format(package,seconds))
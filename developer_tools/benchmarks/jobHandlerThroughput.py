@@ -0,0 +1,91 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the JobHandler throughput (jobs per second) for trivial jobs.
+  Runs the JobHandler polling loop in its own thread, as Simulation does, and drives it
+  the way MultiRun does: collect the finished jobs, refill the queue, then wait.
+  If the JobHandler supports job events the driver waits on them, otherwise it sleeps
+  "sleepTime" between inquiries (the old behavior), so the same script times both.
+
+  usage: python jobHandlerThroughput.py [numJobs] [batchSize] [sleepTime]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import time
+import threading
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import utils
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+
+def trivialJob(x):
+  """
+    A job that does (almost) nothing.
+    @ In, x, int, a number
+    @ Out, x, int, the same number
+  """
+  return x
+
+def run(numJobs,batchSize,sleepTime):
+  """
+    Runs numJobs trivial jobs through a JobHandler.
+    @ In, numJobs, int, number of jobs
+    @ In, batchSize, int, number of jobs running at the same time
+    @ In, sleepTime, float, waiting time of the driver (longest wait if job events are available)
+    @ Out, seconds, float, wall time from the first submission to the last collection
+    @ Out, events, bool, True if job events were used
+  """
+  import MessageHandler
+  from JobHandler import JobHandler
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+  jobHandler = JobHandler()
+  jobHandler.initialize({'maxQueueSize':None, 'batchSize':batchSize, 'internalParallel':False}, mh)
+  loop = threading.Thread(target=jobHandler.startLoop)
+  loop.daemon = True
+  loop.start()
+  events = hasattr(jobHandler,'waitForJobEvent')
+  submitted = collected = 0
+  start = time.time()
+  jobEvent = jobHandler.lastJobEvent() if events else None
+  while collected < numJobs:
+    collected += len(jobHandler.getFinished())
+    while submitted < numJobs and jobHandler.availability() > 0:
+      jobHandler.addJob((submitted,), trivialJob, str(submitted), forceUseThreads=True)
+      submitted += 1
+    if collected < numJobs:
+      if events:
+        jobEvent = jobHandler.waitForJobEvent(jobEvent, sleepTime)
+      else:
+        time.sleep(sleepTime)
+  seconds = time.time()-start
+  jobHandler.shutdown()
+  return seconds,events
+
+if __name__ == '__main__':
+  numJobs = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+  batchSize = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+  sleepTime = float(sys.argv[3]) if len(sys.argv) > 3 else 0.005
+  seconds,events = run(numJobs,batchSize,sleepTime)
+  print('{} trivial jobs, batchSize {}, {}: {:8.3f} s, {:10.1f} jobs/s'.format(numJobs,batchSize,
+        'job events' if events else 'polling every {} s'.format(sleepTime),seconds,numJobs/seconds))
@@ -0,0 +1,138 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the extraction of the limit surface on grids of increasing size and dimension.
+  The limit surface is a hypersphere; for each grid the node by node search that the LimitSurface
+  PostProcessor and the LimitSurfaceSearch sampler used to perform (sign change detection, band
+  thickening, persistence lookup) is timed against the whole-array version (mathUtils.gridSignChange
+  and mathUtils.gridBand), and the extracted surfaces and bands are checked to be the same.
+
+  usage: python limitSurfaceExtraction.py [thickness] [maxLoopNodes]
+    the node by node search is skipped on the grids with more than maxLoopNodes nodes (default 2e6)
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import time
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+def loopSearch(testMatrix, toBeTested, sign):
+  """
+    The node by node limit surface search (as formerly done by LimitSurface.__localLimitStateSearch__)
+    @ In, testMatrix, np.ndarray, the classification of the grid nodes
+    @ In, toBeTested, np.ndarray, the candidate nodes (one row per node)
+    @ In, sign, int, the side of the surface (-1 or +1)
+    @ Out, listSurfPoint, list, the nodes on the limit surface
+  """
+  listSurfPoint = []
+  gridShape = testMatrix.shape
+  nVar = testMatrix.ndim
+  myIdList = np.zeros(nVar,dtype=int)
+  for coordinate in np.rollaxis(toBeTested, 0):
+    myIdList[:] = coordinate
+    if testMatrix[tuple(coordinate)] * sign > 0:
+      for iVar in range(nVar):
+        if coordinate[iVar] + 1 < gridShape[iVar]:
+          myIdList[iVar] += 1
+          if testMatrix[tuple(myIdList)] * sign <= 0:
+            listSurfPoint.append(coordinate.copy())
+            break
+          myIdList[iVar] -= 1
+          if coordinate[iVar] > 0:
+            myIdList[iVar] -= 1
+            if testMatrix[tuple(myIdList)] * sign <= 0:
+              listSurfPoint.append(coordinate.copy())
+              break
+            myIdList[iVar] += 1
+  return listSurfPoint
+
+def loopBand(points, shape, thickness):
+  """
+    The node by node band thickening (as formerly done by LimitSurfaceSearch.localStillReady)
+    @ In, points, list, the nodes on the limit surface
+    @ In, shape, tuple, the grid shape
+    @ In, thickness, int, the band thickness
+    @ Out, band, set, the nodes in the band
+  """
+  setSurfPoint = set(tuple(point) for point in points)
+  band = set()
+  newIndices = set(setSurfPoint)
+  for _ in range(1,thickness):
+    prevPoints = set(newIndices)
+    newIndices = set()
+    for iCoords in prevPoints:
+      for d in range(len(iCoords)):
+        offset = np.zeros(len(iCoords),dtype=int)
+        offset[d] = 1
+        if iCoords[d] - offset[d] > 0:
+          newIndices.add(tuple(iCoords - offset))
+        if iCoords[d] + offset[d] < shape[d]-1:
+          newIndices.add(tuple(iCoords + offset))
+    band.update(newIndices)
+  return band.difference(setSurfPoint)
+
+def makeGrid(dimension, nodesPerAxis):
+  """
+    Classifies the nodes of a unit hypercube grid with respect to a hypersphere
+    @ In, dimension, int, the grid dimension
+    @ In, nodesPerAxis, int, the number of nodes along each axis
+    @ Out, testMatrix, np.ndarray, +1 outside, -1 inside the sphere
+    @ Out, toBeTested, np.ndarray, the candidate nodes (as preselected by the LimitSurface gradient)
+  """
+  axis = np.linspace(0.,1.,nodesPerAxis)
+  radius2 = np.zeros((nodesPerAxis,)*dimension)
+  for d in range(dimension):
+    shape = [1]*dimension
+    shape[d] = nodesPerAxis
+    radius2 = radius2 + ((axis-0.45)**2).reshape(shape)
+  testMatrix = np.where(radius2 > 0.3**2,1.,-1.)
+  toBeTested = np.argwhere(np.sum(np.abs(np.gradient(testMatrix)),axis=0))
+  return testMatrix, toBeTested
+
+if __name__ == '__main__':
+  from utils import mathUtils
+  thickness = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+  maxLoopNodes = float(sys.argv[2]) if len(sys.argv) > 2 else 2e6
+  persistence = None
+  for dimension, nodesPerAxis in [(2,100),(2,1000),(3,50),(3,100),(4,20),(4,32),(6,7),(6,10)]:
+    testMatrix, toBeTested = makeGrid(dimension,nodesPerAxis)
+    persistence = np.random.randint(-3,4,size=testMatrix.shape).astype(float)
+    line = '{}D grid, {:8d} nodes, {:7d} candidates:'.format(dimension,testMatrix.size,len(toBeTested))
+    start = time.time()
+    surface = []
+    for sign in (-1,1):
+      onSurface = mathUtils.gridSignChange(testMatrix*sign)
+      surface += list(toBeTested[onSurface[tuple(toBeTested.T)]])
+    mask = np.zeros(testMatrix.shape,dtype=bool)
+    mask[tuple(np.asarray(surface).T)] = True
+    band = mathUtils.gridBand(mask,thickness)
+    invPersistence = np.abs(persistence[tuple(np.asarray(surface).T)])
+    arrayTime = time.time()-start
+    line += ' whole-array {:8.3f} s'.format(arrayTime)
+    if testMatrix.size <= maxLoopNodes:
+      start = time.time()
+      loopSurface = loopSearch(testMatrix,toBeTested,-1) + loopSearch(testMatrix,toBeTested,1)
+      loopBandNodes = loopBand(loopSurface,testMatrix.shape,thickness)
+      loopPersistence = np.ones(len(loopSurface))
+      for pointID, coordinate in enumerate(loopSurface):
+        loopPersistence[pointID] = abs(persistence[tuple(coordinate)])
+      loopTime = time.time()-start
+      same = np.array_equal(np.asarray(surface),np.asarray(loopSurface)) and \
+             set(tuple(node) for node in np.argwhere(band)) == loopBandNodes and \
+             np.array_equal(invPersistence,loopPersistence)
+      line += ', node by node {:8.3f} s (x{:.0f}), same surface and band: {}'.format(loopTime,loopTime/arrayTime,same)
+    print(line)
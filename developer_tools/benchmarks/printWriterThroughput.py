@@ -0,0 +1,143 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmarks the CSV writing of the Print OutStreams during a step.
+  Realizations are added to a PointSet and to a HistorySet and printed every few realizations, the way
+  OutStreamPrint.addOutput does, through the pandas writer (DataSet._toCSV) and through the incremental
+  writer (<incremental>, DataSet._toCSVIncremental) with split and long history formats. Only the time
+  spent in the writers is reported (the collapse of the collector, asDataset, is done before timing), and
+  the files of the incremental split writer are checked to be the same as the pandas ones.
+
+  usage: python printWriterThroughput.py [numRealizations] [printEvery] [historyLength]
+"""
+from __future__ import division, print_function, absolute_import
+import os
+import sys
+import time
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+def makeRealizations(num,histLength):
+  """
+    Creates PointSet-like and HistorySet-like realizations.
+    @ In, num, int, number of realizations
+    @ In, histLength, int, length of each history
+    @ Out, points, list(dict), scalar realizations
+    @ Out, histories, list(dict), history realizations
+  """
+  np.random.seed(42)
+  time = np.linspace(0,1,histLength)
+  points = []
+  histories = []
+  for _ in range(num):
+    a,b = np.random.rand(2)
+    points.append({'a':np.array([a]),'b':np.array([b]),'x':np.array([a+b]),'z':np.array([a*b])})
+    histories.append({'a':np.array([a]),'b':np.array([b]),'x':a*time,'y':b*time,'Timelike':time})
+  return points,histories
+
+def makeDataObject(typ,mh):
+  """
+    Creates an empty DataObject.
+    @ In, typ, str, PointSet or HistorySet
+    @ In, mh, MessageHandler.MessageHandler, message handler
+    @ Out, data, DataObjects.DataSet, the data object
+  """
+  import DataObjects
+  xml = ET.Element(typ,{'name':'bench'})
+  ET.SubElement(xml,'Input').text = 'a,b'
+  ET.SubElement(xml,'Output').text = 'x,z' if typ == 'PointSet' else 'x,y'
+  if typ == 'HistorySet':
+    options = ET.SubElement(xml,'options')
+    ET.SubElement(options,'pivotParameter').text = 'Timelike'
+  data = getattr(DataObjects,typ)()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  return data
+
+def printRun(typ,rlzs,printEvery,fileName,mh,historyFormat=None):
+  """
+    Adds the realizations and prints them every printEvery realizations.
+    @ In, typ, str, PointSet or HistorySet
+    @ In, rlzs, list(dict), realizations
+    @ In, printEvery, int, number of realizations between two prints
+    @ In, fileName, str, name of the CSV to write (without extension)
+    @ In, mh, MessageHandler.MessageHandler, message handler
+    @ In, historyFormat, str, optional, if None the pandas writer is used, otherwise the incremental one
+      with this history format ('split' or 'long')
+    @ Out, seconds, float, time spent writing
+  """
+  data = makeDataObject(typ,mh)
+  kwargs = {}
+  if historyFormat is not None:
+    kwargs = {'openFiles':{},'historyFormat':historyFormat}
+  seconds = 0.0
+  index = 0
+  for first in range(0,len(rlzs),printEvery):
+    for rlz in rlzs[first:first+printEvery]:
+      data.addRealization(rlz)
+    data.asDataset()
+    start = time.time()
+    index = data.write(fileName,style='CSV',firstIndex=index,**kwargs)
+    seconds += time.time()-start
+  for openFile in kwargs.get('openFiles',{}).values():
+    openFile.close()
+  return seconds
+
+def sameFiles(typ,num):
+  """
+    Checks that the incremental split writer gave the same files as the pandas writer.
+    @ In, typ, str, PointSet or HistorySet
+    @ In, num, int, number of realizations
+    @ Out, same, bool, True if the files are the same
+  """
+  names = [('pandas'+typ+'.csv','split'+typ+'.csv')]
+  if typ == 'HistorySet':
+    names += list(('pandas{}_{}.csv'.format(typ,i),'split{}_{}.csv'.format(typ,i)) for i in range(num))
+  for pandasName,splitName in names:
+    with open(pandasName,'r') as pandasFile, open(splitName,'r') as splitFile:
+      if pandasFile.read() != splitFile.read().replace('split'+typ,'pandas'+typ):
+        return False
+  return True
+
+if __name__ == '__main__':
+  num = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+  printEvery = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+  histLength = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+  from utils.utils import find_crow
+  find_crow(frameworkDir)
+  import MessageHandler
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+  points,histories = makeRealizations(num,histLength)
+  print('Realizations: {}, printed every {}, history length: {}'.format(num,printEvery,histLength))
+  cwd = os.getcwd()
+  workDir = tempfile.mkdtemp()
+  os.chdir(workDir)
+  try:
+    for typ,rlzs in [('PointSet',points),('HistorySet',histories)]:
+      pandas = printRun(typ,rlzs,printEvery,'pandas'+typ,mh)
+      split = printRun(typ,rlzs,printEvery,'split'+typ,mh,historyFormat='split')
+      print('{:10s} pandas writer          : {:8.3f} s'.format(typ,pandas))
+      print('{:10s} incremental writer     : {:8.3f} s, ratio {:5.2f}, same files as pandas: {}'.format(typ,split,pandas/split,sameFiles(typ,num)))
+      if typ == 'HistorySet':
+        longFormat = printRun(typ,rlzs,printEvery,'long'+typ,mh,historyFormat='long')
+        print('{:10s} incremental long format: {:8.3f} s, ratio {:5.2f}'.format(typ,longFormat,pandas/longFormat))
+  finally:
+    os.chdir(cwd)
+    shutil.rmtree(workDir)
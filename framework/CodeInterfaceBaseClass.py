@@ -166,6 +166,17 @@ class CodeInterfaceBase(utils.metaclass_insert(abc.ABCMeta,object)):
     """
     self.addInputExtension(['i','inp','in'])
 
+  def isInputFileUnmodified(self,inputFile):
+    """
+      This method tells if an input file is left unmodified by createNewInput, so that it can be
+      hard-linked into the run directories instead of copied (see the Code option <linkAuxiliaryFiles>).
+      Since the code interfaces can select the files they rewrite by type, name or content, no file
+      is considered unmodified unless the interface overloads this method.
+      @ In, inputFile, Files.File, the input file
+      @ Out, unmodified, bool, True if the file is never written by this interface
+    """
+    return False
+
   def initialize(self,runInfo, oriInputFiles):
     """
       Method to initialize the run of a new step
@@ -18,7 +18,8 @@ Created on April 14, 2014
 
 comment: The CodeInterface Module is an Handler.
          It inquires all the modules contained in the folder './CodeInterfaces'
-         and load them, constructing a '__interFaceDict' on the fly
+         and parses them, constructing a '__interFaceDict' on the fly;
+         a module is only loaded when one of its interfaces is requested
 """
 #for future compatibility with Python 3--------------------------------------------------------------
 from __future__ import division, print_function, unicode_literals, absolute_import
@@ -28,8 +29,8 @@ warnings.simplefilter('default',DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import os
+import ast
 from glob import glob
-import inspect
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -41,21 +42,52 @@ startDir = os.path.join(os.path.dirname(__file__),'CodeInterfaces')
 for dirr,_,_ in os.walk(startDir):
   __moduleInterfaceList.extend(glob(os.path.join(dirr,"*.py")))
   utils.add_path(dirr)
-__moduleImportedList = []
+__moduleImportedDict = {}
+
+def __findInterfaceClasses(moduleList):
+  """
+    Finds the code interfaces defined in the modules, without importing them:
+    the classes with a 'createNewInput' method, directly or inherited from another class in these modules
+    or from CodeInterfaceBase.
+    @ In, moduleList, list(str), paths of the modules
+    @ Out, interfaces, dict, {class name:module path} of the code interfaces
+  """
+  classes = {} # {class name: (module path, base class names, defines createNewInput)}
+  for modulePath in moduleList:
+    with open(modulePath) as moduleFile:
+      source = moduleFile.read()
+    if 'class' not in source:
+      continue
+    for node in ast.parse(source,modulePath).body:
+      if isinstance(node,ast.ClassDef):
+        bases = [base.id if isinstance(base,ast.Name) else getattr(base,'attr',None) for base in node.bases]
+        defined = any(isinstance(item,ast.FunctionDef) and item.name == 'createNewInput' for item in node.body)
+        classes[node.name] = (modulePath,bases,defined)
+  def isInterface(name,visited):
+    """
+      Checks if the class is a code interface.
+      @ In, name, str, class name
+      @ In, visited, set, class names already checked (guard against cycles)
+      @ Out, isInterface, bool, True if code interface
+    """
+    if name == 'CodeInterfaceBase':
+      return True
+    if name not in classes or name in visited:
+      return False
+    visited.add(name)
+    _,bases,defined = classes[name]
+    return defined or any(isInterface(base,visited) for base in bases)
+  return dict((name,classes[name][0]) for name in classes if isInterface(name,set()))
 
 """
  Interface Dictionary (factory) (private)
 """
 __base                          = 'Code'
-__interFaceDict                 = {}
-for moduleIndex in range(len(__moduleInterfaceList)):
-  if 'class' in open(__moduleInterfaceList[moduleIndex]).read():
-    __moduleImportedList.append(utils.importFromPath(__moduleInterfaceList[moduleIndex],False))
-    for key,modClass in inspect.getmembers(__moduleImportedList[-1], inspect.isclass):
-      # in this way we can get all the class methods
-      classMethods = [method for method in dir(modClass) if callable(getattr(modClass, method))]
-      if 'createNewInput' in classMethods:
-        __interFaceDict[key.replace("Interface","")] = modClass
+__interFaceDict                 = {} # {type:(module path, class name)}, the module is imported on request
+for className,modulePath in __findInterfaceClasses(__moduleInterfaceList).items():
+  __interFaceDict[className.replace("Interface","")] = (modulePath,className)
+# the base class is available in every interface module
+__interFaceDict['CodeBase'] = (os.path.join(os.path.dirname(__file__),'CodeInterfaceBaseClass.py'),'CodeInterfaceBase')
 __knownTypes      = list(__interFaceDict.keys())
 
 def knownTypes():
@@ -75,4 +107,7 @@ def returnCodeInterface(Type,caller):
   """
   if Type not in knownTypes():
     caller.raiseAnError(NameError,'not known '+__base+' type '+Type)
-  return __interFaceDict[Type]()
+  modulePath,className = __interFaceDict[Type]
+  if modulePath not in __moduleImportedDict:
+    __moduleImportedDict[modulePath] = utils.importFromPath(modulePath,False)
+  return getattr(__moduleImportedDict[modulePath],className)()
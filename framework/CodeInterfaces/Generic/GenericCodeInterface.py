@@ -159,6 +159,16 @@ class GenericCode(CodeInterfaceBase):
     print('Execution Command: '+str(returnCommand[0]))
     return returnCommand
 
+  def isInputFileUnmodified(self,inputFile):
+    """
+      This method tells if an input file is left unmodified by createNewInput, so that it can be
+      hard-linked into the run directories instead of copied. Only the files with an input extension
+      are rewritten by the GenericParser.
+      @ In, inputFile, Files.File, the input file
+      @ Out, unmodified, bool, True if the file is never written by this interface
+    """
+    return inputFile.getExt() not in self.getInputExtension()
+
   def createNewInput(self,currentInputFiles,origInputFiles,samplerType,**Kwargs):
     """
       This method is used to generate an input based on the information passed in.
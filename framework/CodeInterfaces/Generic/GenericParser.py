@@ -36,6 +36,86 @@ def _reprIfFloat(value):
   else:
     return str(value)
 
+## templates already split by _compileTemplate, shared by all the parsers (that is, by all the samples)
+##   {(file content, prefix, postfix, defaultDelim, formatDelim):template}
+_compiledTemplates = {}
+_maxCompiledTemplates = 32
+
+def _compileTemplate(inputFile,prefix,postfix,defaultDelim,formatDelim,acceptFormats):
+  """
+    Splits a template input file into the text between the wildcards and the wildcards themselves.
+    The template only depends on the content of the file, so a content is split once and then
+    shared (e.g. by the copies of the same template in the directory of each sample).
+    @ In, inputFile, Files.File, the input file
+    @ In, prefix, string, the string prefix to find input variables within the input file
+    @ In, postfix, string, the string postfix signifying the end of an input variable within the input file
+    @ In, defaultDelim, string, the string used between prefix and postfix to set default values
+    @ In, formatDelim, string, the string used between prefix and postfix to set the format of the value
+    @ In, acceptFormats, dict, the accepted format characters and the type they convert the value to
+    @ Out, template, tuple, (segments, varPlaces, defaults, formats) where "segments" is the tuple of text
+      segments (holding the variable name at the place of each wildcard), "varPlaces" is {var:tuple(places)},
+      "defaults" is {var:default} and "formats" is {var:(format,type)}
+  """
+  lines = inputFile.readlines()
+  inputFile.close()
+  key = (''.join(lines),prefix,postfix,defaultDelim,formatDelim)
+  if key in _compiledTemplates:
+    return _compiledTemplates[key]
+  segments  = []
+  varPlaces = {}
+  defaults  = {}
+  formats   = {}
+  seg = [] # text since the last wildcard, joined once
+  for line in lines:
+    while prefix in line and postfix in line:
+      segments.append(''.join(seg))
+      start = line.find(prefix)
+      end = line.find(postfix,start+1)
+      var = line[start+len(prefix):end]
+      if defaultDelim in var or formatDelim in var:
+        optionalPos = [None]*2
+        optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
+        if optionalPos[0] == -1:
+          optionalPos[0]  = sys.maxsize
+        if optionalPos[1] == -1:
+          optionalPos[1] = sys.maxsize
+        defval    = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
+        varformat = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
+        var = var[0:min(optionalPos)]
+        if var in defaults.keys() and optionalPos[0] != sys.maxsize:
+          print('multiple default values given for variable',var)
+        if var in formats.keys() and optionalPos[1] != sys.maxsize:
+          print('multiple format values given for variable',var)
+        #TODO allow the user to specify take-last or take-first?
+        if optionalPos[0] != sys.maxsize:
+          defaults[var]=defval
+        if optionalPos[1] != sys.maxsize:
+          # check if the format is valid
+          if not any(formVal in varformat for formVal in acceptFormats.keys()):
+            try:
+              int(varformat)
+            except ValueError:
+              raise ValueError("the format specified for wildcard "+ line[start+len(prefix):end] +
+                                                 " is unknown. Available are either a plain integer or the following "+" ".join(acceptFormats.keys()))
+            formats[var]=varformat,int
+          else:
+            for formVal in acceptFormats.keys():
+              if formVal in varformat:
+                formats[var]=varformat,acceptFormats[formVal]; break
+      segments.append(line[:start])
+      segments.append(var)
+      varPlaces.setdefault(var,[]).append(len(segments)-1)
+      line=line[end+1:]
+      seg = []
+    else:
+      seg.append(line)
+  segments.append(''.join(seg))
+  template = tuple(segments),dict((var,tuple(places)) for var,places in varPlaces.items()),defaults,formats
+  if len(_compiledTemplates) >= _maxCompiledTemplates:
+    _compiledTemplates.pop(next(iter(_compiledTemplates)))
+  _compiledTemplates[key] = template
+  return template
+
 class GenericParser():
   """
     import the user-edited input file, build list of strings with replacable parts
@@ -43,6 +123,7 @@ class GenericParser():
   def __init__(self,inputFiles,prefix='$RAVEN-',postfix='$',defaultDelim=':', formatDelim='|'):
     """
       Accept the input file and parse it by the prefix-postfix breaks. Someday might be able to change prefix,postfix,defaultDelim from input file, but not yet.
+      Each file is only split once (see _compileTemplate), so creating a parser for each sample is cheap.
       @ In, inputFiles, list, string list of input filenames that might need parsing.
       @ In, prefix, string, optional, the string prefix to find input variables within the input files
       @ In, postfix, string, optional, the string postfix signifying hte end of an input variable within an input file
@@ -61,67 +142,22 @@ class GenericParser():
     self.printTag = 'GENERIC_PARSER'
     for inputFile in self.inputFiles:
       infileName = inputFile.getFilename()#os.path.basename(inputFile)
-      self.segments[infileName] = []
       if not os.path.exists(inputFile.getAbsFile()):
         ## Make sure to cast the inputFile to a string as it may be File object.
         raise IOError('Input file not found: ' + str(inputFile))
-      seg = ''
-      lines = inputFile.readlines()
-      inputFile.close()
-      for line in lines:
-        while self.prefixKey in line and self.postfixKey in line:
-          self.segments[infileName].append(seg)
-          start = line.find(self.prefixKey)
-          end = line.find(self.postfixKey,start+1)
-          var = line[start+len(self.prefixKey):end]
-          if defaultDelim in var or formatDelim in var:
-            optionalPos = [None]*2
-            optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
-            if optionalPos[0] == -1:
-              optionalPos[0]  = sys.maxsize
-            if optionalPos[1] == -1:
-              optionalPos[1] = sys.maxsize
-            defval    = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
-            varformat = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
-            var = var[0:min(optionalPos)]
-            if var in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              print('multiple default values given for variable',var)
-            if var in self.formats.keys() and optionalPos[1] != sys.maxsize:
-              print('multiple format values given for variable',var)
-            #TODO allow the user to specify take-last or take-first?
-            if var not in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              self.defaults[var] = {}
-            if var not in self.formats.keys()  and optionalPos[1] != sys.maxsize:
-              self.formats[var ] = {}
-            if optionalPos[0] != sys.maxsize:
-              self.defaults[var][infileName]=defval
-            if optionalPos[1] != sys.maxsize:
-              # check if the format is valid
-              if not any(formVal in varformat for formVal in self.acceptFormats.keys()):
-                try:
-                  int(varformat)
-                except ValueError:
-                  raise ValueError("the format specified for wildcard "+ line[start+len(self.prefixKey):end] +
-                                                     " is unknown. Available are either a plain integer or the following "+" ".join(self.acceptFormats.keys()))
-                self.formats[var][infileName ]=varformat,int
-              else:
-                for formVal in self.acceptFormats.keys():
-                  if formVal in varformat:
-                    self.formats[var][infileName ]=varformat,self.acceptFormats[formVal]; break
-          self.segments[infileName].append(line[:start])
-          self.segments[infileName].append(var)
-          if var not in self.varPlaces.keys():
-            self.varPlaces[var] = {infileName:[len(self.segments[infileName])-1]}
-          elif infileName not in self.varPlaces[var].keys():
-            self.varPlaces[var][infileName]=[len(self.segments[infileName])-1]
-          else:
-            self.varPlaces[var][infileName].append(len(self.segments[infileName])-1)
-          #self.segments.append(line[end+1:])
-          line=line[end+1:]
-          seg = ''
-        else:
-          seg+=line
-      self.segments[infileName].append(seg)
+      segments,varPlaces,defaults,formats = _compileTemplate(inputFile,prefix,postfix,defaultDelim,formatDelim,self.acceptFormats)
+      # the values are written in a copy of the segments, the template itself is shared
+      self.segments[infileName] = list(segments)
+      for var,places in varPlaces.items():
+        self.varPlaces.setdefault(var,{})[infileName] = list(places)
+      for var,defval in defaults.items():
+        if var in self.defaults.keys():
+          print('multiple default values given for variable',var)
+        self.defaults.setdefault(var,{})[infileName] = defval
+      for var,varformat in formats.items():
+        if var in self.formats.keys():
+          print('multiple format values given for variable',var)
+        self.formats.setdefault(var,{})[infileName] = varformat
 
   def modifyInternalDictionary(self,**Kwargs):
     """
@@ -212,5 +248,5 @@ class GenericParser():
       outfile = inFiles[f]
       #if os.path.isfile(outfile.getAbsFile()): os.remove(outfile.getAbsFile())
       outfile.open('w')
-      outfile.writelines(''.join(self.segments[inFile.getFilename()]))
+      outfile.write(''.join(self.segments[inFile.getFilename()]))
       outfile.close()
@@ -70,6 +70,16 @@ class MAAP5(GenericCode):
     if (len(self.boolOutputVariables)==0) and (len(self.contOutputVariables)==0):
       raise IOError('At least one of two nodes <boolMaapOutputVariables> or <contMaapOutputVariables> has to be specified')
 
+  def isInputFileUnmodified(self,inputFile):
+    """
+      This method tells if an input file is left unmodified by createNewInput.
+      For the Dynamic Event Tree, the MAAP5 input and include files are rewritten in place,
+      therefore no file is considered unmodified.
+      @ In, inputFile, Files.File, the input file
+      @ Out, unmodified, bool, True if the file is never written by this interface
+    """
+    return False
+
   def createNewInput(self,currentInputFiles,oriInputFiles,samplerType,**Kwargs):
     """
       This method is used to generate an input based on the information passed in.
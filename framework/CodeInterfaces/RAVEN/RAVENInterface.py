@@ -24,6 +24,7 @@ import os
 import copy
 import numpy as np
 import sys
+import threading
 from sys import platform
 from utils import utils
 from CodeInterfaceBaseClass import CodeInterfaceBase
@@ -55,6 +56,34 @@ class RAVEN(CodeInterfaceBase):
     self.linkedDataObjectOutStreamsNames = None
     # input manipulation module
     self.inputManipulationModule = None
+    # run the SLAVE RAVEN inputs in persistent worker processes (instead of a new RAVEN for each sample)?
+    self.persistentWorkers = False
+    # pool of persistent SLAVE RAVEN processes (started at the first run)
+    self.workerPool = None
+    self.workerLock = threading.Lock()
+    # the content of the linked DataObjects returned by the workers {runWorkingDir:{dataObjectName:xarray.Dataset}}
+    self.workerResults = {}
+
+  def __getstate__(self):
+    """
+      Get state for pickling (the pool of workers and its lock stay with the original object)
+      @ In, None
+      @ Out, state, dict, the state
+    """
+    state = copy.copy(self.__dict__)
+    state['workerPool'] = None
+    state['workerResults'] = {}
+    del state['workerLock']
+    return state
+
+  def __setstate__(self,state):
+    """
+      Set state for unpickling
+      @ In, state, dict, the state
+      @ Out, None
+    """
+    self.__dict__.update(state)
+    self.workerLock = threading.Lock()
 
   def addDefaultExtension(self):
     """
@@ -127,6 +156,13 @@ class RAVEN(CodeInterfaceBase):
         elif moduleNode.tag == 'input':
           self.inputManipulationModule = source
 
+    # persistent SLAVE RAVEN processes
+    child = xmlNode.find("persistentWorkers")
+    if child is not None:
+      self.persistentWorkers = utils.interpretBoolean(child.text.strip())
+      if self.persistentWorkers not in [True, False]:
+        raise IOError(self.printTag+' ERROR: persistentWorkers node must be a boolean. Got "'+child.text.strip()+'"!')
+
   def __findInputFile(self,inputFiles):
     """
       Method to return the index of the RAVEN input file (error out in case it is not found)
@@ -267,6 +303,31 @@ class RAVEN(CodeInterfaceBase):
     parser.copySlaveFiles(currentInputFiles[index].getPath())
     return currentInputFiles
 
+  def runInWorker(self,executable,inputFiles,workingDir,logFile,walltime=None):
+    """
+      Runs the SLAVE RAVEN in one of the persistent worker processes, if requested (node persistentWorkers),
+      instead of launching a new RAVEN. The content of the linked DataObjects is kept in memory for
+      checkForOutputFailure and finalizeCodeOutput.
+      @ In, executable, string, executable name with absolute path (the raven_framework script)
+      @ In, inputFiles, list, List of input files (the perturbed ones)
+      @ In, workingDir, string, the working directory of this run
+      @ In, logFile, string, absolute path of the log file of this run
+      @ In, walltime, float, optional, the longest time the run can take (seconds), no limit if None
+      @ Out, run, RAVENworker.WorkerRun, the outcome of the run (None if the persistent workers are not used)
+    """
+    if not self.persistentWorkers:
+      return None
+    import RAVENworker
+    with self.workerLock:
+      if self.workerPool is None:
+        self.workerPool = RAVENworker.RAVENworkerPool(os.path.join(os.path.dirname(os.path.realpath(executable)),'framework'))
+    index = self.__findInputFile(inputFiles)
+    dataObjects = set(self.outStreamsNamesAndType[outStream][0] for outStream in self.linkedDataObjectOutStreamsNames)
+    run, data = self.workerPool.run(inputFiles[index].getAbsFile(),logFile,dataObjects,walltime)
+    if data is not None:
+      self.workerResults[workingDir] = data
+    return run
+
   def checkForOutputFailure(self,output,workingDir):
     """
       This method is called by the RAVEN code at the end of each run  if the return code is == 0.
@@ -279,6 +340,16 @@ class RAVEN(CodeInterfaceBase):
       @ Out, failure, bool, True if the job is failed, False otherwise
     """
     failure = False
+    # run by a persistent worker: the data is already here
+    if workingDir in self.workerResults:
+      for name, dataset in self.workerResults[workingDir].items():
+        for var in dataset.data_vars:
+          values = dataset[var].values
+          if values.dtype.kind == 'f' and np.isnan(values).any():
+            print(self.printTag+' ERROR: Found nan in RAVEN SLAVE DataObject "'+name+'" (variable "'+var+'")!')
+            self.workerResults.pop(workingDir)
+            return True
+      return False
     # check for log file
     try:
       outputToRead = open(os.path.join(workingDir,output),"r")
@@ -328,6 +399,8 @@ class RAVEN(CodeInterfaceBase):
     #####
     dataObjectsToReturn = {}
     numRlz = None
+    # content of the DataObjects, if the SLAVE RAVEN was run by a persistent worker
+    workerData = self.workerResults.pop(workingDir,None)
     messageHandler = MessageHandler()
     messageHandler.initialize({'verbosity':'quiet'})
     for filename in self.linkedDataObjectOutStreamsNames:
@@ -340,7 +413,10 @@ class RAVEN(CodeInterfaceBase):
       data.readXML(dataObjectInfo[2], messageHandler, variableGroups=self.variableGroups)
       # set the name, then load the data
       data.name = filename
-      data.load(os.path.join(workingDir,self.innerWorkingDir,filename),style='csv')
+      if workerData is None:
+        data.load(os.path.join(workingDir,self.innerWorkingDir,filename),style='csv')
+      else:
+        data.load(workerData[dataObjectInfo[0]],style='dataset')
       # check consistency of data object number of realizations
       if numRlz is None:
         # set the standard if you're the first data object
@@ -0,0 +1,386 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Persistent SLAVE RAVEN workers for the RAVEN interface.
+  Instead of starting a new RAVEN (interpreter start-up, imports, ...) for every sample, the RAVEN
+  interface can keep a pool of worker processes alive. Each worker imports the framework once, then
+  runs the perturbed inputs it receives (through its standard input/output pipes) one after the other
+  and sends back the content of the requested DataObjects, so that nothing has to be read back from disk.
+  The worker is this very module, run as a script: "python RAVENworker.py".
+
+  Created on October 18, 2026
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os
+import sys
+import struct
+import atexit
+import threading
+import traceback
+import subprocess
+from six.moves import cPickle as pickle
+
+# messages are pickled objects preceded by their length
+_header = struct.Struct(str('!Q'))
+
+def _send(stream, obj):
+  """
+    Sends an object through a pipe.
+    @ In, stream, file, the (binary) pipe
+    @ In, obj, object, the object to send
+    @ Out, None
+  """
+  data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+  stream.write(_header.pack(len(data)))
+  stream.write(data)
+  stream.flush()
+
+def _recv(stream):
+  """
+    Receives an object sent with _send.
+    @ In, stream, file, the (binary) pipe
+    @ Out, obj, object, the object (EOFError is raised if the pipe is closed)
+  """
+  data = _readExactly(stream, _header.size)
+  return pickle.loads(_readExactly(stream, _header.unpack(data)[0]))
+
+def _readExactly(stream, size):
+  """
+    Reads a given number of bytes from a pipe.
+    @ In, stream, file, the (binary) pipe
+    @ In, size, int, number of bytes
+    @ Out, data, bytes, the bytes read
+  """
+  chunks = []
+  while size > 0:
+    chunk = stream.read(size)
+    if not chunk:
+      raise EOFError('pipe closed')
+    chunks.append(chunk)
+    size -= len(chunk)
+  return b''.join(chunks)
+
+class WorkerRun(object):
+  """
+    Outcome of an input run by a worker. It quacks like the processes launched by the process supervisor
+    (see Runners.ProcessSupervisor), so that the Code model can wait for it the same way.
+  """
+  def __init__(self, returncode, timedOut=False):
+    """
+      Constructor
+      @ In, returncode, int, 0 if the SLAVE RAVEN completed
+      @ In, timedOut, bool, optional, True if the run was killed because it exceeded its walltime
+      @ Out, None
+    """
+    self.returncode = returncode
+    self.timedOut   = timedOut
+
+  def wait(self):
+    """
+      Returns the return code (the run is over already).
+      @ In, None
+      @ Out, returncode, int, the return code
+    """
+    return self.returncode
+
+class _Worker(object):
+  """
+    Bookkeeping for one worker process of the RAVENworkerPool.
+  """
+  def __init__(self, command, env):
+    """
+      Starts a new worker process.
+      @ In, command, list, the command starting the worker
+      @ In, env, dict, the environment of the worker
+      @ Out, None
+    """
+    ## the worker inherits stderr, so that the errors outside of the runs are not lost
+    self.process  = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
+    self.timedOut = False
+
+  def kill(self):
+    """
+      Kills the worker process (e.g. if it exceeded the walltime).
+      @ In, None
+      @ Out, None
+    """
+    self.timedOut = True
+    try:
+      self.process.kill()
+    except OSError:
+      pass
+
+  def stop(self):
+    """
+      Stops the worker process, closing its input (the worker exits once it reads the end of it).
+      @ In, None
+      @ Out, None
+    """
+    for stream in (self.process.stdin, self.process.stdout):
+      try:
+        stream.close()
+      except (IOError, OSError):
+        pass
+    ## give it some time to tear down, then make sure it is gone
+    timer = threading.Timer(5.0, self.kill)
+    timer.start()
+    self.process.wait()
+    timer.cancel()
+
+class RAVENworkerPool(object):
+  """
+    Pool of persistent SLAVE RAVEN processes on the local machine. A worker is started whenever an
+    input has to be run and no worker is idle, so that the pool grows up to the number of simultaneous runs.
+  """
+  def __init__(self, frameworkDir):
+    """
+      Constructor
+      @ In, frameworkDir, string, the framework directory of the SLAVE RAVEN
+      @ Out, None
+    """
+    script = os.path.join(frameworkDir,'CodeInterfaces','RAVEN','RAVENworker.py')
+    if not os.path.exists(script):
+      raise IOError('RAVEN WORKER ERROR: the SLAVE RAVEN worker script "'+script+'" was not found!')
+    ## same interpreter and optimization level as the MASTER RAVEN (raven_framework runs in "opt" mode)
+    self.command = [sys.executable] + (['-O'] if sys.flags.optimize else []) + [script]
+    self.env     = dict(os.environ)
+    # the SLAVE RAVEN is not run as an interface check (as in Driver.py with no "interfaceCheck" argument)
+    self.env['RAVENinterfaceCheck'] = 'False'
+    self.__lock    = threading.Lock()
+    self.__idle    = []    ## workers waiting for an input
+    self.__busy    = set() ## workers running an input
+    self.__closed  = False
+    atexit.register(self.shutdown)
+
+  def numWorkers(self):
+    """
+      Returns the number of worker processes alive.
+      @ In, None
+      @ Out, numWorkers, int, number of workers
+    """
+    with self.__lock:
+      return len(self.__idle) + len(self.__busy)
+
+  def run(self, inputFile, logFile, dataObjects, walltime=None):
+    """
+      Runs a SLAVE RAVEN input in a worker (blocking until it is done).
+      @ In, inputFile, string, absolute path of the (perturbed) input file
+      @ In, logFile, string, absolute path of the file that collects the output of the SLAVE RAVEN
+      @ In, dataObjects, list, names of the DataObjects of the SLAVE RAVEN whose content is returned
+      @ In, walltime, float, optional, the longest time the run can take (seconds), no limit if None
+      @ Out, run, WorkerRun, the outcome of the run (return code 0 if the SLAVE RAVEN completed)
+      @ Out, data, dict, {dataObjectName:xarray.Dataset} content of the DataObjects (None if the run failed)
+    """
+    with self.__lock:
+      if self.__closed:
+        raise RuntimeError('RAVEN WORKER ERROR: the pool of SLAVE RAVEN workers has been shut down!')
+      worker = self.__idle.pop() if len(self.__idle) > 0 else None
+    if worker is None:
+      worker = _Worker(self.command, self.env)
+    with self.__lock:
+      self.__busy.add(worker)
+    timer = None
+    if walltime is not None:
+      timer = threading.Timer(walltime, worker.kill)
+      timer.start()
+    try:
+      _send(worker.process.stdin, {'inputFile':inputFile, 'logFile':logFile, 'dataObjects':list(dataObjects)})
+      reply = _recv(worker.process.stdout)
+    except (EOFError, IOError, OSError, pickle.UnpicklingError):
+      reply = None
+    finally:
+      if timer is not None:
+        timer.cancel()
+    with self.__lock:
+      self.__busy.discard(worker)
+      keep = reply is not None and not worker.timedOut and not self.__closed
+      if keep:
+        self.__idle.append(worker)
+    if not keep:
+      ## the worker died (or was killed): it is not reused
+      worker.stop()
+    if reply is None:
+      if not worker.timedOut:
+        with open(logFile,'a') as log:
+          log.write('\nRAVEN WORKER ERROR: the SLAVE RAVEN worker terminated unexpectedly!\n')
+      return WorkerRun(-1, worker.timedOut), None
+    if not reply['success']:
+      return WorkerRun(1), None
+    return WorkerRun(0), reply['data']
+
+  def shutdown(self):
+    """
+      Stops the worker processes.
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__closed = True
+      workers = self.__idle
+      self.__idle = []
+    for worker in workers:
+      worker.stop()
+
+################################################################################
+# worker side
+
+def _resetGlobalState():
+  """
+    Puts back the global state of the framework that a run may have changed, so that every input
+    behaves as in a new SLAVE RAVEN: the random number generators of randomUtils (and, with crow, the one
+    of the DistributionContainer used by the distributions) are seeded as in a new process.
+    The modules imported by the previous runs are forgotten by _forgetRunModules. What is NOT reset is the
+    module-level state of the framework itself, of the plugins (imported with the framework, once per worker)
+    and of the libraries (e.g. numpy's global generator, that a new process does not seed either).
+    @ In, None
+    @ Out, None
+  """
+  from utils import randomUtils
+  if randomUtils.stochasticEnv == 'crow':
+    ## default seed of the crow random engines (the one of a newly created engine)
+    randomUtils.randomSeed(5489)
+    randomUtils.boxMullerGen = randomUtils.BoxMullerGenerator()
+  else:
+    randomUtils.npStochEnv = randomUtils.newRNG()
+
+def _forgetRunModules(previousModules, inputDir, libraryDirs):
+  """
+    Forgets (removes from sys.modules) the modules imported by a run, so that the next run imports them
+    again with a fresh module-level state, as a new SLAVE RAVEN does: the modules imported from the run
+    directory (e.g. the ones of the ExternalModels and Functions) and the other modules the run imported
+    from outside the framework and the libraries (e.g. helper modules imported by the ExternalModels).
+    @ In, previousModules, set, the names of the modules loaded before the run
+    @ In, inputDir, string, the directory of the input of the run
+    @ In, libraryDirs, list, the directories of the framework and of the libraries (the sys.path of the worker)
+    @ Out, None
+  """
+  for name, module in list(sys.modules.items()):
+    moduleFile = getattr(module,'__file__',None)
+    if moduleFile is None:
+      continue
+    moduleFile = os.path.abspath(str(moduleFile))
+    if moduleFile.startswith(inputDir+os.sep):
+      del sys.modules[name]
+    elif name not in previousModules and not any(moduleFile.startswith(libraryDir+os.sep) for libraryDir in libraryDirs):
+      del sys.modules[name]
+
+def runInput(frameworkDir, inputFile, dataObjects):
+  """
+    Runs a RAVEN input in this process, as Driver.py does.
+    @ In, frameworkDir, string, the framework directory
+    @ In, inputFile, string, absolute path of the input file
+    @ In, dataObjects, list, names of the DataObjects whose content is returned
+    @ Out, data, dict, {dataObjectName:xarray.Dataset} content of the DataObjects
+  """
+  from Simulation import Simulation
+  import utils.TreeStructure as TS
+  import xml.etree.ElementTree as ET
+  _resetGlobalState()
+  simulation = Simulation(frameworkDir)
+  try:
+    configFile = os.path.join(os.path.expanduser("~"),".raven","default_runinfo.xml")
+    if os.path.exists(configFile):
+      root = ET.parse(configFile).getroot()
+      if root.tag == 'Simulation' and [x.tag for x in root] == ["RunInfo"]:
+        simulation.XMLread(root,runInfoSkip=set(["totNumCoresUsed"]),xmlFilename=configFile)
+      else:
+        raise IOError(str(configFile)+' should only have Simulation and inside it RunInfo')
+    simulation.setInputFiles([inputFile])
+    root = TS.parse(open(inputFile,'r')).getroot()
+    if root.tag != 'Simulation':
+      raise IOError('The outermost block of the input file '+inputFile+' it is not Simulation')
+    simulation.XMLpreprocess(root,os.path.dirname(inputFile))
+    simulation.XMLread(root,runInfoSkip=set(["DefaultInputFile"]),xmlFilename=inputFile)
+    simulation.initialize()
+    simulation.run()
+  except:
+    simulation.jobHandler.terminateAll()
+    raise
+  finally:
+    simulation.jobHandler.shutdown()
+  data = {}
+  for name in dataObjects:
+    ## only the values travel back (the attributes may hold objects that cannot be pickled)
+    dataset = simulation.dataDict[name].asDataset().copy()
+    dataset.attrs = {}
+    data[name] = dataset
+  return data
+
+def workerLoop(frameworkDir, channelIn, channelOut):
+  """
+    Main loop of a worker: receives the inputs to run, runs them, sends back the results.
+    The output of each run (including that of the subprocesses it starts) goes to the log file of the run.
+    @ In, frameworkDir, string, the framework directory
+    @ In, channelIn, file, the pipe the requests come from
+    @ In, channelOut, file, the pipe the results go to
+    @ Out, None
+  """
+  workingDir = os.getcwd()
+  libraryDirs = [os.path.abspath(path) for path in set(sys.path + [frameworkDir]) if path and os.path.isdir(path)]
+  console = os.dup(2)
+  while True:
+    try:
+      request = _recv(channelIn)
+    except EOFError:
+      break
+    sysPath = list(sys.path)
+    previousModules = set(sys.modules.keys())
+    sys.stdout.flush()
+    sys.stderr.flush()
+    log = open(request['logFile'],'w')
+    os.dup2(log.fileno(),1)
+    os.dup2(log.fileno(),2)
+    try:
+      reply = {'success':True, 'data':runInput(frameworkDir, request['inputFile'], request['dataObjects'])}
+    except BaseException:
+      traceback.print_exc()
+      reply = {'success':False}
+    finally:
+      sys.stdout.flush()
+      sys.stderr.flush()
+      os.dup2(console,1)
+      os.dup2(console,2)
+      log.close()
+      _forgetRunModules(previousModules, os.path.dirname(request['inputFile']), libraryDirs)
+      sys.path[:] = sysPath
+      os.chdir(workingDir)
+    try:
+      _send(channelOut, reply)
+    except (IOError, OSError, pickle.PicklingError):
+      ## the MASTER RAVEN is gone (or the data cannot be sent back)
+      break
+
+if __name__ == '__main__':
+  ## the pipes to the MASTER RAVEN are moved away from the standard input/output, so that nothing
+  ## else can write on them; outside of the runs the standard output goes to the standard error
+  channelIn  = os.fdopen(os.dup(0),'rb')
+  channelOut = os.fdopen(os.dup(1),'wb')
+  os.dup2(os.open(os.devnull,os.O_RDONLY),0)
+  os.dup2(2,1)
+  frameworkDir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir,os.pardir))
+  sys.path[0] = frameworkDir
+  from utils import utils
+  utils.find_crow(frameworkDir)
+  if sys.version_info.major == 2:
+    utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+  else:
+    utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+  utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+  utils.add_path(os.path.join(frameworkDir,'contrib'))
+  ## import the framework once for all the runs
+  import Simulation
+  workerLoop(frameworkDir, channelIn, channelOut)
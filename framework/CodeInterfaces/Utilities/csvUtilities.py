@@ -31,6 +31,7 @@ import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
+from utils import csvUtils
 #Internal Modules End--------------------------------------------------------------------------------
 
 class csvUtilityClass(object):
@@ -66,23 +67,11 @@ class csvUtilityClass(object):
         self.listOfFiles.extend(glob(os.path.join(os.path.split(fileToExpand)[0],os.path.split(fileToExpand)[1].replace("$*$","*") + ".csv")))
 
     for filename in self.listOfFiles:
-      # open file
-      myFile = open (filename,'rb')
-      # read the field names
-      head = myFile.readline().decode()
-      for _ in range(linesToSkipAfterHeader):
-        myFile.readline()
-      all_field_names = head.split(delimeter)
-      for index in range(len(all_field_names)):
-        all_field_names[index] = all_field_names[index].strip()
-      if all_field_names[-1] == "":
-        all_field_names.pop(-1) # it means there is a trailing "'" at the end of the file
-      isAlreadyIn = False
-
-      # load the table data (from the csv file) into a numpy nd array
-      data = np.loadtxt(myFile, delimiter=delimeter, usecols=tuple([i for i in range(len(all_field_names))]))
-      # close file
-      myFile.close()
+      # read the field names and load the table data (from the csv file) into a numpy nd array,
+      # keeping only the columns named in the header
+      all_field_names, data = csvUtils.loadNumericCsv(filename, delimiter=delimeter, skipRows=linesToSkipAfterHeader, headerColumns=True)
+      # as numpy.loadtxt, drop the dimensions of length one
+      data = np.squeeze(data)
       self.allHeaders.extend(all_field_names)
       # store the data
       self.dataContainer[filename] = {"headers":all_field_names,"data":data}
@@ -31,6 +31,7 @@ import copy
 
 #Internal Modules------------------------------------------------------------------------------------
 from utils import utils
+from utils import csvUtils
 import MessageHandler
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -60,20 +61,12 @@ class CsvLoader(MessageHandler.MessageUser):
       FLOAT ,FLOAT ,FLOAT ,FLOAT
       ...
       FLOAT ,FLOAT ,FLOAT ,FLOAT
-      @ In, fileIn, string, Input file name (absolute path)
+      @ In, myFile, Files.File, the csv file
       @ Out, data, numpy.ndarray, the loaded data
     """
-    # open file
-    myFile.open(mode='rb')
-    # read the field names
-    head = myFile.readline().decode()
-    self.allFieldNames = head.split(',')
-    for index in range(len(self.allFieldNames)):
-      self.allFieldNames[index] = self.allFieldNames[index].strip()
-    # load the table data (from the csv file) into a numpy nd array
-    data = np.loadtxt(myFile,dtype='float',delimiter=',',ndmin=2,skiprows=1)
-    # close file
-    myFile.close()
+    # read the field names and load the table data (from the csv file) into a numpy nd array,
+    # keeping only the columns named in the header
+    self.allFieldNames, data = csvUtils.loadNumericCsv(myFile.getAbsFile(),headerColumns=True)
     return data
 
   def getFieldNames(self):
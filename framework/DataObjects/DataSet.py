@@ -25,6 +25,7 @@ import os
 import sys
 import copy
 import itertools
+import base64
 try:
   import cPickle as pk
 except ImportError:
@@ -41,7 +42,7 @@ try:
   from .DataObject import DataObject
 except ValueError:
   from DataObject import DataObject
-from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils
+from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils, realizationIndex
 
 # for profiling with kernprof
 try:
@@ -89,6 +90,7 @@ class DataSet(DataObject):
     self.printTag         = self.name
     self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
+    self._matchIndexes    = {}               # {(floatKeys,exactKeys):RealizationIndex} for finding realizations by value
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
 
@@ -194,8 +196,8 @@ class DataSet(DataObject):
                          "val" is a np.ndarray of values.
       @ Out, None
     """
-    # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
+    # NOTE: no deepcopy of the realization is needed to protect against back-changing it, since the collector
+    #   copies scalar values and history values into its own buffers.
     # clean out entries that aren't desired
     try:
       rlz = dict((var,rlz[var]) for var in self.getVars()+self.indexes)
@@ -214,32 +216,50 @@ class DataSet(DataObject):
 
     ## check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an innefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    # newData is a numpy array of realizations,
-    #   each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #   This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #   Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    ## set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0],dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(rlz))
-    # append
-    self._collector.append(newData)
+    # append the realization as a list of entries in collector order; the columnar collector
+    #   stores each entry in its own typed buffer, so no object array of the realization is needed.
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
     # reset scaling factors, kd tree
     self._resetScaling()
 
+  def addRealizationBatch(self,batch):
+    """
+      Adds several "rows" (or "samples") to this data object at once, with the same result as
+      adding each of them with addRealization.
+      If every variable has a single value for each realization, the values are appended to the
+      collector a column at a time; otherwise the realizations are added one by one.
+      @ In, batch, dict, {var:vals} format where
+                         "var" is the variable name as a string,
+                         "vals" is a np.ndarray with the realizations along the first axis
+                         (as built by utils.stackRealizations).
+      @ Out, None
+    """
+    # clean out entries that aren't desired
+    try:
+      batch = dict((var,batch[var]) for var in self.getVars()+self.indexes)
+    except KeyError as e:
+      self.raiseADebug('Variables provided:',batch.keys())
+      self.raiseAnError(KeyError,'Provided realizations do not have all requisite values for object "{}": "{}"'.format(self.name,e.args[0]))
+    if len(batch) == 0 or len(self.indexes) or 'RAVEN_parentID' in batch or \
+       not all(isinstance(vals,np.ndarray) and vals.ndim == 1 and vals.dtype != object for vals in batch.values()):
+      for rlz in utils.unstackRealizations(batch):
+        self.addRealization(rlz)
+      return
+    ## establish types if not done yet
+    self._setDataTypes(dict((var,vals[0]) for var,vals in batch.items()))
+    # if data storage isn't set up, set it up
+    if self._collector is None:
+      self._collector = self._newCollector(width=len(batch))
+    self._collector.extend(list(batch[var] for var in self._orderedVars))
+    # reset scaling factors, kd tree
+    self._resetScaling()
+
   def addVariable(self,varName,values,classify='meta',indices=None):
     """
       Adds a variable/column to the data.  "values" needs to be as long as self.size.
@@ -465,6 +485,8 @@ class DataSet(DataObject):
     # load based on style for loading
     if style == 'netcdf':
       self._fromNetCDF(dataIn,**kwargs)
+    elif style == 'parquet':
+      self._fromParquet(dataIn,**kwargs)
     elif style == 'csv':
       # make sure we don't include the "csv"
       if dataIn.endswith('.csv'):
@@ -477,6 +499,8 @@ class DataSet(DataObject):
     # TODO dask
     else:
       self.raiseAnError(NotImplementedError,'Unrecognized read style: "{}"'.format(style))
+    # the loaded data replaces what was indexed
+    self._resetMatchIndexes()
     # after loading, set or reset scaling factors
     self._setScalingFactors()
 
@@ -492,7 +516,6 @@ class DataSet(DataObject):
       @ Out, index, int, optional, index where found (or len(self) if not found), only returned if matchDict
       @ Out, rlz, dict, realization requested (None if not found)
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     ## first, check that some direction was given, either an index or a match to find
     if (index is None and matchDict is None) or (index is not None and matchDict is not None):
       self.raiseAnError(TypeError,'Either "index" OR "matchDict" (not both) must be specified to use "realization!"')
@@ -531,21 +554,30 @@ class DataSet(DataObject):
     ## END select by index
     ## START collect by matching realization
     else: # matchDict must not be None
-      # if nothing in data, try collector
-      if numInData == 0:
-        # if nothing in data OR collector, we can't have a match
-        if numInCollector == 0:
-          return 0,None
-        # otherwise, get it from the collector
+      # if nothing in data OR collector, we can't have a match
+      if numInData + numInCollector == 0:
+        return 0,None
+      # if the requested variables can be indexed, only check the realizations near the request
+      index = self._getRealizationIndexByValue(matchDict,tol=tol)
+      if index is not None:
+        if index >= numInData + numInCollector:
+          rlz = None
+        elif index < numInData:
+          rlz = self._getRealizationFromDataByIndex(index, unpackXArray)
         else:
-          index,rlz = self._getRealizationFromCollectorByValue(matchDict,tol=tol)
+          rlz = self._getRealizationFromCollectorByIndex(index - numInData)
+        return index,rlz
       # otherwise, first try to find it in the data
-      else:
+      if numInData > 0:
         index,rlz = self._getRealizationFromDataByValue(matchDict,tol=tol, unpackXArray=unpackXArray)
-        # if no match found in data, try in the collector (if there's anything in it)
-        if rlz is None:
-          if numInCollector > 0:
-            index,rlz = self._getRealizationFromCollectorByValue(matchDict,tol=tol)
+        if rlz is not None:
+          return index,rlz
+      # if no match found in data, try in the collector (if there's anything in it)
+      if numInCollector > 0:
+        index,rlz = self._getRealizationFromCollectorByValue(matchDict,tol=tol)
+        # collector indices follow the data
+        if rlz is not None:
+          index += numInData
       return index,rlz
 
   def remove(self,variable):
@@ -589,7 +621,8 @@ class DataSet(DataObject):
     if self._scaleFactors is not None:
       self._scaleFactors.pop(variable,None)
     #either way reset kdtree
-    self.inputKDTree = None
+    self._inputKDTree = None
+    self._resetMatchIndexes(variable)
 
   def renameVariable(self,old,new):
     """
@@ -623,6 +656,7 @@ class DataSet(DataObject):
     # change scaling factor entry
     if old in self._scaleFactors:
       self._scaleFactors[new] = self._scaleFactors.pop(old)
+    self._resetMatchIndexes(old)
     if self._data is not None:
       self._data.rename({old:new},inplace=True)
 
@@ -638,6 +672,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._matchIndexes = {}
 
   def sliceByIndex(self,index):
     """
@@ -666,18 +701,28 @@ class DataSet(DataObject):
       @ In, style, str, optional, options are enumerated below
       @ In, kwargs, dict, optional, additional arguments to pass to writing function
           Includes:  firstIndex, int, optional, if included then is the realization index that writing should start from (implies appending instead of rewriting)
+                     openFiles, dict, optional, if included then the CSV is appended through the light-weight writer
+                                (see _toCSVIncremental), keeping the file objects in this dictionary open between calls
+                     historyFormat, str, optional, 'split' (one CSV per history) or 'long' (single CSV), used with openFiles
+                     compression, str, optional, netCDF: if given, zlib compression is used; Parquet: codec (default 'snappy')
+                     chunkSize, int, optional, number of realizations per netCDF chunk or Parquet row group
       @ Out, index, int, index of latest rlz to be written, for tracking purposes
     """
     self.asDataset() #just in case there is stuff left in the collector
     if style.lower() == 'netcdf':
       self._toNetCDF(fileName,**kwargs)
+    elif style.lower() == 'parquet':
+      self._toParquet(fileName,**kwargs)
     elif style.lower() == 'csv':
       if len(self)==0: #TODO what if it's just metadata?
         self.raiseAWarning('Nothing to write to CSV! Checking metadata ...')
       else:
         #first write the CSV
         firstIndex = kwargs.get('firstIndex',0)
-        self._toCSV(fileName,start=firstIndex,**kwargs)
+        if kwargs.get('openFiles',None) is not None:
+          self._toCSVIncremental(fileName,start=firstIndex,**kwargs)
+        else:
+          self._toCSV(fileName,start=firstIndex,**kwargs)
       # then the metaxml
       if len(self._meta):
         self._toCSVXML(fileName,**kwargs)
@@ -764,9 +809,11 @@ class DataSet(DataObject):
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index - lenData,self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError,'Requested value change for realization "{}", which is past the end of the data object!'.format(index))
+    # indexed values for this variable are no longer valid
+    self._resetMatchIndexes(var)
 
   def _checkAlignedIndexes(self,rlz,tol=1e-15):
     """
@@ -910,7 +957,7 @@ class DataSet(DataObject):
     # method = 'once' # see below, parallelization is possible but not implemented
     # first case: single entry per node: floats, strings, ints, etc
     if utils.isSingleValued(data[i]):
-      data = np.array(data,dtype=dataType)
+      data = np.asarray(data,dtype=dataType)
       array = xr.DataArray(data,
                            dims=[self.sampleTag],
                            coords={self.sampleTag:labels},
@@ -1100,37 +1147,49 @@ class DataSet(DataObject):
           for index in dims:
             # if aligned, grab the data into one large chunk and make a datarray with all rlzs
             if index in self._alignedIndexes.keys():
-              data = np.vstack(self._collector[:,v]).astype(dtype)
+              # histories in the collector share one flat buffer, so aligned ones can be viewed as a matrix directly
+              data = self._collector.getUniformHistories(v) if self._collector.isRagged(v) else None
+              if data is None:
+                data = np.vstack(self._collector[:,v])
+              data = data.astype(dtype,copy=False)
               coords = dict((idx,self._alignedIndexes[idx]) for idx in dims)
               arrays[var] = self.constructNDSample(data,dims=[self.sampleTag]+dims,coords=coords)
             # otherwise, we're better off making one dataarray for each rlz, then collapsing
             else:
               # first make a datarray out of each realization value
+              indexColumns = dict((idx,self._orderedVars.index(idx)) for idx in dims)
+              samples = np.empty(len(self._collector),dtype=object)
               for r in range(len(self._collector)):
                 values = self._collector[r,v]
                 dtype = self._getCompatibleType(values[0])
                 values = np.array(values,dtype=dtype)
-                coords = dict((idx,self._collector[r,self._orderedVars.index(idx)]) for idx in dims)
-                self._collector[r][v] = self.constructNDSample(values,dims,coords,name=str(r))
+                coords = dict((idx,self._collector[r,col]) for idx,col in indexColumns.items())
+                samples[r] = self.constructNDSample(values,dims,coords,name=str(r))
               # then collapse these entries into a single datarray
-              arrays[var] = self._collapseNDtoDataArray(self._collector[:,v],var,dtype=dtype)
+              arrays[var] = self._collapseNDtoDataArray(samples,var,dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
         elif isinstance(self._collector[0,v],xr.DataArray):
           self.raiseAnError(NotImplementedError,'History entries should be numpy arrays, not data arrays!')
         # if not ND, then it's a simple data array construction
         else:
-          try:
-            varData = np.array(self._collector[:,v],dtype=dtype)
-          except ValueError as e:
-            # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
-              self.raiseAWarning('NaN detected, but no safe casting NaN to "{}" so switching to "object" type. '.format(dtype) \
-                  + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
-              dtype=object
-            # otherwise, let error be raised.
-            else:
-              raise e
+          column = self._collector.getColumn(v)
+          # typed columns that already match are used as they are (no copy)
+          if column.dtype == np.dtype(dtype):
+            varData = column
+          else:
+            column = column.astype(object)
+            try:
+              varData = np.array(column,dtype=dtype)
+            except ValueError as e:
+              # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
+              if dtype != float and pd.isnull(column).sum() != 0:
+                self.raiseAWarning('NaN detected, but no safe casting NaN to "{}" so switching to "object" type. '.format(dtype) \
+                    + ' This may cause problems with other entities in RAVEN.')
+                varData = column
+                dtype=object
+              # otherwise, let error be raised.
+              else:
+                raise e
           # create single dataarrays
           arrays[var] = self._collapseNDtoDataArray(varData,var,dtype=dtype)
         # END if for variable data type (ndarray, xarray, or scalar)
@@ -1240,6 +1299,15 @@ class DataSet(DataObject):
     # if nothing to load, return nothing
     if not haveMeta:
       return metadata
+    return self._parseGeneralMeta(meta)
+
+  def _parseGeneralMeta(self,meta):
+    """
+      Reads the general information (variables, indexes, sample tag) from the metadata written by a data object.
+      @ In, meta, xml.etree.ElementTree.Element, root of the metadata, containing the "DataSet" node
+      @ Out, metadata, dict, metadata discovered
+    """
+    metadata = {}
     tagNode = xmlUtils.findPath(meta,'DataSet/general/sampleTag')
     # read samplerTag
     if tagNode is not None:
@@ -1296,19 +1364,9 @@ class DataSet(DataObject):
     # make a collector from scratch
     rows = len(utils.first(source.values()))
     cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols],dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data,dtype=object)
+    # the collector takes the columns in bulk: 1-D arrays as scalars, 2-D arrays or arrays of arrays as histories
+    self._collector = self._newCollector(width=cols,length=max(rows,1))
+    self._collector.extend(list(source[var] for var in self._orderedVars))
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1325,12 +1383,59 @@ class DataSet(DataObject):
       @ Out, None
     """
     # TODO set up to use dask for on-disk operations -> or is that a different data object?
-    self._data = xr.open_dataset(fileName)
+    data = xr.open_dataset(fileName)
     # NOTE: open_dataset does NOT close the file object after loading (lazy loading)
     ## -> if you try to rm the file in Windows before closing, it will fail with WindowsError 32: file in use!
     # convert metadata back to XML files
-    for key,val in self._data.attrs.items():
-      self._meta[key] = pk.loads(val.encode('utf-8'))
+    for key,val in data.attrs.items():
+      try:
+        self._meta[key] = pk.loads(base64.b64decode(val))
+      except Exception:
+        # files written before the metadata were base64-encoded hold the plain pickle text
+        self._meta[key] = pk.loads(val.encode('utf-8'))
+    # only read what this data object needs, then release the file so it can be rewritten
+    toRead = self._loadBinaryMeta(list(data.data_vars.keys()),fileName)
+    self._data = data.drop(list(var for var in data.data_vars if var not in toRead)).load()
+    data.close()
+
+  def _fromParquet(self,fileName,**kwargs):
+    """
+      Reads this data object from an Apache Parquet file written by _toParquet (requires pyarrow).
+      Only the columns of the variables this data object needs are read.
+      @ In, fileName, str, path/name to read file
+      @ In, kwargs, dict, optional, additional arguments
+      @ Out, None
+    """
+    try:
+      import pyarrow.parquet as pq
+    except ImportError:
+      self.raiseAnError(ImportError,'The "pyarrow" library is required to read Parquet files!')
+    parquetFile = pq.ParquetFile(fileName)
+    metadata = parquetFile.schema.to_arrow_schema().metadata or {}
+    if b'RAVEN' not in metadata:
+      self.raiseAnError(IOError,'File "{}" was not written by a RAVEN data object!'.format(fileName))
+    stored = pk.loads(metadata[b'RAVEN'])
+    self._meta.update(stored['meta'])
+    # "dims" is {var:[indexes]} for every variable in the file
+    dims = stored['dims']
+    toRead = self._loadBinaryMeta(list(dims.keys()),fileName)
+    indexes = sorted(set(idx for var in toRead for idx in dims[var]))
+    self.raiseADebug('Reading data from "{}"'.format(fileName))
+    df = parquetFile.read(columns=[self.sampleTag]+indexes+toRead).to_pandas()
+    # scalars are repeated along the indexes, so take the first row of each realization
+    first = df.drop_duplicates(self.sampleTag)
+    data = xr.Dataset(dict((var,((self.sampleTag,),first[var].values)) for var in toRead if len(dims[var]) == 0),
+                      coords={self.sampleTag:first[self.sampleTag].values})
+    # index-dependent variables are rebuilt from their (sampleTag, indexes) rows, grouped by indexes
+    groups = {}
+    for var in toRead:
+      if len(dims[var]):
+        groups.setdefault(tuple(dims[var]),[]).append(var)
+    for group,variables in groups.items():
+      keys = [self.sampleTag] + list(group)
+      sub = df[keys+variables].drop_duplicates(keys).set_index(keys)
+      data = data.merge(xr.Dataset.from_dataframe(sub))
+    self._data = data
 
   def _fromXarrayDataset(self,dataset):
     """
@@ -1393,6 +1498,72 @@ class DataSet(DataObject):
       _type = object
     return _type
 
+  def _getMatchIndex(self,toMatch):
+    """
+      Obtains the index for finding realizations by the variables in "toMatch", creating it or adding
+      the realizations collected since the last search as needed.
+      @ In, toMatch, dict, elements to match as {var:val}
+      @ Out, index, realizationIndex.RealizationIndex, index of all realizations (or None if these variables can't be indexed)
+    """
+    floatKeys = []
+    exactKeys = []
+    for var in sorted(toMatch.keys()):
+      # only scalar variables can be indexed
+      if var not in self._orderedVars or var in self._pivotParams or any(var in deps for deps in self._pivotParams.values()):
+        return None
+      if utils.isAFloatOrInt(toMatch[var]):
+        floatKeys.append(var)
+      else:
+        exactKeys.append(var)
+    key = (tuple(floatKeys),tuple(exactKeys))
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    numInCollector = len(self._collector) if self._collector is not None else 0
+    index = self._matchIndexes.get(key)
+    # if realizations were removed from under the index, start over
+    if index is not None and index.size > numInData + numInCollector:
+      index = None
+    start = index.size if index is not None else 0
+    if start == numInData + numInCollector:
+      return index
+    # collect the values of the new realizations
+    values = {}
+    for var in floatKeys + exactKeys:
+      parts = []
+      if start < numInData:
+        parts.append(self._data[var].values[start:])
+      if numInCollector > 0:
+        parts.append(self._collector.getColumn(self._orderedVars.index(var))[max(start-numInData,0):])
+      values[var] = parts[0] if len(parts) == 1 else np.concatenate(parts)
+      # numbers are compared with tolerance, anything else has to be equal; mixed columns are searched directly
+      kind = values[var].dtype.kind
+      if var in floatKeys:
+        isValid = kind in 'biu' or values[var].dtype == np.float64
+      else:
+        isValid = kind in 'SU' or (kind == 'O' and not any(utils.isAFloatOrInt(v) for v in values[var]))
+      if not isValid:
+        self._matchIndexes.pop(key,None)
+        return None
+    numNew = numInData + numInCollector - start
+    floatValues = np.array(list(values[var] for var in floatKeys),dtype=float).T if floatKeys else np.zeros((numNew,0))
+    exactValues = list(zip(*(values[var] for var in exactKeys))) if exactKeys else [()]*numNew
+    if index is None:
+      # scale the tree by the known scaling factors, or by the spread of the values being indexed
+      loc = np.zeros(len(floatKeys))
+      scale = np.ones(len(floatKeys))
+      for v,var in enumerate(floatKeys):
+        if var in self._scaleFactors:
+          loc[v],scale[v] = self._scaleFactors[var]
+        else:
+          finite = floatValues[:,v][np.isfinite(floatValues[:,v])]
+          if len(finite):
+            loc[v],scale[v] = finite.mean(),finite.std()
+        if not (np.isfinite(loc[v]) and np.isfinite(scale[v]) and scale[v] > 0):
+          loc[v],scale[v] = 0.0,1.0
+      index = realizationIndex.RealizationIndex(floatKeys,exactKeys,loc,scale)
+      self._matchIndexes[key] = index
+    index.add(floatValues,exactValues)
+    return index
+
   def _getRealizationFromCollectorByIndex(self,index):
     """
       Obtains a realization from the collector storage using the provided index.
@@ -1492,6 +1663,55 @@ class DataSet(DataObject):
       return len(self),None
     return idx,self._getRealizationFromDataByIndex(idx,unpackXArray)
 
+  def _getRealizationIndexByValue(self,toMatch,tol=1e-15):
+    """
+      Finds the first realization matching "toMatch" using the realization index.  Candidates are checked
+      with the same criteria as the direct searches: in the data, numbers must match within "tol" after
+      scaling by the scaling factors; in the collector, numbers must match to relative tolerance "tol".
+      @ In, toMatch, dict, elements to match
+      @ In, tol, float, optional, tolerance to which match should be made
+      @ Out, index, int, index where match was found, OR size of data if not found, OR None if the index can't be used
+    """
+    # a tolerance this loose can't be turned into a search distance
+    if not 0 <= tol < 1:
+      return None
+    index = self._getMatchIndex(toMatch)
+    if index is None:
+      return None
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    numInCollector = len(self._collector) if self._collector is not None else 0
+    lookingFor = np.array(list(toMatch[var] for var in index.floatKeys),dtype=float)
+    # infinite and NaN requests are searched directly
+    if not np.all(np.isfinite(lookingFor)):
+      return None
+    # scaling used when comparing to the data, as in _getRealizationFromDataByValue
+    dataLoc = np.zeros(len(lookingFor))
+    dataScale = np.ones(len(lookingFor))
+    for v,var in enumerate(index.floatKeys):
+      if var in self._scaleFactors:
+        dataLoc[v],dataScale[v] = self._scaleFactors[var]
+        if dataScale[v] == 0:
+          dataScale[v] = 1.0
+    if not np.all(np.isfinite(dataScale)):
+      return None
+    # furthest distance along each variable that can still match, in the data or in the collector
+    radius = np.zeros(len(lookingFor))
+    if numInData > 0:
+      radius = np.maximum(radius,tol*np.abs(dataScale))
+    if numInCollector > 0:
+      radius = np.maximum(radius,tol*np.abs(lookingFor)/(1.0-tol))
+    floatVals = list(toMatch[var] for var in index.floatKeys)
+    exactVals = tuple(toMatch[var] for var in index.exactKeys)
+    for r in index.candidates(lookingFor,exactVals,radius):
+      values = index.getValues(r)
+      if r < numInData:
+        match = all(abs((values[v]-dataLoc[v])/dataScale[v] - (val-dataLoc[v])/dataScale[v]) < tol for v,val in enumerate(floatVals))
+      else:
+        match = all(mathUtils.compareFloats(val,values[v],tol=tol) for v,val in enumerate(floatVals))
+      if match:
+        return r
+    return len(self)
+
   def _getRequestedElements(self,options):
     """
       Obtains a list of the elements to be written, based on defaults and options[what]
@@ -1575,6 +1795,30 @@ class DataSet(DataObject):
     # otherwise, return happily and continue loading the CSV
     return dims
 
+  def _loadBinaryMeta(self,stored,fileName):
+    """
+      Registers the metadata read from a netCDF or Parquet file (as _loadCsvMeta does for CSVs) and selects the
+      variables to read from it: only the ones this data object needs.
+      @ In, stored, list(str), variables stored in the file
+      @ In, fileName, str, name of the file
+      @ Out, toRead, list(str), variables to read
+    """
+    if 'DataSet' in self._meta:
+      root = ET.Element('DataObjectMetadata')
+      root.append(self._meta['DataSet'].getRoot())
+      meta = self._parseGeneralMeta(root)
+      dims = meta.get('pivotParams',{})
+      metavars = list(var for var in meta.get('metavars',[]) if var in stored)
+      self.addExpectedMeta(metavars,dict((key,val) for key,val in dims.items() if key in metavars))
+    needed = set(self.getVars())
+    # a data object without variables takes everything
+    if len(needed) == 0:
+      return list(stored)
+    missing = needed - set(stored)
+    if len(missing) > 0:
+      self.raiseAnError(IOError,'Not all variables requested for data object "{}" were found in "{}"! Missing: {}'.format(self.name,fileName,','.join(sorted(missing))))
+    return list(var for var in stored if var in needed)
+
   def _newCollector(self,width=1,length=100,dtype=None):
     """
       Creates a new collector object and returns it.
@@ -1582,9 +1826,9 @@ class DataSet(DataObject):
       @ In, length, int, optional, initial length of (allocated) collector
       @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-    return cached_ndarray.cNDarray(width=width,length=length,dtype=dtype)
+    # NOTE: the columnar collector determines a type for each column from its entries, so "dtype" is
+    #   accepted for compatibility but not needed.
+    return cached_ndarray.cColumnarArray(width=width,length=length)
 
   def _readPandasCSV(self,fname,nullOK=None):
     """
@@ -1614,6 +1858,17 @@ class DataSet(DataObject):
       self.raiseAnError(IOError,'Invalid data in input file: row "{}" in "{}"'.format(bad+1,fname))
     return df
 
+  def _resetMatchIndexes(self,var=None):
+    """
+      Removes the indexes for finding realizations by value, usually because values changed in some way.
+      @ In, var, str, optional, if given then only removes indexes that include "var"
+      @ Out, None
+    """
+    if var is None:
+      self._matchIndexes = {}
+    else:
+      self._matchIndexes = dict((key,index) for key,index in self._matchIndexes.items() if var not in key[0]+key[1])
+
   def _resetScaling(self):
     """
       Removes the KDTree and scaling factors, usually because the data changed in some way
@@ -1737,6 +1992,89 @@ class DataSet(DataObject):
       self._usePandasWriteCSV(subName, data, ordered, keepSampleTag=self.sampleTag in keep, mode='w') # TODO append mode
       self.raiseADebug('Wrote sub-cluster file to "{}.csv"'.format(subName))
 
+  def _toCSVIncremental(self,fileName,start=0,openFiles=None,historyFormat='split',**kwargs):
+    """
+      Writes the realizations from "start" on to CSV file (except the general metadata, see _toCSVXML) without
+      the xarray/pandas round-trip of _toCSV, so that periodic printing only pays for the new realizations.
+      The file objects are stored in "openFiles" so the caller can keep appending to them (see OutStreamPrint).
+      @ In, fileName, str, path/name to write file
+      @ In, start, int, optional, first realization to start printing from (if > 0, implies append mode)
+      @ In, openFiles, dict, optional, {path:file object} of the files kept open between calls, filled here
+      @ In, historyFormat, str, optional, layout of history files (only used by HistorySet)
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    keep = self._getRequestedElements(kwargs)
+    ordered = list(var for var in itertools.chain(self._inputs,self._outputs,self._metavars) if var in keep)
+    # xr.Variables are accessed directly, since building a xr.DataArray for each is the expensive part
+    variables = self._data.variables
+    # clustering, reconstructed hierarchical paths and ND variables are left to the pandas writer
+    if 'clusterLabel' in kwargs or (not self.hierarchical and 'RAVEN_isEnding' in self.getVars()) \
+        or any(len(variables[var].dims) > 1 for var in ordered):
+      self._toCSV(fileName,start=start,**kwargs)
+      return
+    if openFiles is None:
+      openFiles = {}
+    columns = list(variables[var].values[start:] for var in ordered)
+    if self.sampleTag in keep:
+      ordered = [self.sampleTag] + ordered
+      columns = [variables[self.sampleTag].values[start:]] + columns
+    self.raiseADebug('Appending data from "{}" to CSV: "{}"'.format(self.name,fileName+'.csv'))
+    outFile = self._openCSVIncremental(fileName+'.csv',start,openFiles,ordered)
+    outFile.writelines(self._formatCSVRows(columns))
+    outFile.flush()
+
+  def _openCSVIncremental(self,path,start,openFiles,header):
+    """
+      Gets the file object to append CSV rows to, (re)opening it if needed.
+      @ In, path, str, path/name of the file (with extension)
+      @ In, start, int, first realization being printed (if 0, the file is rewritten starting from the header)
+      @ In, openFiles, dict, {path:file object} of the files kept open between calls
+      @ In, header, list(str), column names
+      @ Out, outFile, file, file object to write to
+    """
+    outFile = openFiles.get(path,None)
+    if start == 0 or outFile is None:
+      if outFile is not None:
+        outFile.close()
+      outFile = open(path,'w' if start == 0 else 'a')
+      openFiles[path] = outFile
+      if start == 0:
+        outFile.write(','.join(header)+'\n')
+    return outFile
+
+  def _formatCSVRows(self,columns):
+    """
+      Formats columns of values into CSV lines, the same way pandas would print them.
+      @ In, columns, list(np.array), 1D arrays of values, one per column, all of the same length
+      @ Out, rows, list(str), CSV lines (including the line terminator)
+    """
+    formatted = list(self._formatCSVColumn(column) for column in columns)
+    return list(','.join(row)+'\n' for row in zip(*formatted))
+
+  def _formatCSVColumn(self,values):
+    """
+      Formats an array of values into CSV entries: shortest round-trip representation for floats,
+      empty entries for NaN/None and quoting for strings containing separators.
+      @ In, values, np.array, 1D array of values
+      @ Out, entries, list(str), formatted entries
+    """
+    kind = values.dtype.kind
+    if kind == 'f':
+      return list(repr(v) if v == v else '' for v in values.tolist())
+    if kind in 'iub':
+      return list('{}'.format(v) for v in values.tolist())
+    entries = []
+    for v in values.tolist():
+      if v is None or (isinstance(v,float) and v != v):
+        entries.append('')
+        continue
+      entry = repr(v) if isinstance(v,float) else '{}'.format(v)
+      if ',' in entry or '"' in entry or '\n' in entry:
+        entry = '"{}"'.format(entry.replace('"','""'))
+      entries.append(entry)
+    return entries
+
   def _toCSVXML(self,fileName,**kwargs):
     """
       Writes the general metadata of this data object to XML file
@@ -1776,14 +2114,27 @@ class DataSet(DataObject):
         genNode.remove(r)
 
     self.raiseADebug('Printing metadata XML: "{}"'.format(fileName+'.xml'))
-    with open(fileName+'.xml','w') as ofile:
-      #header
-      ofile.writelines('<DataObjectMetadata name="{}">\n'.format(self.name))
-      for name in sorted(list(meta.keys())):
-        target = meta[name]
-        xml = xmlUtils.prettify(target.getRoot(),startingTabs=1,addRavenNewlines=False)
-        ofile.writelines('  {}\n'.format(xml))
-      ofile.writelines('</DataObjectMetadata>\n')
+    lines = ['<DataObjectMetadata name="{}">\n'.format(self.name)]
+    for name in sorted(list(meta.keys())):
+      target = meta[name]
+      xml = xmlUtils.prettify(target.getRoot(),startingTabs=1,addRavenNewlines=False)
+      lines.append('  {}\n'.format(xml))
+    lines.append('</DataObjectMetadata>\n')
+    # with the light-weight CSV writer (see _toCSVIncremental) the file is kept open and rewritten in place
+    openFiles = kwargs.get('openFiles',None)
+    if openFiles is None:
+      with open(fileName+'.xml','w') as ofile:
+        ofile.writelines(lines)
+    else:
+      ofile = openFiles.get(fileName+'.xml',None)
+      if ofile is None:
+        ofile = open(fileName+'.xml','w')
+        openFiles[fileName+'.xml'] = ofile
+      else:
+        ofile.seek(0)
+        ofile.truncate()
+      ofile.writelines(lines)
+      ofile.flush()
 
   def _toNetCDF(self,fileName,**kwargs):
     """
@@ -1795,9 +2146,69 @@ class DataSet(DataObject):
       @ Out, None
     """
     # TODO set up to use dask for on-disk operations -> or is that a different data object?
-    # convert metadata into writeable
-    self._data.attrs = dict((key,pk.dumps(val)) for key,val in self._meta.items())
-    self._data.to_netcdf(fileName,**kwargs)
+    keep = self._getRequestedElements(kwargs)
+    data = self._data.drop(list(var for var in self._data.data_vars if var not in keep))
+    # convert metadata into writeable (netCDF attributes must be text)
+    data.attrs = dict((key,base64.b64encode(pk.dumps(val,protocol=2)).decode('ascii')) for key,val in self._meta.items())
+    options = dict((key,val) for key,val in kwargs.items() if key in ['format','engine','mode','group','unlimited_dims'])
+    # chunking and compression are only applied if requested, numeric variables only
+    compression = kwargs.get('compression',None)
+    chunkSize = kwargs.get('chunkSize',None)
+    if compression is not None or chunkSize is not None:
+      encoding = {}
+      for var in data.data_vars:
+        if data[var].dtype.kind not in 'biuf':
+          continue
+        encoding[var] = {}
+        if compression is not None:
+          encoding[var]['zlib'] = True
+          encoding[var]['complevel'] = int(kwargs.get('complevel',4))
+        if chunkSize is not None:
+          encoding[var]['chunksizes'] = tuple(min(int(chunkSize),size) if dim == self.sampleTag else size
+                                              for dim,size in zip(data[var].dims,data[var].shape))
+      options['encoding'] = encoding
+    data.to_netcdf(fileName,**options)
+
+  def _toParquet(self,fileName,**kwargs):
+    """
+      Writes this data object to an Apache Parquet file (requires pyarrow).
+      Each row is a realization for scalar data; for index-dependent data each row is a (realization, index) point,
+      with the scalars repeated.  The RAVEN metadata and the variable dimensions are stored in the file schema.
+      @ In, fileName, str, path/name to write file
+      @ In, kwargs, dict, optional, additional arguments, including:
+                                      compression, str, codec to use (default 'snappy')
+                                      chunkSize, int, number of realizations per row group
+      @ Out, None
+    """
+    try:
+      import pyarrow as pa
+      import pyarrow.parquet as pq
+    except ImportError:
+      self.raiseAnError(ImportError,'The "pyarrow" library is required to write Parquet files!')
+    keep = self._getRequestedElements(kwargs)
+    ordered = list(var for var in itertools.chain(self._inputs,self._outputs,self._metavars) if var in keep)
+    dims = dict((var,list(self.getDimensions(var)[var])) for var in ordered)
+    ndVars = list(var for var in ordered if len(dims[var]))
+    if len(ndVars) == 0:
+      df = pd.DataFrame(dict([(self.sampleTag,self._data[self.sampleTag].values)] +
+                             list((var,self._data[var].values) for var in ordered)),
+                        columns=[self.sampleTag]+ordered)
+      rowsPerRlz = 1
+    else:
+      data = self._data[ordered]
+      df = data.to_dataframe().reset_index()
+      # histories of different lengths are padded with NaN; drop the padding but keep at least one row per realization
+      padding = df[ndVars].isnull().all(axis=1).values & df.duplicated(self.sampleTag).values
+      df = df[~padding]
+      rowsPerRlz = max(1,int(np.ceil(len(df)/float(max(1,len(self))))))
+      df = df[[self.sampleTag] + sorted(dim for dim in data.dims if dim != self.sampleTag) + ordered]
+    table = pa.Table.from_pandas(df,preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b'RAVEN'] = pk.dumps({'meta':self._meta,'dims':dims},protocol=2)
+    table = table.replace_schema_metadata(metadata)
+    chunkSize = kwargs.get('chunkSize',None)
+    rowGroupSize = None if chunkSize is None else int(chunkSize)*rowsPerRlz
+    pq.write_table(table,fileName,compression=kwargs.get('compression','snappy'),row_group_size=rowGroupSize)
 
   def _usePandasWriteCSV(self,fileName,data,ordered,keepSampleTag=False,keepIndex=False,mode='w'):
     """
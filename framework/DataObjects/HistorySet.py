@@ -140,6 +140,8 @@ class HistorySet(DataSet):
     # pre-build realization spots
     for out in self._outputs + self.indexes + self._outputMetaVars:
       data[out] = np.zeros(nSamples,dtype=object)
+    # long-format CSVs (see _toCSVIncremental) hold many histories, so they are read once; {path:{sample id:history}}
+    longFiles = {}
     # read in secondary CSVs
     for i,sub in enumerate(subFiles):
       subFile = sub
@@ -147,7 +149,18 @@ class HistorySet(DataSet):
       if not os.path.isabs(subFile):
         subFile = os.path.join(os.path.dirname(fileName),subFile)
       # read in file
-      subDat = self._readPandasCSV(subFile)
+      if subFile not in longFiles:
+        subDat = self._readPandasCSV(subFile)
+        # the long format prints the sample IDs in both files (the clustered CSVs only in the histories)
+        if labels is not None and self.sampleTag in subDat:
+          longFiles[subFile] = self._groupLongHistories(subDat)
+      if subFile in longFiles:
+        # histories in long format are matched to the main CSV rows through their sample ID
+        histories = longFiles[subFile]
+        if labels[i] not in histories:
+          self.raiseAnError(IOError,'Importing HistorySet from .csv: no history found in "{}" for {} "{}" (row {} of "{}")!'
+                                    .format(subFile,self.sampleTag,labels[i],i+1,fileName+'.csv'))
+        subDat = histories[labels[i]]
       # first time create structures
       if len(set(subDat.keys()).intersection(self.indexes)) != len(self.indexes):
         self.raiseAnError(IOError,'Importing HistorySet from .csv: the pivot parameters "'+', '.join(self.indexes)+'" have not been found in the .csv file. Check that the '
@@ -173,8 +186,19 @@ class HistorySet(DataSet):
         subFile = os.path.join(os.path.dirname(fileName),subFile)
     with open(subFile,'r') as sub:
       outputAvail = list(s.strip() for s in sub.readline().split(','))
+    # long-format CSVs also carry the sample tag, which is not an output
+    outputAvail = list(var for var in outputAvail if var != self.sampleTag)
     return inputAvail + outputAvail
 
+  def _groupLongHistories(self,subDat):
+    """
+      Splits a long-format history CSV (one row per sample and pivot value) into its histories.
+      @ In, subDat, pd.DataFrame, contents of the long-format CSV
+      @ Out, histories, dict, {sample id:pd.DataFrame of the history}
+    """
+    histories = dict((label,history) for label,history in subDat.groupby(self.sampleTag,sort=False))
+    return histories
+
   def _selectiveRealization(self,rlz):
     """
       Uses "options" parameters from input to select part of the collected data
@@ -303,6 +327,74 @@ class HistorySet(DataSet):
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
 
+  def _toCSVIncremental(self,fileName,start=0,openFiles=None,historyFormat='split',**kwargs):
+    """
+      Writes the histories from "start" on to CSV files (for metadata see _toCSVXML) without the xarray/pandas
+      round-trip of _toCSV. With historyFormat "long", instead of one CSV per history, all the histories are appended
+      to a single "<fileName>_histories.csv" with one row per sample and pivot value, and the sample IDs are always
+      printed in the main CSV to match them back (see _fromCSV).
+      @ In, fileName, str, path/name to write file
+      @ In, start, int, optional, starting realization to print
+      @ In, openFiles, dict, optional, {path:file object} of the files kept open between calls, filled here
+      @ In, historyFormat, str, optional, either "split" (one CSV per history) or "long" (single CSV)
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    # reconstructed hierarchical histories are left to the pandas writer
+    if not self.hierarchical and 'RAVEN_isEnding' in self.getVars():
+      self._toCSV(fileName,start=start,**kwargs)
+      return
+    if openFiles is None:
+      openFiles = {}
+    keep = self._getRequestedElements(kwargs)
+    variables = self._data.variables
+    sampleIDs = variables[self.sampleTag].values[start:]
+    baseName = os.path.split(fileName)[1]
+    self.raiseADebug('Appending data to CSV: "{}"'.format(fileName+'.csv'))
+    ## write input space CSV with pointers to history CSVs
+    ordered = list(i for i in itertools.chain(self._inputs,self._inputMetaVars) if i in keep)
+    columns = list(variables[var].values[start:] for var in ordered)
+    if historyFormat == 'long':
+      subFiles = np.array([baseName+'_histories.csv']*len(sampleIDs),dtype=object)
+    else:
+      subFiles = np.array(list('{}_{}.csv'.format(baseName,rid) for rid in sampleIDs),dtype=object)
+    ordered.append('filename')
+    columns.append(subFiles)
+    # the long-format histories are found back through the sample IDs, so these are always printed
+    if self.sampleTag in keep or historyFormat == 'long':
+      ordered = [self.sampleTag] + ordered
+      columns = [sampleIDs] + columns
+    mainFile = self._openCSVIncremental(fileName+'.csv',start,openFiles,ordered)
+    mainFile.writelines(self._formatCSVRows(columns))
+    mainFile.flush()
+    ## write the histories
+    ordered = list(o for o in itertools.chain(self._outputs,self._outputMetaVars) if o in keep)
+    if not len(ordered):
+      self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
+      return
+    pivot = self.indexes[0]
+    pivotValues = variables[pivot].values
+    histories = list(variables[var].transpose(self.sampleTag,pivot).values[start:] for var in ordered)
+    # histories share the pivot coordinate, so drop the entries past the end of each history (as dropna does)
+    valid = np.ones(histories[0].shape,dtype=bool)
+    for values in histories:
+      valid &= ~pd.isnull(values)
+    if historyFormat == 'long':
+      longFile = self._openCSVIncremental(fileName+'_histories.csv',start,openFiles,[self.sampleTag,pivot]+ordered)
+      columns = [np.repeat(sampleIDs,valid.sum(axis=1)),np.tile(pivotValues,len(sampleIDs))[valid.ravel()]]
+      columns += list(values[valid] for values in histories)
+      longFile.writelines(self._formatCSVRows(columns))
+      longFile.flush()
+    else:
+      header = ','.join([pivot]+ordered)+'\n'
+      dirName = os.path.dirname(fileName)
+      for s,subFile in enumerate(subFiles):
+        rows = valid[s]
+        columns = [pivotValues[rows]] + list(values[s][rows] for values in histories)
+        with open(os.path.join(dirName,subFile),'w') as outFile:
+          outFile.write(header)
+          outFile.writelines(self._formatCSVRows(columns))
+
   def addExpectedMeta(self,keys, params={}):
     """
       Registers meta to look for in realizations.
@@ -34,8 +34,10 @@ import collections
 
 #Internal Modules------------------------------------------------------------------------------------
 from BaseClasses import BaseType
-from h5py_interface_creator import hdf5Database as h5Data
 from utils import utils
+from utils import importerUtils
+# h5py is only loaded if a database is used
+h5pyInterface = importerUtils.importModuleLazy('h5py_interface_creator')
 from utils import InputData
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -65,6 +67,8 @@ class DateBase(BaseType):
     inputSpecification.addParam("directory", InputData.StringType)
     inputSpecification.addParam("filename", InputData.StringType)
     inputSpecification.addParam("readMode", InputData.makeEnumType("readMode","readModeType",["overwrite","read"]), True)
+    inputSpecification.addParam("layout", InputData.makeEnumType("layout","layoutType",["hierarchical","columnar"]))
+    inputSpecification.addParam("compression", InputData.makeEnumType("compression","compressionType",["none","gzip","lzf"]))
     inputSpecification.addSub(InputData.parameterInputFactory("variables", contentType=InputData.StringListType))
     return inputSpecification
 
@@ -89,6 +93,11 @@ class DateBase(BaseType):
     varNode = paramInput.findFirst("variables")
     if varNode is not None:
       self.variables =  varNode.value
+    # read the layout and the compression
+    if 'layout' in paramInput.parameterValues:
+      self.layout = paramInput.parameterValues['layout']
+    if 'compression' in paramInput.parameterValues:
+      self.compression = paramInput.parameterValues['compression']
     # read mode
     self.readMode = paramInput.parameterValues['readMode'].strip().lower()
     self.raiseADebug('HDF5 Read Mode is "'+self.readMode+'".')
@@ -103,15 +112,29 @@ class DateBase(BaseType):
         self.exist = True
       elif self.readMode == 'overwrite':
         self.exist = False
-      self.database = h5Data(self.name,self.databaseDir,self.messageHandler,self.filename,self.exist,self.variables)
     else:
       #file does not exist in path
       if self.readMode == 'read':
         self.raiseAnError(IOError, 'Requested to read from database, but it does not exist at:',fullpath,'; The path to the database must be either absolute or relative to <workingDir>!')
       self.exist = False
-      self.database  = h5Data(self.name,self.databaseDir,self.messageHandler,self.filename,self.exist,self.variables)
+    self._createDatabase()
     self.raiseAMessage('Database is located at:',fullpath)
 
+  def _createDatabase(self):
+    """
+      Function to create (or open, if it exists) the database instance.
+      The layout of an existing database is the one it has been written with.
+      @ In, None
+      @ Out, None
+    """
+    if self.exist:
+      self.layout = h5pyInterface.storedLayout(os.path.join(self.databaseDir,self.filename))
+    self.raiseADebug('HDF5 layout is "'+self.layout+'".')
+    if self.layout == 'columnar':
+      self.database = h5pyInterface.hdf5ColumnarDatabase(self.name,self.databaseDir,self.messageHandler,self.filename,self.exist,self.variables,self.compression)
+    else:
+      self.database = h5pyInterface.hdf5Database(self.name,self.databaseDir,self.messageHandler,self.filename,self.exist,self.variables)
+
 
   def __init__(self,runInfoDict):
     """
@@ -128,6 +151,8 @@ class DateBase(BaseType):
     self.databaseDir = self.workingDir  # Database directory. Default = working directory.
     self.printTag = 'DATABASE'          # For printing verbosity labels
     self.variables = None               # if not None, list of specific variables requested to be stored by user
+    self.layout = 'hierarchical'        # layout of the database ("hierarchical" => a group per realization, "columnar" => a dataset per variable)
+    self.compression = 'gzip'           # compression of the datasets (columnar layout only)
 
   @abc.abstractmethod
   def addGroup(self,attributes,loadFrom):
@@ -171,6 +196,7 @@ class HDF5(DateBase):
     self._metavars = []
     self._allvars  = []
     self.printTag = 'DATABASE HDF5'
+    self.readChunkSize = 1000  # number of realizations read at once (and kept in memory) by allRealizations
 
 
   def __getstate__(self):
@@ -199,7 +225,7 @@ class HDF5(DateBase):
     """
     self.__dict__.update(newstate)
     self.exist    = True
-    self.database = h5Data(self.name,self.databaseDir,self.messageHandler,self.filename,self.exist)
+    self._createDatabase()
 
   def getInitParams(self):
     """
@@ -240,6 +266,23 @@ class HDF5(DateBase):
     self.database.addGroup(rlz)
     self.built = True
 
+  def addRealizationBatch(self,batch):
+    """
+      Adds several "rows" (or "samples") to this database at once.
+      With the "columnar" layout, each dataset is extended just once for the whole batch.
+      @ In, batch, dict, {var:np.ndarray} with the realizations along the first axis
+                         (as built by utils.stackRealizations).
+      @ Out, None
+    """
+    rlzs = utils.unstackRealizations(batch)
+    start = len(self.database)
+    for index, rlz in enumerate(rlzs):
+      # prefix must be present
+      if 'prefix' not in rlz:
+        rlz['prefix'] = start + index
+    self.database.addGroups(rlzs)
+    self.built = True
+
   def addExpectedMeta(self,keys,params={}):
     """
       Registers meta to look for in realizations.
@@ -281,17 +324,20 @@ class HDF5(DateBase):
     tupleVar = self.database.retrieveHistory(options['history'],options)
     return tupleVar
 
-  def allRealizations(self):
+  def allRealizations(self,variables=None):
     """
-      Casts this database as an xr.Dataset.
-      Efficiency note: this is the slowest part of typical data collection.
-      @ In, None
-      @ Out, allData, list of arrays, all the data from this data object.
+      Iterates over all the realizations of this database.
+      Efficiency note: this is the slowest part of typical data collection. The realizations are read
+      "readChunkSize" at a time, so the memory needed does not depend on the size of the database.
+      @ In, variables, list, optional, the variables to read (None => all the variables)
+      @ Out, allData, generator, all the realizations (dictionaries) from this database
     """
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
-    allData = [self.realization(name) for name in allRealizationNames]
+    if (not self.exist) and (not self.built):
+      self.raiseAnError(Exception,'Can not retrieve a realization from Database' + self.name + '.It has not been built yet!')
+    allData = self.database.realizationIterator(allRealizationNames,{'reconstruct':True,'variables':variables},self.readChunkSize)
     return allData
 
   def realization(self,index=None,matchDict=None,tol=1e-15):
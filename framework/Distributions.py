@@ -27,6 +27,7 @@ warnings.simplefilter('default',DeprecationWarning)
 import sys
 import numpy as np
 import scipy
+import six
 from math import gamma
 import os
 import operator
@@ -380,14 +381,25 @@ class BoostDistribution(Distribution):
     self.dimensionality  = 1
     self.disttype        = 'Continuous'
 
+  def _evaluateVector(self,function,x):
+    """
+      Evaluates a crow vector function on every entry of an array in one call, keeping its shape.
+      @ In, function, callable, crow function taking the distribution and a vector of floats
+      @ In, x, array-like, values to evaluate at
+      @ Out, values, np.array, evaluated values, with the same shape as x
+    """
+    x = np.asarray(x,dtype=float)
+    values = np.array(function(self._distribution,x.ravel().tolist()),dtype=float)
+    return values.reshape(x.shape)
+
   def cdf(self,x):
     """
       Function to get the cdf at a provided coordinate
-      @ In, x, float, value to get the cdf at
-      @ Out, retunrCdf, float, requested cdf
+      @ In, x, float or array-like, value(s) to get the cdf at
+      @ Out, retunrCdf, float or np.array, requested cdf
     """
     if hasattr(x,'__len__'):
-      returnCdf = np.array([self.cdf(i) for i in x])
+      returnCdf = self._evaluateVector(distribution1D.cdfVector,x)
     else:
       returnCdf = self._distribution.cdf(x)
     return returnCdf
@@ -395,12 +407,11 @@ class BoostDistribution(Distribution):
   def ppf(self,x):
     """
       Function to get the inverse cdf at a provided coordinate
-      @ In, x, float, value to get the inverse cdf at
-      @ Out, retunrPpf, float, requested inverse cdf
+      @ In, x, float or array-like, value(s) to get the inverse cdf at
+      @ Out, retunrPpf, float or np.array, requested inverse cdf
     """
-    # TODO speed this up by doing it in Crow, not in python
     if hasattr(x,'__len__'):
-      returnPpf = np.array([self.ppf(i) for i in x])
+      returnPpf = self._evaluateVector(distribution1D.inverseCdfVector,x)
     else:
       returnPpf = self._distribution.inverseCdf(x)
     return returnPpf
@@ -408,10 +419,13 @@ class BoostDistribution(Distribution):
   def pdf(self,x):
     """
       Function to get the pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, returnPdf, float, requested pdf
+      @ In, x, float or array-like, value(s) to get the pdf at
+      @ Out, returnPdf, float or np.array, requested pdf
     """
-    returnPdf = self._distribution.pdf(x)
+    if hasattr(x,'__len__'):
+      returnPdf = self._evaluateVector(distribution1D.pdfVector,x)
+    else:
+      returnPdf = self._distribution.pdf(x)
     return returnPdf
 
   def untruncatedCdfComplement(self, x):
@@ -473,8 +487,8 @@ class BoostDistribution(Distribution):
     if size is None:
       rvsValue = self.ppf(random())
     else:
-      # TODO to speed up, do this on the C side instead of in python
-      rvsValue = np.array([self.rvs() for _ in range(size)])
+      # same draws, in the same order, as calling rvs() "size" times
+      rvsValue = self.ppf(random(1,size,keepMatrix=True)[:,0])
     return rvsValue
 
 class Uniform(BoostDistribution):
@@ -1664,9 +1678,11 @@ class Categorical(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, float/string, value to get the pdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float/string or array-like, value(s) to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__') and not isinstance(x,six.string_types):
+      return np.array([self.pdf(i) for i in x])
     if x in self.values:
       pdfValue =  self.mapping[x]
     else:
@@ -1676,9 +1692,11 @@ class Categorical(Distribution):
   def cdf(self,x):
     """
       Function to get the cdf value of x
-      @ In, x, float/string, value to get the cdf at
-      @ Out, cumulative, float, requested cdf
+      @ In, x, float/string or array-like, value(s) to get the cdf at
+      @ Out, cumulative, float or np.array, requested cdf
     """
+    if hasattr(x,'__len__') and not isinstance(x,six.string_types):
+      return np.array([self.cdf(i) for i in x])
     sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
     if x in self.values:
       cumulative=0.0
@@ -1692,9 +1710,11 @@ class Categorical(Distribution):
   def ppf(self,x):
     """
       Function that calculates the inverse of the cdf given 0 =< x =< 1
-      @ In, x, float, value to get the ppf at
-      @ Out, element[0], float/string, requested inverse cdf
+      @ In, x, float or array-like, value(s) to get the ppf at
+      @ Out, element[0], float or np.array, requested inverse cdf
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.ppf(i) for i in x])
     sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
     cumulative=0.0
     for element in sortedMapping:
@@ -2537,8 +2557,8 @@ class Custom1D(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, scalar , coordinates to get the pdf at
-      @ Out, pdfValue, scalar, requested pdf
+      @ In, x, float or array-like, coordinates to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
     pdfValue = self.pdfFunc(x)
     return pdfValue
@@ -2546,11 +2566,13 @@ class Custom1D(Distribution):
   def cdf(self,x):
     """
       Function that calculates the cdf value of x
-      @ In, x, scalar , coordinates to get the cdf at
-      @ Out, pdfValue, scalar, requested pdf
+      @ In, x, float or array-like, coordinates to get the cdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
     if self.functionType == 'cdf':
       cdfValue = self.cdfFunc(x)
+    elif np.ndim(x) > 0:
+      cdfValue = np.array([self.pdfFunc.integral(self.data[0][0],i) for i in x])
     else:
       cdfValue = self.pdfFunc.integral(self.data[0][0],x)
     return cdfValue
@@ -2558,8 +2580,8 @@ class Custom1D(Distribution):
   def ppf(self,x):
     """
       Return the ppf of given coordinate
-      @ In, x, float, the x coordinates
-      @ Out, ppfValue, float, ppf values
+      @ In, x, float or array-like, the x coordinates
+      @ Out, ppfValue, float or np.array, ppf values
     """
     ppfValue = self.invCDF(x)
     return ppfValue
@@ -2641,9 +2663,11 @@ class LogUniform(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, float , coordinates to get the pdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float or array-like, coordinates to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.pdf(i) for i in x])
     if self.base == 'natural':
       pdfValue = 1./(self.upperBound-self.lowerBound) * 1./x
     else:
@@ -2654,9 +2678,11 @@ class LogUniform(Distribution):
   def cdf(self,x):
     """
       Function that calculates the cdf value of x
-      @ In, x, float , coordinates to get the cdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float or array-like, coordinates to get the cdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.cdf(i) for i in x])
     if self.base == 'natural':
       cdfValue = (math.log(x)-self.lowerBound)/(self.upperBound-self.lowerBound)
     else:
@@ -2666,9 +2692,11 @@ class LogUniform(Distribution):
   def ppf(self,x):
     """
       Return the ppf of given coordinate
-      @ In, x, float, the x coordinates
-      @ Out, ppfValue, float, ppf values
+      @ In, x, float or array-like, the x coordinates
+      @ Out, ppfValue, float or np.array, ppf values
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.ppf(i) for i in x])
     if self.base == 'natural':
       ppfValue = math.exp((self.upperBound-self.lowerBound)*x + self.lowerBound)
     else:
@@ -68,8 +68,14 @@ class JobHandler(MessageHandler.MessageUser):
     self.runInfoDict      = {}
 
     self.isParallelPythonInitialized = False
-
-    self.sleepTime  = 1e-4 #0.005
+    ## Internal parallel backends, set up when the first internal job is added
+    self.ppserver    = None
+    self.processPool = None
+
+    ## Longest time the polling loop waits for a job event before checking the
+    ## queues anyway. Runners signal when they are done, so this is only a
+    ## safety net.
+    self.maxWaitTime = 0.1
     self.completed = False
 
     ## Determines whether to collect and print job timing summaries at the end of job runs.
@@ -108,6 +114,15 @@ class JobHandler(MessageHandler.MessageUser):
 
     self.__queueLock = threading.RLock()
 
+    ## Wakes up the polling loop: set when a job is queued, a job is done, or
+    ## the handler is shut down
+    self.__loopEvent = threading.Event()
+
+    ## Wakes up whoever waits on the jobs (steps, models): notified, with a new
+    ## event number, when a job is finished or leaves the pending queue
+    self.__jobEvent = threading.Condition(threading.Lock())
+    self.__jobEventCount = 0
+
     ## List of submitted job identifiers, includes jobs that have completed as
     ## this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -168,13 +183,25 @@ class JobHandler(MessageHandler.MessageUser):
       Internal method that is aimed to initialize the internal parallel system.
       It initilizes the paralle python implementation (with socketing system) in
       case RAVEN is run in a cluster with multiple nodes or the NumMPI > 1,
-      otherwise multi-threading is used.
+      or a pool of persistent local processes if the internalParallelMethod is
+      processPool, otherwise multi-threading is used.
       @ In, None
       @ Out, None
     """
+    ## The process pool only runs on the local machine
+    useProcessPool = self.runInfoDict['internalParallel'] and self.runInfoDict.get('internalParallelMethod','parallelPython') == 'processPool'
+    if useProcessPool and len(set(nodeId.strip() for nodeId in self.runInfoDict['Nodes'])) > 1:
+      self.raiseAWarning('internalParallelMethod "processPool" only uses the local machine: switching to "parallelPython" to reach the other nodes')
+      useProcessPool = False
+
     ## Check if the list of unique nodes is present and, in case, initialize the
     ## socket
-    if self.runInfoDict['internalParallel']:
+    if useProcessPool:
+      ## Persistent local processes, one per available core
+      self.ppserver = None
+      numWorkers = len(self.runInfoDict['Nodes']) if len(self.runInfoDict['Nodes']) > 0 else int(self.runInfoDict['totalNumCoresUsed'])
+      self.processPool = Runners.ProcessPool(numWorkers, self.messageHandler)
+    elif self.runInfoDict['internalParallel']:
       if len(self.runInfoDict['Nodes']) > 0:
         availableNodes = [nodeId.strip() for nodeId in self.runInfoDict['Nodes']]
 
@@ -291,14 +318,56 @@ class JobHandler(MessageHandler.MessageUser):
     This function begins the polling loop for the JobHandler where it will
     constantly fill up its running queue with jobs in its pending queue and
     unload finished jobs into its finished queue to be extracted by
+    other threads. Between passes it sleeps until a job is queued or done.
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
+      ## clear before looking at the queues, so anything happening from now on
+      ## wakes us up again
+      self.__loopEvent.clear()
       self.fillJobQueue()
       self.cleanJobQueue()
-      ## TODO May want to revisit this:
-      ## http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      ## probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      self.__loopEvent.wait(self.maxWaitTime)
+
+  def lastJobEvent(self):
+    """
+      Returns the number of the last job event (a job finished or left the
+      pending queue), to be passed to waitForJobEvent.
+      @ In, None
+      @ Out, lastJobEvent, int, number of the last job event
+    """
+    with self.__jobEvent:
+      return self.__jobEventCount
+
+  def waitForJobEvent(self, lastEvent, timeout):
+    """
+      Blocks until there is a job event (a job finished or left the pending
+      queue) newer than "lastEvent", or until "timeout" seconds have passed.
+      Typical use:
+        event = jobHandler.lastJobEvent()
+        while not done:
+          (collect finished jobs, submit new ones)
+          event = jobHandler.waitForJobEvent(event, timeout)
+      @ In, lastEvent, int, number of the last job event already handled by the
+        caller (from lastJobEvent or a previous call to this method)
+      @ In, timeout, float, maximum time to wait (seconds)
+      @ Out, lastJobEvent, int, number of the last job event
+    """
+    with self.__jobEvent:
+      if self.__jobEventCount == lastEvent:
+        self.__jobEvent.wait(timeout)
+      return self.__jobEventCount
+
+  def __notifyJobEvent(self):
+    """
+      Wakes up whoever is waiting in waitForJobEvent.
+      @ In, None
+      @ Out, None
+    """
+    with self.__jobEvent:
+      self.__jobEventCount += 1
+      self.__jobEvent.notify_all()
 
   def addJob(self, args, functionToRun, identifier, metadata=None, modulesToImport = [], forceUseThreads = False, uniqueHandler="any", clientQueue = False):
     """
@@ -328,12 +397,19 @@ class JobHandler(MessageHandler.MessageUser):
     if not self.isParallelPythonInitialized:
       self.__initializeParallelPython()
 
-    if self.ppserver is None or forceUseThreads:
+    if (self.ppserver is None and self.processPool is None) or forceUseThreads:
       internalJob = Runners.SharedMemoryRunner(self.messageHandler, args,
                                                functionToRun,
                                                identifier, metadata,
                                                uniqueHandler,
                                                profile=self.__profileJobs)
+    elif self.processPool is not None:
+      internalJob = Runners.ProcessPoolRunner(self.messageHandler,
+                                              self.processPool, args,
+                                              functionToRun,
+                                              identifier, metadata,
+                                              uniqueHandler,
+                                              profile=self.__profileJobs)
     else:
       skipFunctions = [utils.metaclass_insert(abc.ABCMeta,BaseType)]
       internalJob = Runners.DistributedMemoryRunner(self.messageHandler,
@@ -355,6 +431,7 @@ class JobHandler(MessageHandler.MessageUser):
       @ In, runner, Runner Instance, this is the instance of the runner that we want to readd in the queque
       @ Out, None
     """
+    runner.setFinishedCallback(self.__loopEvent.set)
     with self.__queueLock:
       if not runner.clientRunner:
         self.__queue.append(runner)
@@ -363,6 +440,7 @@ class JobHandler(MessageHandler.MessageUser):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+    self.__loopEvent.set()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, modulesToImport = [], uniqueHandler="any"):
     """
@@ -608,6 +686,7 @@ class JobHandler(MessageHandler.MessageUser):
     ## self.__running variable, so we should be able to safely query this outside
     ## of the lock given that this function is called only on that thread as well.
     emptySlots = [i for i,run in enumerate(self.__running) if run is None]
+    started = False
 
     ## Don't bother acquiring the lock if there are no empty spots or nothing
     ## in the queue (this could be simultaneously added to by the main thread,
@@ -652,6 +731,7 @@ class JobHandler(MessageHandler.MessageUser):
             self.__running[i].start()
             self.__running[i].trackTime('started')
             self.__nextId += 1
+            started = True
           else:
             break
 
@@ -665,9 +745,14 @@ class JobHandler(MessageHandler.MessageUser):
             self.__clientRunning[i].start()
             self.__clientRunning[i].trackTime('jobHandler_started')
             self.__nextId += 1
+            started = True
           else:
             break
 
+    ## the pending queues are shorter, so there is room for new jobs
+    if started:
+      self.__notifyJobEvent()
+
   def cleanJobQueue(self):
     """
     Method that will remove finished jobs from the queue and place them into the
@@ -678,6 +763,7 @@ class JobHandler(MessageHandler.MessageUser):
     ## The code handling these two lists was the exact same, I have taken the
     ## liberty of condensing these loops into one and removing some of the
     ## redundant checks to make this code a bit simpler.
+    finished = False
     for runList in [self.__running, self.__clientRunning]:
       for i,run in enumerate(runList):
         if run is not None and run.isDone():
@@ -689,6 +775,9 @@ class JobHandler(MessageHandler.MessageUser):
             self.__finished.append(run)
             self.__finished[-1].trackTime('jobHandler_finished')
             runList[i] = None
+          finished = True
+    if finished:
+      self.__notifyJobEvent()
 
   def setProfileJobs(self,profile=False):
     """
@@ -706,6 +795,9 @@ class JobHandler(MessageHandler.MessageUser):
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    ## the models shipped to the worker processes may change between steps
+    if self.processPool is not None:
+      self.processPool.reset()
 
   def shutdown(self):
     """
@@ -715,6 +807,9 @@ class JobHandler(MessageHandler.MessageUser):
     @ Out, None
     """
     self.completed = True
+    self.__loopEvent.set()
+    if self.processPool is not None:
+      self.processPool.shutdown()
 
   def terminateAll(self):
     """
@@ -730,6 +825,7 @@ class JobHandler(MessageHandler.MessageUser):
         unfinishedRuns = [run for run in runList if run is not None]
         for run in unfinishedRuns:
           run.kill()
+    self.__notifyJobEvent()
 
   def terminateJobs(self, ids):
     """
@@ -738,6 +834,7 @@ class JobHandler(MessageHandler.MessageUser):
       @ Out, None
     """
     queues = [self.__queue, self.__clientQueue, self.__running, self.__clientRunning]
+    terminated = False
     with self.__queueLock:
       for q,queue in enumerate(queues):
         toRemove = []
@@ -755,6 +852,11 @@ class JobHandler(MessageHandler.MessageUser):
           else:
             queue.remove(job)
           self.raiseADebug('Terminated job "{}" by request.'.format(job.identifier))
+          terminated = True
+    if terminated:
+      ## slots are free for other jobs
+      self.__loopEvent.set()
+      self.__notifyJobEvent()
     if len(ids):
       self.raiseADebug('Tried to remove some jobs but not found in any queues:',', '.join(ids))
 
@@ -23,30 +23,23 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 ################################################################################
-from utils import utils
-from .Metric import Metric
-from .DTW import DTW
-from .SklMetric import SKL
-from .PairwiseMetric import PairwiseMetric
-from .CDFAreaDifference import CDFAreaDifference
-from .PDFCommonArea import PDFCommonArea
-from .ScipyMetric import ScipyMetric
+from utils import importerUtils
 ## [ Add new class here ]
 ################################################################################
-## Alternatively, to fully automate this file:
-# from OutStreamManagers import *
-################################################################################
 
 """
   Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The Metrics are registered by the path of their class and only imported when requested
+# (e.g. sklearn is only loaded if a SKL or PairwiseMetric is used).
 __base = 'Metric'
-__interFaceDict = {}
-
-for classObj in utils.getAllSubclasses(eval(__base)):
-  __interFaceDict[classObj.__name__] = classObj
+__interFaceDict = importerUtils.LazyClassDict()
+__interFaceDict['DTW'              ] = 'Metrics.DTW.DTW'
+__interFaceDict['SKL'              ] = 'Metrics.SklMetric.SKL'
+__interFaceDict['PairwiseMetric'   ] = 'Metrics.PairwiseMetric.PairwiseMetric'
+__interFaceDict['CDFAreaDifference'] = 'Metrics.CDFAreaDifference.CDFAreaDifference'
+__interFaceDict['PDFCommonArea'    ] = 'Metrics.PDFCommonArea.PDFCommonArea'
+__interFaceDict['ScipyMetric'      ] = 'Metrics.ScipyMetric.ScipyMetric'
 
 def knownTypes():
   """
@@ -22,14 +22,9 @@ from __future__ import absolute_import
 ## 'from OutStreamManagers.OutStreamPlot import OutStreamPlot' outside
 ## of this submodule
 from .Metric import Metric
-from .DTW import DTW
-from .SklMetric import SKL
-from .PairwiseMetric import PairwiseMetric
-from .CDFAreaDifference import CDFAreaDifference
-from .PDFCommonArea import PDFCommonArea
-from .ScipyMetric import ScipyMetric
+# the Metrics are imported by the factory when requested (see Factory.py)
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
-__all__ = ['DTW','SKL','PairwiseMetric','CDFAreaDifference','PDFCommonArea','ScipyMetric']
+__all__ = ['Metric']
@@ -25,10 +25,8 @@ import os
 import sys
 import copy
 import shutil
-import importlib
 import platform
 import shlex
-import time
 import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
@@ -36,6 +34,7 @@ import numpy as np
 from .Model import Model
 from utils import utils
 from utils import InputData
+from utils import importerUtils
 import CsvLoader #note: "from CsvLoader import CsvLoader" currently breaks internalParallel with Files and genericCodeInterface - talbpaul 2017-08-24
 import Files
 from DataObjects import Data
@@ -46,7 +45,7 @@ class Code(Model):
   """
     This is the generic class that import an external code into the framework
   """
-  CodeInterfaces = importlib.import_module("CodeInterfaces")
+  CodeInterfaces = importerUtils.importModuleLazy("CodeInterfaces") # only scanned if a Code model is used
 
   @classmethod
   def getInputSpecification(cls):
@@ -62,6 +61,7 @@ class Code(Model):
     inputSpecification.addSub(InputData.parameterInputFactory("executable", contentType=InputData.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("walltime", contentType=InputData.FloatType))
     inputSpecification.addSub(InputData.parameterInputFactory("preexec", contentType=InputData.StringType))
+    inputSpecification.addSub(InputData.parameterInputFactory("linkAuxiliaryFiles", contentType=InputData.BoolType))
 
     ## Begin command line arguments tag
     ClargsInput = InputData.parameterInputFactory("clargs")
@@ -122,6 +122,7 @@ class Code(Model):
     self.foundExecutable    = True # True indicates the executable is found, otherwise not found
     self.foundPreExec       = True # True indicates the pre-executable is found, otherwise not found
     self.maxWallTime        = None # If set, this indicates the maximum CPU time a job can take.
+    self.linkAuxiliaryFiles = False # True to hard-link (rather than copy) the input files the code interface does not modify
 
   def _readMoreXML(self,xmlNode):
     """
@@ -142,6 +143,8 @@ class Code(Model):
         self.maxWallTime = child.value
       if child.getName() =='preexec':
         self.preExec = child.value
+      elif child.getName() == 'linkAuxiliaryFiles':
+        self.linkAuxiliaryFiles = child.value
       elif child.getName() == 'clargs':
         argtype    = child.parameterValues['type']      if 'type'      in child.parameterValues else None
         arg        = child.parameterValues['arg']       if 'arg'       in child.parameterValues else None
@@ -329,11 +332,30 @@ class Code(Model):
       else:
         self.raiseAMessage('not found pre-executable '+self.executable,'ExceptedError')
 
+    if self.linkAuxiliaryFiles and not any(self.code.isInputFileUnmodified(inputFile) for inputFile in self.oriInputFiles):
+      self.raiseAWarning('The code interface of model "'+self.name+'" does not declare any of its input files as unmodified: <linkAuxiliaryFiles> has no effect!')
     if 'initialize' in dir(self.code):
       # the deepcopy is needed to avoid the code interface
       # developer to modify the content of the runInfoDict
       self.code.initialize(copy.deepcopy(runInfoDict), self.oriInputFiles)
 
+  def _linkFile(self,source,directory):
+    """
+      Hard-links a file into a directory, so that large files the code interface does not
+      modify are not duplicated in every run directory. Falls back to a copy wherever a
+      hard link cannot be made (e.g. across file systems or on platforms without os.link).
+      @ In, source, string, the absolute path of the file
+      @ In, directory, string, the directory where the file is needed
+      @ Out, None
+    """
+    destination = os.path.join(directory,os.path.basename(source))
+    if os.path.exists(destination):
+      os.remove(destination)
+    try:
+      os.link(source,destination)
+    except (OSError,AttributeError):
+      shutil.copy(source,directory)
+
   def createNewInput(self,currentInput,samplerType,**kwargs):
     """
       This function will return a new input to be submitted to the model, it is called by the sampler.
@@ -373,7 +395,10 @@ class Code(Model):
         os.mkdir(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      if self.linkAuxiliaryFiles and self.code.isInputFileUnmodified(self.oriInputFiles[index]):
+        self._linkFile(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      else:
+        shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
 
     kwargs['subDirectory'] = subDirectory
 
@@ -553,24 +578,21 @@ class Code(Model):
     elif not self.code.getRunOnShell():
       command = self._expandCommand(command)
     ## This code should be evaluated by the job handler, so it is fine to wait
-    ## until the execution of the external subprocess completes.
-    process = utils.pickleSafeSubprocessPopen(command, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
-
-    if self.maxWallTime is not None:
-      timeout = time.time() + self.maxWallTime
-      while True:
-        time.sleep(0.5)
-        process.poll()
-        if time.time() > timeout and process.returncode is None:
-          self.raiseAWarning('walltime exeeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
-          process.kill()
-          process.returncode = -1
-        if process.returncode is not None or time.time() > timeout:
-          break
-    else:
-      process.wait()
-
-    returnCode = process.returncode
+    ## until the execution of the external subprocess completes. The process
+    ## supervisor watches all the subprocesses (and their walltime) from a
+    ## single thread, and wakes us up as soon as ours is done.
+    ## Code interfaces keeping the code alive between the runs (e.g. RAVEN with persistent workers)
+    ## run it themselves, returning an object that can be waited for as the subprocesses.
+    process = None
+    if 'runInWorker' in dir(self.code):
+      executable = self.executable.replace("%FRAMEWORK_DIR%",kwargs['FRAMEWORK_DIR'])
+      process = self.code.runInWorker(executable, self.currentInputFiles, metaData['subDirectory'], os.path.join(sampleDirectory,codeLogFile), self.maxWallTime)
+    if process is None:
+      process = Runners.getProcessSupervisor().launch(command, walltime=self.maxWallTime, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
+    returnCode = process.wait()
+    if process.timedOut:
+      self.raiseAWarning('walltime exeeded in run in working dir: '+str(metaData['subDirectory'])+'. The run was killed...')
+      returnCode = -1
     # procOutput = process.communicate()[0]
 
     ## If the returnCode is already non-zero, we should maintain our current
@@ -197,6 +197,45 @@ class Dummy(Model):
     output.addRealization(result)
     # END can be abstracted to base class
 
+  def canEvaluateBatch(self):
+    """
+      Determines if this model can evaluate several samples in one job (see Model.submitBatch).
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if batches of samples can be submitted
+    """
+    return True
+
+  def evaluateBatch(self, myInput, samplerType, kwargsList):
+    """
+        This will evaluate several samples on this model in one job. Each sample
+        is evaluated as in evaluateSample; models that can do better (e.g. evaluate
+        all the samples at once) overload this method.
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, kwargsList, list, the dictionaries with the information coming from the sampler, one per sample
+        @ Out, batch, dict, the realizations of the samples stacked as {var:np.ndarray} (see utils.stackRealizations)
+    """
+    return utils.stackRealizations(list(self.evaluateSample(myInput, samplerType, kwargs) for kwargs in kwargsList))
+
+  def collectOutputBatch(self,finishedJob,output,options=None):
+    """
+      Method that collects the outputs from a run of several samples (see Model.submitBatch)
+      @ In, finishedJob, InternalRunner object, instance of the run just finished
+      @ In, output, "DataObjects" object, output where the results of the calculation needs to be stored
+      @ In, options, dict, optional, dictionary of options that can be passed in when the collect of the output is performed by another model (e.g. EnsembleModel)
+      @ Out, None
+    """
+    batch = finishedJob.getEvaluation()
+    if isinstance(batch,Runners.Error):
+      self.raiseAnError(Runners.Error,'No available output to collect!')
+    # alias system
+    self._replaceVariablesNamesWithAliasSystem(batch,'output',True)
+    if output.type in ['PointSet','HistorySet','DataSet','HDF5']:
+      output.addRealizationBatch(batch)
+    else:
+      for rlz in utils.unstackRealizations(batch):
+        output.addRealization(rlz)
+
   def collectOutputFromDict(self,exportDict,output,options=None):
     """
       Collect results from a dictionary
@@ -23,7 +23,6 @@ warnings.simplefilter('default',DeprecationWarning)
 #External Modules------------------------------------------------------------------------------------
 import copy
 import numpy as np
-import time
 import itertools
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
@@ -32,6 +31,7 @@ from collections import OrderedDict
 from .Dummy import Dummy
 from utils import utils
 from utils import graphStructure
+from utils import fixedPointAcceleration
 import Runners
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -73,9 +73,16 @@ class EnsembleModel(Dummy):
     self.modelsDictionary       = {}                    # dictionary of models that are going to be assembled
                                                         # {'modelName':{'Input':[in1,in2,..,inN],'Output':[out1,out2,..,outN],'Instance':Instance}}
     self.activatePicard         = False                 # is non-linear system beeing identified?
-    self.localTargetEvaluations = {}                    # temporary storage of target evaluation data objects
-    self.maxIterations          = 30                    # max number of iterations (in case of non-linear system activated)
+    self.localTargetEvaluations = {}                    # templates of the target evaluation data objects (never filled)
+    self.inRunTargetEvaluations = []                    # pool of per-sample target evaluation data objects ({modelName:DataObject}), recycled among the samples
+    self.modelDependencies      = {}                    # models each model waits for in every iteration {'modelName':set(modelNames)}
+    self.sleepTime              = 0.1                   # longest waiting time before checking the sub-models again (the wait ends as soon as a job finishes)
+    self.maxIterations          = 30                   # max number of iterations (in case of non-linear system activated)
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
+    self.accelerationMethod     = 'none'                # acceleration of the iteration scheme (if activated): 'none', 'aitken' or 'anderson'
+    self.relaxation             = 1.0                   # relaxation factor of the iteration scheme (initial one for 'aitken')
+    self.historyDepth           = 5                     # number of previous iterations used by the 'anderson' acceleration
+    self.skipConvergedModels    = False                 # do not rerun the models whose inputs did not change (within the tolerance) in the iteration scheme
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
     self.initialStartModels     = []                    # list of models that will execute first.
     self.ensembleModelGraph     = None                  # graph object (graphStructure.graphObject)
@@ -147,6 +154,20 @@ class EnsembleModel(Dummy):
         self.maxIterations  = int(child.text)
       elif child.tag == 'tolerance':
         self.convergenceTol = float(child.text)
+      elif child.tag == 'accelerationMethod':
+        self.accelerationMethod = child.text.strip().lower()
+        if self.accelerationMethod not in fixedPointAcceleration.knownMethods():
+          self.raiseAnError(IOError,"Unknown accelerationMethod "+child.text.strip()+". Available are: "+', '.join(fixedPointAcceleration.knownMethods()))
+      elif child.tag == 'relaxation':
+        self.relaxation = float(child.text)
+        if self.relaxation <= 0.0:
+          self.raiseAnError(IOError,"The relaxation factor must be positive. Got "+child.text.strip())
+      elif child.tag == 'historyDepth':
+        self.historyDepth = int(child.text)
+        if self.historyDepth < 1:
+          self.raiseAnError(IOError,"The historyDepth must be at least 1. Got "+child.text.strip())
+      elif child.tag == 'skipConvergedModels':
+        self.skipConvergedModels = utils.interpretBoolean(child.text)
       elif child.tag == 'initialStartModels':
         self.initialStartModels = list(inp.strip() for inp in child.text.strip().split(','))
       elif child.tag == 'initialConditions':
@@ -232,6 +253,7 @@ class EnsembleModel(Dummy):
 
     # collect the models
     self.allOutputs = set()
+    self.inRunTargetEvaluations = []
     for modelClass,modelType,modelName,modelInstance in self.assemblerDict['Model']:
       self.modelsDictionary[modelName]['Instance'] = modelInstance
       inputInstancesForModel = []
@@ -261,8 +283,9 @@ class EnsembleModel(Dummy):
       # assert acceptable TargetEvaluation types are used
       if targetEvaluation.type not in ['PointSet','HistorySet','DataSet']:
         self.raiseAnError(IOError, "Only DataObjects are allowed as TargetEvaluation object. Got "+ str(targetEvaluation.type)+"!")
-      # localTargetEvaluations are for passing data and then resetting, not keeping data between samples
+      # localTargetEvaluations are the templates of the per-sample containers used for passing data (see __getTargetEvaluations)
       self.localTargetEvaluations[modelName] = copy.deepcopy(targetEvaluation)
+      self.localTargetEvaluations[modelName].reset()
       # get input variables
       inps   = targetEvaluation.getVars('input')
       # get pivot parameters in input space if any and add it in the 'Input' list
@@ -337,6 +360,18 @@ class EnsembleModel(Dummy):
           if self.orderList.index(source) >= indexModelIn:
             self.raiseAnError(IOError, 'In model "'+modelIn+'" the "metadataToTransfer" named "'+metadataToGet+
                                        '" is linked to the source"'+source+'" that will be executed after this model.')
+    # build the dependencies among the models once: in every iteration, a model waits for the models preceding it in the
+    # execution list that produce some of its inputs (or the metadata it requests). The others run concurrently.
+    # The inputs coming from models following it in the execution list are the ones of the previous (Picard's) iteration
+    self.modelDependencies = {}
+    for modelCnt, modelIn in enumerate(self.orderList):
+      inputs = set(self.modelsDictionary[modelIn]['Input'])
+      self.modelDependencies[modelIn] = set(source for _, source, _ in self.modelsDictionary[modelIn]['metadataToTransfer'])
+      for previousModel in self.orderList[:modelCnt]:
+        producedVars = set(self.localTargetEvaluations[previousModel].getVars("output")+self.localTargetEvaluations[previousModel].getVars("indexes"))
+        if not inputs.isdisjoint(producedVars):
+          self.modelDependencies[modelIn].add(previousModel)
+      self.raiseADebug('Model "'+modelIn+'" depends on: '+', '.join(sorted(self.modelDependencies[modelIn])))
     self.needToCheckInputs = True
     # write debug statements
     self.raiseADebug("Specs of Graph Network represented by EnsembleModel:")
@@ -490,6 +525,15 @@ class EnsembleModel(Dummy):
     returnValue = (Input,self._externalRun(Input,jobHandler))
     return returnValue
 
+  def canEvaluateBatch(self):
+    """
+      Determines if this model can evaluate several samples in one job (see Model.submitBatch).
+      The samples of this model are submitted one at a time, as client jobs.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, False
+    """
+    return False
+
   def submit(self,myInput,samplerType,jobHandler,**kwargs):
     """
         This will submit an individual sample to be evaluated by this model to a
@@ -534,15 +578,66 @@ class EnsembleModel(Dummy):
             dependentOutputs[inKey] =  previousOutputs[inKey] if len(previousOutputs[inKey]) > 1 else previousOutputs[inKey][0]
     return dependentOutputs
 
+  def __getTargetEvaluations(self):
+    """
+      Method to get the containers where the projections of the results of the sub-models on their TargetEvaluation
+      are stored while a sample is evaluated. The containers are recycled among the samples (see __releaseTargetEvaluations),
+      therefore they are only copied once for each sample evaluated concurrently
+      @ In, None
+      @ Out, targetEvaluations, dict, empty DataObjects {modelName:DataObject}
+    """
+    try:
+      # the samples are evaluated by concurrent threads, list.pop is atomic
+      targetEvaluations = self.inRunTargetEvaluations.pop()
+    except IndexError:
+      # deepcopy assures distinct copies
+      targetEvaluations = dict((modelIn,copy.deepcopy(self.localTargetEvaluations[modelIn])) for modelIn in self.orderList)
+    return targetEvaluations
+
+  def __releaseTargetEvaluations(self, targetEvaluations):
+    """
+      Method to give back the containers got from __getTargetEvaluations once the sample is evaluated
+      @ In, targetEvaluations, dict, DataObjects {modelName:DataObject}
+      @ Out, None
+    """
+    for targetEvaluation in targetEvaluations.values():
+      targetEvaluation.reset()
+    self.inRunTargetEvaluations.append(targetEvaluations)
+
+  def __inputsChange(self, previousInputs, inputs):
+    """
+      Method to measure the change of the inputs of a model between two runs. The inputs usually have
+      different scales, so the change of each variable is relative to its (L2) norm
+      @ In, previousInputs, dict, the inputs of the previous run {var:value}
+      @ In, inputs, dict, the inputs of this run {var:value}
+      @ Out, change, float, largest relative change of the variables (inf if the inputs can not be compared)
+    """
+    if set(previousInputs.keys()) != set(inputs.keys()):
+      return np.inf
+    change = 0.0
+    try:
+      for var in inputs:
+        value = np.ravel(np.asarray(inputs[var],dtype=float))
+        delta = np.linalg.norm(value - np.ravel(np.asarray(previousInputs[var],dtype=float)))
+        norm  = np.linalg.norm(value)
+        change = max(change, delta/norm if norm > 0.0 else delta)
+    except (ValueError, TypeError):
+      return np.inf
+    return change
+
   def _externalRun(self,inRun, jobHandler):
     """
-      Method that performs the actual run of the essembled model (separated from run method for parallelization purposes)
+      Method that performs the actual run of the essembled model (separated from run method for parallelization purposes).
+      The sub-models are dispatched following their dependencies (see initialize): all the sub-models whose inputs are
+      available are submitted at once and the method sleeps until one of them finishes.
+      For non-linear systems, the Picard's iterations can be accelerated (see fixedPointAcceleration) and the models
+      whose inputs did not change can be skipped
       @ In, inRun, tuple, tuple of Inputs, e.g. inRun[0]: actual dictionary of input, inRun[1]: string,
         the type of Sampler or Optimizer, inRun[2], dict, contains the information from the Sampler
       @ In, jobHandler, object, instance of jobHandler
       @ Out, returnEvaluation, tuple, the results of the essembled model:
                                - returnEvaluation[0] dict of results from each sub-model,
-                               - returnEvaluation[1] the dataObjects where the projection of each model is stored
+                               - returnEvaluation[1] dict of the projections of the results of each sub-model on its TargetEvaluation ({modelName:{var:values}})
                                - returnEvaluation[2] dict used to store the optional outputs
     """
     originalInput = inRun[0]
@@ -550,153 +645,199 @@ class EnsembleModel(Dummy):
     inputKwargs = inRun[2]
     identifier = inputKwargs.pop('prefix')
     tempOutputs = {}
-    inRunTargetEvaluations = {}
-
-    for modelIn in self.orderList:
-      # reset the DataObject for the projection
-      self.localTargetEvaluations[modelIn].reset()
-      # deepcopy assures distinct copies
-      inRunTargetEvaluations[modelIn] = copy.deepcopy(self.localTargetEvaluations[modelIn])
-    residueContainer = dict.fromkeys(self.modelsDictionary.keys())
+    projections = {}
+    inRunTargetEvaluations = self.__getTargetEvaluations()
     gotOutputs       = [{}]*len(self.orderList)
     typeOutputs      = ['']*len(self.orderList)
 
-    # if nonlinear system, initialize residue container
+    # if nonlinear system, initialize the iteration scheme
     if self.activatePicard:
-      for modelIn in self.orderList:
-        residueContainer[modelIn] = {'residue':{},'iterValues':[{}]*2}
-        for out in self.modelsDictionary[modelIn]['Output']:
-          residueContainer[modelIn]['residue'][out] = np.zeros(1)
-          residueContainer[modelIn]['iterValues'][0][out] = np.zeros(1)
-          residueContainer[modelIn]['iterValues'][1][out] = np.zeros(1)
+      accelerator     = fixedPointAcceleration.returnInstance(self.accelerationMethod, self.relaxation, self.historyDepth)
+      iterateValues   = None # outputs the current iteration starts from (None in the first iteration)
+      runInputs       = {}   # inputs of the models running {modelName:{var:value}}
+      lastRuns        = {}   # inputs and results of the last run of each model {modelName:{'inputs':{},'outputs':{},'response':{}}}
+      numberOfRuns    = 0
+      numberOfSkips   = 0
+      converged       = False
 
     maxIterations = self.maxIterations if self.activatePicard else 1
     iterationCount = 0
-    while iterationCount < maxIterations:
-      returnDict     = {}
-      iterationCount += 1
-
-      if self.activatePicard:
-        self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
-
-      for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
-        inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-
-        nextModel = False
-        while not nextModel:
-          moveOn = False
-          while not moveOn:
-            if jobHandler.availability() > 0:
-              # run the model
-              #if modelIn not in modelsOnHold:
-              self.raiseADebug('Submitting model',modelIn)
-              self.modelsDictionary[modelIn]['Instance'].submit(originalInput[modelIn], samplerType, jobHandler, **inputKwargs[modelIn])
-              # wait until the model finishes, in order to get ready to run the subsequential one
-              while not jobHandler.isThisJobFinished(modelIn+utils.returnIdSeparator()+identifier):
-                time.sleep(1.e-3)
-              nextModel = moveOn = True
-            else:
-              time.sleep(1.e-3)
-          # store the results in the working dictionaries
+    try:
+      while iterationCount < maxIterations:
+        returnDict     = {}
+        iterationCount += 1
+
+        if self.activatePicard:
+          self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
+
+        # outputs of the previous iteration, used by the models whose inputs come from models following them in the execution list
+        previousOutputs = list(gotOutputs)
+        toSubmit  = list(self.orderList)
+        running   = []
+        completed = set()
+        failure   = None # (exception type, message) of the first error, raised once the running models are collected
+        jobEvent = jobHandler.lastJobEvent()
+        while len(toSubmit) > 0 or len(running) > 0:
+          newEvents = False
+          # collect the models that are finished
+          for modelIn in list(running):
+            jobIdentifier = modelIn+utils.returnIdSeparator()+identifier
+            if not jobHandler.isThisJobFinished(jobIdentifier):
+              continue
+            running.remove(modelIn)
+            newEvents = True
+            modelCnt = self.orderList.index(modelIn)
+            # get job that just finished to gather the results
+            finishedRun = jobHandler.getFinished(jobIdentifier = jobIdentifier, uniqueHandler=self.name+identifier)
+            evaluation = finishedRun[0].getEvaluation()
+            if isinstance(evaluation, Runners.Error):
+              # the model failed, do not submit anything else and wait for the models still running before reporting it
+              if failure is None:
+                failure = (RuntimeError, "The Model  " + modelIn + " identified by " + finishedRun[0].identifier +" failed!")
+              toSubmit = []
+              continue
+            completed.add(modelIn)
+            # store the results in the working dictionaries
             returnDict[modelIn]   = {}
-          #if modelIn not in modelsOnHold:
-          # get job that just finished to gather the results
-          finishedRun = jobHandler.getFinished(jobIdentifier = modelIn+utils.returnIdSeparator()+identifier, uniqueHandler=self.name+identifier)
-          evaluation = finishedRun[0].getEvaluation()
-          if isinstance(evaluation, Runners.Error):
-            # the model failed
-            for modelToRemove in self.orderList:
-              if modelToRemove != modelIn:
-                jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
-            self.raiseAnError(RuntimeError,"The Model  " + modelIn + " identified by " + finishedRun[0].identifier +" failed!")
-          # store the output dictionary
-          tempOutputs[modelIn] = copy.deepcopy(evaluation)
-          # collect the target evaluation
-          #if modelIn not in modelsOnHold:
-          self.modelsDictionary[modelIn]['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations[modelIn])
-          ## FIXME: The call asDataset() is unuseful here. It must be done because otherwise the realization(...) method from collector
-          ## does not return the indexes values (TO FIX)
-          inRunTargetEvaluations[modelIn].asDataset()
-          # get realization
-          dataSet = inRunTargetEvaluations[modelIn].realization(index=iterationCount-1,unpackXArray=True)
-          ##FIXME: the following dict construction is a temporary solution since the realization method returns scalars if we have a PointSet
-          dataSet = {key:np.atleast_1d(dataSet[key]) for key in dataSet}
-          responseSpace         = dataSet
-          typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
-          gotOutputs[modelCnt]  = {key: dataSet[key] for key in inRunTargetEvaluations[modelIn].getVars("output")+inRunTargetEvaluations[modelIn].getVars("indexes")}
-
-          #store the results in return dictionary
-          # store the metadata
-          returnDict[modelIn]['response'        ] = evaluation
-          # overwrite with target evaluation filtering
-          returnDict[modelIn]['response'        ].update(responseSpace)
-          returnDict[modelIn]['prefix'          ] = np.atleast_1d(identifier)
-          returnDict[modelIn]['general_metadata'] = inRunTargetEvaluations[modelIn].getMeta(general=True)
-          # if nonlinear system, compute the residue
-          if self.activatePicard:
-            residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
-            for out in  inRunTargetEvaluations[modelIn].getVars("output"):
-              residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
-              if iterationCount == 1:
-                residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
-            for out in gotOutputs[modelCnt].keys():
-              residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) - np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
-            residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
-
-      # if nonlinear system, check the total residue and convergence
+            # store the output dictionary
+            tempOutputs[modelIn] = copy.deepcopy(evaluation)
+            # collect the target evaluation
+            self.modelsDictionary[modelIn]['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations[modelIn])
+            ## FIXME: The call asDataset() is unuseful here. It must be done because otherwise the realization(...) method from collector
+            ## does not return the indexes values (TO FIX)
+            inRunTargetEvaluations[modelIn].asDataset()
+            # get realization (the last one, the models that are skipped do not add any)
+            dataSet = inRunTargetEvaluations[modelIn].realization(index=len(inRunTargetEvaluations[modelIn])-1,unpackXArray=True)
+            ##FIXME: the following dict construction is a temporary solution since the realization method returns scalars if we have a PointSet
+            dataSet = {key:np.atleast_1d(dataSet[key]) for key in dataSet}
+            responseSpace         = dataSet
+            projections[modelIn]  = responseSpace
+            typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+            gotOutputs[modelCnt]  = {key: dataSet[key] for key in inRunTargetEvaluations[modelIn].getVars("output")+inRunTargetEvaluations[modelIn].getVars("indexes")}
+
+            #store the results in return dictionary
+            # store the metadata
+            returnDict[modelIn]['response'        ] = evaluation
+            # overwrite with target evaluation filtering
+            returnDict[modelIn]['response'        ].update(responseSpace)
+            returnDict[modelIn]['prefix'          ] = np.atleast_1d(identifier)
+            returnDict[modelIn]['general_metadata'] = inRunTargetEvaluations[modelIn].getMeta(general=True)
+            # if nonlinear system, keep the results in case the next iteration does not need to rerun the model
+            if self.activatePicard:
+              lastRuns[modelIn] = {'inputs':runInputs.pop(modelIn), 'outputs':gotOutputs[modelCnt], 'response':returnDict[modelIn]}
+
+          # submit the models whose dependencies are satisfied (in the order of the execution list)
+          for modelIn in list(toSubmit):
+            if not self.modelDependencies[modelIn].issubset(completed):
+              continue
+            if jobHandler.availability() <= 0:
+              break
+            modelCnt = self.orderList.index(modelIn)
+            # in case there are metadataToTransfer, let's collect them from the source
+            metadataToTransfer = None
+            if self.modelsDictionary[modelIn]['metadataToTransfer']:
+              metadataToTransfer = {}
+            # as for the failed runs, the errors are raised after the models still running are collected
+            for metadataToGet, source, alias in self.modelsDictionary[modelIn]['metadataToTransfer']:
+              if metadataToGet in returnDict[source]['general_metadata']:
+                metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+                metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+                metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+              elif metadataToGet in returnDict[source]['response']:
+                metaDataValue = returnDict[source]['response'][metadataToGet]
+                metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+                metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+              else:
+                failure = (RuntimeError, 'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+                break
+            if failure is not None:
+              toSubmit = []
+              break
+            # get dependent outputs (of this iteration from the models preceding this one, of the previous iteration from the others)
+            dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs[:modelCnt]+previousOutputs[modelCnt:], typeOutputs)
+            # if nonlinear system, check for initial coditions
+            if iterationCount == 1  and self.activatePicard:
+              sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+              conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+              for initialConditionToSet in conditionsToCheck:
+                if initialConditionToSet in self.initialConditions.keys():
+                  dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+                else:
+                  failure = (IOError, "No initial conditions provided for variable "+ initialConditionToSet)
+                  break
+              if failure is not None:
+                toSubmit = []
+                break
+            # set new identifiers
+            inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
+            inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
+            if metadataToTransfer is not None:
+              inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+            for key, value in dependentOutput.items():
+              inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+              ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+              ## Who has this information? -- DPM 4/11/17
+              inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
+            self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+            self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+            toSubmit.remove(modelIn)
+            newEvents = True
+            if self.activatePicard:
+              if self.skipConvergedModels and modelIn in lastRuns and \
+                 self.__inputsChange(lastRuns[modelIn]['inputs'],inputKwargs[modelIn]["SampledVars"]) <= self.convergenceTol:
+                # the inputs did not change, the results of the last run are still valid
+                self.raiseADebug('Skipping model',modelIn,'(converged)')
+                returnDict[modelIn]  = lastRuns[modelIn]['response']
+                gotOutputs[modelCnt] = lastRuns[modelIn]['outputs']
+                completed.add(modelIn)
+                numberOfSkips += 1
+                continue
+              runInputs[modelIn] = dict(inputKwargs[modelIn]["SampledVars"])
+              numberOfRuns += 1
+            # run the model
+            self.raiseADebug('Submitting model',modelIn)
+            self.modelsDictionary[modelIn]['Instance'].submit(originalInput[modelIn], samplerType, jobHandler, **inputKwargs[modelIn])
+            running.append(modelIn)
+          if not newEvents:
+            # sleep until a job finishes (or leaves the queue, making room for the models waiting to be submitted)
+            jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
+        if failure is not None:
+          self.raiseAnError(*failure)
+
+        # if nonlinear system, check the total residue and convergence
+        if self.activatePicard:
+          # outputs of this iteration G(x), x being the outputs this iteration started from
+          outputValues = np.concatenate([np.ravel(gotOutputs[modelCnt][out]) for modelCnt, modelIn in enumerate(self.orderList)
+                                                                              for out in inRunTargetEvaluations[modelIn].getVars("output")]).astype(float)
+          if iterateValues is not None and iterateValues.size != outputValues.size:
+            self.raiseAnError(RuntimeError,"The size of the outputs of the models changed between Picard's iterations!")
+          residue = np.linalg.norm(outputValues - (iterateValues if iterateValues is not None else 0.0))
+          self.raiseAMessage("Picard's Iteration Norm: "+ str(residue))
+          if residue <= self.convergenceTol:
+            converged = True
+            self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residue))
+            break
+          if iterateValues is None or (self.accelerationMethod == 'none' and self.relaxation == 1.0):
+            # plain iteration, the next iteration starts from the outputs of this one
+            iterateValues = outputValues
+          else:
+            # accelerated (relaxed) update, used by the next iteration as outputs of the previous one
+            iterateValues = accelerator.update(iterateValues, outputValues)
+            start = 0
+            for modelCnt, modelIn in enumerate(self.orderList):
+              gotOutputs[modelCnt] = dict(gotOutputs[modelCnt])
+              for out in inRunTargetEvaluations[modelIn].getVars("output"):
+                size = np.size(gotOutputs[modelCnt][out])
+                gotOutputs[modelCnt][out] = iterateValues[start:start+size].reshape(np.shape(gotOutputs[modelCnt][out]))
+                start += size
       if self.activatePicard:
-        iterZero = []
-        iterOne = []
-        for modelIn in self.orderList:
-          iterZero += residueContainer[modelIn]['iterValues'][0].values()
-          iterOne  += residueContainer[modelIn]['iterValues'][1].values()
-        residueContainer['TotalResidue'] = np.linalg.norm(np.asarray(iterOne)-np.asarray(iterZero))
-        self.raiseAMessage("Picard's Iteration Norm: "+ str(residueContainer['TotalResidue']))
-        residualPass = residueContainer['TotalResidue'] <= self.convergenceTol
-        # sometimes there can be multiple residual values
-        if hasattr(residualPass,'__len__'):
-          residual = all(residualPass)
-        if residualPass:
-          self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
-          break
-    returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
+        report = "in "+str(iterationCount)+" iterations ("+str(numberOfRuns)+" model runs, "+str(numberOfSkips)+" skipped as converged)"
+        if converged:
+          self.raiseAMessage("Picard's Iteration for sample "+identifier+" converged "+report)
+        else:
+          self.raiseAWarning("Picard's Iteration for sample "+identifier+" did not converge "+report)
+    finally:
+      self.__releaseTargetEvaluations(inRunTargetEvaluations)
+    returnEvaluation = returnDict, projections, tempOutputs
     return returnEvaluation
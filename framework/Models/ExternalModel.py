@@ -294,12 +294,38 @@ class ExternalModel(Dummy):
 
     # TODO move this check to the data object instead.
     if output.type in ['HistorySet']:
-      outputSize = -1
-      for key in output.getVars('output'):
-        # OLD ? if key in instanciatedSelf.modelVariableType.keys(): #TODO why would it not be in this dict?
-        if outputSize == -1:
-          outputSize = len(np.atleast_1d(evaluation[key]))
-        if not utils.sizeMatch(evaluation[key],outputSize):
-          self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(len(np.atleast_1d(outcomes[key]))))
+      self.__checkHistorySizes(evaluation,output)
 
     Dummy.collectOutput(self, finishedJob, output, options)
+
+  def collectOutputBatch(self,finishedJob,output,options=None):
+    """
+      Method that collects the outputs from a run of several samples (see Model.submitBatch)
+      @ In, finishedJob, InternalRunner object, instance of the run just finished
+      @ In, output, "DataObjects" object, output where the results of the calculation needs to be stored
+      @ In, options, dict, optional, dictionary of options that can be passed in when the collect of the output is performed by another model (e.g. EnsembleModel)
+      @ Out, None
+    """
+    batch = finishedJob.getEvaluation()
+    if isinstance(batch, Runners.Error):
+      self.raiseAnError(RuntimeError,"No available Output to collect")
+    if output.type in ['HistorySet']:
+      for evaluation in utils.unstackRealizations(dict((key,batch[key]) for key in output.getVars('output'))):
+        self.__checkHistorySizes(evaluation,output)
+
+    Dummy.collectOutputBatch(self, finishedJob, output, options)
+
+  def __checkHistorySizes(self,evaluation,output):
+    """
+      Checks that all the outputs of a realization to be stored in a HistorySet have the same length
+      @ In, evaluation, dict, the realization {var:np.ndarray}
+      @ In, output, HistorySet, output where the realization is going to be stored
+      @ Out, None
+    """
+    outputSize = -1
+    for key in output.getVars('output'):
+      # OLD ? if key in instanciatedSelf.modelVariableType.keys(): #TODO why would it not be in this dict?
+      if outputSize == -1:
+        outputSize = len(np.atleast_1d(evaluation[key]))
+      if not utils.sizeMatch(evaluation[key],outputSize):
+        self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(len(np.atleast_1d(evaluation[key]))))
@@ -26,7 +26,6 @@ warnings.simplefilter('default',DeprecationWarning)
 import copy
 import numpy as np
 from numpy import linalg
-import time
 import itertools
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
@@ -113,7 +112,7 @@ class HybridModel(Dummy):
     self.romTrainMaxSize       = 1.0e6               # the maximum size of training set
     self.romValidateSize       = 10                  # the size of rom validation set
     self.romTrained            = False               # True if all roms are trained
-    self.sleepTime             = 0.005               # waiting time before checking if a run is finished.
+    self.sleepTime             = 0.005               # longest waiting time before checking if a run is finished.
     self.romConverged          = False               # True if all roms are converged
     self.romValid              = False               # True if all roms are valid for given input data
     self.romConvergence        = 0.01                # The criterion used to check ROM convergence
@@ -555,6 +554,15 @@ class HybridModel(Dummy):
       ready = True
     return ready
 
+  def canEvaluateBatch(self):
+    """
+      Determines if this model can evaluate several samples in one job (see Model.submitBatch).
+      The samples of this model are submitted one at a time, as client jobs.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, False
+    """
+    return False
+
   def submit(self,myInput,samplerType,jobHandler,**kwargs):
     """
       This will submit an individual sample to be evaluated by this model to a
@@ -644,6 +652,7 @@ class HybridModel(Dummy):
       exportDict = {}
       self.raiseADebug("Switch to ROMs")
       # submit all the roms
+      jobEvent = jobHandler.lastJobEvent()
       for romName, romInfo in self.romsDictionary.items():
         inputKwargs[romName]['prefix'] = romName+utils.returnIdSeparator()+identifier
         nextRom = False
@@ -653,7 +662,7 @@ class HybridModel(Dummy):
             self.raiseADebug("Job ", romName, " with identifier ", identifier, " is submitted")
             nextRom = True
           else:
-            time.sleep(self.sleepTime)
+            jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
       # collect the outputs from the runs of ROMs
       while True:
         finishedJobs = jobHandler.getFinished(uniqueHandler=uniqueHandler)
@@ -668,22 +677,23 @@ class HybridModel(Dummy):
         if jobHandler.areTheseJobsFinished(uniqueHandler=uniqueHandler):
           self.raiseADebug("Jobs with uniqueHandler ", uniqueHandler, "are collected!")
           break
-        time.sleep(self.sleepTime)
+        jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
       exportDict['prefix'] = identifier
     else:
       # run model
       inputKwargs['prefix'] = self.modelInstance.name+utils.returnIdSeparator()+identifier
       inputKwargs['uniqueHandler'] = self.name + identifier
       moveOn = False
+      jobEvent = jobHandler.lastJobEvent()
       while not moveOn:
         if jobHandler.availability() > 0:
           self.modelInstance.submit(originalInput, samplerType, jobHandler, **inputKwargs)
           self.raiseADebug("Job submitted for model ", self.modelInstance.name, " with identifier ", identifier)
           moveOn = True
         else:
-          time.sleep(self.sleepTime)
+          jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
       while not jobHandler.isThisJobFinished(self.modelInstance.name+utils.returnIdSeparator()+identifier):
-        time.sleep(self.sleepTime)
+        jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
       self.raiseADebug("Job finished ", self.modelInstance.name, " with identifier ", identifier)
       finishedRun = jobHandler.getFinished(jobIdentifier = inputKwargs['prefix'], uniqueHandler = uniqueHandler)
       evaluation = finishedRun[0].getEvaluation()
@@ -203,6 +203,9 @@ class Model(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     self.runQueue = []
     self.printTag = 'MODEL'
     self.createWorkingDir = False
+    # increased when the state of the model changes during a step (e.g. a ROM trained by a sampler), so that
+    #  the copies of it kept by the workers of the processPool (see Runners.ProcessPool) are updated
+    self.stateVersion = 0
 
   def _readMoreXML(self,xmlNode):
     """
@@ -388,6 +391,34 @@ class Model(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     ## class and pass self in as the first parameter
     jobHandler.addJob((self, myInput, samplerType, kwargs), self.__class__.evaluateSample, prefix, metadata=metadata, modulesToImport=self.mods, uniqueHandler=uniqueHandler, forceUseThreads=forceThreads)
 
+  def canEvaluateBatch(self):
+    """
+      Determines if this model can evaluate several samples in one job (see submitBatch).
+      Models that can, overload this method together with evaluateBatch and collectOutputBatch.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if batches of samples can be submitted
+    """
+    return False
+
+  def submitBatch(self, myInput, samplerType, jobHandler, kwargsList):
+    """
+        This will submit several samples to be evaluated by this model in a single
+        job of the specified jobHandler, saving the overhead of one job per sample.
+        The job returns the realizations of all the samples stacked together
+        (see evaluateBatch), to be collected with collectOutputBatch.
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, jobHandler, JobHandler instance, the global job handler instance
+        @ In, kwargsList, list, the dictionaries with the information coming from the sampler (see submit), one per sample
+        @ Out, None
+    """
+    prefixes = list(str(kwargs.get("prefix")) for kwargs in kwargsList)
+    identifier = prefixes[0] if len(prefixes) == 1 else prefixes[0]+'-'+prefixes[-1]
+    uniqueHandler = kwargsList[0].get("uniqueHandler",'any')
+    forceThreads = kwargsList[0].get("forceThreads",False)
+    metadata = {'prefix':identifier, 'batch':kwargsList}
+    jobHandler.addJob((self, myInput, samplerType, kwargsList), self.__class__.evaluateBatch, identifier, metadata=metadata, modulesToImport=self.mods, uniqueHandler=uniqueHandler, forceUseThreads=forceThreads)
+
   def addOutputFromExportDictionary(self,exportDict,output,options,jobIdentifier):
     """
       Method that collects the outputs from them export dictionary
@@ -304,6 +304,9 @@ class ROM(Dummy):
     self.__dict__ = d
     # since we pop this out during saving state, initialize it here
     self.assemblerDict = {}
+    # ROMs serialized before the state version was introduced
+    if 'stateVersion' not in d:
+      self.stateVersion = 0
 
   def _readMoreXML(self,xmlNode):
     """
@@ -423,6 +426,7 @@ class ROM(Dummy):
     """
     self.supervisedEngine.reset()
     self.amITrained   = False
+    self.stateVersion += 1
 
   def getInitParams(self):
     """
@@ -460,6 +464,7 @@ class ROM(Dummy):
       ## TODO this should be changed when the SupervisedLearning objects themselves can use the Assembler
       self.supervisedEngine.train(self.trainingSet, self.assemblerDict)
       self.amITrained = self.supervisedEngine.amITrained
+    self.stateVersion += 1
 
   def confidence(self,request,target = None):
     """
@@ -514,7 +519,48 @@ class ROM(Dummy):
     inRun = self._manipulateInput(Input[0])
     # collect results from model run
     result = self._externalRun(inRun)
-    # build realization
+    return self._buildRealization(inRun,result,kwargs)
+
+  def evaluateBatch(self, myInput, samplerType, kwargsList):
+    """
+        This will evaluate several samples on this model in one job. Unless the ROM
+        is time-dependent, all the samples are requested from the trained ROM at once.
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, kwargsList, list, the dictionaries with the information coming from the sampler, one per sample
+        @ Out, batch, dict, the realizations of the samples stacked as {var:np.ndarray} (see utils.stackRealizations)
+    """
+    engine = self.supervisedEngine
+    if engine.isADynamicModel or any(isinstance(rom,SupervisedLearning.Collection) or rom.isDynamic() for rom in engine.supervisedContainer):
+      return Dummy.evaluateBatch(self, myInput, samplerType, kwargsList)
+    inRuns = list(self._manipulateInput(self.createNewInput(myInput, samplerType, **kwargs)[0]) for kwargs in kwargsList)
+    results = None
+    variables = set(inRuns[0].keys())
+    if all(set(inRun.keys()) == variables and all(np.size(val) == 1 for val in inRun.values()) for inRun in inRuns):
+      # one request for all the samples
+      request = dict((var,np.concatenate(list(np.atleast_1d(inRun[var]) for inRun in inRuns))) for var in variables)
+      result = self.evaluate(request)
+      # some ROMs only evaluate the first point of a request
+      if all(len(val) == len(inRuns) for val in result.values()):
+        results = list(dict((var,val[index:index+1]) for var,val in result.items()) for index in range(len(inRuns)))
+    if results is None:
+      results = list(self.evaluate(inRun) for inRun in inRuns)
+    rlzs = []
+    for inRun,result,kwargs in zip(inRuns,results,kwargsList):
+      # alias system, as in _externalRun
+      self._replaceVariablesNamesWithAliasSystem(result, 'output', True)
+      self._replaceVariablesNamesWithAliasSystem(inRun, 'input', True)
+      rlzs.append(self._buildRealization(inRun,result,kwargs))
+    return utils.stackRealizations(rlzs)
+
+  def _buildRealization(self,inRun,result,kwargs):
+    """
+      Builds the realization of an evaluated sample.
+      @ In, inRun, dict, the input of the ROM for this sample
+      @ In, result, dict, the evaluation of the ROM for this sample
+      @ In, kwargs, dict, the information coming from the sampler for this sample
+      @ Out, rlz, dict, the realization {var:np.ndarray}
+    """
     # assure rlz has all metadata
     self._replaceVariablesNamesWithAliasSystem(kwargs['SampledVars'] ,'input',True)
     rlz = dict((var,np.atleast_1d(kwargs[var])) for var in kwargs.keys())
@@ -22,23 +22,18 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 ################################################################################
-from .Optimizer import Optimizer
-from .GradientBasedOptimizer import GradientBasedOptimizer
-from .SPSA import SPSA
-from .FiniteDifference import FiniteDifference
+from utils import importerUtils
 ## [ Add new class here ]
 
-
 """
  Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The Optimizers are registered by the path of their class and only imported when requested.
 __base = 'Optimizer'
-__interFaceDict = {}
-__interFaceDict['GradientBasedOptimizer'           ] = GradientBasedOptimizer
-__interFaceDict['SPSA'                             ] = SPSA
-__interFaceDict['FiniteDifference'] = FiniteDifference
+__interFaceDict = importerUtils.LazyClassDict()
+__interFaceDict['GradientBasedOptimizer'           ] = 'Optimizers.GradientBasedOptimizer.GradientBasedOptimizer'
+__interFaceDict['SPSA'                             ] = 'Optimizers.SPSA.SPSA'
+__interFaceDict['FiniteDifference'] = 'Optimizers.FiniteDifference.FiniteDifference'
 __knownTypes = list(__interFaceDict.keys())
 
 def knownTypes():
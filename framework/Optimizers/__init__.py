@@ -23,8 +23,7 @@ from __future__ import absolute_import
 # These lines ensure that we do not have to do something like:
 # 'from Optimizers.Optimizer import Sampler' outside of this submodule
 from .Optimizer import Optimizer
-from .GradientBasedOptimizer import GradientBasedOptimizer
-from .SPSA import SPSA
+# the Optimizers are imported by the factory when requested (see Factory.py)
 
 
 from .Factory import knownTypes
@@ -87,6 +87,24 @@ class OrthogonalPolynomial(MessageHandler.MessageUser):
     inps=self.params+[self.pointMod(pt)]
     return self._evPoly(order,*inps) * self.norm(order)
 
+  def evaluateTable(self,maxOrder,pts):
+    """
+      Returns the polynomials of all the orders up to 'maxOrder' evaluated at each of the points 'pts'
+      (the univariate Vandermonde table), used to evaluate polynomial expansions at many points at once.
+      @ In, maxOrder, int, maximum order at which the polynomials should be evaluated
+      @ In, pts, np.array, values at which the polynomials should be evaluated
+      @ Out, table, np.array, shape (len(pts),maxOrder+1), table[i,o] is the polynomial of order o evaluated at pts[i]
+    """
+    pts = np.atleast_1d(np.asarray(pts,dtype=float))
+    try:
+      modPts = np.asarray(self.pointMod(pts),dtype=float)
+    except TypeError:
+      # the point modification (e.g. the CDF conversion) only accepts scalars
+      modPts = np.asarray(list(self.pointMod(pt) for pt in pts),dtype=float)
+    orders = np.arange(maxOrder+1)
+    inps = self.params+[modPts[:,np.newaxis]]
+    return self._evPoly(orders[np.newaxis,:],*inps) * np.asarray(list(self.norm(order) for order in orders))
+
   def __getstate__(self):
     """
       Pickle dump method.
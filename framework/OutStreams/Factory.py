@@ -23,30 +23,19 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 ################################################################################
-from utils import utils
-from .OutStreamManager import OutStreamManager
-from .OutStreamPlot import OutStreamPlot
-from .OutStreamPrint import OutStreamPrint
+from utils import importerUtils
 ## [ Add new class here ]
 ################################################################################
-## Alternatively, to fully automate this file:
-# from OutStreamManagers import *
-################################################################################
 
 """
   Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The OutStreams are registered by the path of their class and only imported when requested
+# (e.g. matplotlib is only loaded if a Plot is used).
 __base = 'OutStreamManager'
-__interFaceDict = {}
-
-for classObj in utils.getAllSubclasses(eval(__base)):
-  ## As long as these subclasses follow the pattern of starting with OutStream
-  ## this will appropriately key them to a more user-friendly name without the
-  ## need for them to redudantly prepend "X" as "OutStreamX"
-  key = classObj.__name__.replace('OutStream','')
-  __interFaceDict[key] = classObj
+__interFaceDict = importerUtils.LazyClassDict()
+__interFaceDict['Plot' ] = 'OutStreams.OutStreamPlot.OutStreamPlot'
+__interFaceDict['Print'] = 'OutStreams.OutStreamPrint.OutStreamPrint'
 
 def knownTypes():
   """
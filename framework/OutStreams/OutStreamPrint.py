@@ -27,6 +27,7 @@ import os
 
 #Internal Modules---------------------------------------------------------------
 import DataObjects
+from utils import utils
 from .OutStreamManager import OutStreamManager
 from ClassProperty import ClassProperty
 #Internal Modules End-----------------------------------------------------------
@@ -41,7 +42,7 @@ class OutStreamPrint(OutStreamManager):
   ## the variables immutable (so long as no one touches the internally stored
   ## "_"-prefixed), so other objects don't accidentally modify them.
 
-  _availableOutStreamTypes = ['csv', 'xml']
+  _availableOutStreamTypes = ['csv', 'xml', 'netcdf', 'parquet']
 
   @ClassProperty
   def availableOutStreamTypes(cls):
@@ -67,6 +68,10 @@ class OutStreamPrint(OutStreamManager):
     # dictionary of what indices have already been printed, so we don't duplicate writing efforts
     self.indexPrinted = {} # keys are filenames, which should be reset at the end of every step
     self.subDirectory = None # subdirectory where to store the outputs
+    self.incremental = False # if True, the CSV files are kept open and appended to through the light-weight writer
+    self.historyFormat = 'split' # layout of the history CSVs, either 'split' (one file per history) or 'long'
+    self.openFiles = {} # open file objects of the light-weight writer, keys are paths, closed at the end of every step
+    self.binaryPending = False # if True, the binary (netcdf, parquet) files still need to be written at the end of the step
 
   def localGetInitParams(self):
     """
@@ -104,12 +109,22 @@ class OutStreamPrint(OutStreamManager):
     """
     self.type = 'OutStreamPrint'
     for subnode in xmlNode:
-      if subnode.tag not in ['type','source','what','filename','target','clusterLabel','directory']:
+      if subnode.tag not in ['type','source','what','filename','target','clusterLabel','directory','incremental','historyFormat','compression','chunkSize']:
         self.raiseAnError(IOError, ' Print Outstream object ' + str(self.name) + ' contains the following unknown node: ' + str(subnode.tag))
       if subnode.tag == 'source':
         self.sourceName = subnode.text.split(',')
       elif subnode.tag == 'filename':
         self.filename = subnode.text
+      elif subnode.tag == 'incremental':
+        self.incremental = utils.interpretBoolean(subnode.text)
+      elif subnode.tag == 'chunkSize':
+        self.options['chunkSize'] = int(subnode.text)
+        if self.options['chunkSize'] < 1:
+          self.raiseAnError(IOError, 'Print Outstream object ' + str(self.name) + ': chunkSize must be a positive integer!')
+      elif subnode.tag == 'historyFormat':
+        self.historyFormat = subnode.text.strip().lower()
+        if self.historyFormat not in ['split','long']:
+          self.raiseAnError(IOError, 'Print Outstream object ' + str(self.name) + ': unknown historyFormat "' + subnode.text + '". Available are "split" and "long".')
       else:
         self.options[subnode.tag] = subnode.text
     if 'type' not in self.options.keys():
@@ -118,7 +133,7 @@ class OutStreamPrint(OutStreamManager):
       self.raiseAnError(TypeError, 'Print type ' + self.options['type'] + ' not available yet. ')
     if 'what' in self.options.keys():
       self.what = self.options['what']
-      if self.options['type'] == 'csv':
+      if self.options['type'] in ['csv','netcdf','parquet']:
         for elm in self.what.lower().split(","):
           if not elm.startswith("input") and not elm.startswith("output") and not elm.startswith("metadata"):
             self.raiseAnError(IOError, 'Not recognized request in "what" node <'+elm.strip()+'>. The request must begin with one of "input", "output" or "metadata" or it could be "all" for ROMs!')
@@ -143,6 +158,17 @@ class OutStreamPrint(OutStreamManager):
     if 'target' in self.options.keys():
       dictOptions['target'] = self.options['target']
 
+    # binary files are not appendable: write them once, when the step is over
+    if self.options['type'] in ['netcdf','parquet']:
+      self.binaryPending = True
+      return
+
+    # the light-weight CSV writer keeps its files in self.openFiles, closed here unless printing incrementally
+    useOpenFiles = self.options['type'] == 'csv' and (self.incremental or self.historyFormat == 'long')
+    if useOpenFiles:
+      dictOptions['openFiles'] = self.openFiles
+      dictOptions['historyFormat'] = self.historyFormat
+
     for index in range(len(self.sourceName)):
       try:
         empty = self.sourceData[index].isEmpty
@@ -169,8 +195,43 @@ class OutStreamPrint(OutStreamManager):
           self.sourceData[index].printXML(dictOptions)
         except AttributeError:
           self.raiseAnError(NotImplementedError, 'No implementation for source type', self.sourceData[index].type, 'and output type "'+str(self.options['type'].strip())+'"!')
+    if useOpenFiles and not self.incremental:
+      self.closeFiles()
 
+  def closeFiles(self):
+    """
+      Closes the files kept open by the light-weight CSV writer.
+      @ In, None
+      @ Out, None
+    """
+    for openFile in self.openFiles.values():
+      openFile.close()
+    self.openFiles = {}
 
+  def writeBinary(self):
+    """
+      Writes the linked dataObjects to netCDF or Parquet files, one per source.
+      @ In, None
+      @ Out, None
+    """
+    filenameRoot = self.filename if len(self.filename) > 0 else self.name
+    if self.subDirectory is not None:
+      filenameRoot = os.path.join(self.subDirectory,filenameRoot)
+    extension = {'netcdf':'.nc','parquet':'.parquet'}[self.options['type']]
+    dictOptions = dict((key,self.options[key]) for key in ['compression','chunkSize'] if key in self.options)
+    if self.what:
+      dictOptions['what'] = self.what
+    for index in range(len(self.sourceName)):
+      source = self.sourceData[index]
+      if not hasattr(source,'isEmpty') or not hasattr(source,'write'):
+        self.raiseAnError(NotImplementedError, 'No implementation for source type', source.type, 'and output type "'+str(self.options['type'].strip())+'"!')
+      if source.isEmpty:
+        self.raiseAWarning('Nothing to write to', self.options['type'], 'for source', source.name, '! Skipping ...')
+        continue
+      filename = filenameRoot
+      if len(self.sourceName) > 1:
+        filename += '_' + source.name
+      source.write(filename+extension,style=self.options['type'],**dictOptions)
 
   def finalize(self):
     """
@@ -178,5 +239,9 @@ class OutStreamPrint(OutStreamManager):
       @ In, None
       @ Out, None
     """
+    if self.binaryPending:
+      self.writeBinary()
+      self.binaryPending = False
     # clear history of printed realizations; start fresh for next step
     self.indexPrinted = {}
+    self.closeFiles()
@@ -26,12 +26,11 @@ from __future__ import absolute_import
 ## 'from OutStreamManagers.OutStreamPlot import OutStreamPlot' outside
 ## of this submodule
 from .OutStreamManager import OutStreamManager
-from .OutStreamPlot import OutStreamPlot
-from .OutStreamPrint import OutStreamPrint
+# the OutStreams are imported by the factory when requested (see Factory.py)
 
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['OutStreamManager','OutStreamPlot','OutStreamPrint']
+__all__ = ['OutStreamManager']
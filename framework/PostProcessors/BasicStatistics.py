@@ -35,6 +35,7 @@ from .PostProcessor import PostProcessor
 from utils import utils
 from utils import InputData
 from utils import mathUtils
+from utils import streamingStatistics
 import Files
 import Runners
 #Internal Modules End-----------------------------------------------------------
@@ -115,6 +116,9 @@ class BasicStatistics(PostProcessor):
     multipleFeaturesInput = InputData.parameterInputFactory("multipleFeatures", contentType=InputData.BoolType)
     inputSpecification.addSub(multipleFeaturesInput)
 
+    chunkSizeInput = InputData.parameterInputFactory("chunkSize", contentType=InputData.IntegerType)
+    inputSpecification.addSub(chunkSizeInput)
+
     return inputSpecification
 
   def __init__(self, messageHandler):
@@ -142,6 +146,7 @@ class BasicStatistics(PostProcessor):
     self.steMetaIndex   = 'targets' # when Dataset is requested as output, the default index of ste metadata is ['targets', self.pivotParameter]
     self.multipleFeatures = True # True if multiple features are employed in linear regression as feature inputs
     self.sampleSize     = None # number of sample size
+    self.chunkSize      = None # if not None, the moments, extrema, percentiles and covariance are accumulated over chunks of this number of samples
 
   def inputToInternal(self, currentInp):
     """
@@ -362,6 +367,10 @@ class BasicStatistics(PostProcessor):
         self.outputDataset = child.value
       elif tag == "multipleFeatures":
         self.multipleFeatures = child.value
+      elif tag == "chunkSize":
+        self.chunkSize = child.value
+        if self.chunkSize < 1:
+          self.raiseAnError(IOError, 'The "chunkSize" of BasicStatistics must be a positive integer! Got', self.chunkSize)
       else:
         self.raiseAWarning('Unrecognized node in BasicStatistics "',tag,'" has been ignored!')
 
@@ -424,25 +433,9 @@ class BasicStatistics(PostProcessor):
     if order > 4:
       self.raiseAnError(RuntimeError,"computeUnbiasedCorrection is implemented for order <=4 only!")
     if type(weightsOrN).__name__ not in ['int','int8','int16','int64','int32']:
-      if order == 2:
-        V1, v1Square, V2 = self.__computeVp(1, weightsOrN), self.__computeVp(1, weightsOrN)**2.0, self.__computeVp(2, weightsOrN)
-        corrFactor   = v1Square/(v1Square-V2)
-      elif order == 3:
-        V1, v1Cubic, V2, V3 = self.__computeVp(1, weightsOrN), self.__computeVp(1, weightsOrN)**3.0, self.__computeVp(2, weightsOrN), self.__computeVp(3, weightsOrN)
-        corrFactor   =  v1Cubic/(v1Cubic-3.0*V2*V1+2.0*V3)
-      elif order == 4:
-        V1, v1Square, V2, V3, V4 = self.__computeVp(1, weightsOrN), self.__computeVp(1, weightsOrN)**2.0, self.__computeVp(2, weightsOrN), self.__computeVp(3, weightsOrN), self.__computeVp(4, weightsOrN)
-        numer1 = v1Square*(v1Square**2.0-3.0*v1Square*V2+2.0*V1*V3+3.0*V2**2.0-3.0*V4)
-        numer2 = 3.0*v1Square*(2.0*v1Square*V2-2.0*V1*V3-3.0*V2**2.0+3.0*V4)
-        denom = (v1Square-V2)*(v1Square**2.0-6.0*v1Square*V2+8.0*V1*V3+3.0*V2**2.0-6.0*V4)
-        corrFactor = numer1/denom ,numer2/denom
+      corrFactor = streamingStatistics.unbiasedCorrection(order,*(self.__computeVp(p,weightsOrN) for p in range(1,5)))
     else:
-      if   order == 2:
-        corrFactor   = float(weightsOrN)/(float(weightsOrN)-1.0)
-      elif order == 3:
-        corrFactor   = (float(weightsOrN)**2.0)/((float(weightsOrN)-1)*(float(weightsOrN)-2))
-      elif order == 4:
-        corrFactor = (float(weightsOrN)*(float(weightsOrN)**2.0-2.0*float(weightsOrN)+3.0))/((float(weightsOrN)-1)*(float(weightsOrN)-2)*(float(weightsOrN)-3)),(3.0*float(weightsOrN)*(2.0*float(weightsOrN)-3.0))/((float(weightsOrN)-1)*(float(weightsOrN)-2)*(float(weightsOrN)-3))
+      corrFactor = streamingStatistics.unbiasedCorrection(order,weightsOrN)
     return corrFactor
 
   def _computeKurtosis(self, arrayIn, expValue, variance, pbWeight=None, dim=None):
@@ -540,20 +533,137 @@ class BasicStatistics(PostProcessor):
       @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
       @ Out, result, float, the percentile
     """
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+    arrayIn      = np.asarray(arrayIn,dtype=float)
+    idxs         = np.argsort(arrayIn)
     # Inserting [0.0,arrayIn[idxs[0]]] is needed when few samples are generated and
     # a percentile that is < that the first pb weight is requested. Otherwise the median
     # is returned (that is wrong).
-    sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
+    sortedPoints = np.insert(arrayIn[idxs],0,arrayIn[idxs[0]])
+    weightsCDF   = np.cumsum(np.insert(np.asarray(pbWeight,dtype=float)[idxs],0,0.0))
     try:
       index = utils.find_le_index(weightsCDF,percent)
-      result = sortedWeightsAndPoints[index,1]
+      result = sortedPoints[index]
     except ValueError:
       result = np.percentile(arrayIn,percent,interpolation='lower')
     return result
 
 
+  def __accumulateChunks(self, inputDataset, pbWeights, needed):
+    """
+      Method to compute the moments, extrema, percentiles and covariance accumulating the samples chunk by chunk
+      (see utils.streamingStatistics), so that the intermediate arrays are bounded by the chunk size.
+      The sensitivities are still computed from the full dataset.
+      @ In, inputDataset, xarray.Dataset, the dataset of inputs
+      @ In, pbWeights, xarray.Dataset, the probability weights of the variables (None if not present)
+      @ In, needed, dict, the required computations ({metric:{'targets':list, ...}})
+      @ Out, calculations, dict, the computed metrics, in the same format of the full dataset computations
+    """
+    momentMetrics = ['expectedValue','variance','skewness','kurtosis','maximum','minimum']
+    quantileMetrics = ['median','percentile']
+    covParams = list(set(needed['covariance']['targets']).union(set(needed['covariance']['features'])))
+    momentTargets = set(covParams)
+    for metric in momentMetrics:
+      momentTargets.update(needed[metric]['targets'])
+    quantileTargets = set()
+    for metric in quantileMetrics:
+      quantileTargets.update(needed[metric]['targets'])
+    dynamicTargets = set(target for target in momentTargets.union(quantileTargets) if self.pivotParameter in inputDataset[target].dims)
+    numPivots = len(self.pivotValue) if self.pivotParameter in inputDataset.sizes.keys() else 1
+    dynamicCov = len(covParams) > 0 and self.pivotParameter in inputDataset[covParams].sizes.keys()
+
+    moments = dict((target,streamingStatistics.WeightedMoments()) for target in momentTargets)
+    sketches = dict((target,[streamingStatistics.QuantileSketch() for _ in range(numPivots if target in dynamicTargets else 1)]) for target in quantileTargets)
+    covariances = [streamingStatistics.WeightedCovariance() for _ in range(numPivots if dynamicCov else 1)]
+    for start in range(0, self.sampleSize, self.chunkSize):
+      chunkSlice = {self.sampleTag:slice(start, start + self.chunkSize)}
+      chunk = inputDataset.isel(**chunkSlice)
+      chunkWeights = pbWeights.isel(**chunkSlice) if self.pbPresent else None
+      for target in momentTargets.union(quantileTargets):
+        if target in dynamicTargets:
+          values = chunk[target].transpose(self.sampleTag, self.pivotParameter).values
+        else:
+          values = chunk[target].values
+        weights = chunkWeights[target].values if self.pbPresent else None
+        if target in momentTargets:
+          moments[target].update(values, weights)
+        if target in quantileTargets:
+          if target in dynamicTargets:
+            for i, sketch in enumerate(sketches[target]):
+              sketch.update(values[:,i], weights)
+          else:
+            sketches[target][0].update(values, weights)
+      if len(covParams) > 0:
+        weights = self.realizationWeight.isel(**chunkSlice)['ProbabilityWeight'].values if self.pbPresent else None
+        if dynamicCov:
+          values = chunk[covParams].to_array().transpose(self.pivotParameter, self.sampleTag, 'variable').values
+          for i, covariance in enumerate(covariances):
+            covariance.update(values[i,...], weights)
+        else:
+          covariances[0].update(chunk[covParams].to_array().transpose(self.sampleTag, 'variable').values, weights)
+
+    def statisticArray(target, value):
+      """
+        Builds the DataArray of a statistic of a target
+        @ In, target, str, the target name
+        @ In, value, float or numpy.array, the statistic (a value for each pivot value if the target is time-dependent)
+        @ Out, statisticArray, xarray.DataArray, the statistic
+      """
+      if target in dynamicTargets:
+        return xr.DataArray(value, dims=(self.pivotParameter), coords={self.pivotParameter:self.pivotValue})
+      return xr.DataArray(value)
+
+    statistics = {'expectedValue':lambda acc: acc.expectedValue(),
+                  'variance':lambda acc: acc.variance(self.biased),
+                  'skewness':lambda acc: acc.skewness(self.biased),
+                  'kurtosis':lambda acc: acc.kurtosis(self.biased),
+                  'maximum':lambda acc: acc.maximum,
+                  'minimum':lambda acc: acc.minimum}
+    calculations = {}
+    for metric in momentMetrics:
+      if len(needed[metric]['targets'])>0:
+        self.raiseADebug('Starting "'+metric+'" (accumulated over chunks of '+str(self.chunkSize)+' samples)...')
+        calculations[metric] = xr.Dataset(dict((target,statisticArray(target,statistics[metric](moments[target]))) for target in needed[metric]['targets']))
+    if self.pbPresent and len(needed['expectedValue']['targets'])>0:
+      calculations['equivalentSamples'] = xr.Dataset(dict((target,xr.DataArray(moments[target].equivalentSamples())) for target in needed['expectedValue']['targets']))
+    metric = 'median'
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'" (accumulated over chunks of '+str(self.chunkSize)+' samples)...')
+      medianSet = xr.Dataset()
+      for target in needed[metric]['targets']:
+        median = [sketch.median() for sketch in sketches[target]]
+        medianSet[target] = statisticArray(target, median if target in dynamicTargets else median[0])
+      calculations[metric] = medianSet
+    metric = 'percentile'
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'" (accumulated over chunks of '+str(self.chunkSize)+' samples)...')
+      percent = list(needed[metric]['percent'])
+      percentileSet = xr.Dataset()
+      for target in needed[metric]['targets']:
+        quantile = [[sketch.quantile(pct) for sketch in sketches[target]] for pct in percent]
+        if target in dynamicTargets:
+          percentileSet[target] = xr.DataArray(quantile,dims=('percent',self.pivotParameter),coords={'percent':percent,self.pivotParameter:self.pivotValue})
+        else:
+          percentileSet[target] = xr.DataArray(np.asarray(quantile)[:,0],dims=('percent'),coords={'percent':percent})
+      calculations[metric] = percentileSet
+    metric = 'covariance'
+    if len(covParams)>0:
+      self.raiseADebug('Starting "'+metric+'" (accumulated over chunks of '+str(self.chunkSize)+' samples)...')
+      targVars = list(inputDataset[covParams].data_vars)
+      covMatrices = []
+      for i, covariance in enumerate(covariances):
+        # the means and the variances of each variable are computed with its own probability weights
+        means = [moments[var].expectedValue()[i] if var in dynamicTargets else moments[var].expectedValue() for var in targVars]
+        variances = [moments[var].variance(self.biased)[i] if var in dynamicTargets else moments[var].variance(self.biased) for var in targVars]
+        cov = covariance.covariance(self.biased, means=means)
+        np.fill_diagonal(cov,variances)
+        covMatrices.append(cov)
+      if dynamicCov:
+        calculations[metric] = xr.DataArray(np.asarray(covMatrices), dims=(self.pivotParameter,'targets','features'),
+                                            coords={self.pivotParameter:self.pivotValue,'targets':targVars,'features':targVars})
+      else:
+        calculations[metric] = xr.DataArray(covMatrices[0], dims=('targets','features'), coords={'targets':targVars,'features':targVars})
+    return calculations
+
   def __runLocal(self, inputData):
     """
       This method executes the postprocessor action. In this case, it computes all the requested statistical FOMs
@@ -651,11 +761,14 @@ class BasicStatistics(PostProcessor):
 
       calculations[metric] = samplesDA
 
+    if self.chunkSize is not None:
+      calculations.update(self.__accumulateChunks(inputDataset, pbWeights, needed))
+
     #
     # expected value
     #
     metric = 'expectedValue'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       if self.pbPresent:
@@ -671,7 +784,7 @@ class BasicStatistics(PostProcessor):
     # variance
     #
     metric = 'variance'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -697,7 +810,7 @@ class BasicStatistics(PostProcessor):
     # skewness
     #
     metric = 'skewness'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -708,7 +821,7 @@ class BasicStatistics(PostProcessor):
     # kurtosis
     #
     metric = 'kurtosis'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       meanSet = calculations['expectedValue'][list(needed[metric]['targets'])]
@@ -719,7 +832,7 @@ class BasicStatistics(PostProcessor):
     # median
     #
     metric = 'median'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       if self.pbPresent:
@@ -824,7 +937,7 @@ class BasicStatistics(PostProcessor):
     # maximum
     #
     metric = 'maximum'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       calculations[metric] = dataSet.max(dim=self.sampleTag)
@@ -832,7 +945,7 @@ class BasicStatistics(PostProcessor):
     # minimum
     #
     metric = 'minimum'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       calculations[metric] = dataSet.min(dim=self.sampleTag)
@@ -840,7 +953,7 @@ class BasicStatistics(PostProcessor):
     # percentile, this metric is handled differently
     #
     metric = 'percentile'
-    if len(needed[metric]['targets'])>0:
+    if len(needed[metric]['targets'])>0 and metric not in calculations:
       self.raiseADebug('Starting "'+metric+'"...')
       dataSet = inputDataset[list(needed[metric]['targets'])]
       percent = list(needed[metric]['percent'])
@@ -935,7 +1048,7 @@ class BasicStatistics(PostProcessor):
     #
     metric = 'covariance'
     targets,features,skip = startVector(metric)
-    if not skip:
+    if not skip and metric not in calculations:
       # because the C implementation is much faster than picking out individual values,
       #   we do the full covariance matrix with all the targets and features.
       # FIXME adding an alternative for users to choose pick OR do all, defaulting to something smart
@@ -24,64 +24,40 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 ################################################################################
-from utils import utils
-from .PostProcessor import PostProcessor
-
-from .Metric import Metric
-from .DataMining import DataMining
-from .ETImporter import ETImporter
-from .SafestPoint import SafestPoint
-from .LimitSurface import LimitSurface
-from .ValueDuration import ValueDuration
-from .SampleSelector import SampleSelector
-from .ImportanceRank import ImportanceRank
-from .BasicStatistics import BasicStatistics
-from .CrossValidation import CrossValidation
-from .FastFourierTransform import FastFourierTransform
-from .LimitSurfaceIntegral import LimitSurfaceIntegral
-from .ExternalPostProcessor import ExternalPostProcessor
-from .InterfacedPostProcessor import InterfacedPostProcessor
-from .TopologicalDecomposition import TopologicalDecomposition
-from .ComparisonStatisticsModule import ComparisonStatistics
-# from .RavenOutput import RavenOutput # deprecated for now
-
-## These utilize the optional prequisite library PySide, so don't error if they
-## do not import appropriately.
-try:
-  from .TopologicalDecomposition import QTopologicalDecomposition
-  from .DataMining import QDataMining
-except ImportError:
-  pass
-
+from utils import importerUtils
 ## [ Add new class here ]
-
-################################################################################
-## Alternatively, to fully automate this file:
-# from PostProcessors import *
 ################################################################################
 
-
 """
  Interface Dictionary (factory) (private)
 """
-
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The PostProcessors are registered by the path of their class and only imported when requested,
+# so that their libraries are not loaded by the inputs not using them.
 __base = 'PostProcessor'
-__interFaceDict = {}
-
-for classObj in utils.getAllSubclasses(eval(__base)):
-  key = classObj.__name__
-  __interFaceDict[key] = classObj
-
+__interFaceDict = importerUtils.LazyClassDict()
+__interFaceDict['BasicStatistics'         ] = 'PostProcessors.BasicStatistics.BasicStatistics'
+__interFaceDict['ComparisonStatistics'    ] = 'PostProcessors.ComparisonStatisticsModule.ComparisonStatistics'
+__interFaceDict['CrossValidation'         ] = 'PostProcessors.CrossValidation.CrossValidation'
+__interFaceDict['DataClassifier'          ] = 'PostProcessors.DataClassifier.DataClassifier'
+__interFaceDict['ETImporter'              ] = 'PostProcessors.ETImporter.ETImporter'
+__interFaceDict['FTImporter'              ] = 'PostProcessors.FTImporter.FTImporter'
+__interFaceDict['ExternalPostProcessor'   ] = 'PostProcessors.ExternalPostProcessor.ExternalPostProcessor'
+__interFaceDict['FastFourierTransform'    ] = 'PostProcessors.FastFourierTransform.FastFourierTransform'
+__interFaceDict['ImportanceRank'          ] = 'PostProcessors.ImportanceRank.ImportanceRank'
+__interFaceDict['InterfacedPostProcessor' ] = 'PostProcessors.InterfacedPostProcessor.InterfacedPostProcessor'
+__interFaceDict['LimitSurface'            ] = 'PostProcessors.LimitSurface.LimitSurface'
+__interFaceDict['LimitSurfaceIntegral'    ] = 'PostProcessors.LimitSurfaceIntegral.LimitSurfaceIntegral'
+__interFaceDict['Metric'                  ] = 'PostProcessors.Metric.Metric'
+__interFaceDict['SafestPoint'             ] = 'PostProcessors.SafestPoint.SafestPoint'
+__interFaceDict['SampleSelector'          ] = 'PostProcessors.SampleSelector.SampleSelector'
+__interFaceDict['ValueDuration'           ] = 'PostProcessors.ValueDuration.ValueDuration'
 ## Adding aliases for certain classes that are exposed to the user.
-__interFaceDict['External'] = ExternalPostProcessor
-try:
-  __interFaceDict['TopologicalDecomposition' ] = QTopologicalDecomposition
-  __interFaceDict['DataMining'               ] = QDataMining
-except NameError:
-  ## The correct names should already be used for these classes otherwise
-  pass
+__interFaceDict['External'                ] = 'PostProcessors.ExternalPostProcessor.ExternalPostProcessor'
+## These utilize the optional prequisite library PySide when available, otherwise the plain classes are used.
+__interFaceDict['TopologicalDecomposition'] = ('PostProcessors.TopologicalDecomposition.QTopologicalDecomposition',
+                                               'PostProcessors.TopologicalDecomposition.TopologicalDecomposition')
+__interFaceDict['DataMining'              ] = ('PostProcessors.DataMining.QDataMining',
+                                               'PostProcessors.DataMining.DataMining')
 
 def knownTypes():
   """
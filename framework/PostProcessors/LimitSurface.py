@@ -22,7 +22,7 @@ warnings.simplefilter('default', DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-import copy
+from scipy import spatial
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
 
@@ -30,6 +30,7 @@ from collections import OrderedDict
 from .PostProcessor import PostProcessor
 from utils import InputData
 from utils import utils
+from utils import mathUtils
 import LearningGate
 import GridEntities
 import Files
@@ -96,6 +97,15 @@ class LimitSurface(PostProcessor):
     self.jobHandler        = None             # job handler pointer
     self.transfMethods     = {}               # transformation methods container
     self.crossedLimitSurf  = False            # Limit surface has been crossed?
+    self.incremental       = False            # evaluate the ROM only on the grid nodes closest to the new samples?
+    self.gridTree          = {}               # incremental mode: KD-tree of the nodes of each grid
+    self.nearestDistance   = {}               # incremental mode: distance of each grid node from its closest sample
+    self.nearestSample     = {}               # incremental mode: index of the closest sample of each grid node
+    self.distanceScale     = None             # incremental mode: scale of each variable in the distances (fixed, unlike the ROM normalization)
+    self.nearestNeighborROM = False           # the ROM is a nearest neighbor classifier (the default one, or KNeighborsClassifier with one neighbor)?
+    self.numIncorporated   = {}               # incremental mode: number of samples accounted for in each test matrix
+    self.testMatrixChange  = {}               # incremental mode: sum of the absolute changes of each test matrix in the last run
+    self.fullEvaluation    = False            # incremental mode: evaluate the ROM on all the nodes in the next run?
     self.addAssemblerObject('ROM','-1', True)
     self.addAssemblerObject('Function','1')
     self.printTag = 'POSTPROCESSOR LIMITSURFACE'
@@ -131,8 +141,11 @@ class LimitSurface(PostProcessor):
     self.externalFunction = self.assemblerDict['Function'][0][3]
     if 'ROM' not in self.assemblerDict.keys():
       self.ROM = LearningGate.returnInstance('SupervisedGate','SciKitLearn', self, **{'SKLtype':'neighbors|KNeighborsClassifier',"n_neighbors":1, 'Features':','.join(list(self.parameters['targets'])), 'Target':[self.externalFunction.name]})
+      self.nearestNeighborROM = True
     else:
       self.ROM = self.assemblerDict['ROM'][0][3]
+      romOptions = self.ROM.initializationOptionDict if self.ROM.subType == 'SciKitLearn' else {}
+      self.nearestNeighborROM = romOptions.get('SKLtype') == 'neighbors|KNeighborsClassifier' and romOptions.get('n_neighbors') == 1
     self.ROM.reset()
     self.indexes = -1
     for index, inp in enumerate(self.inputs):
@@ -267,6 +280,8 @@ class LimitSurface(PostProcessor):
       self.lsSide = dictIn["side"]
     if "tolerance" in dictIn.keys():
       self.tolerance = float(dictIn["tolerance"])
+    if "incremental" in dictIn.keys():
+      self.incremental = dictIn["incremental"]
     if self.lsSide not in ["negative", "positive", "both"]:
       self.raiseAnError(IOError, 'Computation side can be positive, negative, both only !!!!')
 
@@ -362,6 +377,7 @@ class LimitSurface(PostProcessor):
     for nodeName in self.gridEntity.getAllNodesNames(self.name):
       if nodeName != self.name:
         self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
+        self.gridTree.pop(nodeName,None)
 
   def run(self, inputIn = None, returnListSurfCoord = False, exceptionGrid = None, merge = True):
     """
@@ -383,14 +399,17 @@ class LimitSurface(PostProcessor):
     self.surfPoint, evaluations, listSurfPoint = OrderedDict().fromkeys(allGridNames), OrderedDict().fromkeys(allGridNames) ,OrderedDict().fromkeys(allGridNames)
     for nodeName in allGridNames:
       #if skipMainGrid == True and nodeName == self.name: continue
-      self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
       self.gridCoord[nodeName] = self.gridEntity.returnGridAsArrayOfCoordinates(nodeName=nodeName)
-      tempDict ={}
-      for  varId, varName in enumerate(self.axisName):
-        tempDict[varName] = self.gridCoord[nodeName][:,varId]
-      self.testMatrix[nodeName].shape     = (self.gridCoord[nodeName].shape[0])                       #rearrange the grid matrix such as is an array of values
-      self.testMatrix[nodeName][:]        = self.ROM.evaluate(tempDict)[self.externalFunction.name]   #get the prediction on the testing grid
-      self.testMatrix[nodeName].shape     = self.gridEntity.returnParameter("gridShape",nodeName)     #bring back the grid structure
+      if self.incremental:
+        self.__updateTestMatrix(nodeName)
+      else:
+        self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
+        tempDict ={}
+        for  varId, varName in enumerate(self.axisName):
+          tempDict[varName] = self.gridCoord[nodeName][:,varId]
+        self.testMatrix[nodeName].shape     = (self.gridCoord[nodeName].shape[0])                       #rearrange the grid matrix such as is an array of values
+        self.testMatrix[nodeName][:]        = self.ROM.evaluate(tempDict)[self.externalFunction.name]   #get the prediction on the testing grid
+        self.testMatrix[nodeName].shape     = self.gridEntity.returnParameter("gridShape",nodeName)     #bring back the grid structure
       self.gridCoord[nodeName].shape      = self.gridEntity.returnParameter("gridCoorShape",nodeName) #bring back the grid structure
       self.raiseADebug('LimitSurface: Prediction performed')
       # here next the points that are close to any change are detected by a gradient (it is a pre-screener)
@@ -431,10 +450,9 @@ class LimitSurface(PostProcessor):
           self.raiseADebug('LimitSurface: ' + myStr + '  value: ' + str(self.testMatrix[nodeName][tuple(coordinate)]))
       # if the number of point on the limit surface is > than zero than save it
       if len(listSurfPoint[nodeName]) > 0:
-        self.surfPoint[nodeName] = np.ndarray((len(listSurfPoint[nodeName]), self.nVar))
         evaluations[nodeName] = np.concatenate((-np.ones(nNegPoints), np.ones(nPosPoints)), axis = 0)
-        for pointID, coordinate in enumerate(listSurfPoint[nodeName]):
-          self.surfPoint[nodeName][pointID, :] = self.gridCoord[nodeName][tuple(coordinate)]
+        self.surfPoint[nodeName] = self.gridCoord[nodeName][tuple(np.asarray(listSurfPoint[nodeName]).T)]
+    self.fullEvaluation = False
     if self.name != exceptionGrid:
       self.listSurfPointNegative, self.listSurfPointPositive = listSurfPoint[self.name][:nNegPoints-1],listSurfPoint[self.name][nNegPoints:]
     if merge == True:
@@ -446,6 +464,79 @@ class LimitSurface(PostProcessor):
       returnSurface = (self.surfPoint, evaluations, listSurfPoint) if returnListSurfCoord else (self.surfPoint, evaluations)
     return returnSurface
 
+  def __updateTestMatrix(self, nodeName):
+    """
+      Incremental mode: updates the test matrix of a grid after new samples have been added.
+      The closest sample of each grid node is tracked (see mathUtils.updateNearestSamples), with the variables scaled
+      by the size of the main grid: unlike the Z-normalization of the ROMs, this does not change with the samples.
+      With a nearest neighbor classifier (self.nearestNeighborROM), each node takes the value of its closest sample,
+      that is exactly the classification of the whole grid (in the scaled variables). With the other ROMs, they are
+      only evaluated on the nodes whose closest sample changed (on all the nodes if self.fullEvaluation is set); the
+      other nodes keep their previous classification.
+      @ In, nodeName, string, the grid name (its coordinates in self.gridCoord[nodeName], shaped (#nodes, #variables))
+      @ Out, None
+    """
+    coordinates = self.gridCoord[nodeName]
+    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
+    if self.distanceScale is None:
+      mainCoordinates = coordinates if nodeName == self.name else self.gridCoord[self.name]
+      self.distanceScale = np.ptp(np.reshape(mainCoordinates,(-1,len(self.axisName))),axis=0)
+      self.distanceScale[self.distanceScale == 0.0] = 1.0
+    nodes = coordinates/self.distanceScale
+    samples = np.asarray([self.functionValue[varName] for varName in self.axisName],dtype=float).T/self.distanceScale
+    if nodeName not in self.gridTree:
+      # first evaluation of this grid: all the nodes
+      self.gridTree[nodeName] = spatial.cKDTree(nodes)
+      self.nearestDistance[nodeName], self.nearestSample[nodeName] = spatial.cKDTree(samples).query(nodes)
+      toBeEvaluated = np.arange(len(nodes))
+    else:
+      toBeEvaluated = mathUtils.updateNearestSamples(self.gridTree[nodeName], nodes, samples, self.numIncorporated[nodeName],
+                                                     self.nearestDistance[nodeName], self.nearestSample[nodeName])
+      if self.fullEvaluation and not self.nearestNeighborROM:
+        toBeEvaluated = np.arange(len(nodes))
+    self.numIncorporated[nodeName] = len(samples)
+    oldValues = self.testMatrix[nodeName].reshape(-1)[toBeEvaluated] if nodeName in self.testMatrix else 0.0
+    if nodeName not in self.testMatrix or self.testMatrix[nodeName].shape != tuple(gridShape):
+      self.testMatrix[nodeName] = np.zeros(gridShape)
+    testMatrix = self.testMatrix[nodeName].reshape(-1)
+    if len(toBeEvaluated) > 0:
+      if self.nearestNeighborROM:
+        testMatrix[toBeEvaluated] = self.functionValue[self.externalFunction.name][self.nearestSample[nodeName][toBeEvaluated]]
+      else:
+        tempDict = {}
+        for varId, varName in enumerate(self.axisName):
+          tempDict[varName] = coordinates[toBeEvaluated,varId]
+        testMatrix[toBeEvaluated] = np.asarray(self.ROM.evaluate(tempDict)[self.externalFunction.name]).reshape(-1)
+    self.testMatrixChange[nodeName] = np.sum(np.abs(testMatrix[toBeEvaluated] - oldValues))
+
+  def getTestMatrixChange(self, nodeName):
+    """
+      Incremental mode: returns how much a test matrix changed in the last run (sum of the absolute changes).
+      @ In, nodeName, string, the grid name
+      @ Out, testMatrixChange, float, the change
+    """
+    return self.testMatrixChange[nodeName]
+
+  def getNearestSampleDistance(self, nodeName):
+    """
+      Incremental mode: returns the distance of the nodes of a grid from their closest sample
+      (with the variables scaled by getDistanceScale).
+      @ In, nodeName, string, the grid name
+      @ Out, nearestDistance, np.ndarray, the distances (flattened grid), None if the samples
+        evaluated so far are not all accounted for
+    """
+    if self.numIncorporated.get(nodeName) != len(self.functionValue.get(self.axisName[0],[])):
+      return None
+    return self.nearestDistance[nodeName]
+
+  def getDistanceScale(self):
+    """
+      Incremental mode: returns the scale of each variable in the distances of getNearestSampleDistance.
+      @ In, None
+      @ Out, distanceScale, np.ndarray, the scales (None before the first run)
+    """
+    return self.distanceScale
+
   def __localLimitStateSearch__(self, toBeTested, sign, nodeName):
     """
       It returns the list of points belonging to the limit state surface and resulting in
@@ -456,29 +547,8 @@ class LimitSurface(PostProcessor):
       @ In, nodeName, string, the sub-grid name
       @ Out, listSurfPoint, list, the list of limit surface coordinates
     """
-    #TODO: This approach might be extremely slow. It must be replaced with matrix operations
-    listSurfPoint = []
-    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
-    myIdList = np.zeros(self.nVar,dtype=int)
-    putIt = np.zeros(self.nVar,dtype=bool)
-    for coordinate in np.rollaxis(toBeTested, 0):
-      myIdList[:] = coordinate
-      putIt[:]    = False
-      if self.testMatrix[nodeName][tuple(coordinate)] * sign > 0:
-        for iVar in range(self.nVar):
-          if coordinate[iVar] + 1 < gridShape[iVar]:
-            myIdList[iVar] += 1
-            if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-              putIt[iVar] = True
-              listSurfPoint.append(copy.copy(coordinate))
-              break
-            myIdList[iVar] -= 1
-            if coordinate[iVar] > 0:
-              myIdList[iVar] -= 1
-              if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-                putIt[iVar] = True
-                listSurfPoint.append(copy.copy(coordinate))
-                break
-              myIdList[iVar] += 1
-      #if len(set(putIt)) == 1 and  list(set(putIt))[0] == True: listSurfPoint.append(copy.copy(coordinate))
+    toBeTested = np.asarray(toBeTested,dtype=int).reshape(-1,self.nVar)
+    # the sign change is detected on the whole grid at once, then the candidate points are filtered
+    onSurface = mathUtils.gridSignChange(self.testMatrix[nodeName] * sign)
+    listSurfPoint = list(toBeTested[onSurface[tuple(toBeTested.T)]])
     return listSurfPoint
@@ -22,15 +22,16 @@ warnings.simplefilter('default', DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-import xarray
 import math
 import os
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from .PostProcessor import PostProcessor
-from .BasicStatistics import BasicStatistics
+from utils import utils
 from utils import InputData
+from utils import randomUtils
+from utils import streamingStatistics
 import LearningGate
 import Files
 import Runners
@@ -75,6 +76,15 @@ class LimitSurfaceIntegral(PostProcessor):
     LSISeedInput = InputData.parameterInputFactory("seed", contentType=InputData.IntegerType)
     inputSpecification.addSub(LSISeedInput)
 
+    LSIChunkSizeInput = InputData.parameterInputFactory("chunkSize", contentType=InputData.IntegerType)
+    inputSpecification.addSub(LSIChunkSizeInput)
+
+    LSIEarlyStoppingInput = InputData.parameterInputFactory("earlyStopping", contentType=InputData.BoolType)
+    inputSpecification.addSub(LSIEarlyStoppingInput)
+
+    LSIMinimumEventsInput = InputData.parameterInputFactory("minimumEvents", contentType=InputData.IntegerType)
+    inputSpecification.addSub(LSIMinimumEventsInput)
+
     LSITargetInput = InputData.parameterInputFactory("target", contentType=InputData.StringType)
     inputSpecification.addSub(LSITargetInput)
 
@@ -93,14 +103,22 @@ class LimitSurfaceIntegral(PostProcessor):
     self.variableDist = {}  # dictionary created upon the .xml input file reading. It stores the distributions for each variable.
     self.target = None  # target that defines the f(x1,x2,...,xn)
     self.tolerance = 0.0001  # integration tolerance
-    self.integralType = 'montecarlo'  # integral type (which alg needs to be used). Either montecarlo or quadrature(quadrature not yet)
+    self.integralType = 'montecarlo'  # integral type (which alg needs to be used). Either montecarlo, halton, sobol or importancesampling
     self.seed = 20021986  # seed for montecarlo
+    self.chunkSize = 10000  # number of samples evaluated at once
+    self.earlyStopping = False  # stop as soon as the estimated standard error is not above the tolerance?
+    self.minimumEvents = 10  # minimum number of samples in and out of the event before stopping early (the error estimate is not reliable before)
+    self.randomShifts = 10  # number of independent random shifts of the quasi-random points (halton and sobol), used to estimate the error
+    self.defensiveFraction = 0.1  # fraction of the importance sampling samples drawn uniformly (bounds the weights)
+    self.maxCenters = 1000  # maximum number of limit surface points used as centers of the importance sampling density
+    self.centers = None  # centers of the importance sampling density (in the unit hypercube)
+    self.bandwidth = None  # standard deviations of the importance sampling kernels (in the unit hypercube)
+    self.integralError = None  # estimated standard error of the last integral
+    self.numEvaluations = 0  # number of evaluations of the last integral
     self.matrixDict = {}  # dictionary of arrays and target
     self.lowerUpperDict = {}
     self.functionS = None
     self.computationPrefix = None
-    self.stat = BasicStatistics(self.messageHandler)  # instantiation of the 'BasicStatistics' processor, which is used to compute the pb given montecarlo evaluations
-    self.stat.what = ['expectedValue']
     self.addAssemblerObject('distribution','-n', newXmlFlg = True)
     self.printTag = 'POSTPROCESSOR INTEGRAL'
 
@@ -147,17 +165,24 @@ class LimitSurfaceIntegral(PostProcessor):
           self.raiseAnError(ValueError, "tolerance can not be converted into a float value!")
       elif child.getName() == 'integralType':
         self.integralType = child.value.strip().lower()
-        if self.integralType not in ['montecarlo']:
-          self.raiseAnError(IOError, 'only one integral types are available: MonteCarlo!')
+        if self.integralType not in ['montecarlo', 'halton', 'sobol', 'importancesampling']:
+          self.raiseAnError(IOError, 'the available integral types are: MonteCarlo, Halton, Sobol and ImportanceSampling! Got: ' + child.value)
       elif child.getName() == 'seed':
         try:
           self.seed = child.value
         except ValueError:
           self.raiseAnError(ValueError, 'seed can not be converted into a int value!')
-        if self.integralType != 'montecarlo':
-          self.raiseAWarning('integral type is ' + self.integralType + ' but a seed has been inputted!!!')
-        else:
-          np.random.seed(self.seed)
+        np.random.seed(self.seed)
+      elif child.getName() == 'chunkSize':
+        self.chunkSize = child.value
+        if self.chunkSize < 2:
+          self.raiseAnError(IOError, 'chunkSize needs to be at least 2! Got: ' + str(self.chunkSize))
+      elif child.getName() == 'earlyStopping':
+        self.earlyStopping = child.value
+      elif child.getName() == 'minimumEvents':
+        self.minimumEvents = child.value
+        if self.minimumEvents < 0:
+          self.raiseAnError(IOError, 'minimumEvents can not be negative! Got: ' + str(self.minimumEvents))
       elif child.getName() == 'target':
         self.target = child.value
       elif child.getName() == 'outputName':
@@ -171,6 +196,8 @@ class LimitSurfaceIntegral(PostProcessor):
             self.raiseAnError(NameError, 'either a distribution name or lowerBound and upperBound need to be specified for variable ' + varName)
     if self.computationPrefix == None:
       self.raiseAnError(IOError,'The required XML node <outputName> has not been inputted!!!')
+    if self.integralType == 'sobol' and len(self.variableDist) > randomUtils.sobolMaxDimension:
+      self.raiseAnError(IOError, 'the Sobol sequence is available up to ' + str(randomUtils.sobolMaxDimension) + ' variables. Use the Halton integral type!')
     if self.target == None:
       self.raiseAWarning('integral target has not been provided. The postprocessor is going to take the last output it finds in the provided limitsurface!!!')
 
@@ -183,9 +210,6 @@ class LimitSurfaceIntegral(PostProcessor):
       @ Out, None
     """
     self.inputToInternal(inputs)
-    if self.integralType in ['montecarlo']:
-      self.stat.toDo = {'expectedValue':[{'targets':set([self.target]), 'prefix':self.computationPrefix}]}
-      self.stat.initialize(runInfo, inputs, initDict)
     self.functionS = LearningGate.returnInstance('SupervisedGate','SciKitLearn', self, **{'SKLtype':'neighbors|KNeighborsClassifier', 'Features':','.join(list(self.variableDist.keys())), 'Target':self.target})
     self.functionS.train(self.matrixDict)
     self.raiseADebug('DATA SET MATRIX:')
@@ -195,6 +219,27 @@ class LimitSurfaceIntegral(PostProcessor):
         self.variableDist[varName] = self.retrieveObjectFromAssemblerDict('distribution', distName)
         self.lowerUpperDict[varName]['lowerBound'] = self.variableDist[varName].lowerBound
         self.lowerUpperDict[varName]['upperBound'] = self.variableDist[varName].upperBound
+    if self.integralType == 'importancesampling':
+      self._initializeImportanceSampling()
+
+  def _initializeImportanceSampling(self):
+    """
+      Builds the importance sampling density: a mixture of gaussian kernels centered on the limit surface points
+      (in the unit hypercube, where the integrand density is uniform), with a bandwidth from Scott's rule
+      @ In, None
+      @ Out, None
+    """
+    centers = np.zeros((len(self.matrixDict[self.target]), len(self.variableDist)))
+    for index, varName in enumerate(self.variableDist.keys()):
+      if self.variableDist[varName] == None:
+        lowerBound, upperBound = self.lowerUpperDict[varName]['lowerBound'], self.lowerUpperDict[varName]['upperBound']
+        centers[:, index] = (self.matrixDict[varName] - lowerBound) / (upperBound - lowerBound)
+      else:
+        centers[:, index] = self.variableDist[varName].cdf(self.matrixDict[varName])
+    if len(centers) > self.maxCenters:
+      centers = centers[np.random.choice(len(centers), self.maxCenters, replace=False)]
+    self.centers = centers
+    self.bandwidth = np.maximum(np.std(centers, axis=0) * len(centers)**(-1.0 / (centers.shape[1] + 4)), 0.01)
 
   def inputToInternal(self, currentInput):
     """
@@ -229,24 +274,102 @@ class LimitSurfaceIntegral(PostProcessor):
   def run(self, input):
     """
       This method executes the postprocessor action. In this case, it performs the computation of the LS integral
+      The integrand is evaluated by chunks of self.chunkSize samples (up to ceil(1/tolerance^2) samples), keeping
+      a running estimate of the probability and of its standard error.
+      With early stopping, the integration stops once the error is within the tolerance and at least
+      self.minimumEvents samples fell in and out of the event: the estimated error is zero as long as no sample
+      fell in the event, which would stop the integration of a rare event with a zero probability.
       @ In,  input, object, object contained the data to process. (inputToInternal output)
       @ Out, pb, float, integral outcome (probability of the event)
     """
-    pb = None
-    if self.integralType == 'montecarlo':
-      tempDict = {}
-      randomMatrix = np.random.rand(int(math.ceil(1.0 / self.tolerance**2)), len(self.variableDist.keys()))
-      for index, varName in enumerate(self.variableDist.keys()):
-        if self.variableDist[varName] == None:
-          randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
-        else:
-          f = np.vectorize(self.variableDist[varName].ppf, otypes=[np.float])
-          randomMatrix[:, index] = f(randomMatrix[:, index])
-        tempDict[varName] = randomMatrix[:, index]
-      pb = self.stat.run({'targets':{self.target:xarray.DataArray(self.functionS.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target]
+    maxSamples = int(math.ceil(1.0 / self.tolerance**2))
+    nVar = len(self.variableDist)
+    quasiRandom = self.integralType in ['halton', 'sobol']
+    if quasiRandom:
+      # randomized quasi Monte Carlo: the same low discrepancy points are shifted (modulo 1) by independent
+      # random vectors, the spread of the estimates of the shifted point sets gives the error
+      shifts = np.random.rand(self.randomShifts, nVar)
+      estimators = [streamingStatistics.WeightedMoments() for _ in range(self.randomShifts)]
+      sequence = randomUtils.haltonSequence if self.integralType == 'halton' else randomUtils.sobolSequence
     else:
-      self.raiseAnError(NotImplemented, "quadrature not yet implemented")
-    return pb
+      estimator = streamingStatistics.WeightedMoments()
+    numSamples, numEvents, sequenceIndex = 0, 0, 0
+    pb, error = None, None
+    while numSamples < maxSamples:
+      chunkSize = min(self.chunkSize, maxSamples - numSamples)
+      if quasiRandom:
+        pointsPerShift = int(math.ceil(chunkSize / float(self.randomShifts)))
+        points = sequence(nVar, pointsPerShift, start=sequenceIndex)
+        for estimatorShift, shift in zip(estimators, shifts):
+          values = self._evaluateIntegrand(np.mod(points + shift, 1.0))
+          estimatorShift.update(values)
+          numEvents += np.count_nonzero(values)
+        sequenceIndex += pointsPerShift
+        chunkSize = pointsPerShift * self.randomShifts
+        estimates = [estimatorShift.expectedValue() for estimatorShift in estimators]
+        pb = np.mean(estimates)
+        error = np.std(estimates, ddof=1) / math.sqrt(self.randomShifts)
+      else:
+        if self.integralType == 'importancesampling':
+          values = self._importanceSamplingChunk(chunkSize)
+        else:
+          values = self._evaluateIntegrand(np.random.rand(chunkSize, nVar))
+        estimator.update(values)
+        numEvents += np.count_nonzero(values)
+        pb = estimator.expectedValue()
+        error = estimator.sigma() / math.sqrt(estimator.count) if estimator.count > 1 else None
+      numSamples += chunkSize
+      if self.earlyStopping and error is not None and error <= self.tolerance and min(numEvents, numSamples - numEvents) >= self.minimumEvents:
+        break
+    self.integralError, self.numEvaluations = error, numSamples
+    self.raiseAMessage('Integral of ' + self.target + ': ' + str(pb) + ' (estimated standard error ' + str(error) + ', ' + str(numSamples) + ' evaluations)')
+    return float(pb)
+
+  def _evaluateIntegrand(self, unitPoints):
+    """
+      Evaluates the indicator function of the event (the classifier trained on the limit surface) on points of
+      the unit hypercube, mapped to the integration domain through the inverse CDFs or the bounds of the variables
+      @ In, unitPoints, np.array, the points in the unit hypercube, shaped (number of points, number of variables)
+      @ Out, values, np.array, the indicator function (0 or 1) at each point
+    """
+    tempDict = {}
+    for index, varName in enumerate(self.variableDist.keys()):
+      if self.variableDist[varName] == None:
+        tempDict[varName] = unitPoints[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
+      else:
+        tempDict[varName] = self.variableDist[varName].ppf(unitPoints[:, index])
+    return np.asarray(self.functionS.evaluate(tempDict)[self.target], dtype=float).reshape(-1)
+
+  def _importanceSamplingChunk(self, chunkSize):
+    """
+      Draws samples from the importance sampling density (a defensive mixture of the uniform density on the unit
+      hypercube and of the gaussian kernels centered on the limit surface points) and evaluates the weighted integrand
+      @ In, chunkSize, int, the number of samples
+      @ Out, values, np.array, the integrand times the likelihood ratio at each sample (0 outside the hypercube)
+    """
+    nVar = len(self.variableDist)
+    numUniform = np.random.binomial(chunkSize, self.defensiveFraction)
+    points = np.random.rand(chunkSize, nVar)
+    kernels = self.centers[np.random.randint(len(self.centers), size=chunkSize - numUniform)]
+    points[numUniform:] = kernels + np.random.randn(chunkSize - numUniform, nVar) * self.bandwidth
+    inside = np.all((points >= 0.0) & (points <= 1.0), axis=1)
+    density = self.defensiveFraction + (1.0 - self.defensiveFraction) * self._kernelDensity(points[inside])
+    values = np.zeros(chunkSize)
+    values[inside] = self._evaluateIntegrand(points[inside]) / density
+    return values
+
+  def _kernelDensity(self, points):
+    """
+      Evaluates the mixture of the gaussian kernels centered on the limit surface points
+      @ In, points, np.array, the points, shaped (number of points, number of variables)
+      @ Out, density, np.array, the density at each point
+    """
+    density = np.zeros(len(points))
+    # the centers are processed in blocks, to bound the memory
+    for start in range(0, len(self.centers), 100):
+      deviation = (points[:, np.newaxis, :] - self.centers[np.newaxis, start:start + 100, :]) / self.bandwidth
+      density += np.sum(np.exp(-0.5 * np.sum(deviation**2, axis=2)), axis=1)
+    return density / (len(self.centers) * np.prod(self.bandwidth) * (2.0 * np.pi)**(0.5 * len(self.bandwidth)))
 
   def collectOutput(self, finishedJob, output):
     """
@@ -101,7 +101,7 @@ class DistributedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return self.thread.finished
+      return self.finished or self.thread.finished
 
   def _collectRunnerResponse(self):
     """
@@ -124,7 +124,10 @@ class DistributedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = self.__ppserver.submit(self.functionToRun, args=self.args, depfuncs=(), modules = tuple(list(set(self.frameworkMods))),functionToSkip=self.functionToSkip)
+      self.finished = False
+      ## parallel python calls the callback with the result once the job is done
+      self.thread = self.__ppserver.submit(self.functionToRun, args=self.args, depfuncs=(), modules = tuple(list(set(self.frameworkMods))),
+                                           callback=lambda result: self._signalFinished(), functionToSkip=self.functionToSkip)
       self.trackTime('runner_started')
       self.started = True
     except Exception as ae:
@@ -146,3 +149,4 @@ class DistributedMemoryRunner(InternalRunner):
     self.thread = None
     self.returnCode = -1
     self.trackTime('runner_killed')
+    self._signalFinished()
@@ -0,0 +1,495 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runs internal objects in a pool of persistent local worker processes.
+  The object whose method a job runs (e.g. the Model in Model.evaluateSample)
+  is pickled once and shipped once to each worker, then only the remaining
+  arguments (sampled variables, metadata) travel with each job. The object is
+  shipped again when a new step starts or when its "stateVersion" attribute
+  changes (e.g. a ROM trained during a step); any other change of its state
+  during a step is not seen by the workers.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import io
+import os
+import sys
+import atexit
+import types
+import importlib
+import threading
+import traceback
+import collections
+import multiprocessing
+from six.moves import cPickle as pickle
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from utils import utils
+import MessageHandler
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+def _persistentId(obj):
+  """
+    Pickles modules (e.g. the module of an ExternalModel) by reference.
+    @ In, obj, object, object being pickled
+    @ Out, persistentId, tuple, reference to the module, None for any other object
+  """
+  if isinstance(obj, types.ModuleType):
+    filename = getattr(obj, '__file__', None)
+    ## the workers do not share the working directory and search path of this process
+    if filename is not None:
+      filename = os.path.abspath(filename)
+    return ('module', obj.__name__, filename)
+  return None
+
+def _persistentLoad(persistentId):
+  """
+    Retrieves a module pickled by _persistentId, importing it if needed.
+    @ In, persistentId, tuple, reference to the module
+    @ Out, module, module, the module
+  """
+  _, name, filename = persistentId
+  module = sys.modules.get(name)
+  if module is None:
+    if filename is not None and os.path.exists(filename):
+      module = utils.importFromPath(filename, False)
+    else:
+      module = importlib.import_module(name)
+  return module
+
+def _dumps(obj):
+  """
+    Pickles an object for the workers.
+    @ In, obj, object, object to pickle
+    @ Out, data, bytes, the pickled object
+  """
+  stream = io.BytesIO()
+  pickler = pickle.Pickler(stream, pickle.HIGHEST_PROTOCOL)
+  pickler.persistent_id = _persistentId
+  pickler.dump(obj)
+  return stream.getvalue()
+
+def _loads(data):
+  """
+    Unpickles an object pickled by _dumps.
+    @ In, data, bytes, the pickled object
+    @ Out, obj, object, the object
+  """
+  unpickler = pickle.Unpickler(io.BytesIO(data))
+  unpickler.persistent_load = _persistentLoad
+  return unpickler.load()
+
+def _getContext():
+  """
+    Gets the multiprocessing context used to start the workers. This process runs
+    several threads (e.g. the JobHandler loop, the listeners of the pool), so a
+    worker forked from it could inherit locks held by the other threads: on python 3
+    the workers are forked from a single-threaded server process instead (forkserver,
+    or spawned where it is not available). Python 2 can only fork.
+    @ In, None
+    @ Out, context, multiprocessing context, the context (the multiprocessing module on python 2)
+  """
+  if not hasattr(multiprocessing, 'get_context'):
+    return multiprocessing
+  if 'forkserver' in multiprocessing.get_all_start_methods():
+    return multiprocessing.get_context('forkserver')
+  return multiprocessing.get_context('spawn')
+
+def _workerLoop(connection, searchPath):
+  """
+    Main loop of a worker process: receives jobs, runs them, sends back their results.
+    Each job message is (generation, ownerKey, owner, job), where "owner" is the pickled
+    object whose method the job runs (only sent the first time this worker needs it, or
+    when it changed, None otherwise) and "job" is the pickled (function, methodName, args).
+    An empty message stops the worker.
+    @ In, connection, multiprocessing.Connection, the worker end of the pipe to the pool
+    @ In, searchPath, list, the module search path of the pool process (sys.path)
+    @ Out, None
+  """
+  ## the worker is not forked from the pool process, so it does not know where the modules it imported are
+  for path in searchPath:
+    if path not in sys.path:
+      sys.path.append(path)
+  owners = {}
+  currentGeneration = None
+  while True:
+    try:
+      message = connection.recv_bytes()
+    except (EOFError, IOError):
+      break
+    if len(message) == 0:
+      break
+    try:
+      generation, ownerKey, owner, job = _loads(message)
+      ## the objects shipped during a previous step might be outdated
+      if generation != currentGeneration:
+        owners.clear()
+        currentGeneration = generation
+      if owner is not None:
+        owners[ownerKey] = _loads(owner)
+      function, methodName, args = _loads(job)
+      if ownerKey is not None:
+        function = getattr(owners[ownerKey], methodName)
+      result = _dumps((True, function(*args)))
+    except Exception:
+      result = _dumps((False, traceback.format_exc()))
+    try:
+      connection.send_bytes(result)
+    except (EOFError, IOError):
+      break
+
+class _Worker(object):
+  """
+    Bookkeeping for one worker process of the ProcessPool.
+  """
+  def __init__(self):
+    """
+      Starts a new worker process.
+      @ In, None
+      @ Out, None
+    """
+    context = _getContext()
+    self.connection, workerEnd = context.Pipe()
+    self.process = context.Process(target=_workerLoop, args=(workerEnd, list(sys.path)))
+    self.process.daemon = True
+    ## do not let the worker inherit buffered output
+    sys.stdout.flush()
+    sys.stderr.flush()
+    self.process.start()
+    workerEnd.close()
+    self.runner = None      ## runner currently running on this worker
+    self.shipped = {}       ## {ownerKey: stateVersion} of the owners this worker already has
+
+  def hasOwnerOf(self, runner):
+    """
+      Checks if this worker already has the current state of the object whose method a job runs.
+      @ In, runner, ProcessPoolRunner, the runner of the job
+      @ Out, hasOwner, bool, True if the object does not need to be shipped
+    """
+    hasOwner = runner.ownerKey in self.shipped and self.shipped[runner.ownerKey] == runner.ownerVersion
+    return hasOwner
+
+class ProcessPool(MessageHandler.MessageUser):
+  """
+    Pool of persistent worker processes on the local machine, used by the
+    ProcessPoolRunner. Jobs are queued here and dispatched to idle workers.
+  """
+  def __init__(self, numWorkers, messageHandler):
+    """
+      Init method, starts the worker processes.
+      @ In, numWorkers, int, number of worker processes
+      @ In, messageHandler, MessageHandler object, the global RAVEN message
+        handler object
+      @ Out, None
+    """
+    self.printTag = 'Process Pool'
+    self.messageHandler = messageHandler
+    self.__lock = threading.RLock()
+    self.__pending = collections.deque()  ## runners waiting for a free worker
+    self.__owners = {}                    ## {ownerKey: (owner, stateVersion, pickled owner)} for the current generation
+    self.__generation = 0                 ## increased when the shipped owners might be outdated
+    self.__closed = False
+    self.__workers = []
+    with self.__lock:
+      for _ in range(max(1, numWorkers)):
+        self.__startWorker()
+    self.raiseADebug('Started', len(self.__workers), 'worker processes')
+    ## stop the workers before multiprocessing terminates them at exit, so they
+    ## are not taken for crashed workers and replaced
+    atexit.register(self.shutdown)
+
+  def __startWorker(self):
+    """
+      Starts a worker process and the thread listening to it. Call with the lock held.
+      @ In, None
+      @ Out, None
+    """
+    worker = _Worker()
+    self.__workers.append(worker)
+    listener = threading.Thread(target=self.__listen, args=(worker,), name='ProcessPool-{}'.format(worker.process.pid))
+    listener.daemon = True
+    listener.start()
+
+  def __listen(self, worker):
+    """
+      Collects the results of a worker, one job after the other, until the
+      worker goes away.
+      @ In, worker, _Worker, the worker
+      @ Out, None
+    """
+    while True:
+      try:
+        success, returnValue = _loads(worker.connection.recv_bytes())
+      except (EOFError, IOError):
+        break
+      except Exception:
+        success, returnValue = False, traceback.format_exc()
+      with self.__lock:
+        runner = worker.runner
+        worker.runner = None
+        if runner is None:
+          ## the job was killed in the meantime
+          continue
+        if not success:
+          ## the owner may not have been set up, so send it again next time
+          worker.shipped.pop(runner.ownerKey, None)
+        self.__dispatch()
+      runner.setResult(success, returnValue)
+    ## the worker is gone: replace it, unless it was stopped on purpose
+    with self.__lock:
+      runner = worker.runner
+      worker.runner = None
+      if worker in self.__workers:
+        self.__workers.remove(worker)
+        if not self.__closed:
+          self.raiseAWarning('A worker process terminated unexpectedly, starting a new one')
+          self.__startWorker()
+          self.__dispatch()
+    worker.connection.close()
+    if runner is not None:
+      runner.setResult(False, 'The worker process running the job terminated unexpectedly')
+
+  def reset(self):
+    """
+      Forgets the objects already shipped to the workers, so they are sent again
+      (with their current state) the next time a job needs them. Called when a
+      new step starts.
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__generation += 1
+      self.__owners = {}
+      for worker in self.__workers:
+        worker.shipped.clear()
+
+  def submit(self, runner):
+    """
+      Queues the job of a runner; it starts as soon as a worker is free.
+      @ In, runner, ProcessPoolRunner, the runner
+      @ Out, None
+    """
+    owner, methodName, args = _splitMethod(runner.functionToRun, runner.args)
+    try:
+      with self.__lock:
+        if self.__closed:
+          raise RuntimeError('the process pool has been shut down')
+        if owner is not None:
+          runner.ownerKey = id(owner)
+          runner.ownerVersion = getattr(owner, 'stateVersion', None)
+          ## pickle the object again if its state changed since it was last shipped
+          cached = self.__owners.get(runner.ownerKey)
+          if cached is None or cached[1] != runner.ownerVersion:
+            self.__owners[runner.ownerKey] = (owner, runner.ownerVersion, _dumps(owner))
+          runner.ownerData = self.__owners[runner.ownerKey][2]
+      if owner is not None:
+        runner.job = _dumps((None, methodName, args))
+      else:
+        runner.job = _dumps((runner.functionToRun, None, args))
+    except Exception:
+      runner.setResult(False, traceback.format_exc())
+      return
+    with self.__lock:
+      self.__pending.append(runner)
+      self.__dispatch()
+
+  def __dispatch(self):
+    """
+      Sends the pending jobs to the idle workers, preferring workers that
+      already have (the current state of) the object the job needs. Call with the lock held.
+      @ In, None
+      @ Out, None
+    """
+    while len(self.__pending) > 0:
+      idle = [worker for worker in self.__workers if worker.runner is None]
+      if len(idle) == 0:
+        return
+      runner = self.__pending.popleft()
+      worker = idle[0]
+      for candidate in idle:
+        if candidate.hasOwnerOf(runner):
+          worker = candidate
+          break
+      owner = None
+      if runner.ownerKey is not None and not worker.hasOwnerOf(runner):
+        owner = runner.ownerData
+        worker.shipped[runner.ownerKey] = runner.ownerVersion
+      worker.runner = runner
+      try:
+        worker.connection.send_bytes(_dumps((self.__generation, runner.ownerKey, owner, runner.job)))
+      except (EOFError, IOError, OSError):
+        ## the worker is gone, its listener will fail the job and replace it
+        pass
+
+  def cancel(self, runner):
+    """
+      Removes a job from the pool. If it is running, its worker process is
+      terminated and replaced.
+      @ In, runner, ProcessPoolRunner, the runner
+      @ Out, None
+    """
+    with self.__lock:
+      if runner in self.__pending:
+        self.__pending.remove(runner)
+        return
+      for worker in self.__workers:
+        if worker.runner is runner:
+          worker.runner = None
+          self.__workers.remove(worker)
+          worker.process.terminate()
+          if not self.__closed:
+            self.__startWorker()
+            self.__dispatch()
+          return
+
+  def shutdown(self):
+    """
+      Stops the worker processes. Jobs still pending fail.
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__closed = True
+      workers = self.__workers
+      self.__workers = []
+      pending = list(self.__pending)
+      self.__pending.clear()
+    for worker in workers:
+      try:
+        worker.connection.send_bytes(b'')
+      except (EOFError, IOError):
+        pass
+    for worker in workers:
+      worker.process.join(1.0)
+      if worker.process.is_alive():
+        worker.process.terminate()
+    for runner in pending:
+      runner.setResult(False, 'The process pool was shut down before the job started')
+
+def _splitMethod(function, args):
+  """
+    Identifies the object whose method a job runs, so it can be shipped once per
+    worker instead of once per job. This is either the object a method is bound
+    to, or the first argument when the function is a method of its class (as in
+    the "self.__class__.evaluateSample, (self, ...)" jobs of the Models).
+    @ In, function, function or method, the function of the job
+    @ In, args, tuple, the arguments of the job
+    @ Out, owner, object, the object, None if the function is not a method
+    @ Out, methodName, str, the name of the method, None if there is no owner
+    @ Out, args, tuple, the arguments to pass to the method of the owner
+  """
+  name = getattr(function, '__name__', None)
+  underlying = getattr(function, '__func__', function)
+  owner = getattr(function, '__self__', None)
+  if owner is not None and not isinstance(owner, (type, types.ModuleType)):
+    if getattr(getattr(owner, name, None), '__func__', None) is underlying:
+      return owner, name, tuple(args)
+  elif len(args) > 0 and name is not None:
+    method = getattr(type(args[0]), name, None)
+    if getattr(method, '__func__', method) is underlying:
+      return args[0], name, tuple(args[1:])
+  return None, None, tuple(args)
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects in a pool of persistent local processes
+  """
+  def __init__(self, messageHandler, processPool, args, functionToRun, identifier=None, metadata=None, uniqueHandler = "any", profile = False):
+    """
+      Init method
+      @ In, messageHandler, MessageHandler object, the global RAVEN message
+        handler object
+      @ In, processPool, ProcessPool, the pool of worker processes
+      @ In, args, dict, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args)
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, identifier, string, optional, id of this job
+      @ In, metadata, dict, optional, dictionary of metadata associated with
+        this run
+      @ In, uniqueHandler, string, optional, it is a special keyword attached to
+        this runner. For example, if present, to retrieve this runner using the
+        method jobHandler.getFinished, the uniqueHandler needs to be provided.
+        If uniqueHandler == 'any', every "client" can get this runner
+      @ In, profile, bool, optional, if True then at deconstruction timing statements will be printed
+      @ Out, None
+    """
+    super(ProcessPoolRunner, self).__init__(messageHandler, args, functionToRun, identifier, metadata, uniqueHandler, profile)
+
+    ## Other parameters passed at initialization
+    self.processPool = processPool
+
+    ## Other parameters manipulated internally (by the pool)
+    self.ownerKey     = None  ## key of the object whose method is run, if any
+    self.ownerVersion = None  ## state version of the object whose method is run, if any
+    self.ownerData    = None  ## pickled object whose method is run, if any
+    self.job       = None  ## pickled function and arguments
+
+    self.skipOnCopy.extend(['processPool','ownerData','job'])
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    return self.started and self.finished
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    self.finished = False
+    self.started = True
+    self.trackTime('runner_started')
+    self.processPool.submit(self)
+
+  def setResult(self, success, returnValue):
+    """
+      Stores the outcome of the job. Called by the pool once the job is over.
+      @ In, success, bool, True if the function returned
+      @ In, returnValue, object, what the function returned, or the error
+        message if it failed
+      @ Out, None
+    """
+    if success:
+      self.runReturn = returnValue
+    else:
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:\n"+ str(returnValue),'ExceptedError')
+      self.runReturn = None
+      self.returnCode = -1
+    self.hasBeenAdded = True
+    self.ownerData = None
+    self.job = None
+    self._signalFinished()
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    self.processPool.cancel(self)
+    self.returnCode = -1
+    self.trackTime('runner_killed')
+    self._signalFinished()
@@ -0,0 +1,299 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Supervision of the subprocesses of the external codes from a single thread.
+
+  Each supervised subprocess inherits the write end of a pipe, whose read end is watched (with
+  select.poll) by the supervisor thread: the pipe is closed, and the thread wakes up, as soon as
+  the subprocess exits. The same thread kills the subprocesses that exceed their walltime.
+  The jobs waiting for their subprocess just block until it is reaped, so no thread polls.
+  Where pipes cannot be passed to the subprocesses (Python 2, Windows), the supervisor thread
+  polls the subprocesses instead.
+
+  Created on October 18, 2026
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import os
+import sys
+import time
+import select
+import threading
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from utils import utils
+#Internal Modules End--------------------------------------------------------------------------------
+
+## the supervisor of this process (see getProcessSupervisor)
+_supervisor = None
+_supervisorLock = threading.Lock()
+
+def getProcessSupervisor():
+  """
+    Returns the process supervisor of the current process, creating it if needed.
+    Worker processes (e.g. forked by the internal parallel backends) get their own supervisor.
+    @ In, None
+    @ Out, supervisor, ProcessSupervisor, the supervisor
+  """
+  global _supervisor
+  with _supervisorLock:
+    if _supervisor is None or _supervisor.pid != os.getpid():
+      _supervisor = ProcessSupervisor()
+    return _supervisor
+
+class SupervisedProcess(object):
+  """
+    A subprocess watched by a ProcessSupervisor
+  """
+  def __init__(self, process, walltime, owner, notifyFd):
+    """
+      Constructor
+      @ In, process, subprocess.Popen, the subprocess
+      @ In, walltime, float, the longest time the subprocess can run (seconds), None for no limit
+      @ In, owner, object, whoever launched the subprocess (the thread, see ProcessSupervisor.kill)
+      @ In, notifyFd, int, the read end of the pipe closed when the subprocess exits, None if polled
+      @ Out, None
+    """
+    self.process  = process
+    self.pid      = process.pid
+    self.deadline = time.time() + walltime if walltime is not None else None
+    self.owner    = owner
+    self.notifyFd = notifyFd
+    self.timedOut = False ## True if the subprocess was killed because it exceeded its walltime
+    self.killed   = False ## True if the subprocess was killed on request
+    self.__reaped = threading.Event()
+
+  def wait(self):
+    """
+      Blocks until the subprocess is done (and reaped).
+      @ In, None
+      @ Out, returncode, int, the return code of the subprocess
+    """
+    self.__reaped.wait()
+    return self.process.returncode
+
+  def isDone(self):
+    """
+      Tells whether the subprocess is done (and reaped), without waiting.
+      @ In, None
+      @ Out, isDone, bool, True if the subprocess is done
+    """
+    return self.__reaped.is_set()
+
+  def _setReaped(self):
+    """
+      Wakes up whoever waits for the subprocess. Called by the supervisor.
+      @ In, None
+      @ Out, None
+    """
+    self.__reaped.set()
+
+class ProcessSupervisor(object):
+  """
+    Launches subprocesses and watches them from a single thread: it reaps them as soon as they
+    exit, and kills the ones that exceed their walltime. The thread only runs while there are
+    subprocesses to watch.
+  """
+  def __init__(self, pollTime=0.05, backstopTime=1.0):
+    """
+      Constructor
+      @ In, pollTime, float, optional, time between two checks of the subprocesses that cannot notify their exit
+      @ In, backstopTime, float, optional, longest time between two checks of all the subprocesses, in case a
+        subprocess exits without closing the pipe (e.g. it left behind a daemon that inherited it)
+      @ Out, None
+    """
+    self.pid          = os.getpid()
+    self.pollTime     = pollTime
+    self.backstopTime = backstopTime
+    ## the pipes tell when the subprocesses exit only where they can be passed to the subprocesses
+    self.usePipes     = hasattr(select,'poll') and sys.version_info.major > 2 and os.name == 'posix'
+
+    ############################################################################
+    ## The following variables are protected by the __lock
+    self.__lock     = threading.Lock()
+    self.__pending  = []    ## subprocesses launched, not yet seen by the supervisor thread
+    self.__watched  = {}    ## {pid: SupervisedProcess} seen by the supervisor thread
+    self.__running  = False ## True while the supervisor thread runs
+    ## End block of __lock protected variables
+    ############################################################################
+
+    ## wakes up the supervisor thread when there are new subprocesses or kills
+    if self.usePipes:
+      self.__poller = select.poll()
+      self.__wakeRead, self.__wakeWrite = os.pipe()
+      self.__poller.register(self.__wakeRead, select.POLLIN)
+      ## the read ends of the pipes of the watched subprocesses {fd:SupervisedProcess}
+      self.__notifyFds = {}
+    else:
+      self.__wakeEvent = threading.Event()
+
+  def launch(self, command, walltime=None, **kwargs):
+    """
+      Starts a subprocess and watches it.
+      @ In, command, list or string, the command (as for subprocess.Popen)
+      @ In, walltime, float, optional, the longest time the subprocess can run (seconds), no limit if None.
+        Once exceeded, the subprocess is killed and its "timedOut" attribute set.
+      @ In, kwargs, dict, the other arguments of subprocess.Popen
+      @ Out, supervised, SupervisedProcess, the subprocess; call its "wait" method to wait until it is done
+    """
+    notifyFd = None
+    if self.usePipes:
+      notifyFd, writeFd = os.pipe()
+      kwargs['pass_fds'] = tuple(kwargs.get('pass_fds',())) + (writeFd,)
+    try:
+      process = utils.pickleSafeSubprocessPopen(command, **kwargs)
+    except:
+      if notifyFd is not None:
+        os.close(notifyFd)
+      raise
+    finally:
+      ## only the subprocess (and its children) keep the write end open
+      if notifyFd is not None:
+        os.close(writeFd)
+    supervised = SupervisedProcess(process, walltime, threading.current_thread(), notifyFd)
+    with self.__lock:
+      self.__pending.append(supervised)
+      if not self.__running:
+        self.__running = True
+        thread = threading.Thread(target=self.__loop, name='ProcessSupervisor')
+        thread.daemon = True
+        thread.start()
+    self.__wake()
+    return supervised
+
+  def kill(self, owner):
+    """
+      Kills the subprocesses launched by "owner" (for example the thread of a job being terminated).
+      The subprocesses are then reaped as any other, which wakes up whoever waits for them.
+      @ In, owner, object, the thread that launched the subprocesses
+      @ Out, None
+    """
+    with self.__lock:
+      toKill = [supervised for supervised in self.__pending + list(self.__watched.values()) if supervised.owner is owner]
+    for supervised in toKill:
+      supervised.killed = True
+      self.__killProcess(supervised)
+    if len(toKill) > 0:
+      self.__wake()
+
+  def numWatched(self):
+    """
+      Returns the number of subprocesses being watched.
+      @ In, None
+      @ Out, numWatched, int, the number of subprocesses not reaped yet
+    """
+    with self.__lock:
+      return len(self.__pending) + len(self.__watched)
+
+  def __wake(self):
+    """
+      Wakes up the supervisor thread.
+      @ In, None
+      @ Out, None
+    """
+    if self.usePipes:
+      os.write(self.__wakeWrite, b'x')
+    else:
+      self.__wakeEvent.set()
+
+  def __killProcess(self, supervised):
+    """
+      Kills a subprocess, if it is still running.
+      @ In, supervised, SupervisedProcess, the subprocess
+      @ Out, None
+    """
+    try:
+      supervised.process.kill()
+    except OSError:
+      ## already done
+      pass
+
+  def __loop(self):
+    """
+      The supervisor thread: waits for the subprocesses to exit or to exceed their walltime.
+      Returns once there are no more subprocesses to watch.
+      @ In, None
+      @ Out, None
+    """
+    while True:
+      with self.__lock:
+        newProcesses, self.__pending = self.__pending, []
+        for supervised in newProcesses:
+          self.__watched[supervised.pid] = supervised
+        if len(self.__watched) == 0:
+          self.__running = False
+          return
+        watched = list(self.__watched.values())
+      for supervised in newProcesses:
+        if supervised.notifyFd is not None:
+          self.__notifyFds[supervised.notifyFd] = supervised
+          self.__poller.register(supervised.notifyFd, select.POLLIN)
+      ## how long can we sleep?
+      polled = any(supervised.notifyFd is None for supervised in watched)
+      timeout = self.pollTime if polled else self.backstopTime
+      now = time.time()
+      deadlines = [supervised.deadline for supervised in watched if supervised.deadline is not None and not supervised.timedOut]
+      if len(deadlines) > 0:
+        timeout = max(0.,min(timeout, min(deadlines) - now))
+      ## sleep until a subprocess exits (or something happens)
+      toCheck = set()
+      if self.usePipes:
+        for fd,_ in self.__poller.poll(1000.*timeout):
+          if fd == self.__wakeRead:
+            os.read(self.__wakeRead, 4096)
+          elif fd in self.__notifyFds:
+            ## the pipe was closed: the subprocess is probably done
+            supervised = self.__notifyFds.pop(fd)
+            self.__poller.unregister(fd)
+            os.close(fd)
+            supervised.notifyFd = None
+            toCheck.add(supervised)
+      else:
+        self.__wakeEvent.wait(timeout)
+        self.__wakeEvent.clear()
+      ## check the subprocesses that closed their pipe or cannot notify, or all of them once in a while
+      now = time.time()
+      if polled or len(toCheck) == 0:
+        toCheck = watched
+      for supervised in watched:
+        if supervised.deadline is not None and now > supervised.deadline and not supervised.timedOut:
+          supervised.timedOut = True
+          self.__killProcess(supervised)
+          toCheck = watched
+        if supervised.killed:
+          toCheck = watched
+      for supervised in toCheck:
+        if supervised.process.poll() is not None:
+          self.__reap(supervised)
+
+  def __reap(self, supervised):
+    """
+      Stops watching a subprocess that is done, and wakes up whoever waits for it.
+      @ In, supervised, SupervisedProcess, the subprocess
+      @ Out, None
+    """
+    if supervised.notifyFd is not None:
+      del self.__notifyFds[supervised.notifyFd]
+      self.__poller.unregister(supervised.notifyFd)
+      os.close(supervised.notifyFd)
+      supervised.notifyFd = None
+    with self.__lock:
+      self.__watched.pop(supervised.pid, None)
+    supervised._setReaped()
@@ -59,6 +59,8 @@ class Runner(MessageHandler.MessageUser):
     self.metadata       = copy.copy(metadata)
     self.uniqueHandler  = uniqueHandler
     self.started        = False
+    self.finished       = False ## set by the thread running the job once it is done
+    self.finishedCallback = None ## called with no arguments once the job is done (see setFinishedCallback)
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -133,6 +135,26 @@ class Runner(MessageHandler.MessageUser):
     """
     self.timings[event] = time.time()
 
+  def setFinishedCallback(self, callback):
+    """
+      Sets the function to call when this job is done, so whoever handles it
+      does not need to poll isDone. The callback is called from the thread
+      running the job, so it should be quick and must not wait on other locks.
+      @ In, callback, function, function taking no arguments (or None to remove it)
+      @ Out, None
+    """
+    self.finishedCallback = callback
+
+  def _signalFinished(self):
+    """
+      Marks this job as done and calls the finished callback, if any.
+      @ In, None
+      @ Out, None
+    """
+    self.finished = True
+    if self.finishedCallback is not None:
+      self.finishedCallback()
+
   def start(self):
     """
       Function to run the driven code
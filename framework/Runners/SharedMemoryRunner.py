@@ -42,6 +42,7 @@ from utils import utils
 from BaseClasses import BaseType
 import MessageHandler
 from .InternalRunner import InternalRunner
+from .ProcessSupervisor import getProcessSupervisor
 #Internal Modules End--------------------------------------------------------------------------------
 
 class SharedMemoryRunner(InternalRunner):
@@ -92,7 +93,7 @@ class SharedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return not self.thread.is_alive()
+      return self.finished or not self.thread.is_alive()
 
   def getReturnCode(self):
     """
@@ -133,9 +134,10 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.finished = False
+      self.thread = InterruptibleThread(target = self._runFunction,
                                      name = self.identifier,
-                                     args=(self.subque,) + tuple(self.args))
+                                     args=tuple(self.args))
 
       self.thread.daemon = True
       self.thread.start()
@@ -145,6 +147,18 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _runFunction(self, *args):
+    """
+      Runs the function of this job in its thread, storing the result and
+      signaling when it is done (even if the function fails or is killed).
+      @ In, args, list, the arguments of the function
+      @ Out, None
+    """
+    try:
+      self.subque.append(self.functionToRun(*args))
+    finally:
+      self._signalFinished()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -153,6 +167,8 @@ class SharedMemoryRunner(InternalRunner):
     """
     if self.thread is not None:
       self.raiseADebug('Terminating job thread "{}" and RAVEN identifier "{}"'.format(self.thread.ident, self.identifier))
+      ## a thread waiting for a subprocess cannot be interrupted, so kill the subprocesses it launched first
+      getProcessSupervisor().kill(self.thread)
       while self.thread is not None and self.thread.isAlive():
         time.sleep(0.1)
         try:
@@ -28,6 +28,8 @@ from .Runner import Runner
 from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 from .DistributedMemoryRunner import DistributedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner, ProcessPool
+from .ProcessSupervisor import ProcessSupervisor, SupervisedProcess, getProcessSupervisor
 from .Error import Error
 
 # from .Factory import knownTypes
@@ -35,4 +37,4 @@ from .Error import Error
 # from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['Runner', 'InternalRunner', 'SharedMemoryRunner', 'DistributedMemoryRunner', 'Error']
+__all__ = ['Runner', 'InternalRunner', 'SharedMemoryRunner', 'DistributedMemoryRunner', 'ProcessPoolRunner', 'ProcessPool', 'ProcessSupervisor', 'SupervisedProcess', 'getProcessSupervisor', 'Error']
@@ -96,6 +96,7 @@ class AdaptiveSobol(Sobol,AdaptiveSparseGrid):
       @ Out, None
     """
     Sobol.__init__(self)
+    self.ableToBatchRuns = False # the runs are needed one at a time to adapt the subsets
 
     #identification
     self.type            = 'AdaptiveSobolSampler'
@@ -89,6 +89,7 @@ class AdaptiveSparseGrid(SparseGridCollocation,AdaptiveSampler):
     """
     AdaptiveSampler.__init__(self)
     SparseGridCollocation.__init__(self)
+    self.ableToBatchRuns         = False  # the runs are needed one at a time to adapt the grid
     #identification
     self.type                    = 'AdaptiveSparseGridSampler'
     self.printTag                = self.type
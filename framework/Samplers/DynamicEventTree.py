@@ -97,6 +97,8 @@ class DynamicEventTree(Grid):
     @ Out, None
     """
     Grid.__init__(self)
+    # the branches are generated from the outcome of each run
+    self.ableToBatchRuns                   = False
     # Working directory (Path of the directory in which all the outputs,etc. are stored)
     self.workingDir                        = ""
     # (optional) if not present, the sampler will not change the relative keyword in the input file
@@ -23,54 +23,34 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 ################################################################################
-from Samplers.Sampler import Sampler
-# Forward samplers
-from Samplers.ForwardSampler import ForwardSampler
-from Samplers.MonteCarlo import MonteCarlo
-from Samplers.Grid import Grid
-from Samplers.Stratified import Stratified
-from Samplers.FactorialDesign import FactorialDesign
-from Samplers.ResponseSurfaceDesign import ResponseSurfaceDesign
-from Samplers.Sobol import Sobol
-from Samplers.SparseGridCollocation import SparseGridCollocation
-from Samplers.EnsembleForward import EnsembleForward
-from Samplers.CustomSampler import CustomSampler
-
-# Adaptive samplers
-from Samplers.AdaptiveSampler import AdaptiveSampler
-from Samplers.LimitSurfaceSearch import LimitSurfaceSearch
-from Samplers.AdaptiveSobol import AdaptiveSobol
-from Samplers.AdaptiveSparseGrid import AdaptiveSparseGrid
-# Dynamic Event Tree-based Samplers
-from Samplers.DynamicEventTree import DynamicEventTree
-from Samplers.AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
+from utils import importerUtils
 ## [ Add new class here ]
 ################################################################################
-## Alternatively, to fully automate this file:
-# from Samplers import *
-################################################################################
 
 """
  Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The Samplers are registered by the path of their class and only imported when requested,
+# so that their libraries are not loaded by the inputs not using them.
 __base = 'Sampler'
-__interFaceDict = {}
-__interFaceDict['MonteCarlo'              ] = MonteCarlo
-__interFaceDict['Grid'                    ] = Grid
-__interFaceDict['Stratified'              ] = Stratified
-__interFaceDict['FactorialDesign'         ] = FactorialDesign
-__interFaceDict['ResponseSurfaceDesign'   ] = ResponseSurfaceDesign
-__interFaceDict['Sobol'                   ] = Sobol
-__interFaceDict['SparseGridCollocation'   ] = SparseGridCollocation
-__interFaceDict['CustomSampler'           ] = CustomSampler
-__interFaceDict['EnsembleForward'         ] = EnsembleForward
-__interFaceDict['LimitSurfaceSearch'      ] = LimitSurfaceSearch
-__interFaceDict['AdaptiveSobol'           ] = AdaptiveSobol
-__interFaceDict['AdaptiveSparseGrid'      ] = AdaptiveSparseGrid
-__interFaceDict['DynamicEventTree'        ] = DynamicEventTree
-__interFaceDict['AdaptiveDynamicEventTree'] = AdaptiveDynamicEventTree
+__interFaceDict = importerUtils.LazyClassDict()
+# Forward samplers
+__interFaceDict['MonteCarlo'              ] = 'Samplers.MonteCarlo.MonteCarlo'
+__interFaceDict['Grid'                    ] = 'Samplers.Grid.Grid'
+__interFaceDict['Stratified'              ] = 'Samplers.Stratified.Stratified'
+__interFaceDict['FactorialDesign'         ] = 'Samplers.FactorialDesign.FactorialDesign'
+__interFaceDict['ResponseSurfaceDesign'   ] = 'Samplers.ResponseSurfaceDesign.ResponseSurfaceDesign'
+__interFaceDict['Sobol'                   ] = 'Samplers.Sobol.Sobol'
+__interFaceDict['SparseGridCollocation'   ] = 'Samplers.SparseGridCollocation.SparseGridCollocation'
+__interFaceDict['CustomSampler'           ] = 'Samplers.CustomSampler.CustomSampler'
+__interFaceDict['EnsembleForward'         ] = 'Samplers.EnsembleForward.EnsembleForward'
+# Adaptive samplers
+__interFaceDict['LimitSurfaceSearch'      ] = 'Samplers.LimitSurfaceSearch.LimitSurfaceSearch'
+__interFaceDict['AdaptiveSobol'           ] = 'Samplers.AdaptiveSobol.AdaptiveSobol'
+__interFaceDict['AdaptiveSparseGrid'      ] = 'Samplers.AdaptiveSparseGrid.AdaptiveSparseGrid'
+# Dynamic Event Tree-based Samplers
+__interFaceDict['DynamicEventTree'        ] = 'Samplers.DynamicEventTree.DynamicEventTree'
+__interFaceDict['AdaptiveDynamicEventTree'] = 'Samplers.AdaptiveDynamicEventTree.AdaptiveDynamicEventTree'
 
 def knownTypes():
   """
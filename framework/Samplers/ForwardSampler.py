@@ -35,4 +35,12 @@ class ForwardSampler(Sampler):
   """
     This is a general forward, blind, static sampler
   """
-  pass
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    Sampler.__init__(self)
+    self.ableToBatchRuns = True # the samples do not depend on the outcome of the runs
@@ -36,11 +36,13 @@ import sys
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from PostProcessors import LimitSurface
+from PostProcessors.LimitSurface import LimitSurface
 from .AdaptiveSampler import AdaptiveSampler
 import Distributions
 from AMSC_Object import AMSC_Object
+from utils import utils
 from utils import randomUtils
+from utils import mathUtils
 from utils import InputData
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -87,6 +89,9 @@ class LimitSurfaceSearch(AdaptiveSampler):
     thresholdInput = InputData.parameterInputFactory("threshold", contentType=InputData.FloatType)
     inputSpecification.addSub(thresholdInput)
 
+    incrementalInput = InputData.parameterInputFactory("incremental", contentType=InputData.BoolType)
+    inputSpecification.addSub(incrementalInput)
+
     romInput = InputData.parameterInputFactory("ROM", contentType=InputData.StringType)
     romInput.addParam("type", InputData.StringType)
     romInput.addParam("class", InputData.StringType)
@@ -162,6 +167,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
                                                 #  cutoff (%  of range space)
     self.sizeGrid       = None                  # size of grid
     self.sizeSubGrid    = None                  # size of subgrid
+    self.incremental    = False                 # update the test matrices only around the new samples?
     self.printTag            = 'SAMPLER ADAPTIVE'
 
     self.acceptedScoringParam = ['distance','distancePersistence']
@@ -304,6 +310,8 @@ class LimitSurfaceSearch(AdaptiveSampler):
         if self.threshold < 0 or self.threshold > 1:
           self.raiseAWarning('Requested an invalid threshold level: ', self.threshold, '. Defaulting to 0.')
           self.threshold = 0
+      if child.tag == 'incremental':
+        self.incremental = utils.interpretBoolean(child.text)
 
   def localGetInitParams(self):
     """
@@ -325,6 +333,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     paramDict['simplification'  ] = self.simplification
     paramDict['thickness'       ] = self.thickness
     paramDict['threshold'       ] = self.threshold
+    paramDict['incremental'     ] = self.incremental
     return paramDict
 
   def localGetCurrentSetting(self):
@@ -393,7 +402,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     self.axisName = list(self.distDict.keys())
     self.axisName.sort()
     # initialize LimitSurface PP
-    self.limitSurfacePP._initFromDict({"name":self.name+"LSpp","parameters":[key.replace('<distribution>','') for key in self.axisName],"tolerance":self.tolerance,"side":"both","transformationMethods":transformMethod,"bounds":bounds})
+    self.limitSurfacePP._initFromDict({"name":self.name+"LSpp","parameters":[key.replace('<distribution>','') for key in self.axisName],"tolerance":self.tolerance,"side":"both","transformationMethods":transformMethod,"bounds":bounds,"incremental":self.incremental})
     self.limitSurfacePP.assemblerDict = self.assemblerDict
     self.limitSurfacePP._initializeLSpp({'WorkingDir':None},[self.lastOutput],{'computeCells':self.tolerance != self.subGridTol})
     matrixShape = self.limitSurfacePP.getTestMatrix().shape
@@ -434,7 +443,8 @@ class LimitSurfaceSearch(AdaptiveSampler):
       if len(self.lastOutput) > 0:
         self.limitSurfacePP._initializeLSppROM(self.lastOutput,False)
     self.raiseADebug('Classifier ' +self.name+' has been trained!')
-    self.oldTestMatrix = copy.deepcopy(self.limitSurfacePP.getTestMatrix("all",exceptionGrid=self.exceptionGrid))    #copy the old solution (contained in the limit surface PP) for convergence check
+    if not self.limitSurfacePP.incremental:
+      self.oldTestMatrix = copy.deepcopy(self.limitSurfacePP.getTestMatrix("all",exceptionGrid=self.exceptionGrid))    #copy the old solution (contained in the limit surface PP) for convergence check
     # evaluate the Limit Surface coordinates (return input space coordinates, evaluation vector and grid indexing)
     self.surfPoint, evaluations, self.listSurfPoint = self.limitSurfacePP.run(returnListSurfCoord = True, exceptionGrid=self.exceptionGrid, merge=False)
     self.raiseADebug('Limit Surface has been computed!')
@@ -459,20 +469,30 @@ class LimitSurfaceSearch(AdaptiveSampler):
       self.persistenceMatrix[key] += value
 
     # get the test matrices' dictionaries to test the error
-    testMatrixDict = list(self.limitSurfacePP.getTestMatrix("all",exceptionGrid=self.exceptionGrid).values())
-    oldTestMatrixDict = list(self.oldTestMatrix.values())
-    # the first test matrices in the list are always represented by the coarse grid
-    # (if subGridTol activated) or the only grid available
-    coarseGridTestMatix, coarseGridOldTestMatix = testMatrixDict.pop(0), oldTestMatrixDict.pop(0)
-    # compute the Linf norm with respect the location of the LS
-    testError = np.sum(np.abs(np.subtract(coarseGridTestMatix,coarseGridOldTestMatix)))
+    testMatrices = self.limitSurfacePP.getTestMatrix("all",exceptionGrid=self.exceptionGrid)
+    testMatrixDict = list(testMatrices.values())
+    if self.limitSurfacePP.incremental:
+      # the limit surface PP tracked the changes of the test matrices
+      testMatrixChanges = [self.limitSurfacePP.getTestMatrixChange(gridID) for gridID in testMatrices.keys()]
+      coarseGridTestMatix = testMatrixDict.pop(0)
+      testError = testMatrixChanges.pop(0)
+      subGridError = np.sum(testMatrixChanges)
+    else:
+      oldTestMatrixDict = list(self.oldTestMatrix.values())
+      # the first test matrices in the list are always represented by the coarse grid
+      # (if subGridTol activated) or the only grid available
+      coarseGridTestMatix, coarseGridOldTestMatix = testMatrixDict.pop(0), oldTestMatrixDict.pop(0)
+      # compute the Linf norm with respect the location of the LS
+      testError = np.sum(np.abs(np.subtract(coarseGridTestMatix,coarseGridOldTestMatix)))
+      if len(testMatrixDict) > 0:
+        subGridError = np.sum(np.abs(np.subtract(testMatrixDict,oldTestMatrixDict)))
     if self.sizeGrid is None:
       self.sizeGrid = float(coarseGridTestMatix.size)
     if len(testMatrixDict) > 0:
       # compute the error
       if self.sizeSubGrid is None:
         self.sizeSubGrid = float(np.asarray(testMatrixDict).size)
-      testError += np.sum(np.abs(np.subtract(testMatrixDict,oldTestMatrixDict)))/(self.sizeGrid+self.sizeSubGrid)
+      testError += subGridError/(self.sizeGrid+self.sizeSubGrid)
     else:
       testError/= self.sizeGrid
 
@@ -482,6 +502,10 @@ class LimitSurfaceSearch(AdaptiveSampler):
     else:
       # we are increasing persistence
       self.repetition +=1
+    if self.limitSurfacePP.incremental:
+      # the iterations that count for the persistence evaluate the ROM on the whole grids,
+      # so that the convergence is not driven by the nodes far from the new samples
+      self.limitSurfacePP.fullEvaluation = self.repetition > 0
     if self.persistence<self.repetition:
       ready =  False
       if self.subGridTol != self.tolerance \
@@ -509,8 +533,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
       if len(listsurfPoint)>0:
         self.invPointPersistence[gridID] = np.ones(len(listsurfPoint))
         if self.firstSurface == False:
-          for pointID, coordinate in enumerate(listsurfPoint):
-            self.invPointPersistence[gridID][pointID]=abs(self.persistenceMatrix[gridID][tuple(coordinate)])
+          self.invPointPersistence[gridID] = np.abs(self.persistenceMatrix[gridID][tuple(np.asarray(listsurfPoint).T)])
           maxPers = np.max(self.invPointPersistence[gridID])
           if maxPers != 0:
             self.invPointPersistence[gridID] = (maxPers-self.invPointPersistence[gridID])/maxPers
@@ -530,31 +553,41 @@ class LimitSurfaceSearch(AdaptiveSampler):
     # surface candidate set
     self.bandIndices = OrderedDict()
     for gridID,points in self.listSurfPoint.items():
-      setSurfPoint = set()
-      self.bandIndices[gridID] = set()
-      for surfPoint in points:
-        setSurfPoint.add(tuple(surfPoint))
-      newIndices = set(setSurfPoint)
-      for step in range(1,self.thickness):
-        prevPoints = set(newIndices)
-        newIndices = set()
-        for i,iCoords in enumerate(prevPoints):
-          for d in range(len(iCoords)):
-            offset = np.zeros(len(iCoords),dtype=int)
-            offset[d] = 1
-            if iCoords[d] - offset[d] > 0:
-              newIndices.add(tuple(iCoords - offset))
-            if iCoords[d] + offset[d] < self.oldTestMatrix[gridID].shape[d]-1:
-              newIndices.add(tuple(iCoords + offset))
-        self.bandIndices[gridID].update(newIndices)
-      self.bandIndices[gridID] = self.bandIndices[gridID].difference(setSurfPoint)
-      self.bandIndices[gridID] = list(self.bandIndices[gridID])
-      for coordinate in self.bandIndices[gridID]:
-        self.surfPoint[gridID] = np.vstack((self.surfPoint[gridID],self.limitSurfacePP.gridCoord[gridID][coordinate]))
+      surface = np.zeros(self.limitSurfacePP.getTestMatrix(gridID).shape,dtype=bool)
+      if len(points) > 0:
+        surface[tuple(np.asarray(points).T)] = True
+      band = mathUtils.gridBand(surface,self.thickness)
+      self.bandIndices[gridID] = [tuple(coordinate) for coordinate in np.argwhere(band)]
+      if len(self.bandIndices[gridID]) > 0:
+        self.surfPoint[gridID] = np.vstack((self.surfPoint[gridID],self.limitSurfacePP.gridCoord[gridID][band]))
     if self.converged:
       self.raiseAMessage(self.name + " converged!")
     return ready
 
+  def __incrementalDistance(self, gridID, hangingTree):
+    """
+      Incremental mode: computes the distance of the candidates of a grid from the closest sampled (or hanging)
+      point, using the distances of the grid nodes from their closest sample tracked by the limit surface
+      post-processor, rather than a new KD-tree of all the sampled points. As the tracked ones, the distances
+      are computed with the variables scaled by the size of the grid.
+      @ In, gridID, string, the grid name
+      @ In, hangingTree, spatial.cKDTree, the KD-tree of the scaled hanging points (None if there are none)
+      @ Out, distance, np.array, the distance of each candidate (None if the tracked distances are not up to date)
+    """
+    nearestDistance = self.limitSurfacePP.getNearestSampleDistance(gridID)
+    if nearestDistance is None:
+      return None
+    # the candidates are the limit surface points followed by the band points
+    indices = np.asarray(self.listSurfPoint[gridID],dtype=int).reshape(-1,self.nVar)
+    if len(self.bandIndices.get(gridID,[])) > 0:
+      indices = np.vstack((indices,np.asarray(self.bandIndices[gridID],dtype=int)))
+    if len(indices) != len(self.surfPoint[gridID]):
+      return None
+    distance = nearestDistance[np.ravel_multi_index(tuple(indices.T),self.limitSurfacePP.getTestMatrix(gridID).shape)]
+    if hangingTree is not None:
+      distance = np.minimum(distance,hangingTree.query(self.surfPoint[gridID]/self.limitSurfacePP.getDistanceScale())[0])
+    return distance
+
   def __scoreCandidates(self):
     """
       Compute the scores of the 'candidate set' which should be the currently
@@ -568,10 +601,10 @@ class LimitSurfaceSearch(AdaptiveSampler):
     matrixShape = self.limitSurfacePP.getTestMatrix().shape
     self.scores = OrderedDict()
     if self.scoringMethod.startswith('distance'):
-      sampledMatrix = np.zeros((len(self.limitSurfacePP.getFunctionValue()[axisNames[0]])+len(self.hangingPoints[:,0]),len(self.axisName)))
-      for varIndex, name in enumerate(axisNames):
-        sampledMatrix[:,varIndex] = np.append(self.limitSurfacePP.getFunctionValue()[name],self.hangingPoints[:,varIndex])
-      distanceTree = spatial.cKDTree(copy.copy(sampledMatrix),leafsize=12)
+      distanceTree = None
+      hangingTree = None
+      if self.limitSurfacePP.incremental and len(self.hangingPoints) > 0:
+        hangingTree = spatial.cKDTree(self.hangingPoints/self.limitSurfacePP.getDistanceScale())
       # The hanging point are added to the list of the already explored points
       # so as not to pick the same when in parallel
       for varIndex, _ in enumerate(axisNames):
@@ -580,7 +613,14 @@ class LimitSurfaceSearch(AdaptiveSampler):
 
       for key, value in self.invPointPersistence.items():
         if key != self.exceptionGrid and self.surfPoint[key] is not None:
-          distance, _ = distanceTree.query(self.surfPoint[key])
+          distance = self.__incrementalDistance(key,hangingTree) if self.limitSurfacePP.incremental else None
+          if distance is None:
+            if distanceTree is None:
+              sampledMatrix = np.zeros((len(self.limitSurfacePP.getFunctionValue()[axisNames[0]])+len(self.hangingPoints[:,0]),len(self.axisName)))
+              for varIndex, name in enumerate(axisNames):
+                sampledMatrix[:,varIndex] = np.append(self.limitSurfacePP.getFunctionValue()[name],self.hangingPoints[:,varIndex])
+              distanceTree = spatial.cKDTree(copy.copy(sampledMatrix),leafsize=12)
+            distance, _ = distanceTree.query(self.surfPoint[key])
           # Different versions of scipy/numpy will yield different results on
           # our various supported platforms. If things are this close, then it
           # it is highly unlikely choosing one point over the other will affect
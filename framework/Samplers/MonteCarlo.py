@@ -129,24 +129,10 @@ class MonteCarlo(ForwardSampler):
       reducedDim = self.variables2distributionsMapping[key]['reducedDim']
       weight = 1.0
       if totDim == 1:
+        rvsnum,pdfValues,weights = self._sampleDistribution(key,np.atleast_1d(randomUtils.random()))
         if self.samplingType == 'uniform':
-          distData = self.distDict[key].getCrowDistDict()
-          if ('xMin' not in distData.keys()) or ('xMax' not in distData.keys()):
-            self.raiseAnError(IOError,"In the Monte-Carlo sampler a uniform sampling type has been chosen;"
-                   + " however, one or more distributions have not specified either the lowerBound or the upperBound")
-          lower = distData['xMin']
-          upper = distData['xMax']
-          rvsnum = lower + (upper - lower) * randomUtils.random()
-          epsilon = (upper-lower)/self.limit
-          midPlusCDF  = self.distDict[key].cdf(rvsnum + epsilon)
-          midMinusCDF = self.distDict[key].cdf(rvsnum - epsilon)
-          weight *= midPlusCDF - midMinusCDF
-        else:
-          rvsnum = self.distDict[key].rvs()
-        for kkey in key.split(','):
-          self.values[kkey] = np.atleast_1d(rvsnum)[0]
-        self.inputInfo['SampledVarsPb'][key] = self.distDict[key].pdf(rvsnum)
-        self.inputInfo['ProbabilityWeight-' + key] = 1.
+          weight *= weights[0]
+        self._setDistributionSample(key,rvsnum[0],pdfValues[0])
       elif totDim > 1:
         if reducedDim == 1:
           if self.samplingType is None:
@@ -170,7 +156,99 @@ class MonteCarlo(ForwardSampler):
           self.inputInfo['ProbabilityWeight-' + dist] = 1.
       else:
         self.raiseAnError(IOError,"Total dimension for given distribution should be >= 1")
+    self._setPointProbability(weight)
 
+  def canGenerateInputBatch(self):
+    """
+      Determines if this sampler can currently draw batches of samples as arrays, through localGenerateInputBatch.
+      Only one-dimensional distributions are sampled in batches.
+      @ In, None
+      @ Out, canGenerateInputBatch, bool, True if batches can be drawn
+    """
+    if self.reseedAtEachIteration:
+      return False
+    return all(self.variables2distributionsMapping[key]['totDim'] == 1 for key in self.distDict)
+
+  def localGenerateInputBatch(self,model,myInput,batchSize):
+    """
+      Draws the next "batchSize" samples at once, using the random numbers in the same order as
+      "batchSize" calls to localGenerateInput would.
+      @ In, model, model instance, an instance of a model
+      @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
+      @ In, batchSize, int, number of samples to draw
+      @ Out, batch, dict, {key:(values, pdf values, weights)} for each distribution key
+    """
+    keys = sorted(self.distDict)
+    # one random number per distribution per sample, row by row
+    uniforms = randomUtils.random(dim=len(keys),samples=batchSize,keepMatrix=True)
+    batch = {}
+    for k,key in enumerate(keys):
+      batch[key] = self._sampleDistribution(key,uniforms[:,k])
+    return batch
+
+  def localSetBatchSample(self,batch,index):
+    """
+      Fills self.values and self.inputInfo with one sample from a batch, as localGenerateInput would.
+      @ In, batch, dict, samples drawn by localGenerateInputBatch
+      @ In, index, int, index of the sample to use within the batch
+      @ Out, None
+    """
+    weight = 1.0
+    for key in sorted(batch):
+      rvsnum,pdfValues,weights = batch[key]
+      # as in localGenerateInput, the weight is the one of the last distribution
+      weight = 1.0
+      if self.samplingType == 'uniform':
+        weight *= weights[index]
+      self._setDistributionSample(key,rvsnum[index],pdfValues[index])
+    self._setPointProbability(weight)
+
+  def _sampleDistribution(self,key,uniforms):
+    """
+      Converts random numbers on [0,1] into samples of the one-dimensional distribution "key".
+      @ In, key, str, name of the variable(s) sampled by the distribution
+      @ In, uniforms, np.array, random numbers, one for each sample
+      @ Out, rvsnum, np.array, sampled values
+      @ Out, pdfValues, list, pdf at each sampled value
+      @ Out, weights, list, probability weight of each sample (only for "uniform" sampling type, otherwise 1)
+    """
+    dist = self.distDict[key]
+    if self.samplingType == 'uniform':
+      distData = dist.getCrowDistDict()
+      if ('xMin' not in distData.keys()) or ('xMax' not in distData.keys()):
+        self.raiseAnError(IOError,"In the Monte-Carlo sampler a uniform sampling type has been chosen;"
+               + " however, one or more distributions have not specified either the lowerBound or the upperBound")
+      lower = distData['xMin']
+      upper = distData['xMax']
+      rvsnum = lower + (upper - lower) * uniforms
+      epsilon = (upper-lower)/self.limit
+      weights = np.atleast_1d(dist.cdf(rvsnum + epsilon) - dist.cdf(rvsnum - epsilon)).tolist()
+    else:
+      # same as the distribution "rvs", with the random numbers already drawn
+      rvsnum = np.atleast_1d(dist.ppf(uniforms))
+      weights = [1.0]*len(rvsnum)
+    pdfValues = np.atleast_1d(dist.pdf(rvsnum)).tolist()
+    return rvsnum,pdfValues,weights
+
+  def _setDistributionSample(self,key,value,pdfValue):
+    """
+      Sets the sampled value of a one-dimensional distribution into self.values and self.inputInfo.
+      @ In, key, str, name of the variable(s) sampled by the distribution
+      @ In, value, float, sampled value
+      @ In, pdfValue, float, pdf at the sampled value
+      @ Out, None
+    """
+    for kkey in key.split(','):
+      self.values[kkey] = value
+    self.inputInfo['SampledVarsPb'][key] = pdfValue
+    self.inputInfo['ProbabilityWeight-' + key] = 1.
+
+  def _setPointProbability(self,weight):
+    """
+      Sets the point probability and weight of the current sample into self.inputInfo.
+      @ In, weight, float, probability weight (used for "uniform" sampling type)
+      @ Out, None
+    """
     if len(self.inputInfo['SampledVarsPb'].keys()) > 0:
       self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
     else:
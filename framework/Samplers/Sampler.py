@@ -120,6 +120,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     BaseType.__init__(self)
     Assembler.__init__(self)
     self.ableToHandelFailedRuns        = False                     # is this sampler able to handle failed runs?
+    self.ableToBatchRuns               = False                     # can several samples of this sampler be evaluated in one job (they do not need the outcome of each run)?
     self.counter                       = 0                         # Counter of the samples performed (better the input generated!!!). It is reset by calling the function self.initialize
     self.auxcnt                        = 0                         # Aux counter of samples performed (for its usage check initialize method)
     self.limit                         = sys.maxsize               # maximum number of Samples (for example, Monte Carlo = Number of HistorySet to run, DET = Unlimited)
@@ -149,6 +150,9 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     self.constantSources               = {}                        # storage for the way to obtain constant information
 
     self._endJobRunnable               = sys.maxsize               # max number of inputs creatable by the sampler right after a job ends (e.g., infinite for MC, 1 for Adaptive, etc)
+    self._batch                        = None                      # samples drawn by localGenerateInputBatch and not yet used (see generateInputBatch)
+    self._batchIndex                   = 0                         # next sample to use from self._batch
+    self._batchLength                  = 0                         # number of samples in self._batch
 
     ######
     self.variables2distributionsMapping = {}                       # for each variable 'varName'  , the following informations are included:  'varName': {'dim': 1, 'reducedDim': 1,'totDim': 2, 'name': 'distName'} ; dim = dimension of the variable; reducedDim = dimension of the variable in the transformed space; totDim = total dimensionality of its associated distribution
@@ -801,7 +805,14 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     """
     self._incrementCounter()
     model.getAdditionalInputEdits(self.inputInfo)
-    self.localGenerateInput(model,oldInput)
+    # if a batch of samples was drawn, use the next one; otherwise draw it now
+    if self._batch is not None:
+      self.localSetBatchSample(self._batch,self._batchIndex)
+      self._batchIndex += 1
+      if self._batchIndex >= self._batchLength:
+        self._batch = None
+    else:
+      self.localGenerateInput(model,oldInput)
     # split the sampled vars Pb among the different correlated variables
     self._reassignSampledVarsPbToFullyCorrVars()
     self._reassignPbWeightToCorrelatedVars()
@@ -846,21 +857,71 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
   def generateInputBatch(self,myInput,model,batchSize,projector=None):
     """
       this function provide a mask to create several inputs at the same time
-      It call the generateInput function as many time as needed
+      It call the generateInput function as many time as needed.
+      If the sampler can draw its samples as arrays (see canGenerateInputBatch), the random
+      sampling of the whole batch is done in one call to localGenerateInputBatch, and generateInput
+      then only assembles each sample. The samples are identical to calling generateInput repeatedly.
+      If the sampler runs out of samples (utils.NoMoreSamplesNeeded), the samples found so far are returned;
+      the exception is raised only if none was found.
       @ In, myInput, list, list containing one input set
       @ In, model, model instance, it is the instance of a RAVEN model
       @ In, batchSize, int, the number of input sets required
       @ In, projector, object, optional, used for adaptive sampling to provide the projection of the solution on the success metric
-      @ Out, newInputs, list of list, list of the list of input sets
+      @ Out, newInputs, list of tuple, (found, input, inputInfo) for each sample, where "found" and "input" are as returned
+              by generateInput, and "inputInfo" is a copy of self.inputInfo for that sample
     """
     newInputs = []
-    while self.amIreadyToProvideAnInput() and (self.counter < batchSize):
-      if projector==None:
-        newInputs.append(self.generateInput(model,myInput))
-      else:
-        newInputs.append(self.generateInput(model,myInput,projector))
+    if projector is None and self.canGenerateInputBatch() and self.amIreadyToProvideAnInput():
+      size = min(batchSize,self.limit-self.counter)
+      if size > 0:
+        self._batch = self.localGenerateInputBatch(model,myInput,size)
+        self._batchIndex = 0
+        self._batchLength = size
+    try:
+      while self.amIreadyToProvideAnInput() and (len(newInputs) < batchSize):
+        if projector==None:
+          found,newInput = self.generateInput(model,myInput)
+        else:
+          found,newInput = self.generateInput(model,myInput,projector)
+        newInputs.append((found,newInput,copy.deepcopy(self.inputInfo)))
+    except utils.NoMoreSamplesNeeded:
+      # return the samples found so far; the next request will find none either
+      if len(newInputs) == 0:
+        raise
+    finally:
+      # never carry samples over to a later request
+      self._batch = None
     return newInputs
 
+  def canGenerateInputBatch(self):
+    """
+      Determines if this sampler can currently draw batches of samples as arrays, through localGenerateInputBatch.
+      Samplers that can, overload this method together with localGenerateInputBatch and localSetBatchSample.
+      @ In, None
+      @ Out, canGenerateInputBatch, bool, True if batches can be drawn
+    """
+    return False
+
+  def localGenerateInputBatch(self,model,oldInput,batchSize):
+    """
+      Draws the next "batchSize" samples at once.  The random numbers must be drawn in the same order
+      "batchSize" calls to localGenerateInput would draw them, so that the samples are the same.
+      @ In, model, model instance, Model instance
+      @ In, oldInput, list, a list of the original needed inputs for the model (e.g. list of files, etc. etc)
+      @ In, batchSize, int, number of samples to draw
+      @ Out, batch, dict, sampler-specific arrays describing the samples
+    """
+    self.raiseAnError(NotImplementedError,'Sampler "{}" cannot generate batches of samples!'.format(self.type))
+
+  def localSetBatchSample(self,batch,index):
+    """
+      Fills self.values and self.inputInfo with one sample from a batch, as localGenerateInput would.
+      @ In, batch, dict, samples drawn by localGenerateInputBatch
+      @ In, index, int, index of the sample to use within the batch
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'Sampler "{}" cannot generate batches of samples!'.format(self.type))
+
   @abc.abstractmethod
   def localGenerateInput(self,model,oldInput):
     """
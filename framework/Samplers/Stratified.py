@@ -231,39 +231,135 @@ class Stratified(Grid):
           self.inputInfo['ProbabilityWeight-'+distName] = gridsWeight
       if ("<distribution>" in varName) or self.variables2distributionsMapping[varName]['totDim']==1:
         # 1D variable
-        # if the varName is a comma separated list of strings the user wants to sample the comma separated variables with the same sampled value => link the value to all comma separated variables
-        upper = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:self.sampledCoordinate[self.counter-1][varCount]+1})[varName]
-        lower = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:self.sampledCoordinate[self.counter-1][varCount]})[varName]
+        lower,upper = self._stratumBounds(varName,self.sampledCoordinate[self.counter-1][varCount])
         varCount += 1
-        if self.gridInfo[varName] =='CDF':
-          coordinate = lower + (upper-lower)*randomUtils.random()
-          ppfValue = self.distDict[varName].ppf(coordinate)
-          ppfLower = self.distDict[varName].ppf(min(upper,lower))
-          ppfUpper = self.distDict[varName].ppf(max(upper,lower))
-          gridWeight = self.distDict[varName].cdf(ppfUpper) - self.distDict[varName].cdf(ppfLower)
-          self.inputInfo['SampledVarsPb'][varName]  = self.distDict[varName].pdf(ppfValue)
-        elif self.gridInfo[varName] == 'value':
-          coordinateCdf = self.distDict[varName].cdf(min(upper,lower)) + (self.distDict[varName].cdf(max(upper,lower))-self.distDict[varName].cdf(min(upper,lower)))*randomUtils.random()
-          if coordinateCdf == 0.0:
-            self.raiseAWarning(IOError,"The grid lower bound and upper bound in value will generate ZERO cdf value!!!")
-          coordinate = self.distDict[varName].ppf(coordinateCdf)
-          gridWeight = self.distDict[varName].cdf(max(upper,lower)) - self.distDict[varName].cdf(min(upper,lower))
-          self.inputInfo['SampledVarsPb'][varName] = self.distDict[varName].pdf(coordinate)
-        # compute the weight and ProbabilityWeight-varName
-        weight *= gridWeight
-        self.inputInfo['ProbabilityWeight-'+varName] = gridWeight
-        for subVar in varName.strip().split(','):
-          self.inputInfo['distributionName'][subVar] = self.toBeSampled[varName]
-          self.inputInfo['distributionType'][subVar] = self.distDict[varName].type
-          if self.gridInfo[varName] =='CDF':
-            self.values[subVar] = ppfValue
-            self.inputInfo['upper'][subVar] = ppfUpper
-            self.inputInfo['lower'][subVar] = ppfLower
-          elif self.gridInfo[varName] =='value':
-            self.values[subVar] = coordinate
-            self.inputInfo['upper'][subVar] = max(upper,lower)
-            self.inputInfo['lower'][subVar] = min(upper,lower)
+        stratum = self._sampleStrata(varName,[lower],[upper],np.atleast_1d(randomUtils.random()))
+        weight *= self._setStratumSample(varName,stratum,0)
 
+    self._setPointProbability(weight)
+
+  def canGenerateInputBatch(self):
+    """
+      Determines if this sampler can currently draw batches of samples as arrays, through localGenerateInputBatch.
+      Only one-dimensional distributions are sampled in batches.
+      @ In, None
+      @ Out, canGenerateInputBatch, bool, True if batches can be drawn
+    """
+    if self.reseedAtEachIteration:
+      return False
+    return all(("<distribution>" in varName) or self.variables2distributionsMapping[varName]['totDim'] == 1 for varName in self.axisName)
+
+  def localGenerateInputBatch(self,model,myInput,batchSize):
+    """
+      Draws the next "batchSize" samples at once, using the random numbers in the same order as
+      "batchSize" calls to localGenerateInput would.
+      @ In, model, model instance, an instance of a model
+      @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
+      @ In, batchSize, int, number of samples to draw
+      @ Out, batch, dict, {varName:strata} as returned by _sampleStrata for each variable
+    """
+    # one random number per variable per sample, row by row
+    uniforms = randomUtils.random(dim=len(self.axisName),samples=batchSize,keepMatrix=True)
+    batch = {}
+    for v,varName in enumerate(self.axisName):
+      bounds = list(self._stratumBounds(varName,self.sampledCoordinate[self.counter+i][v]) for i in range(batchSize))
+      batch[varName] = self._sampleStrata(varName,list(b[0] for b in bounds),list(b[1] for b in bounds),uniforms[:,v])
+    return batch
+
+  def localSetBatchSample(self,batch,index):
+    """
+      Fills self.values and self.inputInfo with one sample from a batch, as localGenerateInput would.
+      @ In, batch, dict, samples drawn by localGenerateInputBatch
+      @ In, index, int, index of the sample to use within the batch
+      @ Out, None
+    """
+    self.inputInfo['distributionName'] = {}
+    self.inputInfo['distributionType'] = {}
+    weight = 1.0
+    for varName in self.axisName:
+      weight *= self._setStratumSample(varName,batch[varName],index)
+    self._setPointProbability(weight)
+
+  def _sampleStrata(self,varName,lowers,uppers,uniforms):
+    """
+      Samples a one-dimensional variable within the given strata.
+      @ In, varName, str, name of the variable(s) sampled
+      @ In, lowers, list, grid coordinate at one end of each stratum
+      @ In, uppers, list, grid coordinate at the other end of each stratum
+      @ In, uniforms, np.array, random numbers on [0,1], one for each stratum
+      @ Out, strata, dict, lists of 'value', 'pdf', 'weight', 'lower', and 'upper' for each stratum
+    """
+    dist = self.distDict[varName]
+    lowers = np.asarray(lowers,dtype=float)
+    uppers = np.asarray(uppers,dtype=float)
+    uniforms = np.asarray(uniforms,dtype=float)
+    low = np.minimum(uppers,lowers)
+    high = np.maximum(uppers,lowers)
+    if self.gridInfo[varName] =='CDF':
+      coordinate = lowers + (uppers-lowers)*uniforms
+      values = dist.ppf(coordinate)
+      low = dist.ppf(low)
+      high = dist.ppf(high)
+      weights = dist.cdf(high) - dist.cdf(low)
+      lowerList = np.atleast_1d(low).tolist()
+      upperList = np.atleast_1d(high).tolist()
+    elif self.gridInfo[varName] == 'value':
+      cdfLow = dist.cdf(low)
+      cdfHigh = dist.cdf(high)
+      coordinateCdf = cdfLow + (cdfHigh-cdfLow)*uniforms
+      if np.any(coordinateCdf == 0.0):
+        self.raiseAWarning(IOError,"The grid lower bound and upper bound in value will generate ZERO cdf value!!!")
+      values = dist.ppf(coordinateCdf)
+      weights = cdfHigh - cdfLow
+      # the bounds are the grid coordinates themselves
+      lowerList = list(low)
+      upperList = list(high)
+    strata = {'value':np.atleast_1d(values).tolist(),
+              'pdf':np.atleast_1d(dist.pdf(values)).tolist(),
+              'weight':np.atleast_1d(weights).tolist(),
+              'lower':lowerList,
+              'upper':upperList}
+    return strata
+
+  def _setPointProbability(self,weight):
+    """
+      Sets the point probability and weight of the current sample into self.inputInfo.
+      @ In, weight, float, probability weight of the sample
+      @ Out, None
+    """
     self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
     self.inputInfo['ProbabilityWeight' ] = weight
     self.inputInfo['SamplerType'] = 'Stratified'
+
+  def _setStratumSample(self,varName,strata,index):
+    """
+      Sets one sample of a one-dimensional variable into self.values and self.inputInfo.
+      @ In, varName, str, name of the variable(s) sampled
+      @ In, strata, dict, samples as returned by _sampleStrata
+      @ In, index, int, index of the sample to set
+      @ Out, gridWeight, float, probability weight of the stratum
+    """
+    gridWeight = strata['weight'][index]
+    self.inputInfo['SampledVarsPb'][varName] = strata['pdf'][index]
+    # compute the weight and ProbabilityWeight-varName
+    self.inputInfo['ProbabilityWeight-'+varName] = gridWeight
+    # if the varName is a comma separated list of strings the user wants to sample the comma separated variables with the same sampled value => link the value to all comma separated variables
+    for subVar in varName.strip().split(','):
+      self.inputInfo['distributionName'][subVar] = self.toBeSampled[varName]
+      self.inputInfo['distributionType'][subVar] = self.distDict[varName].type
+      self.values[subVar] = strata['value'][index]
+      self.inputInfo['upper'][subVar] = strata['upper'][index]
+      self.inputInfo['lower'][subVar] = strata['lower'][index]
+    return gridWeight
+
+  def _stratumBounds(self,varName,stratum):
+    """
+      Obtains the grid coordinates bounding a stratum.
+      @ In, varName, str, name of the variable(s) sampled
+      @ In, stratum, int, index of the stratum along the variable's grid
+      @ Out, lower, float, grid coordinate at the start of the stratum
+      @ Out, upper, float, grid coordinate at the end of the stratum
+    """
+    upper = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:stratum+1})[varName]
+    lower = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:stratum})[varName]
+    return lower,upper
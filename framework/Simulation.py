@@ -236,6 +236,7 @@ class Simulation(MessageHandler.MessageUser):
     self.runInfoDict['numProcByRun'      ] = 1            # Total number of core used by one run (number of threads by number of mpi)
     self.runInfoDict['batchSize'         ] = 1            # number of contemporaneous runs
     self.runInfoDict['internalParallel'  ] = False        # activate internal parallel (parallel python). If True parallel python is used, otherwise multi-threading is used
+    self.runInfoDict['internalParallelMethod'] = 'parallelPython' # how internal parallel runs: 'parallelPython' or 'processPool' (persistent local processes)
     self.runInfoDict['ParallelCommand'   ] = ''           # the command that should be used to submit jobs in parallel (mpi)
     self.runInfoDict['ThreadingCommand'  ] = ''           # the command should be used to submit multi-threaded
     self.runInfoDict['totalNumCoresUsed' ] = 1            # total number of cores used by driver
@@ -644,6 +645,12 @@ class Simulation(MessageHandler.MessageUser):
         self.runInfoDict['NumMPI'            ] = int(element.text)
       elif element.tag == 'internalParallel':
         self.runInfoDict['internalParallel'  ] = utils.interpretBoolean(element.text)
+      elif element.tag == 'internalParallelMethod':
+        methods = {'parallelpython':'parallelPython', 'processpool':'processPool'}
+        method = element.text.strip()
+        if method.lower() not in methods:
+          self.raiseAnError(IOError,'Unknown RunInfo.internalParallelMethod "{}"! Available are: parallelPython, processPool'.format(method))
+        self.runInfoDict['internalParallelMethod'] = methods[method.lower()]
       elif element.tag == 'batchSize':
         self.runInfoDict['batchSize'         ] = int(element.text)
       elif element.tag.lower() == 'maxqueuesize':
@@ -88,7 +88,7 @@ class Step(utils.metaclass_insert(abc.ABCMeta,BaseType)):
     """
     BaseType.__init__(self)
     self.parList    = []   # List of list [[role played in the step, class type, specialization, global name (user assigned by the input)]]
-    self.sleepTime  = 0.005  # Waiting time before checking if a run is finished
+    self.sleepTime  = 0.005  # Longest waiting time before checking if a run is finished (finished runs wake the step up)
     #If a step possess re-seeding instruction it is going to ask to the sampler to re-seed according
     #  re-seeding = a number to be used as a new seed
     #  re-seeding = 'continue' the use the already present random environment
@@ -117,6 +117,7 @@ class Step(utils.metaclass_insert(abc.ABCMeta,BaseType)):
     inputSpecification.addParam("pauseAtEnd", InputData.StringType)
     inputSpecification.addParam("fromDirectory", InputData.StringType)
     inputSpecification.addParam("repeatFailureRuns", InputData.StringType)
+    inputSpecification.addParam("samplesPerJob", InputData.IntegerType)
 
     for stepPart in ["Input","Model","Sampler","Output","Optimizer","SolutionExport","Function"]:
       stepPartInput = InputData.parameterInputFactory(stepPart, contentType=InputData.StringType)
@@ -458,6 +459,7 @@ class SingleRun(Step):
     ## get an input field in the outputs variable that is not in the inputs
     ## variable defined above? - DPM 4/6/2017
     #empty dictionary corresponds to sampling data in MultiRun
+    jobEvent = jobHandler.lastJobEvent()
     model.submit(inputs, None, jobHandler, **{'SampledVars':{'prefix':'None'},'additionalEdits':{}})
     while True:
       finishedJobs = jobHandler.getFinished()
@@ -492,7 +494,7 @@ class SingleRun(Step):
                                  str(self.failureHandling['repetitions'])+' times, failing all the times!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
@@ -525,6 +527,9 @@ class MultiRun(SingleRun):
     SingleRun.__init__(self)
     self._samplerInitDict = {} #this is a dictionary that gets sent as key-worded list to the initialization of the sampler
     self.counter          = 0  #just an handy counter of the runs already performed
+    self.samplesPerJob    = 1  #number of samples evaluated in each job, as requested in the input
+    self._samplesPerJob   = 1  #number of samples evaluated in each job, if the model and sampler allow it
+    self._knownAttribute += ['samplesPerJob']
     self.printTag = 'STEP MULTIRUN'
 
   def _localInputAndCheckParam(self,paramInput):
@@ -537,6 +542,10 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError,'It is not possible a multi-run without a sampler or optimizer!')
+    if 'samplesPerJob' in paramInput.parameterValues:
+      self.samplesPerJob = paramInput.parameterValues['samplesPerJob']
+      if self.samplesPerJob < 1:
+        self.raiseAnError(IOError,'In Step named '+self.name+' the attribute "samplesPerJob" must be a positive integer!')
 
   def _initializeSampler(self,inDictionary):
     """
@@ -575,6 +584,14 @@ class MultiRun(SingleRun):
     self.counter = 0
     self._samplerInitDict['externalSeeding'] = self.initSeed
     self._initializeSampler(inDictionary)
+    # evaluate several samples in each job, if both the model and the sampler allow it
+    self._samplesPerJob = 1
+    if self.samplesPerJob > 1:
+      if inDictionary['Model'].canEvaluateBatch() and inDictionary[self.samplerType].ableToBatchRuns:
+        self._samplesPerJob = self.samplesPerJob
+      else:
+        self.raiseAWarning('The model "{}" and {} "{}" of step "{}" cannot evaluate several samples in a job: "samplesPerJob" is ignored!'
+                           .format(inDictionary['Model'].name,self.samplerType,inDictionary[self.samplerType].name,self.name))
     #generate lambda function list to collect the output without checking the type
     self._outputCollectionLambda = []
     self._outputDictCollectionLambda = []
@@ -584,6 +601,9 @@ class MultiRun(SingleRun):
         if 'SolutionExport' in inDictionary.keys() and output.name == inDictionary['SolutionExport'].name:
           self._outputCollectionLambda.append((lambda x:None, outIndex))
           self._outputDictCollectionLambda.append((lambda x:None, outIndex))
+        elif self._samplesPerJob > 1:
+          self._outputCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputBatch(x[0],x[1]), outIndex) )
+          self._outputDictCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputFromDict(x[0],x[1]), outIndex) )
         else:
           self._outputCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutput(x[0],x[1]), outIndex) )
           self._outputDictCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputFromDict(x[0],x[1]), outIndex) )
@@ -600,6 +620,11 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
+    # samplers that draw batches of samples do so for the whole first batch of runs
+    if inDictionary[self.samplerType].canGenerateInputBatch() or self._samplesPerJob > 1:
+      self._submitNewInputs(inDictionary['jobHandler'].runInfoDict['batchSize'], inDictionary[self.samplerType], inDictionary['Model'],
+                            inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'])
+      return
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
@@ -627,6 +652,7 @@ class MultiRun(SingleRun):
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
     # run step loop
+    jobEvent = jobHandler.lastJobEvent()
     while True:
       # collect finished jobs
       finishedJobs = jobHandler.getFinished()
@@ -674,6 +700,9 @@ class MultiRun(SingleRun):
         ## employ a threshold on the number of jobs the jobHandler can take,
         ## in addition, we cannot provide more jobs than the sampler can provide.
         ## So, we take the minimum of these two values.
+        if sampler.canGenerateInputBatch() or self._samplesPerJob > 1:
+          self._submitNewInputs(min(jobHandler.availability(isEnsemble),sampler.endJobRunnable()), sampler, model, inputs, outputs, jobHandler)
+          continue
         for _ in range(min(jobHandler.availability(isEnsemble),sampler.endJobRunnable())):
           self.raiseADebug('Testing if the sampler is ready to generate a new input')
 
@@ -694,7 +723,8 @@ class MultiRun(SingleRun):
       if jobHandler.isFinished() and not sampler.amIreadyToProvideAnInput():
         self.raiseADebug('Finished with %d runs submitted, %d jobs running, and %d completed jobs waiting to be processed.' % (jobHandler.numSubmitted(),jobHandler.numRunning(),len(jobHandler.getFinishedNoPop())) )
         break
-      time.sleep(self.sleepTime)
+      # wait for a job to finish or to leave the queue (sleepTime is only the longest wait)
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, self.sleepTime)
     # END while loop that runs the step iterations
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -725,6 +755,53 @@ class MultiRun(SingleRun):
         for collector, outIndex in self._outputDictCollectionLambda:
           collector([newInp,outputs[outIndex]])
     return newInp
+
+  def _submitNewInputs(self, number, sampler, model, inputs, outputs, jobHandler):
+    """
+      Submits up to "number" new runs, obtaining the samples from the Sampler in batches.
+      As in _findANewInputToRun, samples found in the restart are collected directly and
+      do not count as runs, so the same samples are obtained as submitting them one at a time.
+      If several samples are evaluated in each job (samplesPerJob), each run takes that many
+      samples, except possibly the last one of the sampler. Since only the forward samplers
+      group the samples, whose new inputs are the original inputs (see Sampler.generateInput),
+      each job gets the original inputs and the information of each of its samples.
+      @ In, number, int, number of runs to submit
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ In, inputs, list, the raven objects used as the input in this step
+      @ In, outputs, list, the raven objects used as the output in this step
+      @ In, jobHandler, JobHandler, the job handler to submit the runs to
+      @ Out, None
+    """
+    submitted = 0
+    jobInputInfos = [] # samples waiting to fill a job
+    while submitted < number and sampler.amIreadyToProvideAnInput():
+      try:
+        newInputs = sampler.generateInputBatch(inputs, model, (number - submitted)*self._samplesPerJob - len(jobInputInfos))
+      except utils.NoMoreSamplesNeeded:
+        self.raiseAMessage('Sampler returned "NoMoreSamplesNeeded".  Continuing...')
+        break
+      if len(newInputs) == 0:
+        break
+      for found, newInp, inputInfo in newInputs:
+        if found == 1:
+          # loop over the outputs for this step and collect the data for each
+          for collector, outIndex in self._outputDictCollectionLambda:
+            collector([newInp,outputs[outIndex]])
+        elif self._samplesPerJob == 1:
+          model.submit(newInp, sampler.type, jobHandler, **inputInfo)
+          submitted += 1
+        else:
+          jobInputInfos.append(inputInfo)
+          if len(jobInputInfos) == self._samplesPerJob:
+            model.submitBatch(inputs, sampler.type, jobHandler, jobInputInfos)
+            jobInputInfos = []
+            submitted += 1
+    # the sampler ran out of samples before filling the last job
+    if len(jobInputInfos) > 0:
+      model.submitBatch(inputs, sampler.type, jobHandler, jobInputInfos)
+      submitted += 1
+    self.raiseADebug('Submitted {} inputs'.format(submitted))
 #
 #
 #
@@ -954,10 +1031,14 @@ class IOStep(Step):
         #inDictionary['Input'][i] is a dataObjects, outputs[i] is HDF5
         ## write the data object into a HDF5
         ## TODO convert to load function when it can handle unstructured multiple realizations
-        for rlzNo in range(len(inDictionary['Input'][i])):
-          rlz = inDictionary['Input'][i].realization(rlzNo, unpackXArray=True)
-          rlz = dict((var,np.atleast_1d(val)) for var, val in rlz.items())
-          outputs[i].addRealization(rlz)
+        ## the realizations are added in batches, so that the (columnar) database is extended once per batch
+        batchSize = 1000
+        for start in range(0,len(inDictionary['Input'][i]),batchSize):
+          rlzs = []
+          for rlzNo in range(start,min(start+batchSize,len(inDictionary['Input'][i]))):
+            rlz = inDictionary['Input'][i].realization(rlzNo, unpackXArray=True)
+            rlzs.append(dict((var,np.atleast_1d(val)) for var, val in rlz.items()))
+          outputs[i].addRealizationBatch(utils.stackRealizations(rlzs))
 
       elif self.actionType[i] == 'ROM-dataObjects':
         #inDictionary['Input'][i] is a ROM, outputs[i] is dataObject
@@ -1001,10 +1082,14 @@ class IOStep(Step):
 
       elif self.actionType[i] == 'FILES-dataObjects':
         #inDictionary['Input'][i] is a Files, outputs[i] is PointSet
-        ## load a CSV from file
+        ## load a CSV (or a netCDF/Parquet file, based on the extension) from file
         infile = inDictionary['Input'][i]
-        options = {'fileToLoad':infile}
-        outputs[i].load(inDictionary['Input'][i].getPath(),'csv',**options)
+        style = {'nc':'netcdf','parquet':'parquet'}.get((infile.getExt() or '').lower(),'csv')
+        if style == 'csv':
+          options = {'fileToLoad':infile}
+          outputs[i].load(inDictionary['Input'][i].getPath(),'csv',**options)
+        else:
+          outputs[i].load(infile.getAbsFile(),style)
 
       else:
         # unrecognized, and somehow not caught by the step reader.
@@ -24,20 +24,7 @@ warnings.simplefilter('default', DeprecationWarning)
 
 ################################################################################
 
-from SupervisedLearning.SupervisedLearning import supervisedLearning
-# Forward Samplers
-from SupervisedLearning.ARMA               import ARMA
-from SupervisedLearning.GaussPolynomialRom import GaussPolynomialRom
-from SupervisedLearning.HDMRRom            import HDMRRom
-from SupervisedLearning.MSR                import MSR
-from SupervisedLearning.NDinterpolatorRom  import NDinterpolatorRom
-from SupervisedLearning.NDinvDistWeight    import NDinvDistWeight
-from SupervisedLearning.NDsplineRom        import NDsplineRom
-from SupervisedLearning.SciKitLearn        import SciKitLearn
-from SupervisedLearning.pickledROM         import pickledROM
-from SupervisedLearning.PolyExponential    import PolyExponential
-from SupervisedLearning.DynamicModeDecomposition import DynamicModeDecomposition
-from SupervisedLearning.ROMCollection      import Collection, Segments, Clusters
+from utils import importerUtils
 
 ## [ Add new class here ]
 ################################################################################
@@ -46,23 +33,23 @@ from SupervisedLearning.ROMCollection      import Collection, Segments, Clusters
 """
  Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The ROMs are registered by the path of their class and only imported when requested,
+# so that their libraries (statsmodels, sklearn, ...) are not loaded by the inputs not using them.
 __base = 'supervisedLearning'
-__interfaceDict                         = {}
-__interfaceDict['NDspline'            ] = NDsplineRom
-__interfaceDict['NDinvDistWeight'     ] = NDinvDistWeight
-__interfaceDict['NDsplineRom'         ] = NDsplineRom
-__interfaceDict['SciKitLearn'         ] = SciKitLearn
-__interfaceDict['GaussPolynomialRom'  ] = GaussPolynomialRom
-__interfaceDict['HDMRRom'             ] = HDMRRom
-__interfaceDict['MSR'                 ] = MSR
-__interfaceDict['ARMA'                ] = ARMA
-__interfaceDict['pickledROM'          ] = pickledROM
-__interfaceDict['PolyExponential'     ] = PolyExponential
-__interfaceDict['DMD'                 ] = DynamicModeDecomposition
-__interfaceDict['Segments'            ] = Segments
-__interfaceDict['Clusters'            ] = Clusters
+__interfaceDict                         = importerUtils.LazyClassDict()
+__interfaceDict['NDspline'            ] = 'SupervisedLearning.NDsplineRom.NDsplineRom'
+__interfaceDict['NDinvDistWeight'     ] = 'SupervisedLearning.NDinvDistWeight.NDinvDistWeight'
+__interfaceDict['NDsplineRom'         ] = 'SupervisedLearning.NDsplineRom.NDsplineRom'
+__interfaceDict['SciKitLearn'         ] = 'SupervisedLearning.SciKitLearn.SciKitLearn'
+__interfaceDict['GaussPolynomialRom'  ] = 'SupervisedLearning.GaussPolynomialRom.GaussPolynomialRom'
+__interfaceDict['HDMRRom'             ] = 'SupervisedLearning.HDMRRom.HDMRRom'
+__interfaceDict['MSR'                 ] = 'SupervisedLearning.MSR.MSR'
+__interfaceDict['ARMA'                ] = 'SupervisedLearning.ARMA.ARMA'
+__interfaceDict['pickledROM'          ] = 'SupervisedLearning.pickledROM.pickledROM'
+__interfaceDict['PolyExponential'     ] = 'SupervisedLearning.PolyExponential.PolyExponential'
+__interfaceDict['DMD'                 ] = 'SupervisedLearning.DynamicModeDecomposition.DynamicModeDecomposition'
+__interfaceDict['Segments'            ] = 'SupervisedLearning.ROMCollection.Segments'
+__interfaceDict['Clusters'            ] = 'SupervisedLearning.ROMCollection.Clusters'
 
 def knownTypes():
   """
@@ -97,6 +97,8 @@ class GaussPolynomialRom(supervisedLearning):
     self.polys         = None #dict{varName: OrthoPolynomial object}, has polynomials for evaluation
     self.indexSet      = None #array of tuples, polynomial order combinations
     self.polyCoeffDict = None #dict{index set point, float}, polynomial combination coefficients for each combination
+    self.evaluationPlan = None #dict{'orders','coeffs'}, polynomial orders and coefficients of the expansion as arrays (see _buildEvaluationPlan)
+    self.evaluationChunkSize = 2**22 #maximum number of polynomial products held in memory while evaluating many points
     self.numRuns       = None #number of runs to generate ROM; default is len(self.sparseGrid)
     self.itpDict       = {}   #dict{varName: dict{attribName:value} }
     self.featv         = None  # list of feature variables
@@ -281,6 +283,72 @@ class GaussPolynomialRom(supervisedLearning):
       tot*=self.polys[varName](o,p)
     return tot
 
+  def _buildEvaluationPlan(self):
+    """
+      Compiles the trained expansion into arrays, so that it can be evaluated at many points by matrix products:
+      the polynomial orders of each term of the expansion for each variable and the coefficients of each term for each target.
+      @ In, None
+      @ Out, None
+    """
+    indices = list(self.polyCoeffDict[self.target[0]].keys())
+    orders  = np.asarray(indices,dtype=int).reshape(len(indices),len(self.sparseGrid.varNames))
+    coeffs  = np.asarray(list(list(self.polyCoeffDict[target][idx] for target in self.target) for idx in indices),dtype=float)
+    self.evaluationPlan = {'orders':orders,'coeffs':coeffs.reshape(len(indices),len(self.target))}
+
+  def _getEvaluationPlan(self):
+    """
+      Returns the evaluation plan, building it if it is missing (e.g. ROMs pickled before it was introduced).
+      @ In, None
+      @ Out, evaluationPlan, dict, {'orders':np.array,'coeffs':np.array} (see _buildEvaluationPlan)
+    """
+    if getattr(self,'evaluationPlan',None) is None:
+      self._buildEvaluationPlan()
+    return self.evaluationPlan
+
+  def _maxPolyOrders(self):
+    """
+      Returns the maximum polynomial order of each variable in the expansion.
+      @ In, None
+      @ Out, maxOrders, dict, {varName:int}
+    """
+    orders = self._getEvaluationPlan()['orders']
+    return dict((varName,int(orders[:,i].max())) for i,varName in enumerate(self.sparseGrid.varNames))
+
+  def _polyTables(self,varNames,pts,maxOrders):
+    """
+      Evaluates the univariate polynomials of the requested variables up to the requested orders at many points at once.
+      @ In, varNames, list(str), names of the variables of the columns of pts
+      @ In, pts, np.array, shape (n_points,len(varNames)), values at which to evaluate the polynomials
+      @ In, maxOrders, dict, {varName:int}, variables and maximum orders to evaluate
+      @ Out, tables, dict, {varName:np.array(n_points,maxOrder+1)}, the tables of the polynomials (see OrthogonalPolynomial.evaluateTable)
+    """
+    tables = {}
+    for varName,maxOrder in maxOrders.items():
+      stdPts = self.distDict[varName].convertToQuad(self.quads[varName].type,pts[:,varNames.index(varName)])
+      tables[varName] = self.polys[varName].evaluateTable(maxOrder,stdPts)
+    return tables
+
+  def _evaluatePolyTables(self,tables):
+    """
+      Evaluates the expansion at many points at once, given the tables of the univariate polynomials of its variables.
+      The polynomial products of each term are computed by chunks of points, to bound the memory used.
+      @ In, tables, dict, {varName:np.array(n_points,n_orders)}, tables of the polynomials (see _polyTables)
+      @ Out, values, np.array, shape (n_points,n_targets), the evaluated points
+    """
+    evaluationPlan = self._getEvaluationPlan()
+    orders = evaluationPlan['orders']
+    coeffs = evaluationPlan['coeffs']
+    numPoints = len(tables[self.sparseGrid.varNames[0]])
+    values = np.zeros((numPoints,len(self.target)))
+    chunkSize = max(1,getattr(self,'evaluationChunkSize',2**22)//len(orders))
+    for start in range(0,numPoints,chunkSize):
+      end = min(start+chunkSize,numPoints)
+      basis = np.ones((end-start,len(orders)))
+      for i,varName in enumerate(self.sparseGrid.varNames):
+        basis *= tables[varName][start:end,orders[:,i]]
+      values[start:end] = np.dot(basis,coeffs)
+    return values
+
   def __trainLocal__(self,featureVals,targetVals):
     """
       Trains ROM.
@@ -352,6 +420,7 @@ class GaussPolynomialRom(supervisedLearning):
           wt = self.sparseGrid.weights(translate[tupPt])
           self.polyCoeffDict[target][idx]+=soln*self._multiDPolyBasisEval(idx,stdPt)*wt
         self.polyCoeffDict[target][idx]*=self.norm
+    self._buildEvaluationPlan()
     self.amITrained=True
     self.raiseADebug('...training complete!')
 
@@ -416,29 +485,21 @@ class GaussPolynomialRom(supervisedLearning):
       return self.polyCoeffDict[target][tuple([0]*len(self.features))]
     elif r==2:
       return sum(s**2 for s in self.polyCoeffDict[target].values())
-    tot=0
-    for pt,wt in self.sparseGrid:
-      tot+=self.__evaluateLocal__([pt])[target]**r*wt
+    pts = np.asarray(self.sparseGrid.points(),dtype=float)
+    wts = np.asarray(self.sparseGrid.weights(),dtype=float)
+    tot = np.sum(self.__evaluateLocal__(pts)[target]**r*wts)
     tot*=self.norm
     return tot
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list, of values at which to evaluate the ROM
-      @ Out, returnDict, dict, the evaluated point for each target
+      Evaluates the points (all at once, using the evaluation plan built at training).
+      @ In, featureVals, np.array, shape (n_samples,n_features), values at which to evaluate the ROM
+      @ Out, returnDict, dict, the evaluated points for each target ({target:np.array(n_samples)})
     """
-    featureVals=featureVals[0]
-    returnDict={}
-    stdPt = np.zeros(len(featureVals))
-    for p,pt in enumerate(featureVals):
-      varName = self.sparseGrid.varNames[p]
-      stdPt[p] = self.distDict[varName].convertToQuad(self.quads[varName].type,pt)
-    for target in self.target:
-      tot=0
-      for idx,coeff in self.polyCoeffDict[target].items():
-        tot+=coeff*self._multiDPolyBasisEval(idx,stdPt)
-      returnDict[target] = tot
+    featureVals = np.atleast_2d(np.asarray(featureVals,dtype=float))
+    values = self._evaluatePolyTables(self._polyTables(self.sparseGrid.varNames,featureVals,self._maxPolyOrders()))
+    returnDict = dict((target,values[:,t]) for t,target in enumerate(self.target))
     return returnDict
 
   def _printPolynomial(self):
@@ -230,23 +230,30 @@ class HDMRRom(GaussPolynomialRom):
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list(float), list of values at which to evaluate the ROM
-      @ Out, tot, float, the evaluated point
+      Evaluates the points (all at once, see GaussPolynomialRom.__evaluateLocal__).
+      @ In, featureVals, np.array, shape (n_samples,n_features), values at which to evaluate the ROM
+      @ Out, returnDict, dict, the evaluated points for each target ({target:np.array(n_samples)})
     """
     #am I trained?
-    returnDict = dict.fromkeys(self.target,None)
     if not self.amITrained:
       self.raiseAnError(IOError,'Cannot evaluate, as ROM is not trained!')
-    for target in self.target:
-      tot = 0
-      for term,mult in self.reducedTerms.items():
-        if term == ():
-          tot += self.refSoln[target]*mult
-        else:
-          cutVals = [list(featureVals[0][self.features.index(j)] for j in term)]
-          tot += self.ROMs[term].__evaluateLocal__(cutVals)[target]*mult
-      returnDict[target] = tot
+    featureVals = np.atleast_2d(np.asarray(featureVals,dtype=float))
+    returnDict = dict((target,np.zeros(len(featureVals))) for target in self.target)
+    # the tables of the univariate polynomials are shared by all the cut terms including the variable
+    maxOrders = {}
+    for term in self.reducedTerms.keys():
+      if term != ():
+        for var,order in self.ROMs[term]._maxPolyOrders().items():
+          maxOrders[var] = max(order,maxOrders.get(var,0))
+    tables = self._polyTables(self.features,featureVals,maxOrders)
+    for term,mult in self.reducedTerms.items():
+      if term == ():
+        for target in self.target:
+          returnDict[target] += self.refSoln[target]*mult
+      else:
+        values = self.ROMs[term]._evaluatePolyTables(tables)
+        for t,target in enumerate(self.ROMs[term].target):
+          returnDict[target] += values[:,t]*mult
     return returnDict
 
   def __mean__(self,targ=None):
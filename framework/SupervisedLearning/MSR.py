@@ -71,6 +71,9 @@ class MSR(NDinterpolatorRom):
                                 'biweight', 'quartic', 'triweight', 'tricube',
                                 'gaussian', 'cosine', 'logistic', 'silverman',
                                 'exponential']
+    # Kernels whose support is bounded by the bandwidth
+    self.compactKernels = ['uniform', 'triangular', 'epanechnikov', 'biweight',
+                           'quartic', 'triweight', 'tricube', 'cosine']
     self.__amsc = []                      # AMSC object
     # Some sensible default arguments
     self.gradient = 'steepest'            # Gradient estimate methodology
@@ -106,6 +109,9 @@ class MSR(NDinterpolatorRom):
     self.kernel = 'gaussian'              # What kernel should be used in the
                                           #  kde approach
     self.bandwidth = 1.                   # The bandwidth for the kde approach
+    self.evaluationChunkSize = 2**20      # The maximum number of (query point,
+                                          #  training point) pairs processed at
+                                          #  once by the kde approach
 
     # Read everything in first, and then do error checking as some parameters
     # will not matter, but we can still throw a warning message that they may
@@ -205,7 +211,7 @@ class MSR(NDinterpolatorRom):
       self.raiseAnError(IOError, 'Requested unknown partition predictor:'
                         '\"'+repr(self.partitionPredictor)+'\"','(Available options:',
                         self.acceptedPredictorParam,')')
-    if self.bandwidth <= 0:
+    if self.bandwidth not in ['variable','auto'] and self.bandwidth <= 0:
       if self.partitionPredictor == 'kde':
         self.raiseAnError(IOError, 'Requested invalid bandwidth value:',
                           self.bandwidth, '(bandwidth > 0)')
@@ -299,8 +305,10 @@ class MSR(NDinterpolatorRom):
     # We need a KD-Tree for querying neighbors
     self.kdTree = neighbors.KDTree(self.X)
 
-    distances,_ = self.kdTree.query(self.X,k=self.knn)
-    distances = distances.flatten()
+    # The distances among the training points are only needed to guess the bandwidth
+    if self.bandwidth == 'auto':
+      distances,_ = self.kdTree.query(self.X,k=self.knn)
+      distances = distances.flatten()
 
     # The following are a list of common kernels defined centered at zero with
     # either infinite support or a support defined over the interval [1,1].
@@ -414,7 +422,7 @@ class MSR(NDinterpolatorRom):
           @ In, u, float, the support
           @ Out, kernel, float, the kernel
         """
-        return math.pi/4.*math.cos(u*math.pi/2.)*indicator(u)
+        return math.pi/4.*np.cos(u*math.pi/2.)*indicator(u)
     elif self.kernel == 'logistic':
       if self.bandwidth == 'auto':
         self.bandwidth = max(distances)
@@ -464,6 +472,65 @@ class MSR(NDinterpolatorRom):
     """
     self.raiseAnError(NotImplementedError, '__confidenceLocal__ method must be implemented!')
 
+  def __kdeWeights(self,featureVals,partitions):
+    """
+      Computes, for each query point, the sum of the kernels centered on the training points of each partition.
+      The query points are processed by chunks, so that the memory used is bounded by evaluationChunkSize:
+      for the kernels with a finite support only the training points within the bandwidth (found through the
+      KD-tree) are considered, otherwise all the training points are.
+      @ In, featureVals, numpy.array 2-D, features
+      @ In, partitions, list, the partitions ({key:training point indices}) of each target
+      @ Out, kdeWeights, list, the weights ({key:numpy.array 1-D}) of each target
+    """
+    numTrain = self.X.shape[0]
+    # the partitions containing each training point (the extrema belong to
+    #  several partitions): the partitions of point i are
+    #  memberParts[memberStart[i]:memberStart[i]+memberCount[i]]
+    memberships = []
+    for targetPartitions in partitions:
+      memberPoints = np.concatenate([np.asarray(indices,dtype=int) for indices in targetPartitions.values()])
+      memberParts = np.repeat(np.arange(len(targetPartitions)),[len(indices) for indices in targetPartitions.values()])
+      order = np.argsort(memberPoints,kind='mergesort')
+      memberCount = np.bincount(memberPoints,minlength=numTrain)
+      memberStart = np.cumsum(memberCount) - memberCount
+      memberships.append((memberParts[order],memberStart,memberCount))
+    weights = [np.zeros((featureVals.shape[0],len(targetPartitions))) for targetPartitions in partitions]
+    chunkSize = max(1,self.evaluationChunkSize//numTrain)
+    for start in range(0,featureVals.shape[0],chunkSize):
+      chunk = featureVals[start:start+chunkSize]
+      numChunk = chunk.shape[0]
+      # This is a variable-based bandwidth that will adjust to the density
+      # around the given query point
+      if self.bandwidth == 'variable':
+        h = self.kdTree.query(chunk,k=self.knn)[0][:,-1]
+      else:
+        h = np.full(numChunk,self.bandwidth)
+      if self.kernel in self.compactKernels:
+        # slightly enlarged radius, the kernel itself discards the points outside of its support
+        neighborIndices = self.kdTree.query_radius(chunk,r=h*(1.+1e-10))
+        rows = np.repeat(np.arange(numChunk),[len(n) for n in neighborIndices])
+        cols = np.concatenate(neighborIndices).astype(int)
+        # sum the kernels in the order of the training points
+        order = np.lexsort((cols,rows))
+        rows, cols = rows[order], cols[order]
+      else:
+        rows = np.repeat(np.arange(numChunk),numTrain)
+        cols = np.tile(np.arange(numTrain),numChunk)
+      dists = np.sqrt(((chunk[rows]-self.X[cols])**2).sum(axis=-1))
+      kernels = self.__kernel(dists/h[rows])
+      for (memberParts,memberStart,memberCount), weight in zip(memberships,weights):
+        numPartitions = weight.shape[1]
+        # one entry per (query point, training point, partition of the training point)
+        counts = memberCount[cols]
+        pairs = np.repeat(np.arange(len(cols)),counts)
+        offsets = np.arange(len(pairs)) - np.repeat(np.cumsum(counts)-counts,counts)
+        parts = memberParts[memberStart[cols][pairs]+offsets]
+        weight[start:start+numChunk] = np.bincount(rows[pairs]*numPartitions+parts,
+                                                   weights=kernels[pairs],
+                                                   minlength=numChunk*numPartitions).reshape(numChunk,numPartitions)
+    kdeWeights = [dict((key,weight[:,p]) for p,key in enumerate(targetPartitions.keys())) for targetPartitions,weight in zip(partitions,weights)]
+    return kdeWeights
+
   def __evaluateLocal__(self,featureVals):
     """
       Perform regression on samples in featureVals.
@@ -473,56 +540,32 @@ class MSR(NDinterpolatorRom):
       @ Out, returnDict, dict, dict of predicted values for each target ({'target1':numpy.array 1-D,'target2':numpy.array 1-D}
     """
     returnDict = {}
+    if self.partitionPredictor == 'kde':
+      partitions = [self.__amsc[index].Partitions(self.simplification) for index in range(len(self.target))]
+      kdeWeights = self.__kdeWeights(featureVals,partitions)
     for index, target in enumerate(self.target):
       if self.partitionPredictor == 'kde':
-        partitions = self.__amsc[index].Partitions(self.simplification)
-        weights = {}
-        dists = np.zeros((featureVals.shape[0],self.X.shape[0]))
-        for i,row in enumerate(featureVals):
-          dists[i] = np.sqrt(((row-self.X)**2).sum(axis=-1))
-        # This is a variable-based bandwidth that will adjust to the density
-        # around the given query point
-        if self.bandwidth == 'variable':
-          h = sorted(dists)[self.knn-1]
-        else:
-          h = self.bandwidth
-        for key,indices in partitions.items():
-          #############
-          ## Using SciKit Learn, we have a limited number of kernel functions to
-          ## choose from.
-          # kernel = self.kernel
-          # if kernel == 'uniform':
-          #   kernel = 'tophat'
-          # if kernel == 'triangular':
-          #   kernel = 'linear'
-          # kde = KernelDensity(kernel=kernel, bandwidth=h).fit(self.X[indices,])
-          # weights[key] = np.exp(kde.score_samples(featureVals))
-          #############
-          ## OR
-          #############
-          weights[key] = 0
-          for idx in indices:
-            weights[key] += self.__kernel(dists[:,idx]/h)
-          weights[key]
-          #############
-
+        weights = kdeWeights[index]
         if self.blending:
           weightedPredictions = np.zeros(featureVals.shape[0])
-          sumW = 0
-          for key in partitions.keys():
-            fx = self.__amsc[index].Predict(featureVals,key)
+          sumW = np.zeros(featureVals.shape[0])
+          for key in partitions[index].keys():
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             wx = weights[key]
             sumW += wx
             weightedPredictions += fx*wx
-          returnDict[target] = weightedPredictions if sumW == 0 else weightedPredictions / sumW
+          nonZero = sumW != 0
+          weightedPredictions[nonZero] = weightedPredictions[nonZero] / sumW[nonZero]
+          returnDict[target] = weightedPredictions
         else:
           predictions = np.zeros(featureVals.shape[0])
           maxWeights = np.zeros(featureVals.shape[0])
-          for key in partitions.keys():
-            fx = self.__amsc[index].Predict(featureVals,key)
+          for key in partitions[index].keys():
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             wx = weights[key]
-            predictions[wx > maxWeights] = fx
-            maxWeights[wx > maxWeights] = wx
+            better = wx > maxWeights
+            predictions[better] = fx[better]
+            maxWeights[better] = wx[better]
           returnDict[target] = predictions
       elif self.partitionPredictor == 'svm':
         partitions = self.__amsc[index].Partitions(self.simplification)
@@ -111,13 +111,13 @@ class NDinterpolatorRom(supervisedLearning):
       @ In, featureVals, numpy.array 2-D, features
       @ Out, prediction, numpy.array 1-D, predicted values
     """
-    prediction = {} #np.zeros((featureVals.shape[0]))
+    # the interpolator reads the points from (and writes the predictions into) the arrays, without copies
+    featureVals = np.ascontiguousarray(featureVals,dtype=float)
+    prediction = {}
     for index, target in enumerate(self.target):
       prediction[target] = np.zeros((featureVals.shape[0]))
-      for n_sample in range(featureVals.shape[0]):
-        featv = interpolationND.vectd(featureVals[n_sample][:])
-        prediction[target][n_sample] = self.interpolator[index].interpolateAt(featv)
-      self.raiseAMessage('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' for target '+target+'. Predicted value is ' + str(prediction[target][n_sample]))
+      self.interpolator[index].interpolateAtPoints(featureVals,prediction[target])
+    self.raiseADebug('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' of '+str(featureVals.shape[0])+' points for targets '+','.join(self.target))
     return prediction
 
   def __returnInitialParametersLocal__(self):
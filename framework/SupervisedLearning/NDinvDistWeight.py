@@ -25,6 +25,8 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy import spatial
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -58,9 +60,73 @@ class NDinvDistWeight(NDinterpolatorRom):
       @ In, None
       @ Out, None
     """
+    p = float(self.initOptionDict['p'])
+    if p <= 0.0:
+      self.raiseAnError(IOError,'the <p> parameter of NDinvDistWeight must be greater than zero! Got '+str(p))
     self.interpolator = []
     for _ in range(len(self.target)):
-      self.interpolator.append(interpolationND.InverseDistanceWeighting(float(self.initOptionDict['p'])))
+      self.interpolator.append(interpolationND.InverseDistanceWeighting(p))
+    # if the number of neighbors is given, only the nearest training points (found through a KD-tree) are weighted
+    self.neighbors = int(self.initOptionDict['n_neighbors']) if 'n_neighbors' in self.initOptionDict.keys() else None
+    self.kdTree    = None
+    if self.neighbors is not None and self.neighbors < 1:
+      self.raiseAnError(IOError,'the <n_neighbors> parameter of NDinvDistWeight must be greater than zero!')
+    # the KD-tree only supports the Minkowski distances (p >= 1)
+    if self.neighbors is not None and p < 1.0:
+      self.raiseAnError(IOError,'the <p> parameter of NDinvDistWeight must be greater than or equal to 1 when <n_neighbors> is provided! Got '+str(p))
+
+  def __getstate__(self):
+    """
+      Overwrite state (for pickle-ing)
+      the KD-tree is not pickled but rebuilt at loading (see NDinterpolatorRom.__setstate__)
+      @ In, None
+      @ Out, state, dict, namespace dictionary
+    """
+    state = NDinterpolatorRom.__getstate__(self)
+    state.pop('kdTree',None)
+    return state
+
+  def __trainLocal__(self,featureVals,targetVals):
+    """
+      Perform training on samples in featureVals with responses y.
+      @ In, featureVals, {array-like, sparse matrix}, shape=[n_samples, n_features],
+        an array of input feature values
+      @ In, targetVals, array, shape = [n_samples,n_targets], an array of output target
+        associated with the corresponding points in featureVals
+      @ Out, None
+    """
+    if self.neighbors is None:
+      NDinterpolatorRom.__trainLocal__(self,featureVals,targetVals)
+    else:
+      self.featv, self.targv = featureVals,targetVals
+      self.kdTree = spatial.cKDTree(featureVals)
+
+  def __evaluateLocal__(self,featureVals):
+    """
+      Perform regression on samples in featureVals.
+      If the number of neighbors is given, the weights (1/distance**(n_features+1), see the crow InverseDistanceWeighting)
+      are computed only for the nearest training points, all the samples at once
+      @ In, featureVals, numpy.array 2-D, features
+      @ Out, prediction, dict, predicted values ({target:numpy.array 1-D})
+    """
+    if self.neighbors is None:
+      return NDinterpolatorRom.__evaluateLocal__(self,featureVals)
+    numNeighbors = min(self.neighbors,len(self.featv))
+    distances, indices = self.kdTree.query(featureVals,k=numNeighbors,p=float(self.initOptionDict['p']))
+    distances = distances.reshape(len(featureVals),numNeighbors)
+    indices   = indices.reshape(len(featureVals),numNeighbors)
+    # the samples coinciding with a training point get its value
+    exact = distances[:,0] == 0.0
+    distances[exact] = 1.0
+    weights = (1.0/distances)**(featureVals.shape[1]+1)
+    weightsSum = weights.sum(axis=1)
+    prediction = {}
+    for index, target in enumerate(self.target):
+      targetVals = self.targv[:,index]
+      prediction[target] = (weights*targetVals[indices]).sum(axis=1)/weightsSum
+      prediction[target][exact] = targetVals[indices[exact,0]]
+    self.raiseADebug('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' of '+str(len(featureVals))+' points for targets '+','.join(self.target))
+    return prediction
 
   def __resetLocal__(self):
     """
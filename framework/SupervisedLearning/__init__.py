@@ -25,19 +25,9 @@ from __future__ import absolute_import
 # These lines ensure that we do not have to do something like:
 # 'from Samplers.Sampler import Sampler' outside of this submodule
 from .SupervisedLearning import supervisedLearning
-
-from .ARMA               import ARMA
-from .GaussPolynomialRom import GaussPolynomialRom
-from .HDMRRom            import HDMRRom
-from .MSR                import MSR
-from .NDinterpolatorRom  import NDinterpolatorRom
-from .NDinvDistWeight    import NDinvDistWeight
-from .NDsplineRom        import NDsplineRom
-from .SciKitLearn        import SciKitLearn
-from .pickledROM         import pickledROM
-from .PolyExponential    import PolyExponential
-from .DynamicModeDecomposition import DynamicModeDecomposition
 from .ROMCollection      import Collection, Segments, Clusters
+# the other ROMs are imported by the factory when requested (see Factory.py);
+# use 'from SupervisedLearning.ARMA import ARMA' to get them directly
 
 # Factory methods
 from .Factory import knownTypes
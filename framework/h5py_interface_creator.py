@@ -34,6 +34,7 @@ except ImportError:
   import pickle as pk
 import string
 import difflib
+import collections
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -68,6 +69,16 @@ def _loads(val):
     except UnicodeDecodeError:
       return pk.loads(val,errors='backslashreplace')
 
+def storedLayout(filenameAndPath):
+  """
+    Method to find the layout of an existing database file
+    @ In, filenameAndPath, string, the database file (full path)
+    @ Out, storedLayout, string, "columnar" (see hdf5ColumnarDatabase) or "hierarchical" (see hdf5Database)
+  """
+  with h5.File(filenameAndPath,'r') as fh5:
+    layout = fh5.attrs.get('layout','hierarchical')
+  return utils.toString(layout)
+
 #
 #  *************************
 #  *  HDF5 DATABASE CLASS  *
@@ -119,6 +130,12 @@ class hdf5Database(MessageHandler.MessageUser):
     # List of boolean variables, true if the corresponding group in self.allGroupPaths
     # is an ending group (no sub-groups appended), false otherwise
     self.allGroupEnds = []
+    # Dictionary {group name:group path} indexing "self.allGroupPaths" (it is rebuilt from the
+    # "allGroupPaths" dataset stored in the file when an existing database is opened)
+    self.__groupPaths = {}
+    # Cache of the data of the last parent groups read (see __getParentGroupData)
+    self.__parentCache = collections.OrderedDict()
+    self.parentCacheSize = 1000
     # We can create a base empty database or we open an existing one
     if self.fileExist:
       # self.h5FileW is the HDF5 object. Open the database in "update" mode
@@ -202,6 +219,9 @@ class hdf5Database(MessageHandler.MessageUser):
     else:
       self.h5FileW.visititems(self.__isGroup)
       self.__createFileLevelInfoDatasets()
+    self.__groupPaths = {}
+    for path in self.allGroupPaths:
+      self.__indexGroupPath(path)
     self.h5FileW.attrs["nGroups"] = len(self.allGroupPaths)
     self.raiseAMessage('TOTAL NUMBER OF GROUPS = ' + str(len(self.allGroupPaths)))
 
@@ -224,6 +244,17 @@ class hdf5Database(MessageHandler.MessageUser):
         self.raiseAWarning('not found attribute endGroup in group ' + name + '.Set True.')
     return
 
+  def __indexGroupPath(self,path):
+    """
+      Method to add a group path to the {group name:group path} index
+      (if more groups have the same name, the first one added is kept, as the lookup by name always returned it)
+      @ In, path, bytes, the group path
+      @ Out, None
+    """
+    name = utils.toString(path).split('/')[-1]
+    if name not in self.__groupPaths:
+      self.__groupPaths[name] = path
+
   def addExpectedMeta(self, keys, params={}):
     """
       Store expected metadata
@@ -279,6 +310,14 @@ class hdf5Database(MessageHandler.MessageUser):
     self.__updateFileLevelInfoDatasets()
     self.h5FileW.flush()
 
+  def addGroups(self,rlzs):
+    """
+      Function to add several groups into the database
+      @ In, rlzs, list, list of dictionaries with the data and metadata to add (see addGroup)
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self.addGroup(rlz)
 
   def addGroupInit(self,groupName,attributes=None):
     """
@@ -291,25 +330,20 @@ class hdf5Database(MessageHandler.MessageUser):
     """
     attribs = {} if attributes is None else attributes
     groupNameInit = groupName+"_"+datetime.now().strftime("%m-%d-%Y-%H-%S")
-    for index in range(len(self.allGroupPaths)):
-      comparisonName = utils.toString(self.allGroupPaths[index])
-      splittedPath=comparisonName.split('/')
-      if len(splittedPath) > 0:
-        if groupNameInit in splittedPath[0]:
-          alphabetCounter, movingCounter = 0, 0
-          asciiAlphabet   = list(string.ascii_uppercase)
-          prefixLetter          = ''
-          while True:
-            testGroup = groupNameInit +"_"+prefixLetter+asciiAlphabet[alphabetCounter]
-            if testGroup not in self.allGroupPaths:
-              groupNameInit = utils.toString(testGroup)
-              break
-            alphabetCounter+=1
-            if alphabetCounter >= len(asciiAlphabet):
-              prefix = asciiAlphabet[movingCounter]
-              alphabetCounter = 0
-              movingCounter  += 1
+    if groupNameInit in self.__groupPaths:
+      alphabetCounter, movingCounter = 0, 0
+      asciiAlphabet   = list(string.ascii_uppercase)
+      prefixLetter          = ''
+      while True:
+        testGroup = groupNameInit +"_"+prefixLetter+asciiAlphabet[alphabetCounter]
+        if testGroup not in self.__groupPaths:
+          groupNameInit = utils.toString(testGroup)
           break
+        alphabetCounter+=1
+        if alphabetCounter >= len(asciiAlphabet):
+          prefixLetter = asciiAlphabet[movingCounter]
+          alphabetCounter = 0
+          movingCounter  += 1
     self.parentGroupName = "/" + groupNameInit
     # Create the group
     grp = self.h5FileW.create_group(groupNameInit)
@@ -320,6 +354,7 @@ class hdf5Database(MessageHandler.MessageUser):
     grp.attrs[b'groupName'] = groupNameInit
     self.allGroupPaths.append(utils.toBytes("/" + groupNameInit))
     self.allGroupEnds.append(False)
+    self.__indexGroupPath(self.allGroupPaths[-1])
     self.__updateFileLevelInfoDatasets()
     self.h5FileW.flush()
 
@@ -445,14 +480,16 @@ class hdf5Database(MessageHandler.MessageUser):
     else:
       parentGroupName = parentName
     # Retrieve the parent group from the HDF5 database
-    if parentGroupName in self.h5FileW:
-      parentGroupObj = self.h5FileW.require_group(parentGroupName)
-    else:
+    try:
+      parentGroupObj = self.h5FileW[parentGroupName]
+    except KeyError:
+      parentGroupObj = None
+    if parentGroupObj is None:
       # try to guess the parentID from the file name
-      closestGroup = difflib.get_close_matches(parentName, self.allGroupPaths, n=1, cutoff=0.01)
+      closestGroup = difflib.get_close_matches(parentName, list(self.__groupPaths.keys()), n=1, cutoff=0.01)
       errorOut = False
       if len(closestGroup) > 0:
-        parentGroupName = closestGroup[0]
+        parentGroupName = self.__groupPaths[closestGroup[0]]
         if parentGroupName in self.h5FileW:
           parentGroupObj = self.h5FileW.require_group(parentGroupName)
         else:
@@ -461,7 +498,7 @@ class hdf5Database(MessageHandler.MessageUser):
         errorOut = True
       if errorOut:
         errorString = ' NOT FOUND parent group named "' + str(parentName)
-        errorString+= '\n All group paths are:\n -'+'\n -'.join(self.allGroupPaths)
+        errorString+= '\n All group paths are:\n -'+'\n -'.join(utils.toString(path) for path in self.allGroupPaths)
         errorString+= '\n Closest parent group found is "'+str(closestGroup[0] if len(closestGroup) > 0 else 'None')+'"!'
         self.raiseAnError(ValueError,errorString)
 
@@ -487,6 +524,7 @@ class hdf5Database(MessageHandler.MessageUser):
     else:
       self.allGroupPaths.append(b"/" + utils.toBytes(groupName))
       self.allGroupEnds.append(True)
+    self.__indexGroupPath(self.allGroupPaths[-1])
 
   def retrieveAllHistoryNames(self,rootName=None):
     """
@@ -505,24 +543,44 @@ class hdf5Database(MessageHandler.MessageUser):
 
     return workingList
 
-  def __getListOfParentGroups(self, grp, backGroups = []):
+  def __getParentGroupPaths(self, path):
+    """
+      Method to get the paths of the parent groups of a certain group, from the root to the deepest
+      (the root groups, i.e. "/" and the groups added by addGroupInit, are not included)
+      @ In, path, str, the path of the starting group
+      @ Out, parentPaths, list, the paths of the parent groups
+    """
+    components = utils.toString(path).strip('/').split('/')[:-1]
+    parentPaths = ['/' + '/'.join(components[:i+1]) for i in range(len(components))]
+    if len(parentPaths) > 0 and self.h5FileW[parentPaths[0]].attrs.get("rootname",False):
+      parentPaths.pop(0)
+    return parentPaths
+
+  def __getParentGroupData(self, path, variables = None):
     """
-      Method to get the list of groups from the deepest to the root, given a certain group
-      @ In, grp, h5py.Group, istance of the starting group
-      @ InOut, backGroups, list, list of group instances (from the deepest to the root)
+      Get the data from a parent group. The parent groups are shared by all the branches of a hierarchical
+      structure, so the data of the last "self.parentCacheSize" parent groups read are kept in memory.
+      @ In, path, str, the path of the parent group
+      @ In, variables, set, optional, the variables to read (None => all)
+      @ Out, data, dict, the dictionary with the data
     """
-    if grp.parent and grp.parent != grp:
-      parentGroup = grp.parent
-      if not parentGroup.attrs.get("rootname",False):
-        backGroups.append(parentGroup)
-        self.__getListOfParentGroups(parentGroup, backGroups)
-    return backGroups
+    key = (path, None if variables is None else frozenset(variables))
+    if key in self.__parentCache:
+      # move it to the end (most recently used)
+      data = self.__parentCache.pop(key)
+    else:
+      data = self.__getNewDataFromGroup(self.h5FileW[path], path.split('/')[-1], variables)
+      if len(self.__parentCache) >= self.parentCacheSize:
+        self.__parentCache.popitem(last=False)
+    self.__parentCache[key] = data
+    return data
 
-  def __getNewDataFromGroup(self, group, name):
+  def __getNewDataFromGroup(self, group, name, variables = None):
     """
       Get the data from the group
       @ In, group, h5py.Group, the group from which the data needs to be got
       @ In, name, str, the group name
+      @ In, variables, set, optional, the variables to read (None => all), the others are not read from the file
       @ Out, newData, dict, the dictionary with the data
     """
     newData = {}
@@ -531,33 +589,36 @@ class hdf5Database(MessageHandler.MessageUser):
     if hasIntfloat:
       dataSetIntFloat = group[name + "_dataIntFloat"]
       # Get some variables of interest
-      nVarsIntfloat      = group.attrs[b'nVarsIntfloat']
       varShapeIntfloat   = _loads(group.attrs[b'data_shapesIntfloat'])
       varKeysIntfloat    = _loads(group.attrs[b'data_namesIntfloat'])
       begin, end          = _loads(group.attrs[b'data_begin_endIntfloat'])
+      if variables is None:
+        # a single read of the whole dataset
+        dataSetIntFloat = dataSetIntFloat[()]
       # Reconstruct the dataset
-      newData = {key : np.reshape(dataSetIntFloat[begin[cnt]:end[cnt]], varShapeIntfloat[cnt]) for cnt,key in enumerate(varKeysIntfloat)}
+      newData = {key : np.reshape(dataSetIntFloat[begin[cnt]:end[cnt]], varShapeIntfloat[cnt]) for cnt,key in enumerate(varKeysIntfloat) if variables is None or key in variables}
     if hasOther:
-      # get the "other" data
-      datasetOther = _loads(group.attrs[name + "_dataOther"])
-      # Get some variables of interest
-      nVarsOther      = group.attrs[b'nVarsOther']
-      varShapeOther   = _loads(group.attrs[b'data_shapesOther'])
       varKeysOther    = _loads(group.attrs[b'data_namesOther'])
-      begin, end       = _loads(group.attrs[b'data_begin_endOther'])
-      # Reconstruct the dataset
-      newData.update({key : np.reshape(datasetOther[begin[cnt]:end[cnt]], varShapeOther[cnt]) for cnt,key in enumerate(varKeysOther)})
+      if variables is None or not variables.isdisjoint(varKeysOther):
+        # get the "other" data
+        datasetOther = _loads(group.attrs[name + "_dataOther"])
+        # Get some variables of interest
+        varShapeOther   = _loads(group.attrs[b'data_shapesOther'])
+        begin, end       = _loads(group.attrs[b'data_begin_endOther'])
+        # Reconstruct the dataset
+        newData.update({key : np.reshape(datasetOther[begin[cnt]:end[cnt]], varShapeOther[cnt]) for cnt,key in enumerate(varKeysOther) if variables is None or key in variables})
     return newData
 
   def _getRealizationByName(self,name,options = {}):
     """
       Function to retrieve the history whose end group name is "name"
       @ In, name, string, realization name => It must correspond to a group name (string)
-      @ In, options, dict, dictionary of options (now, just "recunstruct" flag)
-      @ In, attributes, dict, optional, dictionary of attributes (options)
+      @ In, options, dict, dictionary of options ("reconstruct" flag and "variables", the list of variables to
+        read, all if not present; the data of the other variables are not read from the file)
       @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
     """
     reconstruct = options.get("reconstruct", True)
+    variables = set(options['variables']) if options.get('variables') is not None else None
     path  = ''
     found = False
     attrs = {}
@@ -571,28 +632,46 @@ class hdf5Database(MessageHandler.MessageUser):
 
     if found:
       # Grep only history from group "name"
-      group = self.h5FileW.require_group(path)
+      group = self.h5FileW[path]
       # Retrieve dataset
-      newData = self.__getNewDataFromGroup(group, name)
+      newData = self.__getNewDataFromGroup(group, name, variables)
       # Add the attributes
       attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
       # check the reconstruct flag
       if reconstruct:
-        # get list of back groups
-        listGroups = self.__getListOfParentGroups(group)
-        listGroups.reverse()
-        for grp in listGroups:
-          # the root groups get skipped
-          if grp.name not in ["/",self.parentGroupName]:
-            data = self.__getNewDataFromGroup(grp, grp.attrs[b'groupName'])
-            if len(data.keys()) != len(newData.keys()):
-              self.raiseAnError(IOError,'Group named "' + grp.attrs[b'groupName'] + '" has an inconsistent number of variables in database "'+self.name+'"!')
-            newData = {key : np.concatenate((newData[key],data[key])) for key in newData.keys()}
+        # get list of back groups (the root groups get skipped)
+        for parentPath in self.__getParentGroupPaths(path):
+          data = self.__getParentGroupData(parentPath, variables)
+          if len(data.keys()) != len(newData.keys()):
+            self.raiseAnError(IOError,'Group named "' + parentPath.split('/')[-1] + '" has an inconsistent number of variables in database "'+self.name+'"!')
+          newData = {key : np.concatenate((newData[key],data[key])) for key in newData.keys()}
     else:
       self.raiseAnError(IOError,'Group named ' + name + ' not found in database "'+self.name+'"!')
 
     return(newData,attrs)
 
+  def retrieveRealizations(self,names,options = {}):
+    """
+      Function to retrieve several realizations
+      @ In, names, list, the realization names (see _getRealizationByName)
+      @ In, options, dict, dictionary of options (see _getRealizationByName)
+      @ Out, rlzs, list, the realizations (dictionaries)
+    """
+    return [self._getRealizationByName(name,options)[0] for name in names]
+
+  def realizationIterator(self,names,options = {},chunkSize = 1000):
+    """
+      Generator of realizations: the realizations are read chunkSize at a time, so that
+      at most chunkSize realizations are kept in memory by the iterator
+      @ In, names, list, the realization names (see _getRealizationByName)
+      @ In, options, dict, optional, dictionary of options (see _getRealizationByName)
+      @ In, chunkSize, int, optional, the number of realizations read at once
+      @ Out, realizationIterator, generator, the realizations (dictionaries)
+    """
+    for start in range(0,len(names),chunkSize):
+      for rlz in self.retrieveRealizations(names[start:start+chunkSize],options):
+        yield rlz
+
   def closeDatabaseW(self):
     """
       Function to close the database
@@ -621,14 +700,534 @@ class hdf5Database(MessageHandler.MessageUser):
       @ Out, parentGroupName, string, parent group path
     """
     parentGroupName = '-$' # control variable
-    if parentName != '/':
-      # this loops takes ~.2 seconds on a 100 milion list (it is accetable)
+    if parentName == '/':
+      parentGroupName = '/'
+    elif '/' not in parentName.strip():
+      parentGroupName = self.__groupPaths.get(parentName.strip(),parentGroupName)
+    else:
+      # a (partial) path has been given, the index (by name) can not be used
       for s in self.allGroupPaths:
         if utils.toString(s).endswith("/"+parentName.strip()):
           parentGroupName = s
           break
-    else:
-      parentGroupName = '/'
     return parentGroupName
 
 
+#
+#  ***********************************
+#  *  HDF5 COLUMNAR DATABASE CLASS  *
+#  ***********************************
+#
+
+class hdf5ColumnarDatabase(hdf5Database):
+  """
+    class to create a h5py (hdf5) database with a "columnar" layout:
+    -> each variable is stored in its own resizable, chunked (and compressed) dataset, one row per realization
+       (scalars in float datasets, histories and arrays in variable-length datasets, strings in
+       variable-length string datasets and any other object pickled in variable-length byte datasets);
+    -> the name, the parent (for hierarchical, i.e. DET, structures) and the variables of each realization
+       are stored in an index table.
+    The realizations are appended in batches (one resize of each dataset per batch), which keeps the
+    file size, the write time and the open time under control when storing many realizations.
+  """
+  # kinds of columns, each one can be promoted to the ones that follow it in the list
+  __promotions = {'scalar':['array','object'], 'array':['object'], 'string':['object'], 'object':[]}
+
+  def __init__(self,name, databaseDir, messageHandler, filename, exist, variables = None, compression = 'gzip', chunkSize = 1024):
+    """
+      Constructor
+      @ In, name, string, name of this database
+      @ In, databaseDir, string, database directory (full path)
+      @ In, messageHandler, MessageHandler, global message handler
+      @ In, filename, string, the database filename
+      @ In, exist, bool, does it exist?
+      @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ In, compression, string, optional, the compression filter of the datasets ("gzip", "lzf" or "none")
+      @ In, chunkSize, int, optional, the number of realizations in each chunk of the datasets
+      @ Out, None
+    """
+    self.name            = name
+    self.variables       = variables
+    self.type            = None
+    self.printTag        = 'DATABASE HDF5'
+    self.messageHandler  = messageHandler
+    self.fileExist       = exist
+    self.onDiskFile      = filename
+    self.databaseDir     = databaseDir
+    self.filenameAndPath = os.path.join(self.databaseDir,self.onDiskFile)
+    self.fileOpen        = False
+    self.compression     = None if compression in [None,'none'] else compression
+    self.chunkSize       = chunkSize
+    # realization index table (in memory, mirrored in the "RAVEN_index" group of the file)
+    self.names           = []  # names of the realizations (and of the root groups)
+    self.rows            = {}  # {name:row} of the realizations
+    self.parents         = []  # row of the parent realization (-1 for the root "/")
+    self.ends            = []  # True if realization, False if root group (see hdf5Database.allGroupEnds)
+    self.variableSetIds  = []  # index (in self.variableSets) of the variables of each realization (-1 for the root groups)
+    self.variableSets    = []  # list of the (ordered) tuples of variables stored in the realizations
+    # {variable:(datasetName,kind)} of the stored columns
+    self.columns         = {}
+    # row of the current root group (-1 => "/")
+    self.parentRow       = -1
+    if self.fileExist:
+      if not os.path.exists(self.filenameAndPath):
+        self.raiseAnError(IOError,'database file has not been found, searched Path is: ' + self.filenameAndPath )
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'r+')
+      self.__createObjFromFile()
+      self.firstRootGroup = True
+    else:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'w')
+      self.firstRootGroup = False
+      self.__createIndex()
+
+  def __len__(self):
+    """
+      Overload len method
+      @ In, None
+      @ Out, __len__, length (the root "/" included, as for the hierarchical layout)
+    """
+    return len(self.names) + 1
+
+  def __createDataset(self, group, name, dtype):
+    """
+      Method to create an empty, resizable and chunked dataset
+      @ In, group, h5py.Group, the group where the dataset is created
+      @ In, name, str, the dataset name
+      @ In, dtype, np.dtype, the dataset type
+      @ Out, dataset, h5py.Dataset, the new dataset
+    """
+    return group.create_dataset(name, shape=(0,), maxshape=(None,), dtype=dtype, chunks=(self.chunkSize,), compression=self.compression)
+
+  def __createIndex(self):
+    """
+      Method to create the (empty) index table in a new file
+      @ In, None
+      @ Out, None
+    """
+    self.h5FileW.attrs['layout'] = 'columnar'
+    self.h5FileW.attrs['nRealizations'] = 0
+    self.h5FileW.attrs['variableSets'] = _dumps([])
+    index = self.h5FileW.create_group('RAVEN_index')
+    self.__createDataset(index, 'names', h5.special_dtype(vlen=str))
+    self.__createDataset(index, 'parents', np.int64)
+    self.__createDataset(index, 'ends', bool)
+    self.__createDataset(index, 'variableSets', np.int32)
+    self.h5FileW.create_group('RAVEN_data')
+    self.h5FileW.create_group('RAVEN_offsets')
+    self.h5FileW.create_group('RAVEN_shapes')
+    self.h5FileW.create_group('RAVEN_roots')
+
+  def __createObjFromFile(self):
+    """
+      Function to load the index table and the list of the columns from an existing database
+      @ In, None
+      @ Out, None
+    """
+    if 'RAVEN_index' not in self.h5FileW:
+      self.raiseAnError(IOError, 'The database '+str(self.name) + ' does not have a "columnar" layout!')
+    nRows = int(self.h5FileW.attrs['nRealizations'])
+    index = self.h5FileW['RAVEN_index']
+    self.names          = [utils.toString(name) for name in index['names'][:nRows]]
+    self.parents        = index['parents'][:nRows].tolist()
+    self.ends           = index['ends'][:nRows].tolist()
+    self.variableSetIds = index['variableSets'][:nRows].tolist()
+    self.variableSets   = [tuple(varSet) for varSet in _loads(self.h5FileW.attrs['variableSets'])]
+    self.rows           = dict((name,row) for row,name in enumerate(self.names))
+    self.columns        = dict((utils.toString(dataset.attrs['variable']),(key,utils.toString(dataset.attrs['kind']))) for key,dataset in self.h5FileW['RAVEN_data'].items())
+    self.type           = utils.toString(self.h5FileW.attrs['type']) if 'type' in self.h5FileW.attrs else None
+    self.raiseAMessage('TOTAL NUMBER OF GROUPS = ' + str(len(self)))
+
+  def addGroup(self,rlz):
+    """
+      Function to add a group (realization) into the database
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    self.addGroups([rlz])
+
+  def addGroups(self,rlzs):
+    """
+      Function to add several groups (realizations) into the database at once
+      @ In, rlzs, list, list of dictionaries with the data and metadata to add
+      @ Out, None
+    """
+    if len(rlzs) == 0:
+      return
+    firstRow = len(self.names)
+    # {variable:{row:(kind,value)}} of the new realizations
+    newValues = {}
+    for rlz in rlzs:
+      parentID  = rlz.get("RAVEN_parentID",[None])[0]
+      prefix    = rlz.get("prefix")
+      groupName = str(prefix if utils.isSingleValued(prefix) else prefix[0])
+      if groupName in self.rows:
+        # the group alread exists
+        groupName = groupName + "_" + groupName
+      if parentID:
+        #If Hierarchical structure, firstly add the root group
+        if not self.firstRootGroup or parentID == "None":
+          parentRow = self.parentRow
+          self.firstRootGroup = True
+          self.type = 'DET'
+        else:
+          parentRow = self.__findParentRow(parentID)
+          self.raiseAMessage('Adding group named "' + groupName + '" in Database "'+ self.name +'"')
+      else:
+        # Parallel structure (always root level)
+        parentRow = self.parentRow
+        self.firstRootGroup = True
+        self.type = 'MC'
+      row = len(self.names)
+      data = self.__splitRealization(rlz)
+      self.__appendIndex(groupName, parentRow, True, tuple(data.keys()))
+      for var, kindAndValue in data.items():
+        newValues.setdefault(var,{})[row] = kindAndValue
+    for var, values in newValues.items():
+      self.__writeColumn(var, firstRow, values)
+    self.__writeIndex(firstRow)
+
+  def addGroupInit(self,groupName,attributes=None):
+    """
+      Function to add an empty (root) group to the database
+      This function is generally used when the user provides a rootname in the input.
+      It uses the groupName + it appends the date and time.
+      @ In, groupName, string, group name
+      @ In, attributes, dict, optional, dictionary of attributes that must be added as metadata (None by default)
+      @ Out, None
+    """
+    attribs = {} if attributes is None else attributes
+    groupNameInit = groupName+"_"+datetime.now().strftime("%m-%d-%Y-%H-%S")
+    if groupNameInit in self.rows:
+      asciiAlphabet = list(string.ascii_uppercase)
+      counter = 0
+      while groupNameInit + "_" + asciiAlphabet[counter % len(asciiAlphabet)]*(counter//len(asciiAlphabet)+1) in self.rows:
+        counter += 1
+      groupNameInit = groupNameInit + "_" + asciiAlphabet[counter % len(asciiAlphabet)]*(counter//len(asciiAlphabet)+1)
+    grp = self.h5FileW['RAVEN_roots'].create_group(groupNameInit)
+    grp.attrs.update(attribs)
+    firstRow = len(self.names)
+    self.parentRow = firstRow
+    self.__appendIndex(groupNameInit, -1, False, None)
+    self.__writeIndex(firstRow)
+
+  def __splitRealization(self, rlz):
+    """
+      Method to select the variables to store from a realization and to find the kind of column they need
+      (the same selection of the hierarchical layout: the "variables" filter only applies to the numeric data)
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, data, collections.OrderedDict, {variable:(kind,value)}, numeric variables first
+    """
+    if self.variables is not None:
+      # check if all variables are contained in the rlz dictionary
+      if not set(self.variables).issubset(rlz.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+    numeric = collections.OrderedDict()
+    other   = collections.OrderedDict()
+    for key, value in rlz.items():
+      if type(value) == np.ndarray and value.dtype in np.sctypes['float']+np.sctypes['int'] or type(value) in [float,int]:
+        if self.variables is None or key in self.variables:
+          value = np.atleast_1d(value)
+          numeric[key] = ('scalar' if value.shape == (1,) else 'array', value)
+      elif type(value) == np.ndarray:
+        value = np.atleast_1d(value)
+        other[key] = ('string' if value.shape == (1,) and value.dtype.kind == 'U' else 'object', value)
+    numeric.update(other)
+    return numeric
+
+  def __findParentRow(self, parentName):
+    """
+      Method to find the row of the parent of a realization
+      @ In, parentName, str, the parent ID
+      @ Out, parentRow, int, the row of the parent (-1 for the root "/")
+    """
+    if parentName == '/':
+      return -1
+    parentRow = self.rows.get(parentName.strip())
+    if parentRow is None:
+      # try to guess the parentID from the file name
+      closestGroup = difflib.get_close_matches(parentName, self.names, n=1, cutoff=0.01)
+      if len(closestGroup) == 0:
+        self.raiseAnError(ValueError,'NOT FOUND parent group named "' + str(parentName) + '" in Database "'+ self.name +'"!')
+      parentRow = self.rows[closestGroup[0]]
+    return parentRow
+
+  def __appendIndex(self, name, parentRow, end, variables):
+    """
+      Method to append a row to the (in memory) index table
+      @ In, name, str, the realization (or root group) name
+      @ In, parentRow, int, the row of the parent
+      @ In, end, bool, True for realizations, False for the root groups
+      @ In, variables, tuple, the variables of the realization (None for the root groups)
+      @ Out, None
+    """
+    if variables is None:
+      variableSetId = -1
+    else:
+      try:
+        variableSetId = self.variableSets.index(variables)
+      except ValueError:
+        variableSetId = len(self.variableSets)
+        self.variableSets.append(variables)
+    self.rows[name] = len(self.names)
+    self.names.append(name)
+    self.parents.append(parentRow)
+    self.ends.append(end)
+    self.variableSetIds.append(variableSetId)
+
+  def __writeIndex(self, firstRow):
+    """
+      Method to write the rows of the index table from firstRow on into the file
+      @ In, firstRow, int, the first row to write
+      @ Out, None
+    """
+    nRows = len(self.names)
+    index = self.h5FileW['RAVEN_index']
+    for key, values in [('names',self.names), ('parents',self.parents), ('ends',self.ends), ('variableSets',self.variableSetIds)]:
+      dataset = index[key]
+      if dataset.shape[0] < nRows:
+        dataset.resize((nRows,))
+      dataset[firstRow:nRows] = values[firstRow:nRows]
+    self.h5FileW.attrs['nRealizations'] = nRows
+    self.h5FileW.attrs['variableSets'] = _dumps([list(varSet) for varSet in self.variableSets])
+    if self.type is not None:
+      self.h5FileW.attrs['type'] = self.type
+    self.h5FileW.flush()
+
+  def __createColumn(self, var, kind, ndim = 1):
+    """
+      Method to create the dataset(s) of a column
+      @ In, var, str, the variable name
+      @ In, kind, str, the column kind ("scalar", "array", "string" or "object")
+      @ In, ndim, int, optional, the number of dimensions of the values ("array" kind only)
+      @ Out, None
+    """
+    key = self.columns[var][0] if var in self.columns else 'column_' + str(len(self.h5FileW['RAVEN_data']))
+    if kind == 'scalar':
+      dataset = self.__createDataset(self.h5FileW['RAVEN_data'], key, float)
+    elif kind == 'string':
+      dataset = self.__createDataset(self.h5FileW['RAVEN_data'], key, h5.special_dtype(vlen=str))
+    else:
+      # variable-length values are stored one after the other in a flat dataset (floats for the arrays,
+      # bytes of the pickled objects otherwise), the end of the values of each row is in the "offsets"
+      dataset = self.__createDataset(self.h5FileW['RAVEN_data'], key, float if kind == 'array' else np.uint8)
+      self.__createDataset(self.h5FileW['RAVEN_offsets'], key, np.int64)
+      if kind == 'array':
+        self.h5FileW['RAVEN_shapes'].create_dataset(key, shape=(0,ndim), maxshape=(None,ndim), dtype=np.int64, chunks=(self.chunkSize,ndim), compression=self.compression)
+    dataset.attrs['variable'] = var
+    dataset.attrs['kind'] = kind
+    self.columns[var] = (key,kind)
+
+  def __promoteColumn(self, var, kind, ndim, nRows):
+    """
+      Method to rewrite an existing column as a column of a more general kind
+      @ In, var, str, the variable name
+      @ In, kind, str, the new column kind
+      @ In, ndim, int, the number of dimensions of the values ("array" kind only)
+      @ In, nRows, int, the number of rows already written
+      @ Out, None
+    """
+    key = self.columns[var][0]
+    rows = [row for row in range(nRows) if self.variableSetIds[row] >= 0 and var in self.variableSets[self.variableSetIds[row]]]
+    values = dict((row,(kind,value)) for row, value in zip(rows,self.__readColumn(var,rows)))
+    for group in ['RAVEN_data','RAVEN_offsets','RAVEN_shapes']:
+      if key in self.h5FileW[group]:
+        del self.h5FileW[group][key]
+    self.__createColumn(var, kind, ndim)
+    if len(rows) > 0:
+      self.__writeColumn(var, 0, values)
+
+  def __writeColumn(self, var, firstRow, values):
+    """
+      Method to write the values of a variable (one single resize of the dataset(s))
+      @ In, var, str, the variable name
+      @ In, firstRow, int, the first row of the values
+      @ In, values, dict, {row:(kind,value)}, the values to write (rows from firstRow on)
+      @ Out, None
+    """
+    kind = self.columns[var][1] if var in self.columns else None
+    ndims = set(value.ndim for _, value in values.values())
+    if kind == 'array':
+      ndims.add(self.h5FileW['RAVEN_shapes'][self.columns[var][0]].shape[1])
+    elif kind == 'scalar':
+      ndims.add(1)
+    for newKind, _ in values.values():
+      if kind is None or newKind in self.__promotions[kind]:
+        kind = newKind
+      elif newKind != kind and kind not in self.__promotions[newKind]:
+        kind = 'object'
+    if kind == 'array' and len(ndims) > 1:
+      # the arrays of a column must have the same number of dimensions
+      kind = 'object'
+    if var not in self.columns:
+      self.__createColumn(var, kind, max(ndims))
+    elif self.columns[var][1] != kind:
+      self.__promoteColumn(var, kind, max(ndims), firstRow)
+    key = self.columns[var][0]
+    dataset = self.h5FileW['RAVEN_data'][key]
+    lastRow = max(values.keys()) + 1
+    if kind == 'scalar':
+      column = np.full(lastRow - firstRow, np.nan)
+      for row, (_, value) in values.items():
+        column[row - firstRow] = value[0]
+    elif kind == 'string':
+      column = np.empty(lastRow - firstRow, dtype=object)
+      column.fill('')
+      for row, (_, value) in values.items():
+        column[row - firstRow] = value.tolist()[0]
+    else:
+      # the rows (without this variable) after the last one written get empty values
+      offsetDataset = self.h5FileW['RAVEN_offsets'][key]
+      firstRow = offsetDataset.shape[0]
+      if kind == 'array':
+        shapes = np.zeros((lastRow - firstRow, max(ndims)), dtype=np.int64)
+        flat = dict((row,np.asarray(value,dtype=float).ravel()) for row, (_, value) in values.items())
+        for row, (_, value) in values.items():
+          shapes[row - firstRow,:] = value.shape
+        shapeDataset = self.h5FileW['RAVEN_shapes'][key]
+        shapeDataset.resize((lastRow,shapeDataset.shape[1]))
+        shapeDataset[firstRow:lastRow] = shapes
+      else:
+        flat = dict((row,np.frombuffer(pk.dumps((np.atleast_1d(value).ravel().tolist(),value.shape), protocol=2), dtype=np.uint8)) for row, (_, value) in values.items())
+      begin = int(offsetDataset[firstRow-1]) if firstRow > 0 else 0
+      offsets = begin + np.cumsum([len(flat[row]) if row in flat else 0 for row in range(firstRow,lastRow)], dtype=np.int64)
+      offsetDataset.resize((lastRow,))
+      offsetDataset[firstRow:lastRow] = offsets
+      column = np.concatenate([flat[row] for row in sorted(flat.keys())])
+      dataset.resize((begin + len(column),))
+      dataset[begin:] = column
+      return
+    if dataset.shape[0] < lastRow:
+      dataset.resize((lastRow,))
+    dataset[firstRow:lastRow] = column
+
+  def __readColumn(self, var, rows):
+    """
+      Method to read the values of a variable in some rows (one single read of the dataset(s))
+      @ In, var, str, the variable name
+      @ In, rows, list, the (sorted) rows to read
+      @ Out, values, list, the values (np.ndarray) in the requested rows
+    """
+    if len(rows) == 0:
+      return []
+    key, kind = self.columns[var]
+    first, last = rows[0], rows[-1] + 1
+    if kind in ['scalar','string']:
+      column = self.h5FileW['RAVEN_data'][key][first:last]
+      if kind == 'scalar':
+        return [column[row - first:row - first + 1] for row in rows]
+      return [np.atleast_1d(utils.toString(column[row - first])) for row in rows]
+    # ends (and begins) of the values of the rows
+    ends = self.h5FileW['RAVEN_offsets'][key][max(first - 1,0):last]
+    if first == 0:
+      ends = np.concatenate(([0],ends))
+    column = self.h5FileW['RAVEN_data'][key][ends[0]:ends[-1]]
+    ends = ends - ends[0]
+    if kind == 'array':
+      shapes = self.h5FileW['RAVEN_shapes'][key][first:last]
+      values = [np.reshape(column[ends[row - first]:ends[row - first + 1]], shapes[row - first]) for row in rows]
+    else:
+      values = []
+      for row in rows:
+        data, shape = pk.loads(column[ends[row - first]:ends[row - first + 1]].tostring())
+        values.append(np.reshape(data, shape))
+    return values
+
+  def __readRows(self, rows, variables = None):
+    """
+      Method to read the data of several realizations (no reconstruction of the hierarchical structure)
+      @ In, rows, list, the rows to read
+      @ In, variables, set, optional, the variables to read (None => all), the others are not read from the file
+      @ Out, data, list, list of dictionaries {variable:np.ndarray}
+    """
+    data = dict((row,{}) for row in rows)
+    sortedRows = sorted(set(rows))
+    toRead = set()
+    for row in sortedRows:
+      toRead.update(self.variableSets[self.variableSetIds[row]])
+    if variables is not None:
+      toRead.intersection_update(variables)
+    for var in toRead:
+      varRows = [row for row in sortedRows if var in self.variableSets[self.variableSetIds[row]]]
+      for row, value in zip(varRows, self.__readColumn(var, varRows)):
+        data[row][var] = value
+    return [data[row] for row in rows]
+
+  def __ancestorRows(self, row):
+    """
+      Method to get the rows of the ancestors of a realization, from the deepest to the root (root groups excluded)
+      @ In, row, int, the row of the realization
+      @ Out, ancestors, list, the ancestor rows
+    """
+    ancestors = []
+    parent = self.parents[row]
+    while parent >= 0 and self.ends[parent]:
+      ancestors.append(parent)
+      parent = self.parents[parent]
+    return ancestors
+
+  def __reconstruct(self, row, newData, variables = None):
+    """
+      Method to reconstruct a realization of a hierarchical structure from its ancestors
+      @ In, row, int, the row of the realization
+      @ In, newData, dict, the data of the realization itself
+      @ In, variables, set, optional, the variables to read (None => all)
+      @ Out, newData, dict, the reconstructed realization
+    """
+    ancestors = self.__ancestorRows(row)
+    ancestors.reverse()
+    for ancestor, data in zip(ancestors, self.__readRows(ancestors, variables)):
+      if len(data.keys()) != len(newData.keys()):
+        self.raiseAnError(IOError,'Group named "' + self.names[ancestor] + '" has an inconsistent number of variables in database "'+self.name+'"!')
+      newData = {key : np.concatenate((newData[key],data[key])) for key in newData.keys()}
+    return newData
+
+  def retrieveAllHistoryNames(self,rootName=None):
+    """
+      Function to create a list of all the HistorySet names present in an existing database
+      @ In,  rootName, string, optional, It's the root name, if present, only the history names that have this root are going to be returned
+      @ Out, workingList, list, List of the HistorySet names
+    """
+    if not rootName:
+      workingList = [name for name, end in zip(self.names,self.ends) if end]
+    else:
+      rname = utils.toString(rootName)
+      workingList = [name for name, end in zip(self.names,self.ends) if end and name.endswith(rname)]
+    return workingList
+
+  def _getRealizationByName(self,name,options = {}):
+    """
+      Function to retrieve the history whose end group name is "name"
+      @ In, name, string, realization name => It must correspond to a group name (string)
+      @ In, options, dict, dictionary of options ("reconstruct" flag and "variables", the list of variables to
+        read, all if not present; the data of the other variables are not read from the file)
+      @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
+    """
+    row = self.rows.get(name)
+    if row is None or not self.ends[row]:
+      self.raiseAnError(IOError,'Group named ' + name + ' not found in database "'+self.name+'"!')
+    variables = set(options['variables']) if options.get('variables') is not None else None
+    newData = self.__readRows([row], variables)[0]
+    attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
+    if options.get("reconstruct", True):
+      newData = self.__reconstruct(row, newData, variables)
+    return(newData,attrs)
+
+  def retrieveRealizations(self,names,options = {}):
+    """
+      Function to retrieve several realizations (one single read of each needed dataset)
+      @ In, names, list, the realization names (see _getRealizationByName)
+      @ In, options, dict, dictionary of options (see _getRealizationByName)
+      @ Out, rlzs, list, the realizations (dictionaries)
+    """
+    variables = set(options['variables']) if options.get('variables') is not None else None
+    rows = []
+    for name in names:
+      row = self.rows.get(name)
+      if row is None or not self.ends[row]:
+        self.raiseAnError(IOError,'Group named ' + name + ' not found in database "'+self.name+'"!')
+      rows.append(row)
+    rlzs = self.__readRows(rows, variables)
+    if options.get("reconstruct", True):
+      rlzs = [self.__reconstruct(row, rlz, variables) for row, rlz in zip(rows, rlzs)]
+    return rlzs
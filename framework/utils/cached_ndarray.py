@@ -24,6 +24,7 @@ warnings.simplefilter('default',DeprecationWarning)
 #External Modules------------------------------------------------------------------------------------
 import sys
 import threading
+import six
 from numpy import ndarray
 import numpy as np
 import xarray as xr
@@ -388,3 +389,507 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+#
+#
+#
+#
+class cColumnarArray(object):
+  """
+    Column-oriented caching of realization data.  Each entity (column) is stored in its own typed buffer:
+    scalars go into float/int/bool np.ndarray buffers (or object buffers for strings and anything else),
+    while histories (1-D np.ndarray entries) are stored as a single flat buffer plus row offsets.
+    Buffers grow geometrically, so appending a realization costs amortized O(width) with no per-row
+    object arrays, and the typed columns can be handed to the DataObject without copying.
+
+    The indexing API mirrors cNDarray (c[row], c[:,col], c[row,col]) so DataObjects can use either.
+  """
+  # scalar types that can be dropped directly into each kind of typed buffer without checking
+  _intTypes = frozenset(six.integer_types+(np.int8,np.int16,np.int32,np.int64,np.uint8,np.uint16,np.uint32))
+  _floatTypes = frozenset((float,np.float16,np.float32,np.float64)).union(_intTypes)
+  _boolTypes = frozenset((bool,np.bool_))
+  _objectTypes = frozenset((str,bytes,six.text_type,type(None))).union(_floatTypes,_boolTypes)
+
+  ### CONSTRUCTOR ###
+  def __init__(self,width=None,length=None,growth=2):
+    """
+      Constructor.
+      @ In, width, int, number of entities aka columns
+      @ In, length, int, optional, initial capacity (number of samples) to allocate
+      @ In, growth, int, optional, multiplicative factor applied to the capacity when it runs out
+      @ Out, None
+    """
+    if width is None:
+      raise IOError('Creating cColumnarArray: "width" was not specified!')
+    self.size     = 0                                     # number of rows (samples) with actual data
+    self.width    = width                                 # number of entities aka columns
+    self.capacity = length if length is not None else 100 # allocated number of rows
+    self.growth   = max(int(growth),2)                    # capacity multiplier when full
+    self._columns = [None]*width                          # per-entity buffer, created on first entry
+    self._offsets = [None]*width                          # per-entity row offsets into buffer, only for histories
+    self._used    = [0]*width                             # per-entity filled length of buffer, only for histories
+    self._accepts = [frozenset()]*width                   # per-entity scalar types that can be stored without checks
+
+  ### PROPERTIES ###
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size,self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype = None):
+    """
+      so that numpy's array() returns values
+      @ In, dtype, np.type, the requested type of the array
+      @ Out, __array__, numpy.ndarray, the requested array (object-typed rows)
+    """
+    return self.getData()
+
+  def __getitem__(self,val):
+    """
+      Get item method.  Supports c[row], c[rows], c[row,col], c[rows,col], c[rows,cols].
+      Histories are returned as views into the underlying flat buffer.
+      @ In, val, slice object, the slicing object (e.g. 1, :, :2, 1:3, (1,2), etc.)
+      @ Out, __getitem__, object or np.ndarray, the element(s)
+    """
+    if isinstance(val,tuple) and len(val) == 2:
+      rows,cols = val
+    elif isinstance(val,tuple) and len(val) == 1:
+      # e.g. the result of np.where
+      rows,cols = val[0],slice(None)
+    else:
+      rows,cols = val,slice(None)
+    if isinstance(cols,tuple):
+      cols = list(cols)
+    # single column requests
+    if isinstance(cols,(int,np.integer)):
+      if isinstance(rows,(int,np.integer)):
+        return self._getEntry(self._rowIndex(rows),cols)
+      return self.getColumn(cols,asObject=self._offsets[cols] is not None)[rows]
+    # multiple column requests build object rows
+    colIndices = np.arange(self.width)[cols]
+    if isinstance(rows,(int,np.integer)):
+      row = self._rowIndex(rows)
+      # fill an object array entry by entry so histories are not unfolded into a 2-D array
+      data = np.empty(len(colIndices),dtype=object)
+      for i,c in enumerate(colIndices):
+        data[i] = self._getEntry(row,c)
+      return data
+    rowIndices = np.arange(self.size)[rows]
+    data = np.empty((len(rowIndices),len(colIndices)),dtype=object)
+    for i,c in enumerate(colIndices):
+      column = self.getColumn(c,asObject=self._offsets[c] is not None)
+      data[:,i] = column[rowIndices]
+    return data
+
+  def __setitem__(self,val,value):
+    """
+      Set item method.  Only single scalar entries can be changed, as c[row,col] = value.
+      @ In, val, tuple(int,int), the (row,column) to set
+      @ In, value, object, new scalar value
+      @ Out, None
+    """
+    row,col = val
+    row = self._rowIndex(row)
+    if self._offsets[col] is not None:
+      raise IOError('Tried to change a history entry in cColumnarArray; only scalar entries can be changed!')
+    self._fitScalar(col,value)
+    self._columns[col][row] = value
+    self._accepts[col] = self._acceptedTypes(col)
+
+  def __iter__(self):
+    """
+      Overload of iterator, iterates over rows.
+      @ In, None
+      @ Out, __iter__, iterator, iterator
+    """
+    return (self[r] for r in range(self.size))
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self,entry):
+    """
+      Append a single realization.
+      @ In, entry, list or np.ndarray, one value per entity, in column order.  Each value is a scalar or a 1-D np.ndarray.
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries, but got {}!'.format(self.width,len(entry)))
+    if self.size + 1 > self.capacity:
+      self._grow(self.size + 1)
+    size = self.size
+    for c,value in enumerate(entry):
+      # fast path for scalars that already match the column buffer
+      if type(value) in self._accepts[c]:
+        try:
+          self._columns[c][size] = value
+          continue
+        except OverflowError:
+          pass
+      self._setEntry(c,value)
+    self.size += 1
+
+  def extend(self,columns):
+    """
+      Append many realizations at once, given column-wise.
+      @ In, columns, list, one sequence per entity, each with the same number of realizations.
+                     Entries are either scalars or 1-D np.ndarray histories, as in "append".
+                     A 2-D np.ndarray is taken as one (equal-length) history per row.
+      @ Out, None
+    """
+    if len(columns) != self.width:
+      raise IOError('Tried to extend cColumnarArray.  Need {} columns, but got {}!'.format(self.width,len(columns)))
+    num = len(columns[0]) if self.width else 0
+    if any(len(column) != num for column in columns):
+      raise IOError('Tried to extend cColumnarArray with columns of different lengths!')
+    if num == 0:
+      return
+    if self.size + num > self.capacity:
+      self._grow(self.size + num)
+    for c,column in enumerate(columns):
+      self._setColumnEntries(c,column)
+    self.size += num
+
+  def addEntity(self,vals,firstEver=False):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array, one per existing row
+      @ Out, None
+    """
+    assert(len(vals) == self.size)
+    self._columns.append(None)
+    self._offsets.append(None)
+    self._used.append(0)
+    self._accepts.append(frozenset())
+    self.width += 1
+    if self.size:
+      # fill in the existing rows without changing the row count
+      size = self.size
+      self.size = 0
+      self._setColumnEntries(self.width-1,vals)
+      self.size = size
+
+  def removeEntity(self,index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    for store in (self._columns,self._offsets,self._used,self._accepts):
+      store.pop(index)
+    self.width -= 1
+
+  def getColumn(self,index,asObject=False):
+    """
+      Returns the filled part of a column.  Scalar columns are returned as a view of the typed buffer.
+      @ In, index, int, column to return
+      @ In, asObject, bool, optional, if True histories are returned as an object array of (view) arrays
+      @ Out, getColumn, np.ndarray, column values
+    """
+    column = self._columns[index]
+    if column is None:
+      return np.zeros(self.size,dtype=object)
+    offsets = self._offsets[index]
+    if offsets is None:
+      return column[:self.size]
+    if not asObject:
+      raise IOError('Column {} of cColumnarArray holds histories; use getRagged or asObject=True.'.format(index))
+    data = np.empty(self.size,dtype=object)
+    for r in range(self.size):
+      data[r] = column[offsets[r]:offsets[r+1]]
+    return data
+
+  def getRagged(self,index):
+    """
+      Returns the flat buffer and row offsets of a history column, such that row "r" is
+      values[offsets[r]:offsets[r+1]].  Both are views, not copies.
+      @ In, index, int, column to return
+      @ Out, values, np.ndarray, flat history values for all filled rows
+      @ Out, offsets, np.ndarray, integer offsets with length size+1
+    """
+    offsets = self._offsets[index]
+    if offsets is None:
+      raise IOError('Column {} of cColumnarArray does not hold histories!'.format(index))
+    return self._columns[index][:offsets[self.size]], offsets[:self.size+1]
+
+  def getUniformHistories(self,index):
+    """
+      If every row in a history column has the same length, returns them as a (size, length) view.
+      @ In, index, int, column to return
+      @ Out, data, np.ndarray or None, 2-D histories, or None if the lengths differ
+    """
+    values,offsets = self.getRagged(index)
+    lengths = np.diff(offsets)
+    if self.size == 0 or (lengths != lengths[0]).any():
+      return None
+    return values.reshape(self.size,lengths[0])
+
+  def isRagged(self,index):
+    """
+      Checks if a column holds histories.
+      @ In, index, int, column to check
+      @ Out, isRagged, bool, True if histories are stored in the column
+    """
+    return self._offsets[index] is not None
+
+  def getData(self):
+    """
+      Returns the data as an object np.ndarray of rows, matching the cNDarray layout.  This copies the data.
+      @ In, None
+      @ Out, getData, np.ndarray, data up to the used size
+    """
+    return self[:,:]
+
+  ### INTERNAL ###
+  @staticmethod
+  def _scalarDtype(value):
+    """
+      Determines the buffer type for a scalar value.
+      @ In, value, object, the value
+      @ Out, dtype, np.dtype, buffer dtype
+    """
+    if isinstance(value,(bool,np.bool_)):
+      return np.dtype(bool)
+    if isinstance(value,six.integer_types+(np.integer,)):
+      return np.dtype(int)
+    if isinstance(value,(float,np.floating)):
+      return np.dtype(float)
+    return np.dtype(object)
+
+  @staticmethod
+  def _historyDtype(value):
+    """
+      Determines the buffer type for a history.  Strings are kept as objects to avoid numpy string sizing.
+      @ In, value, np.ndarray, the history
+      @ Out, dtype, np.dtype, buffer dtype
+    """
+    if value.dtype.kind in 'biuf':
+      return value.dtype
+    return np.dtype(object)
+
+  def _acceptedTypes(self,col):
+    """
+      Determines which scalar types can be stored directly in the buffer of "col".
+      @ In, col, int, column index
+      @ Out, types, frozenset, accepted types (empty for histories)
+    """
+    column = self._columns[col]
+    if column is None or self._offsets[col] is not None:
+      return frozenset()
+    kind = column.dtype.kind
+    if kind == 'f':
+      return self._floatTypes
+    elif kind == 'i':
+      return self._intTypes
+    elif kind == 'b':
+      return self._boolTypes
+    elif kind == 'O':
+      return self._objectTypes
+    return frozenset()
+
+  def _getEntry(self,row,col):
+    """
+      Obtains a single entry.
+      @ In, row, int, nonnegative row index
+      @ In, col, int, column index
+      @ Out, entry, object, scalar or history view
+    """
+    column = self._columns[col]
+    if column is None:
+      return None
+    offsets = self._offsets[col]
+    if offsets is None:
+      return column[row]
+    return column[offsets[row]:offsets[row+1]]
+
+  def _rowIndex(self,row):
+    """
+      Converts a (possibly negative) row index into a nonnegative one, checking bounds.
+      @ In, row, int, row index
+      @ Out, row, int, nonnegative row index
+    """
+    if row < 0:
+      row += self.size
+    if not 0 <= row < self.size:
+      raise IndexError('Row {} is out of range for cColumnarArray with {} entries!'.format(row,self.size))
+    return row
+
+  def _grow(self,needed):
+    """
+      Grows the row capacity of every column to at least "needed".
+      @ In, needed, int, required capacity
+      @ Out, None
+    """
+    while self.capacity < needed:
+      self.capacity *= self.growth
+    for c,column in enumerate(self._columns):
+      if column is None:
+        continue
+      if self._offsets[c] is None:
+        self._columns[c] = self._resized(column,self.capacity)
+      else:
+        self._offsets[c] = self._resized(self._offsets[c],self.capacity+1)
+
+  def _reserveHistory(self,col,needed):
+    """
+      Grows the flat buffer of a history column to hold at least "needed" values.
+      @ In, col, int, column index
+      @ In, needed, int, required number of values
+      @ Out, None
+    """
+    column = self._columns[col]
+    if needed > len(column):
+      self._columns[col] = self._resized(column,max(needed,len(column)*self.growth))
+
+  @staticmethod
+  def _resized(array,length,dtype=None):
+    """
+      Copies an array into a new (larger) buffer.
+      @ In, array, np.ndarray, original buffer
+      @ In, length, int, new length
+      @ In, dtype, np.dtype, optional, new dtype (defaults to the original)
+      @ Out, new, np.ndarray, new buffer
+    """
+    new = np.empty(length,dtype=array.dtype if dtype is None else dtype)
+    num = min(len(array),length)
+    new[:num] = array[:num]
+    return new
+
+  def _fitScalar(self,col,value):
+    """
+      Assures the scalar buffer for "col" can store "value", promoting its dtype if needed.
+      int columns that receive floats become float; any other mismatch becomes object.
+      @ In, col, int, column index
+      @ In, value, object, scalar to store
+      @ Out, None
+    """
+    dtype = self._scalarDtype(value)
+    column = self._columns[col]
+    if column is None:
+      self._columns[col] = np.empty(self.capacity,dtype=dtype)
+      return
+    current = column.dtype
+    if current == dtype or current == object or (current.kind == 'f' and dtype.kind == 'i'):
+      return
+    if current.kind == 'i' and dtype.kind == 'f':
+      new = float
+    else:
+      new = object
+    self._columns[col] = self._resized(column,len(column),dtype=new)
+
+  def _fitHistory(self,col,dtype):
+    """
+      Assures the history buffer for "col" can store values of type "dtype", promoting if needed.
+      @ In, col, int, column index
+      @ In, dtype, np.dtype, type of the incoming history values
+      @ Out, None
+    """
+    column = self._columns[col]
+    if column is None:
+      self._columns[col] = np.empty(self.capacity,dtype=dtype)
+      self._offsets[col] = np.zeros(self.capacity+1,dtype=int)
+      self._used[col] = 0
+      return
+    current = column.dtype
+    if current == dtype or current == object:
+      return
+    new = np.promote_types(current,dtype) if dtype != object else np.dtype(object)
+    if new != current:
+      self._columns[col] = column.astype(new)
+
+  def _setEntry(self,col,value):
+    """
+      Stores "value" as row self.size of column "col".  Capacity must already be sufficient.
+      @ In, col, int, column index
+      @ In, value, object, scalar or 1-D np.ndarray
+      @ Out, None
+    """
+    column = self._columns[col]
+    if self._offsets[col] is not None and type(value) is np.ndarray and value.ndim == 1 and value.dtype == column.dtype:
+      # fast path for histories matching the buffer
+      start = self._used[col]
+      end = start + len(value)
+      if end > len(column):
+        self._reserveHistory(col,end)
+      self._columns[col][start:end] = value
+      self._used[col] = end
+      self._offsets[col][self.size+1] = end
+      return
+    isHistory = isinstance(value,np.ndarray) and value.ndim == 1
+    if self._columns[col] is None and self.size > 0:
+      # column was never set, so previous rows are missing; should not happen from DataObjects
+      raise IOError('cColumnarArray column {} has no data for the previous {} rows!'.format(col,self.size))
+    if isHistory and (self._columns[col] is None or self._offsets[col] is not None):
+      self._fitHistory(col,self._historyDtype(value))
+      start = self._used[col]
+      end = start + len(value)
+      self._reserveHistory(col,end)
+      self._columns[col][start:end] = value
+      self._used[col] = end
+      self._offsets[col][self.size+1] = end
+      return
+    if self._offsets[col] is not None:
+      raise IOError('cColumnarArray column {} holds histories, but got "{}"!'.format(col,type(value).__name__))
+    if isinstance(value,np.ndarray):
+      # ND entries, zero-d arrays, etc are held as (copied) objects
+      value = value.item() if value.ndim == 0 else value.copy()
+    try:
+      self._fitScalar(col,value)
+      self._columns[col][self.size] = value
+    except (OverflowError,ValueError,TypeError):
+      self._columns[col] = self._resized(self._columns[col],len(self._columns[col]),dtype=object)
+      self._columns[col][self.size] = value
+    self._accepts[col] = self._acceptedTypes(col)
+
+  def _setColumnEntries(self,col,values):
+    """
+      Stores many values at the end of column "col", starting at row self.size.  Capacity must already be sufficient.
+      @ In, col, int, column index
+      @ In, values, sequence, scalars or 1-D np.ndarray histories (or a 2-D np.ndarray of histories)
+      @ Out, None
+    """
+    num = len(values)
+    if isinstance(values,np.ndarray) and values.ndim == 2:
+      # equal-length histories, one per row
+      length = values.shape[1]
+      self._fitHistory(col,self._historyDtype(values))
+      start = self._used[col]
+      end = start + num*length
+      self._reserveHistory(col,end)
+      self._columns[col][start:end] = values.ravel()
+      self._offsets[col][self.size+1:self.size+num+1] = start + length*np.arange(1,num+1)
+      self._used[col] = end
+      return
+    if isinstance(values,np.ndarray) and values.dtype != object and self._offsets[col] is None:
+      # typed scalars can be stored at once
+      self._fitScalar(col,values.dtype.type(0) if values.dtype.kind in 'biuf' else 'object')
+      self._accepts[col] = self._acceptedTypes(col)
+      if self._columns[col].dtype.kind == 'f' or values.dtype.kind == self._columns[col].dtype.kind or self._columns[col].dtype == object:
+        self._columns[col][self.size:self.size+num] = values
+        return
+    # otherwise, one at a time
+    size = self.size
+    for value in values:
+      self._setEntry(col,value)
+      self.size += 1
+    self.size = size
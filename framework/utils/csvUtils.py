@@ -0,0 +1,113 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Reading of numeric CSV files (a header line, then rows of numbers), such as the outputs of the codes.
+  The rows are read in large blocks and each block is parsed by numpy in C, which is several times
+  faster than numpy.loadtxt (that converts the values one at a time in python) and gives the same values.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import io
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+def loadNumericCsv(fileName,delimiter=',',skipRows=0,usecols=None,headerColumns=False,dtype=float,blockSize=16*1024*1024):
+  """
+    Loads a numeric CSV file into a 2D array, and its header.
+    Rows are read in blocks of about "blockSize" bytes, so the text of the whole file is never in memory.
+    Blocks that are not plain rows of numbers (comments, blank lines, missing or extra fields...)
+    are handed to numpy.loadtxt, so they are accepted or rejected exactly as numpy.loadtxt would do.
+    @ In, fileName, string, the CSV file name (absolute path)
+    @ In, delimiter, string, optional, the delimiter between the values
+    @ In, skipRows, int, optional, the number of lines to skip after the header
+    @ In, usecols, tuple, optional, the (sorted) indices of the columns to keep (as numpy.loadtxt), all if None
+    @ In, headerColumns, bool, optional, if True (and usecols is None) only the columns named in the header are kept,
+      i.e. the extra fields at the end of the data rows are ignored
+    @ In, dtype, np.dtype, optional, the type of the values
+    @ Out, headers, list, the stripped field names in the header line
+    @ Out, data, np.ndarray, the values, one row for each line (at least 2D)
+  """
+  sep = delimiter.encode('utf-8')
+  blocks = []
+  with open(fileName,'rb') as csvFile:
+    headers = list(name.strip() for name in csvFile.readline().decode().split(delimiter))
+    for _ in range(skipRows):
+      csvFile.readline()
+    ## a delimiter at the end of the header means that each line ends with a delimiter as well
+    trailing = len(headers) > 1 and headers[-1] == ''
+    if trailing:
+      headers.pop(-1)
+    if (trailing or headerColumns) and usecols is None:
+      usecols = tuple(range(len(headers)))
+    numColumns = len(headers) if usecols is None else len(usecols)
+    ## the fast path can only keep all the columns
+    fast = usecols is None or tuple(usecols) == tuple(range(len(headers)))
+    remainder = b''
+    while True:
+      block = csvFile.read(blockSize)
+      text = remainder + block
+      if block:
+        ## keep the last (possibly incomplete) line for the next block
+        cut = text.rfind(b'\n')
+        if cut < 0:
+          remainder = text
+          continue
+        text, remainder = text[:cut], text[cut+1:]
+      text = text.strip()
+      if text:
+        blocks.append(_parseBlock(text,sep,numColumns,fast,trailing,usecols,dtype))
+      if not block:
+        break
+  if len(blocks) == 0:
+    return headers, np.zeros((0,numColumns),dtype=dtype)
+  data = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+  return headers, data
+
+def _parseBlock(text,sep,numColumns,fast,trailing,usecols,dtype):
+  """
+    Parses a block of complete lines.
+    @ In, text, bytes, the lines (without leading and trailing blanks)
+    @ In, sep, bytes, the delimiter
+    @ In, numColumns, int, the expected number of values in each line
+    @ In, fast, bool, True if all the values of a line are kept
+    @ In, trailing, bool, True if the lines end with a delimiter
+    @ In, usecols, tuple, the indices of the columns to keep, all if None
+    @ In, dtype, np.dtype, the type of the values
+    @ Out, values, np.ndarray, the values in the block, one row for each line
+  """
+  if fast and len(sep) == 1 and b'#' not in text:
+    numRows = text.count(b'\n') + 1
+    values = text
+    if trailing:
+      values = values.replace(sep+b'\n',b'\n')
+      if values.endswith(sep):
+        values = values[:-len(sep)]
+    ## every line must have the expected number of fields (the total number of values is not enough)
+    characters = np.frombuffer(values,dtype=np.uint8)
+    lineEnds = np.concatenate(([0],np.flatnonzero(characters == ord(b'\n')),[len(characters)]))
+    fields = np.diff(np.searchsorted(np.flatnonzero(characters == ord(sep)),lineEnds)) + 1
+    if np.any(fields != numColumns):
+      return np.loadtxt(io.BytesIO(text),dtype=dtype,delimiter=sep.decode(),usecols=usecols,ndmin=2)
+    with warnings.catch_warnings():
+      ## newer numpy warns about text it cannot parse; that is caught by the size check below
+      warnings.simplefilter('ignore',DeprecationWarning)
+      values = np.fromstring(values.replace(b'\n',sep),dtype=dtype,sep=sep.decode())
+    if values.size == numRows*numColumns:
+      return values.reshape(numRows,numColumns)
+  return np.loadtxt(io.BytesIO(text),dtype=dtype,delimiter=sep.decode(),usecols=usecols,ndmin=2)
@@ -0,0 +1,156 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Acceleration schemes for fixed point (Picard's) iterations x = G(x).
+  Given the current iterate x and its image g = G(x), each scheme provides the next iterate:
+    - Relaxation: x + w (g - x), with a constant relaxation factor w (w=1 is the plain Picard's iteration)
+    - Aitken:     x + w_k (g - x), with the relaxation factor w_k updated at each iteration (Aitken's delta-squared)
+    - Anderson:   combination of the last "historyDepth" iterates minimizing the linearized residue (Anderson's mixing)
+  The schemes work on flat numpy arrays and keep the history of the iteration they are used in:
+  a new instance is needed for each fixed point problem.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+class Relaxation(object):
+  """
+    Fixed point iteration with constant relaxation
+  """
+  def __init__(self, relaxation=1.0, historyDepth=None):
+    """
+      Constructor
+      @ In, relaxation, float, optional, relaxation factor
+      @ In, historyDepth, int, optional, not used (only for compatibility with the other schemes)
+      @ Out, None
+    """
+    self.relaxation = relaxation
+
+  def update(self, x, g):
+    """
+      Computes the next iterate
+      @ In, x, np.array, current iterate
+      @ In, g, np.array, image of the current iterate G(x)
+      @ Out, xNew, np.array, next iterate
+    """
+    return x + self.relaxation*(g - x)
+
+class Aitken(Relaxation):
+  """
+    Fixed point iteration with dynamic (Aitken's) relaxation:
+      w_k = -w_{k-1} r_{k-1}.(r_k - r_{k-1}) / |r_k - r_{k-1}|^2, with r = G(x) - x
+  """
+  def __init__(self, relaxation=1.0, historyDepth=None):
+    """
+      Constructor
+      @ In, relaxation, float, optional, relaxation factor of the first iteration
+      @ In, historyDepth, int, optional, not used (only for compatibility with the other schemes)
+      @ Out, None
+    """
+    Relaxation.__init__(self, relaxation)
+    self.previousResidue = None
+
+  def update(self, x, g):
+    """
+      Computes the next iterate
+      @ In, x, np.array, current iterate
+      @ In, g, np.array, image of the current iterate G(x)
+      @ Out, xNew, np.array, next iterate
+    """
+    residue = g - x
+    if self.previousResidue is not None:
+      deltaResidue = residue - self.previousResidue
+      denominator = np.dot(deltaResidue, deltaResidue)
+      # if the residue did not change, keep the previous relaxation factor
+      if denominator > 0.0:
+        self.relaxation = -self.relaxation*np.dot(self.previousResidue, deltaResidue)/denominator
+    self.previousResidue = residue
+    return x + self.relaxation*residue
+
+class Anderson(Relaxation):
+  """
+    Fixed point iteration with Anderson's mixing (type II):
+      x_{k+1} = x_k + b r_k - (dX + b dR) gamma, with gamma = argmin |r_k - dR gamma|
+    where dX and dR are the differences among the last iterates and residues (r = G(x) - x) and b is the relaxation factor.
+    The oldest iterates are discarded when dR is ill-conditioned (e.g. when the problem has less degrees of freedom than the history)
+  """
+  maxConditionNumber = 1.e8 # maximum condition number of dR
+  def __init__(self, relaxation=1.0, historyDepth=5):
+    """
+      Constructor
+      @ In, relaxation, float, optional, relaxation (mixing) factor
+      @ In, historyDepth, int, optional, maximum number of previous iterates used
+      @ Out, None
+    """
+    Relaxation.__init__(self, relaxation)
+    self.historyDepth = historyDepth
+    self.iterates     = [] # last iterates (up to historyDepth+1)
+    self.residues     = [] # last residues (up to historyDepth+1)
+
+  def update(self, x, g):
+    """
+      Computes the next iterate
+      @ In, x, np.array, current iterate
+      @ In, g, np.array, image of the current iterate G(x)
+      @ Out, xNew, np.array, next iterate
+    """
+    residue = g - x
+    self.iterates.append(np.array(x, dtype=float))
+    self.residues.append(residue)
+    if len(self.iterates) > self.historyDepth + 1:
+      self.iterates.pop(0)
+      self.residues.pop(0)
+    xNew = x + self.relaxation*residue
+    while len(self.iterates) > 1:
+      singularValues = np.linalg.svd(np.diff(np.asarray(self.residues), axis=0).T, compute_uv=False)
+      if singularValues[-1]*self.maxConditionNumber >= singularValues[0]:
+        break
+      self.iterates.pop(0)
+      self.residues.pop(0)
+    if len(self.iterates) > 1:
+      deltaIterates = np.diff(np.asarray(self.iterates), axis=0).T
+      deltaResidues = np.diff(np.asarray(self.residues), axis=0).T
+      # machine precision cutoff (the rcond=None of numpy >= 1.14, not accepted by older versions)
+      rcond = np.finfo(float).eps*max(deltaResidues.shape)
+      gamma = np.linalg.lstsq(deltaResidues, residue, rcond=rcond)[0]
+      xNew = xNew - np.dot(deltaIterates + self.relaxation*deltaResidues, gamma)
+    return xNew
+
+__methods = {'none':Relaxation, 'aitken':Aitken, 'anderson':Anderson}
+
+def knownMethods():
+  """
+    Returns the names of the available acceleration schemes
+    @ In, None
+    @ Out, knownMethods, list, the names
+  """
+  return list(__methods.keys())
+
+def returnInstance(method, relaxation=1.0, historyDepth=5):
+  """
+    Returns a new instance of an acceleration scheme
+    @ In, method, str, name of the scheme ('none', 'aitken' or 'anderson')
+    @ In, relaxation, float, optional, relaxation factor
+    @ In, historyDepth, int, optional, maximum number of previous iterates used (Anderson only)
+    @ Out, instance, Relaxation, the scheme
+  """
+  if method not in __methods:
+    raise KeyError('Unknown fixed point acceleration method "'+str(method)+'". Available are: '+', '.join(knownMethods()))
+  return __methods[method](relaxation, historyDepth)
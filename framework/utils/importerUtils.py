@@ -0,0 +1,140 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Utilities to delay the import of modules until they are actually used.
+  RAVEN knows many entities (samplers, ROMs, post-processors, ...) but a single input only uses a few
+  of them: the factories register the entity types by name and import the implementation (and its,
+  sometimes heavy, third-party libraries) the first time the type is requested.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import sys
+import types
+import importlib
+import six
+#External Modules End--------------------------------------------------------------------------------
+
+class _LazyModule(types.ModuleType):
+  """
+    Placeholder of a module that is imported the first time one of its attributes is requested.
+  """
+  def __init__(self,moduleString):
+    """
+      Constructor.
+      @ In, moduleString, str, full name of the module (e.g. "statsmodels.api")
+      @ Out, None
+    """
+    types.ModuleType.__init__(self,str(moduleString))
+    self.__dict__['_lazyModuleString'] = moduleString
+
+  def __getattr__(self,attr):
+    """
+      Imports the module (only called for the attributes not yet in this placeholder).
+      @ In, attr, str, attribute requested
+      @ Out, value, object, attribute of the imported module
+    """
+    if attr.startswith('__') and attr.endswith('__'):
+      # special attributes are probed by the interpreter itself (e.g. "__set_name__" when the placeholder
+      #   is a class attribute): they must not trigger the import
+      raise AttributeError(attr)
+    module = importlib.import_module(self.__dict__['_lazyModuleString'])
+    # after the first access, the placeholder behaves as the module itself
+    self.__dict__.update(module.__dict__)
+    return getattr(module,attr)
+
+def importModuleLazy(moduleString):
+  """
+    Returns a module that is only imported when one of its attributes is used.
+    Meant for the heavy libraries needed by a few methods only: "import statsmodels.api as sm"
+    becomes "sm = importerUtils.importModuleLazy('statsmodels.api')".
+    @ In, moduleString, str, full name of the module
+    @ Out, module, module or _LazyModule, the module if already imported, a placeholder otherwise
+  """
+  if moduleString in sys.modules:
+    return sys.modules[moduleString]
+  return _LazyModule(moduleString)
+
+def importClass(classString):
+  """
+    Imports a class (or any module attribute) from its full path.
+    @ In, classString, str, full path of the class (e.g. "Samplers.MonteCarlo.MonteCarlo")
+    @ Out, classObj, class, the class
+  """
+  moduleString,className = classString.rsplit('.',1)
+  return getattr(importlib.import_module(moduleString),className)
+
+class LazyClassDict(dict):
+  """
+    Dictionary of the classes available to a factory, registered by the full path of the class and
+    imported the first time they are retrieved (through the [] operator).
+    A tuple of paths can be registered instead of a single path: the first one that can be imported is used
+    (e.g. a version of the class relying on an optional library, then the plain one).
+  """
+  def __getitem__(self,key):
+    """
+      Retrieves (importing it if needed) the class registered under key.
+      @ In, key, str, registered name
+      @ Out, classObj, class, the class
+    """
+    value = dict.__getitem__(self,key)
+    if isinstance(value,six.string_types) or isinstance(value,tuple):
+      value = self._importFirst(value)
+      dict.__setitem__(self,key,value)
+    return value
+
+  def values(self):
+    """
+      Retrieves all the classes (importing them).
+      @ In, None
+      @ Out, values, list, the classes
+    """
+    return list(self[key] for key in self.keys())
+
+  def items(self):
+    """
+      Retrieves all the (name, class) pairs (importing the classes).
+      @ In, None
+      @ Out, items, list, the (name, class) pairs
+    """
+    return list((key,self[key]) for key in self.keys())
+
+  def isLoaded(self,key):
+    """
+      Checks if the class registered under key has already been imported.
+      @ In, key, str, registered name
+      @ Out, isLoaded, bool, True if imported
+    """
+    value = dict.__getitem__(self,key)
+    return not (isinstance(value,six.string_types) or isinstance(value,tuple))
+
+  @staticmethod
+  def _importFirst(paths):
+    """
+      Imports the first class that can be imported among paths.
+      @ In, paths, str or tuple(str), full path(s) of the class
+      @ Out, classObj, class, the class
+    """
+    if isinstance(paths,six.string_types):
+      return importClass(paths)
+    for path in paths[:-1]:
+      try:
+        return importClass(path)
+      except (ImportError,AttributeError):
+        continue
+    return importClass(paths[-1])
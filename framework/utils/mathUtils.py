@@ -685,3 +685,74 @@ def evalFourier(period,C,p,t):
   fourier = C * np.sin(2. * np.pi * t / period + p)
   return fourier
 
+
+def gridSignChange(values):
+  """
+    Finds the nodes of a grid that have a positive value and a non-positive neighbor, that is the nodes
+    on the positive side of the surface where the values change sign. Along each axis the following node
+    is checked and, for the nodes that have a following node, the preceding node as well.
+    @ In, values, np.ndarray, the values on the grid nodes (one dimension for each axis of the grid)
+    @ Out, onSurface, np.ndarray, boolean mask of the nodes on the surface (same shape as values)
+  """
+  values = np.asarray(values)
+  crossed = values <= 0
+  onSurface = np.zeros(values.shape,dtype=bool)
+  for axis in range(values.ndim):
+    nodes, neighbors = [slice(None)]*values.ndim, [slice(None)]*values.ndim
+    # following node
+    nodes[axis], neighbors[axis] = slice(None,-1), slice(1,None)
+    onSurface[tuple(nodes)] |= crossed[tuple(neighbors)]
+    # preceding node
+    nodes[axis], neighbors[axis] = slice(1,-1), slice(None,-2)
+    onSurface[tuple(nodes)] |= crossed[tuple(neighbors)]
+  onSurface &= values > 0
+  return onSurface
+
+def gridBand(nodes, thickness):
+  """
+    Thickens a set of grid nodes into a band: the set is grown by one node along each axis, thickness-1 times.
+    The band never reaches the nodes on the boundary of the grid.
+    @ In, nodes, np.ndarray, boolean mask of the nodes to thicken (one dimension for each axis of the grid)
+    @ In, thickness, int, the thickness of the band (1 for no band)
+    @ Out, band, np.ndarray, boolean mask of the nodes in the band, excluding the original nodes
+  """
+  nodes = np.asarray(nodes,dtype=bool)
+  band = np.zeros(nodes.shape,dtype=bool)
+  front = nodes
+  for _ in range(1,thickness):
+    grown = np.zeros(nodes.shape,dtype=bool)
+    for axis in range(nodes.ndim):
+      inner, before, after = [slice(None)]*nodes.ndim, [slice(None)]*nodes.ndim, [slice(None)]*nodes.ndim
+      inner[axis], before[axis], after[axis] = slice(1,-1), slice(None,-2), slice(2,None)
+      grown[tuple(inner)] |= front[tuple(before)] | front[tuple(after)]
+    band |= grown
+    front = grown
+  band &= ~nodes
+  return band
+
+def updateNearestSamples(nodeTree, nodes, samples, start, distance, nearest):
+  """
+    Updates the closest sample of each node after new samples have been added. A node only gets closer
+    to a new sample if it is within its current distance from the closest sample, so only the nodes
+    within the largest of these distances from each new sample are checked (through a KD-tree of the nodes).
+    On ties, the previous closest sample is kept.
+    @ In, nodeTree, scipy.spatial.cKDTree, KD-tree of the nodes
+    @ In, nodes, np.ndarray, coordinates of the nodes, shaped (#nodes, #variables)
+    @ In, samples, np.ndarray, coordinates of all the samples, shaped (#samples, #variables)
+    @ In, start, int, index in samples of the first new sample
+    @ In, distance, np.ndarray, distance of each node from its closest sample among the previous ones, updated in place
+    @ In, nearest, np.ndarray, index of the closest sample of each node, updated in place
+    @ Out, changed, np.ndarray, indices of the nodes whose closest sample changed
+  """
+  radius = np.max(distance) if len(distance) > 0 else 0.0
+  changed = []
+  for index in range(start,len(samples)):
+    candidates = np.asarray(nodeTree.query_ball_point(samples[index],radius),dtype=int)
+    if len(candidates) == 0:
+      continue
+    candidateDistance = np.sqrt(np.sum((nodes[candidates]-samples[index])**2,axis=1))
+    closer = candidateDistance < distance[candidates]
+    distance[candidates[closer]] = candidateDistance[closer]
+    nearest[candidates[closer]] = index
+    changed.append(candidates[closer])
+  return np.unique(np.concatenate(changed)) if len(changed) > 0 else np.zeros(0,dtype=int)
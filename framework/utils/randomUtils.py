@@ -271,8 +271,113 @@ def newRNG(env=None):
     engine = np.random.RandomState()
   return engine
 
+### quasi-random (low discrepancy) sequences ###
+
+# direction numbers of the Sobol sequence, from the second dimension on (S. Joe and F. Y. Kuo, "Constructing Sobol
+# sequences with better two-dimensional projections", SIAM J. Sci. Comput. 30, 2008): degree of the primitive
+# polynomial, its inner coefficients (as the bits of an integer) and the initial direction numbers
+_sobolDirections = [(1, 0,[1]),
+                    (2, 1,[1,3]),
+                    (3, 1,[1,3,1]),
+                    (3, 2,[1,1,1]),
+                    (4, 1,[1,1,3,3]),
+                    (4, 4,[1,3,5,13]),
+                    (5, 2,[1,1,5,5,17]),
+                    (5, 4,[1,1,5,5,5]),
+                    (5, 7,[1,1,7,11,19]),
+                    (5,11,[1,1,5,1,1]),
+                    (5,13,[1,1,1,3,11]),
+                    (5,14,[1,3,5,5,31]),
+                    (6, 1,[1,3,3,9,7,49]),
+                    (6,13,[1,1,1,15,21,21]),
+                    (6,16,[1,3,1,13,27,49]),
+                    (6,19,[1,1,1,15,7,5]),
+                    (6,22,[1,3,1,15,13,25]),
+                    (6,25,[1,1,5,5,19,61]),
+                    (7, 1,[1,3,7,11,23,15,103]),
+                    (7, 4,[1,3,7,13,13,15,69])]
+# number of bits of the Sobol points (the sequence is limited to 2**_sobolBits points)
+_sobolBits = 30
+sobolMaxDimension = len(_sobolDirections) + 1
+
+def haltonSequence(dim,samples,start=0):
+  """
+    Returns points of the Halton low discrepancy sequence in the unit hypercube (the coordinate d of the point
+    of index n is the radical inverse of n in the base of the d-th prime number)
+    @ In, dim, int, the dimensionality of the points
+    @ In, samples, int, the number of points
+    @ In, start, int, optional, the index of the first point (the point of index 0 is the origin)
+    @ Out, pts, np.array, the points, shaped (samples, dim)
+  """
+  indices = np.arange(start,start+samples,dtype=np.int64)
+  pts = np.zeros((samples,dim))
+  for d, base in enumerate(_firstPrimes(dim)):
+    remainder = indices.copy()
+    factor = 1.0/base
+    while np.any(remainder > 0):
+      pts[:,d] += (remainder % base)*factor
+      remainder //= base
+      factor /= base
+  return pts
+
+def sobolSequence(dim,samples,start=0):
+  """
+    Returns points of the Sobol low discrepancy sequence in the unit hypercube (gray code ordering)
+    @ In, dim, int, the dimensionality of the points (at most sobolMaxDimension)
+    @ In, samples, int, the number of points
+    @ In, start, int, optional, the index of the first point (the point of index 0 is the origin)
+    @ Out, pts, np.array, the points, shaped (samples, dim)
+  """
+  if dim > sobolMaxDimension:
+    raise IOError('The Sobol sequence is available up to dimension {}, requested {}!'.format(sobolMaxDimension,dim))
+  if start+samples > 2**_sobolBits:
+    raise IOError('The Sobol sequence is limited to {} points!'.format(2**_sobolBits))
+  directions = _sobolDirectionNumbers(dim)
+  indices = np.arange(start,start+samples,dtype=np.int64)
+  gray = indices ^ (indices >> 1)
+  pts = np.zeros((samples,dim),dtype=np.int64)
+  for bit in range(_sobolBits):
+    mask = ((gray >> bit) & 1).astype(bool)
+    pts[mask] ^= directions[:,bit]
+  return pts/float(2**_sobolBits)
+
 ### internal utilities ###
 
+def _firstPrimes(number):
+  """
+    Returns the first prime numbers
+    @ In, number, int, how many prime numbers
+    @ Out, primes, list, the prime numbers
+  """
+  primes = []
+  candidate = 2
+  while len(primes) < number:
+    if all(candidate % prime for prime in primes if prime*prime <= candidate):
+      primes.append(candidate)
+    candidate += 1
+  return primes
+
+def _sobolDirectionNumbers(dim):
+  """
+    Computes the direction numbers of the Sobol sequence, scaled to _sobolBits bits
+    @ In, dim, int, the dimensionality
+    @ Out, directions, np.array, the direction numbers, shaped (dim, _sobolBits)
+  """
+  directions = np.zeros((dim,_sobolBits),dtype=np.int64)
+  # first dimension: van der Corput sequence in base 2
+  directions[0] = [1 << (_sobolBits-1-bit) for bit in range(_sobolBits)]
+  for d in range(1,dim):
+    degree, coefficients, initial = _sobolDirections[d-1]
+    numbers = [initial[bit] << (_sobolBits-1-bit) for bit in range(min(degree,_sobolBits))]
+    for bit in range(degree,_sobolBits):
+      number = numbers[bit-degree] ^ (numbers[bit-degree] >> degree)
+      for k in range(1,degree):
+        if (coefficients >> (degree-1-k)) & 1:
+          number ^= numbers[bit-k]
+      numbers.append(number)
+    directions[d] = numbers
+  return directions
+
 def _reduceRedundantListing(data,dim,samples):
   """
     Adjusts data to be intuitive for developers.
@@ -0,0 +1,200 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Index structures for finding realizations in a DataObject by value.
+  Numeric keys are kept in scaled KD-trees, non-numeric keys are hashed.  The index
+  grows as realizations are added, so lookups during sampling do not rescan the whole object.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy.spatial import cKDTree
+#External Modules End--------------------------------------------------------------------------------
+
+class SpatialBucket(object):
+  """
+    Holds the numeric coordinates of a set of rows for neighborhood searching.
+    Rows are kept in KD-trees whose sizes follow a binary counter (each tree is smaller than the
+    previous one), so adding rows only rebuilds small trees and a search visits O(log(N)) trees.
+    The newest rows, too few to be worth a tree, are searched directly.
+  """
+  def __init__(self,dim,leafSize=32):
+    """
+      Constructor.
+      @ In, dim, int, number of coordinates for each row
+      @ In, leafSize, int, optional, number of rows to accumulate before building a tree
+      @ Out, None
+    """
+    self.dim = dim
+    self.leafSize = leafSize
+    self.blocks = []                                 # list of (points, rows, tree), largest first
+    self.tailPoints = np.zeros((leafSize,dim))       # newest points not yet in a tree
+    self.tailRows = np.zeros(leafSize,dtype=int)     # rows of the newest points
+    self.tailSize = 0                                # number of entries used in the tail
+    self.special = []                                # rows with non-finite coordinates, always candidates
+
+  def add(self,points,rows):
+    """
+      Adds rows to the bucket.
+      @ In, points, np.ndarray, (n,dim) scaled coordinates of the rows
+      @ In, rows, np.ndarray, (n) row indices
+      @ Out, None
+    """
+    finite = np.all(np.isfinite(points),axis=1)
+    if not finite.all():
+      self.special.extend(rows[np.logical_not(finite)].tolist())
+      points = points[finite]
+      rows = rows[finite]
+    # large additions go directly into a tree
+    if len(rows) >= self.leafSize:
+      self._pushBlock(points,rows)
+      return
+    for point,row in zip(points,rows):
+      self.tailPoints[self.tailSize] = point
+      self.tailRows[self.tailSize] = row
+      self.tailSize += 1
+      if self.tailSize == self.leafSize:
+        self._pushBlock(self.tailPoints.copy(),self.tailRows.copy())
+        self.tailSize = 0
+
+  def query(self,point,radius):
+    """
+      Finds the rows within "radius" of "point" in every coordinate (Chebyshev distance).
+      @ In, point, np.ndarray, (dim) scaled coordinates to search around
+      @ In, radius, float, search radius in scaled coordinates
+      @ Out, found, list(np.ndarray), row indices found, unsorted
+    """
+    found = [np.asarray(self.special,dtype=int)]
+    for _,rows,tree in self.blocks:
+      near = tree.query_ball_point(point,radius,p=np.inf)
+      if len(near):
+        found.append(rows[near])
+    if self.tailSize:
+      dist = np.max(np.abs(self.tailPoints[:self.tailSize]-point),axis=1)
+      found.append(self.tailRows[:self.tailSize][dist <= radius])
+    return found
+
+  def _pushBlock(self,points,rows):
+    """
+      Adds a new tree, merging trees of equal or smaller size so the sizes keep decreasing.
+      @ In, points, np.ndarray, (n,dim) scaled coordinates of the rows
+      @ In, rows, np.ndarray, (n) row indices
+      @ Out, None
+    """
+    while self.blocks and len(self.blocks[-1][1]) <= len(rows):
+      oldPoints,oldRows,_ = self.blocks.pop()
+      points = np.concatenate((oldPoints,points))
+      rows = np.concatenate((oldRows,rows))
+    self.blocks.append((points,rows,cKDTree(points)))
+
+class RealizationIndex(object):
+  """
+    Index over the rows of a DataObject for a fixed set of matching keys.
+    Rows are grouped by the values of their exact keys (hashed); within each group the numeric keys
+    are stored in a SpatialBucket after scaling as (value-loc)/scale.  The index only proposes
+    candidates: the caller applies its own matching criterion to them.
+  """
+  def __init__(self,floatKeys,exactKeys,loc,scale,leafSize=32):
+    """
+      Constructor.
+      @ In, floatKeys, list(str), names of keys matched numerically
+      @ In, exactKeys, list(str), names of keys matched exactly
+      @ In, loc, np.ndarray, offset for scaling each float key
+      @ In, scale, np.ndarray, scale for each float key (must be positive)
+      @ In, leafSize, int, optional, number of rows to accumulate before building a tree
+      @ Out, None
+    """
+    self.floatKeys = list(floatKeys)
+    self.exactKeys = list(exactKeys)
+    self.loc = np.asarray(loc,dtype=float)
+    self.scale = np.asarray(scale,dtype=float)
+    self.leafSize = leafSize
+    self.size = 0                                          # number of rows indexed
+    self._values = np.zeros((leafSize,len(self.floatKeys))) # unscaled float key values, by row
+    self._groups = {}                                      # {exact key values: SpatialBucket or list of rows}
+
+  def add(self,floatValues,exactValues):
+    """
+      Adds the next rows to the index.
+      @ In, floatValues, np.ndarray, (n,len(floatKeys)) values of the float keys
+      @ In, exactValues, list(tuple), n tuples with the values of the exact keys (empty tuples if none)
+      @ Out, None
+    """
+    num = len(exactValues)
+    if num == 0:
+      return
+    floatValues = np.asarray(floatValues,dtype=float).reshape(num,len(self.floatKeys))
+    # store raw values for checking candidates
+    if self.size + num > len(self._values):
+      new = np.zeros((max(2*len(self._values),self.size+num),len(self.floatKeys)))
+      new[:self.size] = self._values[:self.size]
+      self._values = new
+    self._values[self.size:self.size+num] = floatValues
+    rows = np.arange(self.size,self.size+num)
+    self.size += num
+    # group rows by exact values
+    if self.exactKeys:
+      byKey = {}
+      for r,key in enumerate(exactValues):
+        byKey.setdefault(key,[]).append(r)
+      groups = list((key,np.asarray(members,dtype=int)) for key,members in byKey.items())
+    else:
+      groups = [((),slice(None))]
+    points = (floatValues - self.loc)/self.scale
+    for key,members in groups:
+      if self.floatKeys:
+        bucket = self._groups.get(key)
+        if bucket is None:
+          bucket = SpatialBucket(len(self.floatKeys),self.leafSize)
+          self._groups[key] = bucket
+        bucket.add(points[members],rows[members])
+      else:
+        self._groups.setdefault(key,[]).extend(rows[members].tolist())
+
+  def candidates(self,floatPoint,exactKey,radius):
+    """
+      Finds rows that might match the requested values.
+      @ In, floatPoint, np.ndarray, unscaled values of the float keys
+      @ In, exactKey, tuple, values of the exact keys
+      @ In, radius, np.ndarray, largest unscaled distance to search along each float key
+      @ Out, rows, np.ndarray, sorted row indices of the candidates
+    """
+    try:
+      group = self._groups.get(exactKey)
+    except TypeError:
+      # unhashable request can't match any hashed value
+      return np.zeros(0,dtype=int)
+    if group is None:
+      return np.zeros(0,dtype=int)
+    if not self.floatKeys:
+      # rows are added in order, so they are already sorted
+      return np.asarray(group,dtype=int)
+    point = (np.asarray(floatPoint,dtype=float) - self.loc)/self.scale
+    # pad the radius so round-off in the scaling never loses a neighbor; candidates are checked anyway
+    searchRadius = np.max(np.asarray(radius,dtype=float)/self.scale)*(1.0+1e-8) + 1e-10*(1.0+np.max(np.abs(point)))
+    found = group.query(point,searchRadius)
+    return np.sort(np.concatenate(found))
+
+  def getValues(self,rows):
+    """
+      Obtains the unscaled float key values stored for some rows.
+      @ In, rows, int or np.ndarray, row indices
+      @ Out, values, np.ndarray, values of the float keys, in floatKeys order
+    """
+    return self._values[rows]
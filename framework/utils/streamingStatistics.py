@@ -0,0 +1,499 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  One-pass, weighted and mergeable statistics accumulators.
+  The realizations can be fed in any number of batches (as they arrive, or chunk by chunk for data
+  that do not fit in memory), and the accumulators filled by different workers can be merged.
+  The statistics follow the same definitions (and bias corrections) as the BasicStatistics PostProcessor:
+    - WeightedMoments: expected value, variance, sigma, skewness, kurtosis, minimum, maximum;
+    - WeightedCovariance: covariance (and Pearson correlation) matrix;
+    - QuantileSketch: percentiles, exact until the number of realizations exceeds a few times
+      the compression, with a bounded rank error afterwards.
+  Reference for the merging of the central moments:
+  Philippe Pebay, "Formulas for robust, one-pass parallel computation of covariances and
+  arbitrary-order statistical moments", SAND2008-6212, 2008.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import copy
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+def unbiasedCorrection(order,V1,V2=None,V3=None,V4=None):
+  """
+    Computes the unbiased correction factor of the central moments.
+    Reference paper:
+    Lorenzo Rimoldini, "Weighted skewness and kurtosis unbiased by sample size", http://arxiv.org/pdf/1304.6564.pdf
+    @ In, order, int, moment order (2, 3 or 4)
+    @ In, V1, float or int, the sum of the weights, or the number of samples for unweighted statistics
+    @ In, V2, float, optional, the sum of the squared weights (None for unweighted statistics)
+    @ In, V3, float, optional, the sum of the cubed weights (weighted statistics, order >= 3)
+    @ In, V4, float, optional, the sum of the 4th power of the weights (weighted statistics, order 4)
+    @ Out, corrFactor, float (order <=3) or tuple of floats (order == 4), the unbiased correction factor
+  """
+  if order not in (2,3,4):
+    raise RuntimeError('unbiasedCorrection is implemented for 2 <= order <= 4 only!')
+  if V2 is not None:
+    if order == 2:
+      v1Square = V1**2.0
+      corrFactor = v1Square/(v1Square-V2)
+    elif order == 3:
+      v1Cubic = V1**3.0
+      corrFactor = v1Cubic/(v1Cubic-3.0*V2*V1+2.0*V3)
+    else:
+      v1Square = V1**2.0
+      numer1 = v1Square*(v1Square**2.0-3.0*v1Square*V2+2.0*V1*V3+3.0*V2**2.0-3.0*V4)
+      numer2 = 3.0*v1Square*(2.0*v1Square*V2-2.0*V1*V3-3.0*V2**2.0+3.0*V4)
+      denom = (v1Square-V2)*(v1Square**2.0-6.0*v1Square*V2+8.0*V1*V3+3.0*V2**2.0-6.0*V4)
+      corrFactor = numer1/denom, numer2/denom
+  else:
+    n = float(V1)
+    if order == 2:
+      corrFactor = n/(n-1.0)
+    elif order == 3:
+      corrFactor = (n**2.0)/((n-1)*(n-2))
+    else:
+      corrFactor = (n*(n**2.0-2.0*n+3.0))/((n-1)*(n-2)*(n-3)),(3.0*n*(2.0*n-3.0))/((n-1)*(n-2)*(n-3))
+  return corrFactor
+
+class _WeightSums(object):
+  """
+    The sums of the powers of the weights of the realizations seen so far, shared by the accumulators
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.count = 0                ## number of realizations
+    self.weighted = False         ## True once a weighted batch was seen
+    self.weightSums = np.zeros(4) ## sums of the weights to the power 1, 2, 3 and 4
+
+  def _batchWeights(self,numSamples,weights):
+    """
+      Checks the weights of a batch of realizations.
+      @ In, numSamples, int, the number of realizations in the batch
+      @ In, weights, np.array or None, the weights (None for unit weights)
+      @ Out, weights, np.array, the weights
+      @ Out, weighted, bool, True if weights were given
+    """
+    if weights is None:
+      return np.ones(numSamples), False
+    weights = np.asarray(weights,dtype=float).ravel()
+    if len(weights) != numSamples:
+      raise IOError('Got {} weights for {} realizations!'.format(len(weights),numSamples))
+    return weights, True
+
+  def _setWeights(self,weights,weighted):
+    """
+      Sets the sums of the weights of a single batch.
+      @ In, weights, np.array, the weights
+      @ In, weighted, bool, True if weights were given
+      @ Out, None
+    """
+    self.count = len(weights)
+    self.weighted = weighted
+    self.weightSums = np.array([np.sum(weights**p) for p in range(1,5)])
+
+  def _mergeWeights(self,other):
+    """
+      Adds the sums of the weights of another accumulator.
+      @ In, other, _WeightSums, the other accumulator
+      @ Out, None
+    """
+    self.count += other.count
+    self.weighted = self.weighted or other.weighted
+    self.weightSums = self.weightSums + other.weightSums
+
+  def _correction(self,order):
+    """
+      Unbiased correction factor of the central moments of the realizations seen so far.
+      @ In, order, int, moment order (2, 3 or 4)
+      @ Out, corrFactor, float or tuple, the correction factor (see unbiasedCorrection)
+    """
+    if self.weighted:
+      return unbiasedCorrection(order,*self.weightSums)
+    return unbiasedCorrection(order,self.count)
+
+  def equivalentSamples(self):
+    """
+      Equivalent sample size of the realizations seen so far, (sum w)^2/sum(w^2).
+      @ In, None
+      @ Out, equivalentSamples, float, the equivalent sample size
+    """
+    return self.weightSums[0]**2/self.weightSums[1]
+
+class WeightedMoments(_WeightSums):
+  """
+    Accumulates the first four central moments, the minimum and the maximum of weighted realizations.
+    The values of a realization can be a scalar or an array (e.g. several variables, or a time history),
+    the statistics are computed for each entry.
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    _WeightSums.__init__(self)
+    self.mean = None    ## weighted mean
+    self.m2 = None      ## sums of w*(x-mean)^k, for k = 2, 3, 4
+    self.m3 = None
+    self.m4 = None
+    self.minimum = None
+    self.maximum = None
+
+  def update(self,values,weights=None):
+    """
+      Adds a batch of realizations.
+      @ In, values, np.array, the values, shaped (number of realizations, ...)
+      @ In, weights, np.array, optional, the weights of the realizations (unit weights if None)
+      @ Out, None
+    """
+    values = np.asarray(values,dtype=float)
+    if values.shape[0] == 0:
+      return
+    weights, weighted = self._batchWeights(values.shape[0],weights)
+    batch = WeightedMoments()
+    batch._setWeights(weights,weighted)
+    w = weights.reshape((len(weights),)+(1,)*(values.ndim-1))
+    batch.minimum = values.min(axis=0)
+    batch.maximum = values.max(axis=0)
+    ## two passes within the batch, then the batch is merged
+    ## the mean of a constant entry is its value, so that its central moments are exactly zero (as for the full data)
+    batch.mean = np.where(batch.minimum == batch.maximum,batch.minimum,(values*w).sum(axis=0)/batch.weightSums[0])
+    deviation = values - batch.mean
+    wDeviation2 = w*deviation**2
+    batch.m2 = wDeviation2.sum(axis=0)
+    batch.m3 = (wDeviation2*deviation).sum(axis=0)
+    batch.m4 = (wDeviation2*deviation**2).sum(axis=0)
+    self.merge(batch)
+
+  def merge(self,other):
+    """
+      Adds the realizations accumulated by another WeightedMoments (e.g. filled by another worker).
+      @ In, other, WeightedMoments, the other accumulator (unchanged)
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.__dict__.update(copy.deepcopy(other.__dict__))
+      return
+    wa = self.weightSums[0]
+    wb = other.weightSums[0]
+    w = wa + wb
+    delta = other.mean - self.mean
+    deltaW = delta/w
+    m2 = self.m2 + other.m2 + delta*deltaW*wa*wb
+    m3 = self.m3 + other.m3 + delta*deltaW**2*wa*wb*(wa-wb) + 3.0*deltaW*(wa*other.m2-wb*self.m2)
+    m4 = self.m4 + other.m4 + delta*deltaW**3*wa*wb*(wa**2-wa*wb+wb**2) \
+         + 6.0*deltaW**2*(wa**2*other.m2+wb**2*self.m2) + 4.0*deltaW*(wa*other.m3-wb*self.m3)
+    self.mean = self.mean + deltaW*wb
+    self.m2, self.m3, self.m4 = m2, m3, m4
+    self.minimum = np.minimum(self.minimum,other.minimum)
+    self.maximum = np.maximum(self.maximum,other.maximum)
+    self._mergeWeights(other)
+
+  def expectedValue(self):
+    """
+      Expected value.
+      @ In, None
+      @ Out, expectedValue, float or np.array, the (weighted) mean
+    """
+    return self.mean
+
+  def variance(self,biased=False):
+    """
+      Variance.
+      @ In, biased, bool, optional, True for the biased (population) variance
+      @ Out, variance, float or np.array, the variance
+    """
+    variance = self.m2/self.weightSums[0]
+    if not biased:
+      variance = variance*self._correction(2)
+    return variance
+
+  def sigma(self,biased=False):
+    """
+      Standard deviation.
+      @ In, biased, bool, optional, True for the biased (population) standard deviation
+      @ Out, sigma, float or np.array, the standard deviation
+    """
+    return np.sqrt(self.variance(biased))
+
+  def skewness(self,biased=False):
+    """
+      Skewness.
+      @ In, biased, bool, optional, True for the biased skewness
+      @ Out, skewness, float or np.array, the skewness
+    """
+    corr = 1.0 if biased else self._correction(3)
+    return self.m3/self.weightSums[0]*corr/self.variance(biased)**1.5
+
+  def kurtosis(self,biased=False):
+    """
+      Kurtosis (Fisher's definition, i.e. excess kurtosis).
+      @ In, biased, bool, optional, True for the biased kurtosis
+      @ Out, kurtosis, float or np.array, the kurtosis
+    """
+    v1 = self.weightSums[0]
+    if biased:
+      return -3.0 + self.m4/v1/self.variance(True)**2
+    corr = self._correction(4)
+    return -3.0 + (self.m4/v1*corr[0] - (self.m2/v1)**2*corr[1])/self.variance()**2
+
+class WeightedCovariance(_WeightSums):
+  """
+    Accumulates the co-moments of several variables of weighted realizations.
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    _WeightSums.__init__(self)
+    self.mean = None      ## weighted means of the variables
+    self.comoment = None  ## sum of w*(x-mean)(x-mean)^T
+
+  def update(self,values,weights=None):
+    """
+      Adds a batch of realizations.
+      @ In, values, np.array, the values, shaped (number of realizations, number of variables)
+      @ In, weights, np.array, optional, the weights of the realizations (unit weights if None)
+      @ Out, None
+    """
+    values = np.asarray(values,dtype=float)
+    if values.ndim == 1:
+      values = values.reshape(-1,1)
+    if values.shape[0] == 0:
+      return
+    weights, weighted = self._batchWeights(values.shape[0],weights)
+    batch = WeightedCovariance()
+    batch._setWeights(weights,weighted)
+    ## the mean of a constant variable is its value, so that its co-moments are exactly zero (as for the full data)
+    minimum = values.min(axis=0)
+    batch.mean = np.where(minimum == values.max(axis=0),minimum,np.dot(weights,values)/batch.weightSums[0])
+    deviation = values - batch.mean
+    batch.comoment = np.dot(deviation.T*weights,deviation)
+    self.merge(batch)
+
+  def merge(self,other):
+    """
+      Adds the realizations accumulated by another WeightedCovariance (e.g. filled by another worker).
+      @ In, other, WeightedCovariance, the other accumulator (unchanged)
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.__dict__.update(copy.deepcopy(other.__dict__))
+      return
+    wa = self.weightSums[0]
+    wb = other.weightSums[0]
+    w = wa + wb
+    delta = other.mean - self.mean
+    self.comoment = self.comoment + other.comoment + np.outer(delta,delta)*(wa*wb/w)
+    self.mean = self.mean + delta*(wb/w)
+    self._mergeWeights(other)
+
+  def expectedValue(self):
+    """
+      Expected values of the variables.
+      @ In, None
+      @ Out, expectedValue, np.array, the (weighted) means
+    """
+    return self.mean
+
+  def covariance(self,biased=False,means=None):
+    """
+      Covariance matrix.
+      @ In, biased, bool, optional, True for the biased (population) covariance
+      @ In, means, np.array, optional, the values the deviations are taken from (the accumulated means if None),
+        e.g. means computed with other weights
+      @ Out, covariance, np.array, the covariance matrix
+    """
+    comoment = self.comoment
+    if means is not None:
+      shift = self.mean - np.asarray(means,dtype=float)
+      comoment = comoment + np.outer(shift,shift)*self.weightSums[0]
+    covariance = comoment/self.weightSums[0]
+    if not biased:
+      covariance = covariance*self._correction(2)
+    return covariance
+
+  def pearson(self):
+    """
+      Pearson correlation matrix.
+      @ In, None
+      @ Out, pearson, np.array, the correlation matrix
+    """
+    sigma = np.sqrt(np.diag(self.comoment))
+    return self.comoment/np.outer(sigma,sigma)
+
+class QuantileSketch(object):
+  """
+    Weighted quantile sketch of a scalar variable: a sorted list of weighted centroids.
+    Until the number of realizations exceeds "bufferFactor" times the compression the centroids are the
+    realizations and the quantiles are exact (same as the BasicStatistics percentiles). Afterwards,
+    neighboring centroids are merged as long as their total weight does not exceed 1/compression of the
+    total weight, so the rank of a returned value is within totalWeight/compression of the requested one,
+    and the memory is bounded by (bufferFactor+2) times the compression.
+  """
+  def __init__(self,compression=1000,bufferFactor=5):
+    """
+      Constructor
+      @ In, compression, int, optional, the number of centroids kept by a compression (inverse of the rank error)
+      @ In, bufferFactor, int, optional, the sketch is compressed when it has bufferFactor*compression centroids
+      @ Out, None
+    """
+    self.compression = compression
+    self.bufferFactor = bufferFactor
+    self.values = np.zeros(0)   ## centroid values
+    self.weights = np.zeros(0)  ## centroid weights
+    self.totalWeight = 0.0
+    self.weighted = False       ## True once a weighted batch was seen
+    self.exact = True           ## False once centroids were merged
+    self.__sorted = True
+
+  def update(self,values,weights=None):
+    """
+      Adds a batch of realizations.
+      @ In, values, np.array, the values (1D)
+      @ In, weights, np.array, optional, the weights of the realizations (unit weights if None)
+      @ Out, None
+    """
+    values = np.asarray(values,dtype=float).ravel()
+    if weights is None:
+      weights = np.ones(len(values))
+    else:
+      weights = np.asarray(weights,dtype=float).ravel()
+      if len(weights) != len(values):
+        raise IOError('Got {} weights for {} realizations!'.format(len(weights),len(values)))
+      self.weighted = True
+    self.__add(values,weights)
+
+  def merge(self,other):
+    """
+      Adds the realizations accumulated by another QuantileSketch (e.g. filled by another worker).
+      @ In, other, QuantileSketch, the other sketch (unchanged)
+      @ Out, None
+    """
+    self.weighted = self.weighted or other.weighted
+    self.exact = self.exact and other.exact
+    self.__add(other.values,other.weights)
+
+  def __add(self,values,weights):
+    """
+      Adds centroids, compressing the sketch if it is too large.
+      @ In, values, np.array, the centroid values
+      @ In, weights, np.array, the centroid weights
+      @ Out, None
+    """
+    if len(values) == 0:
+      return
+    self.values = np.concatenate((self.values,values))
+    self.weights = np.concatenate((self.weights,weights))
+    self.totalWeight += weights.sum()
+    self.__sorted = False
+    if len(self.values) > self.bufferFactor*self.compression:
+      self.__compress()
+
+  def __sort(self):
+    """
+      Sorts the centroids by value.
+      @ In, None
+      @ Out, None
+    """
+    if not self.__sorted:
+      order = np.argsort(self.values)
+      self.values = self.values[order]
+      self.weights = self.weights[order]
+      self.__sorted = True
+
+  def __compress(self):
+    """
+      Merges neighboring centroids whose total weight does not exceed totalWeight/compression.
+      @ In, None
+      @ Out, None
+    """
+    self.__sort()
+    limit = self.totalWeight/self.compression
+    ## greedy: a new group starts where adding the next centroid would exceed the limit
+    starts = [0]
+    groupWeight = 0.0
+    for i,weight in enumerate(self.weights.tolist()):
+      if groupWeight + weight > limit and groupWeight > 0.0:
+        starts.append(i)
+        groupWeight = 0.0
+      groupWeight += weight
+    if len(starts) == len(self.values):
+      return
+    weights = np.add.reduceat(self.weights,starts)
+    ## the weighted mean of a group lies between its extremes, so the centroids stay sorted
+    values = np.add.reduceat(self.values*self.weights,starts)
+    nonZero = weights > 0.0
+    values[nonZero] /= weights[nonZero]
+    values[~nonZero] = self.values[np.asarray(starts)[~nonZero]]
+    self.values, self.weights = values, weights
+    self.exact = False
+
+  def numCentroids(self):
+    """
+      Number of centroids currently stored.
+      @ In, None
+      @ Out, numCentroids, int, the number of centroids
+    """
+    return len(self.values)
+
+  def quantile(self,percent):
+    """
+      Returns a quantile.
+      With weights (and once compressed) this is the first value whose cumulative weight exceeds the
+      requested fraction of the total weight, as BasicStatistics does for weighted percentiles.
+      Without weights, while exact, this is the "lower" quantile (as numpy.percentile with interpolation='lower'),
+      as BasicStatistics does for unweighted percentiles.
+      @ In, percent, float, the requested quantile (between 0.0 and 1.0)
+      @ Out, result, float, the quantile
+    """
+    if len(self.values) == 0:
+      raise IndexError('No realizations in the quantile sketch!')
+    self.__sort()
+    if self.exact and not self.weighted:
+      return self.values[int(np.floor(percent*(len(self.values)-1)))]
+    cdf = np.cumsum(self.weights)
+    index = np.searchsorted(cdf,percent*self.totalWeight,side='right')
+    return self.values[min(index,len(self.values)-1)]
+
+  def median(self):
+    """
+      Returns the median.
+      Without weights, while exact, this is the median of numpy.median (the mean of the two central values
+      for an even number of realizations), as BasicStatistics does for unweighted medians. Otherwise this is
+      the 0.5 quantile.
+      @ In, None
+      @ Out, result, float, the median
+    """
+    if len(self.values) == 0 or not self.exact or self.weighted:
+      return self.quantile(0.5)
+    self.__sort()
+    half = (len(self.values)-1)/2.0
+    return 0.5*(self.values[int(np.floor(half))]+self.values[int(np.ceil(half))])
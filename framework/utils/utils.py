@@ -1048,6 +1048,44 @@ def mergeDictionaries(*dictArgs):
     mergedDict.update(dictionary)
   return mergedDict
 
+def stackRealizations(rlzs):
+  """
+    Stacks realizations ({var:np.ndarray}, as the models produce them) into a batch of realizations,
+    whose entries have the realizations along their first axis.
+    A variable with a single value of the same type in every realization becomes a 1-D array of those values;
+    any other variable (e.g. histories) becomes a 1-D object array of the arrays of each realization.
+    Only the variables present in all of the realizations are kept.
+    @ In, rlzs, list, list of realizations {var:np.ndarray}
+    @ Out, batch, dict, {var:np.ndarray} with len(rlzs) entries for each variable
+  """
+  batch = {}
+  if len(rlzs) == 0:
+    return batch
+  for var in set(rlzs[0].keys()).intersection(*rlzs[1:]):
+    values = list(numpy.atleast_1d(rlz[var]) for rlz in rlzs)
+    if all(value.shape == (1,) and value.dtype == values[0].dtype for value in values):
+      batch[var] = numpy.concatenate(values)
+    else:
+      batch[var] = numpy.empty(len(values),dtype=object)
+      for index,value in enumerate(values):
+        batch[var][index] = value
+  return batch
+
+def unstackRealizations(batch):
+  """
+    Splits a batch of realizations (see stackRealizations) back into the single realizations.
+    @ In, batch, dict, {var:np.ndarray} with the realizations along the first axis
+    @ Out, rlzs, list, list of realizations {var:np.ndarray}
+  """
+  if len(batch) == 0:
+    return []
+  rlzs = list({} for _ in range(len(first(batch.values()))))
+  for var,values in batch.items():
+    perRealization = values.dtype == object and all(isinstance(value,numpy.ndarray) for value in values)
+    for index,rlz in enumerate(rlzs):
+      rlz[var] = values[index] if perRealization else values[index:index+1]
+  return rlzs
+
 def mergeSequences(seq1,seq2):
   """
     This method has been taken from "http://stackoverflow.com"
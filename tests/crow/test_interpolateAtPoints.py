@@ -0,0 +1,75 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys
+import numpy as np
+import crowTestUtils as utils
+
+interpolationND = utils.findCrowModule('interpolationND')
+
+results = {"pass":0,"fail":0}
+
+randomState = np.random.RandomState(42)
+# scattered points for the inverse distance weighting, cartesian grid for the spline
+scattered = randomState.rand(50,2)
+grid = np.array([[x,y] for x in np.linspace(0.,1.,6) for y in np.linspace(0.,1.,6)])
+points = randomState.rand(20,2)
+points[0] = scattered[3]
+
+interpolators = {'InverseDistanceWeighting':(interpolationND.InverseDistanceWeighting(2.0),scattered),
+                 'NDSpline':(interpolationND.NDSpline(),grid)}
+for name, (interpolator, coordinates) in interpolators.items():
+  values = np.sin(coordinates[:,0]) + coordinates[:,1]**2
+  interpolator.fit(interpolationND.vectd2d(coordinates.tolist()),interpolationND.vectd(values.tolist()))
+  # the bulk interpolation gives the same values of the point by point one
+  bulk = np.zeros(len(points))
+  interpolator.interpolateAtPoints(points,bulk)
+  pointByPoint = np.array([interpolator.interpolateAt(interpolationND.vectd(point.tolist())) for point in points])
+  utils.checkArrayAllClose(name+" interpolateAtPoints",bulk,pointByPoint,results)
+  if name == 'InverseDistanceWeighting':
+    utils.checkAnswer(name+" at a training point",bulk[0],values[3],results)
+
+# the buffers must be C-contiguous float64 arrays with consistent sizes
+interpolator = interpolators['InverseDistanceWeighting'][0]
+for comment, pointsIn, valuesOut in [("Fortran ordered points",np.asfortranarray(points),np.zeros(len(points))),
+                                     ("float32 points",points.astype(np.float32),np.zeros(len(points))),
+                                     ("1-D points",points[:,0].copy(),np.zeros(len(points))),
+                                     ("wrong number of values",points,np.zeros(len(points)+1))]:
+  try:
+    interpolator.interpolateAtPoints(pointsIn,valuesOut)
+    print("checking answer",comment,"no error raised")
+    results["fail"] += 1
+  except (ValueError, RuntimeError):
+    results["pass"] += 1
+
+print(results)
+
+sys.exit(results["fail"])
+
+"""
+ <TestInfo>
+    <name>crow.test_interpolateAtPoints</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>crow</classesTested>
+    <description>
+      This test is a Unit Test for the crow swig classes. It tests the interpolation
+      of many points at once (interpolateAtPoints) from/into numpy arrays
+    </description>
+ </TestInfo>
+"""
@@ -0,0 +1,25 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# All answers are 1.0
+# A smooth response of the two sampled variables
+
+import numpy as np
+
+def run(self,Input):
+  """
+    Evaluates the response
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  self.ans = np.sin(self.x1)*np.exp(-0.5*self.x2) + self.x1*self.x2
@@ -0,0 +1,234 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the hard-linking of the auxiliary input files of the Code model (<linkAuxiliaryFiles>)
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import shutil
+import copy
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+from Simulation import Simulation
+import utils.TreeStructure as TS
+from CodeInterfaceBaseClass import CodeInterfaceBase
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+simulationInput = """
+<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sample</Sequence>
+    <batchSize>1</batchSize>
+  </RunInfo>
+  <Files>
+    <Input name="inp" type="">main.i</Input>
+    <Input name="table" type="table">table.dat</Input>
+  </Files>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="Files" type="">inp</Input>
+      <Input class="Files" type="">table</Input>
+      <Model class="Models" type="Code">code</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+  </Steps>
+  <Models>
+    <Code name="code" subType="GenericCode">
+      <executable>code.py</executable>
+      <clargs arg="python" type="prepend"/>
+      <clargs arg="-i" extension=".i" type="input"/>
+      <clargs arg="-o" type="output"/>
+      <linkAuxiliaryFiles>True</linkAuxiliaryFiles>
+    </Code>
+  </Models>
+  <Distributions>
+    <Uniform name="uniform">
+      <lowerBound>0</lowerBound>
+      <upperBound>1</upperBound>
+    </Uniform>
+  </Distributions>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>2</limit>
+      </samplerInit>
+      <variable name="x">
+        <distribution>uniform</distribution>
+      </variable>
+    </MonteCarlo>
+  </Samplers>
+  <DataObjects>
+    <PointSet name="samples">
+      <Input>x</Input>
+      <Output>y</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+mainInput = "x = $RAVEN-x$\n"
+tableInput = "x = $RAVEN-x$\n0.0 1.0\n1.0 2.0\n"
+
+class TypeEditingInterface(CodeInterfaceBase):
+  """
+    A code interface that, as several actual ones, selects the files it rewrites by type
+  """
+  def generateCommand(self,inputFiles,executable,clargs=None,fargs=None, preExec=None):
+    """
+      Not used in this test
+      @ In, inputFiles, list, the input files
+      @ In, executable, string, the executable
+      @ In, clargs, dict, optional, the command-line arguments
+      @ In, fargs, dict, optional, the file arguments
+      @ In, preExec, string, optional, the pre-executable
+      @ Out, None
+    """
+    return None
+
+  def createNewInput(self,currentInputFiles,oriInputFiles,samplerType,**Kwargs):
+    """
+      Rewrites in place the "table" files
+      @ In, currentInputFiles, list,  list of current input files
+      @ In, oriInputFiles, list, list of the original input files
+      @ In, samplerType, string, Sampler type
+      @ In, Kwargs, dictionary, kwarded dictionary of parameters
+      @ Out, currentInputFiles, list, the new input files
+    """
+    for inputFile in currentInputFiles:
+      if inputFile.getType() == 'table':
+        with open(inputFile.getAbsFile(),'w') as table:
+          table.write('x = '+str(Kwargs['SampledVars']['x'])+'\n')
+    return currentInputFiles
+
+testDir = os.path.abspath('LinkAuxiliaryFiles')
+if os.path.exists(testDir):
+  shutil.rmtree(testDir)
+os.makedirs(testDir)
+for name, content in [('main.i',mainInput),('table.dat',tableInput),('code.py','')]:
+  with open(os.path.join(testDir,name),'w') as inputStream:
+    inputStream.write(content)
+inputFile = os.path.join(testDir,'simulation.xml')
+with open(inputFile,'w') as inputStream:
+  inputStream.write(simulationInput)
+
+simulation = Simulation(frameworkDir)
+simulation.setInputFiles([inputFile])
+root = TS.parse(open(inputFile,'r')).getroot()
+simulation.XMLpreprocess(root,testDir)
+simulation.XMLread(root,runInfoSkip=set(["DefaultInputFile"]),xmlFilename=inputFile)
+simulation.initialize()
+
+model = simulation.whichDict['Models']['code']
+files = [simulation.whichDict['Files']['inp'], simulation.whichDict['Files']['table']]
+runInfo = copy.deepcopy(simulation.runInfoDict)
+runInfo['stepName'] = 'sample'
+stepDir = os.path.join(runInfo['WorkingDir'],'sample')
+if not os.path.exists(stepDir):
+  os.makedirs(stepDir)
+
+def sample(prefix,x):
+  """
+    Creates the input of a sample
+    @ In, prefix, string, the prefix of the sample
+    @ In, x, float, the sampled value
+    @ Out, runDir, string, the directory of the sample
+  """
+  model.createNewInput(files,'MonteCarlo',prefix=prefix,SampledVars={'x':x},additionalEdits={})
+  return os.path.join(stepDir,prefix)
+
+def read(path):
+  """
+    Reads a file
+    @ In, path, string, the file path
+    @ Out, content, string, the file content
+  """
+  with open(path,'r') as inputStream:
+    return inputStream.read()
+
+## the GenericCode only rewrites the files with its input extensions: the table is linked, the main input is rewritten
+model.initialize(runInfo,files)
+for prefix, x in [('1',0.25),('2',0.75)]:
+  runDir = sample(prefix,x)
+  checkTrue('GenericCode, sample '+prefix+', main input rewritten', read(os.path.join(runDir,'main.i')), 'x = '+str(x)+'\n')
+  checkTrue('GenericCode, sample '+prefix+', main input not linked', os.path.samefile(os.path.join(runDir,'main.i'),os.path.join(stepDir,'main.i')), False)
+  checkTrue('GenericCode, sample '+prefix+', table unchanged', read(os.path.join(runDir,'table.dat')), tableInput)
+  if hasattr(os,'link'):
+    checkTrue('GenericCode, sample '+prefix+', table linked', os.path.samefile(os.path.join(runDir,'table.dat'),os.path.join(stepDir,'table.dat')), True)
+checkTrue('GenericCode, original main input unchanged', read(os.path.join(testDir,'main.i')), mainInput)
+checkTrue('GenericCode, original table unchanged', read(os.path.join(testDir,'table.dat')), tableInput)
+
+## an interface rewriting the files by type does not declare them unmodified: the table is copied, never linked
+model.code = TypeEditingInterface()
+model.code.addDefaultExtension()
+model.initialize(runInfo,files)
+for prefix, x in [('3',0.25),('4',0.75)]:
+  runDir = sample(prefix,x)
+  checkTrue('type-editing interface, sample '+prefix+', table rewritten', read(os.path.join(runDir,'table.dat')), 'x = '+str(x)+'\n')
+  checkTrue('type-editing interface, sample '+prefix+', table not linked', os.path.samefile(os.path.join(runDir,'table.dat'),os.path.join(stepDir,'table.dat')), False)
+checkTrue('type-editing interface, step copy of the table unchanged', read(os.path.join(stepDir,'table.dat')), tableInput)
+checkTrue('type-editing interface, original table unchanged', read(os.path.join(testDir,'table.dat')), tableInput)
+
+simulation.jobHandler.shutdown()
+shutil.rmtree(testDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.linkAuxiliaryFiles</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>Models.Code</classesTested>
+    <description>
+       This test checks the option linkAuxiliaryFiles of the Code model: only the input files the code interface
+       declares unmodified (for the GenericCode, the ones without an input extension) are hard-linked into the run
+       directories, and the original input files are left unchanged, also for an interface that rewrites the files
+       selected by type.
+    </description>
+  </TestInfo>
+"""
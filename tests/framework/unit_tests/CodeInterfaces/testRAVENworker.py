@@ -0,0 +1,226 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the persistent SLAVE RAVEN workers of the RAVEN interface
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import shutil
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+sys.path.append(os.path.join(frameworkDir,'CodeInterfaces','RAVEN'))
+import RAVENworker
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+innerInput = """<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>inner</WorkingDir>
+    <Sequence>sample,print</Sequence>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+    <IOStep name="print">
+      <Input class="DataObjects" type="PointSet">samples</Input>
+      <Output class="OutStreams" type="Print">samples_dump</Output>
+    </IOStep>
+  </Steps>
+  <Models>
+    <ExternalModel name="model" subType="" ModuleToLoad="model">
+      <variables>x,y</variables>
+    </ExternalModel>
+  </Models>
+  <Distributions>
+    <Uniform name="dist">
+      <lowerBound>0</lowerBound>
+      <upperBound>UPPER</upperBound>
+    </Uniform>
+  </Distributions>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>5</limit>
+      </samplerInit>
+      <variable name="x">
+        <distribution>dist</distribution>
+      </variable>
+    </MonteCarlo>
+  </Samplers>
+  <OutStreams>
+    <Print name="samples_dump">
+      <type>csv</type>
+      <source>samples</source>
+    </Print>
+  </OutStreams>
+  <DataObjects>
+    <PointSet name="placeholder">
+      <Input>x</Input>
+      <Output>OutputPlaceHolder</Output>
+    </PointSet>
+    <PointSet name="samples">
+      <Input>x</Input>
+      <Output>y</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+model = '''
+def run(self,Input):
+  """
+    Model of the SLAVE RAVEN
+    @ In, Input, dict, the inputs
+    @ Out, None
+  """
+  self.y = 2.*self.x
+'''
+
+## model keeping a module-level state in a helper module (outside of the run directory)
+countingModel = '''
+import sys
+sys.path.append(SHARED)
+import counter
+def run(self,Input):
+  """
+    Model of the SLAVE RAVEN, counting its evaluations in a helper module
+    @ In, Input, dict, the inputs
+    @ Out, None
+  """
+  counter.calls += 1
+  self.y = float(counter.calls)
+'''
+
+testDir = os.path.abspath('RAVENworkerTest')
+if os.path.exists(testDir):
+  shutil.rmtree(testDir)
+def writeInput(name,upperBound,modelSource=model):
+  """
+    Writes a SLAVE RAVEN input (in its own directory, as the RAVEN interface does for each sample)
+    @ In, name, string, name of the run
+    @ In, upperBound, string, upper bound of the distribution of "x"
+    @ In, modelSource, string, optional, source of the ExternalModel
+    @ Out, inputFile, string, the absolute path of the input
+  """
+  runDir = os.path.join(testDir,name)
+  os.makedirs(os.path.join(runDir,'inner'))
+  with open(os.path.join(runDir,'inner','model.py'),'w') as modelFile:
+    modelFile.write(modelSource)
+  inputFile = os.path.join(runDir,'inner.xml')
+  with open(inputFile,'w') as inputStream:
+    inputStream.write(innerInput.replace('UPPER',upperBound))
+  return inputFile
+
+pool = RAVENworker.RAVENworkerPool(frameworkDir)
+
+## a run returns the content of the DataObjects in memory
+inputFile = writeInput('1','1')
+run, data = pool.run(inputFile,os.path.join(testDir,'1','log'),['samples'])
+checkTrue('run completed',run.wait(),0)
+checkTrue('not timed out',run.timedOut,False)
+checkTrue('data objects returned',list(data.keys()),['samples'])
+first = data['samples']
+checkTrue('number of samples',len(first['x'].values),5)
+checkTrue('model evaluated',np.allclose(first['y'].values,2.*first['x'].values),True)
+checkTrue('sampled within the distribution',bool(np.all(first['x'].values <= 1.)),True)
+checkTrue('output of the run in its log','Run complete' in open(os.path.join(testDir,'1','log')).read(),True)
+checkTrue('SLAVE RAVEN OutStreams still printed',os.path.exists(os.path.join(testDir,'1','inner','samples_dump.csv')),True)
+
+## the worker is reused, and every run starts from the same random state as a new RAVEN
+inputFile = writeInput('2','1')
+run, data = pool.run(inputFile,os.path.join(testDir,'2','log'),['samples'])
+checkTrue('second run completed',run.wait(),0)
+checkTrue('worker reused',pool.numWorkers(),1)
+checkTrue('same samples as a new RAVEN',np.array_equal(data['samples']['x'].values,first['x'].values),True)
+
+## a perturbed input gives perturbed results
+inputFile = writeInput('3','10')
+run, data = pool.run(inputFile,os.path.join(testDir,'3','log'),['samples'])
+checkTrue('perturbed run completed',run.wait(),0)
+checkTrue('perturbed input used',np.allclose(data['samples']['x'].values,10.*first['x'].values),True)
+
+## the modules imported by a run (also from outside of the run directory) start afresh in the next run
+sharedDir = os.path.join(testDir,'shared')
+os.makedirs(sharedDir)
+with open(os.path.join(sharedDir,'counter.py'),'w') as counterFile:
+  counterFile.write('calls = 0\n')
+for name in ['counter1','counter2']:
+  inputFile = writeInput(name,'1',countingModel.replace('SHARED',repr(sharedDir)))
+  run, data = pool.run(inputFile,os.path.join(testDir,name,'log'),['samples'])
+  checkTrue('counting run completed',run.wait(),0)
+  checkTrue('helper module state reset',sorted(data['samples']['y'].values.tolist()),[1.,2.,3.,4.,5.])
+
+## a failing SLAVE RAVEN fails the run, but not the worker
+inputFile = writeInput('4','1')
+with open(inputFile,'w') as inputStream:
+  inputStream.write(innerInput.replace('UPPER','1').replace('<Model class="Models" type="ExternalModel">model','<Model class="Models" type="ExternalModel">noModel'))
+run, data = pool.run(inputFile,os.path.join(testDir,'4','log'),['samples'])
+checkTrue('failed run',run.wait() != 0,True)
+checkTrue('no data for a failed run',data,None)
+checkTrue('error in the log','noModel' in open(os.path.join(testDir,'4','log')).read(),True)
+checkTrue('worker still alive',pool.numWorkers(),1)
+
+## a run exceeding its walltime kills its worker
+inputFile = writeInput('5','1')
+run, data = pool.run(inputFile,os.path.join(testDir,'5','log'),['samples'],walltime=0.01)
+checkTrue('run killed',run.wait() != 0,True)
+checkTrue('timed out',run.timedOut,True)
+checkTrue('killed worker not reused',pool.numWorkers(),0)
+
+pool.shutdown()
+shutil.rmtree(testDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.RAVENworker</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>CodeInterfaces.RAVEN.RAVENworker</classesTested>
+    <description>
+       This test performs Unit Tests for the persistent SLAVE RAVEN workers of the RAVEN interface
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -22,8 +22,12 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 
 import xml.etree.ElementTree as ET
-import sys, os
+import sys, os, io
 import pickle as pk
+try:
+  import copyreg
+except ImportError:
+  import copy_reg as copyreg
 import numpy as np
 import xarray as xr
 
@@ -698,6 +702,167 @@ checkRlz('Adding asynchronous histories, dataset[1]',data.realization(index=1),r
 #data._readMoreXML(xml)
 #checkFails('Expected error foulty realization (index/variable no matching shape), rlzFoulty', "SyntaxError: Realization was not formatted correctly", data.addRealization, args=(rlzFoulty,))
 
+######################################
+#      INCREMENTAL CSV PRINTING      #
+######################################
+xml = createElement('HistorySet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x,y'))
+options = createElement('options')
+options.append(createElement('pivotParameter',text='Timelike'))
+xml.append(options)
+rlzs = []
+for i in range(5):
+  rlz = {'a':float(i),'b':1.0/(i+3.0),'x':np.arange(i+2)*0.1,'y':np.arange(i+2)+0.5,'Timelike':np.arange(i+2)*1e-6}
+  formatRealization(rlz)
+  rlzs.append(rlz)
+# split histories through the light-weight writer must give the same files as pandas
+for historyFormat in ['split','long']:
+  data = DataObjects.HistorySet()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  openFiles = {}
+  index = 0
+  for first,last in [(0,2),(2,5)]:
+    for rlz in rlzs[first:last]:
+      data.addRealization(rlz)
+    index = data.write('HSIncremental',style='CSV',firstIndex=index,openFiles=openFiles,historyFormat=historyFormat)
+  checkSame('HistorySet incremental {} index'.format(historyFormat),index,5)
+  for openFile in openFiles.values():
+    openFile.close()
+  if historyFormat == 'split':
+    checkSame('HistorySet incremental split open files',sorted(openFiles.keys()),['HSIncremental.csv','HSIncremental.xml'])
+    data.write('HSPandas',style='CSV')
+    lines = list(line.replace('HSIncremental','HSPandas') for line in open('HSIncremental.csv','r').readlines())
+    checkArray('HistorySet incremental split main',lines,open('HSPandas.csv','r').readlines(),str)
+    for i in range(5):
+      checkArray('HistorySet incremental split history {}'.format(i),open('HSIncremental_{}.csv'.format(i),'r').readlines(),
+                                                                  open('HSPandas_{}.csv'.format(i),'r').readlines(),str)
+      os.remove('HSIncremental_{}.csv'.format(i))
+      os.remove('HSPandas_{}.csv'.format(i))
+    os.remove('HSPandas.csv')
+    os.remove('HSPandas.xml')
+  else:
+    checkSame('HistorySet incremental long open files',sorted(openFiles.keys()),['HSIncremental.csv','HSIncremental.xml','HSIncremental_histories.csv'])
+    lines = open('HSIncremental_histories.csv','r').readlines()
+    checkSame('HistorySet incremental long header',lines[0].strip(),'RAVEN_sample_ID,Timelike,x,y')
+    checkSame('HistorySet incremental long rows',len(lines),1+sum(range(2,7)))
+    checkSame('HistorySet incremental long main',open('HSIncremental.csv','r').readlines()[3].strip(),'2,2.0,0.2,HSIncremental_histories.csv')
+    # long-format files are loaded back as the split ones
+    dataCSV = DataObjects.HistorySet()
+    dataCSV.messageHandler = mh
+    dataCSV._readMoreXML(xml)
+    dataCSV.load('HSIncremental',style='CSV')
+    checkSame('HistorySet incremental long load',len(dataCSV),5)
+    for i in range(5):
+      checkRlz('HistorySet incremental long load rlz {}'.format(i),dataCSV.realization(index=i),rlzs[i],skip=['Timelike'])
+    os.remove('HSIncremental_histories.csv')
+  os.remove('HSIncremental.csv')
+  os.remove('HSIncremental.xml')
+# long-format histories are matched to the main CSV through the sample ID, also when a history has no rows
+dataEmpty = DataObjects.HistorySet()
+dataEmpty.messageHandler = mh
+dataEmpty._readMoreXML(xml)
+for i,rlz in enumerate(rlzs):
+  if i == 2:
+    rlz = dict(rlz)
+    rlz['x'] = np.full(len(rlz['x']),np.nan)
+    rlz['y'] = np.full(len(rlz['y']),np.nan)
+  dataEmpty.addRealization(rlz)
+openFiles = {}
+dataEmpty.write('HSEmpty',style='CSV',firstIndex=0,openFiles=openFiles,historyFormat='long')
+for openFile in openFiles.values():
+  openFile.close()
+checkSame('HistorySet long empty history rows',len(open('HSEmpty_histories.csv','r').readlines()),1+sum(range(2,7))-4)
+dataCSV = DataObjects.HistorySet()
+dataCSV.messageHandler = mh
+dataCSV._readMoreXML(xml)
+checkFails('HistorySet long empty history load','Importing HistorySet from .csv: no history found in "HSEmpty_histories.csv" for RAVEN_sample_ID "2" (row 3 of "HSEmpty.csv")!',
+           dataCSV.load,args=['HSEmpty'],kwargs={'style':'CSV'})
+# without the empty history (and with the rows shuffled), the others are found back
+lines = open('HSEmpty.csv','r').readlines()
+with open('HSEmpty.csv','w') as mainFile:
+  mainFile.writelines([lines[0],lines[5],lines[2],lines[4],lines[1]])
+dataCSV = DataObjects.HistorySet()
+dataCSV.messageHandler = mh
+dataCSV._readMoreXML(xml)
+dataCSV.load('HSEmpty',style='CSV')
+checkSame('HistorySet long empty history reload',len(dataCSV),4)
+for i,index in enumerate([4,1,3,0]):
+  checkRlz('HistorySet long empty history reload rlz {}'.format(index),dataCSV.realization(index=i),rlzs[index],skip=['Timelike'])
+os.remove('HSEmpty.csv')
+os.remove('HSEmpty.xml')
+os.remove('HSEmpty_histories.csv')
+
+######################################
+#      NETCDF AND PARQUET FILES      #
+######################################
+# histories of different lengths must be written and read back without the padding
+binaryStyles = []
+try:
+  import netCDF4
+  # NOTE: netCDF4 versions less than 1.3.1 seg fault (see TestDataSet)
+  if tuple(int(v) for v in netCDF4.__version__.split('.')[:3]) >= (1,3,1):
+    binaryStyles.append(('netcdf','HSBinary.nc'))
+except ImportError:
+  pass
+try:
+  import pyarrow
+  binaryStyles.append(('parquet','HSBinary.parquet'))
+except ImportError:
+  pass
+for style,fileName in binaryStyles:
+  data.write(fileName,style=style,chunkSize=2)
+  back = DataObjects.HistorySet()
+  back.messageHandler = mh
+  back._readMoreXML(xml)
+  back.load(fileName,style=style)
+  checkSame('HistorySet {} size'.format(style),len(back),5)
+  for i in range(5):
+    rlz = back.realization(index=i)
+    checkRlz('HistorySet {} rlz {}'.format(style,i),rlz,rlzs[i],skip=['Timelike'])
+    checkArray('HistorySet {} rlz {} pivot'.format(style,i),rlz['x']['Timelike'].values,rlzs[i]['Timelike'],float)
+  # a data object needing only the scalars does not read the histories
+  xmlSmall = createElement('PointSet',attrib={'name':'small'})
+  xmlSmall.append(createElement('Input',text='a'))
+  xmlSmall.append(createElement('Output',text='b'))
+  small = DataObjects.PointSet()
+  small.messageHandler = mh
+  small._readMoreXML(xmlSmall)
+  small.load(fileName,style=style)
+  checkSame('HistorySet {} partial vars'.format(style),sorted(small.asDataset().data_vars.keys()),['a','b'])
+  checkArray('HistorySet {} partial "b"'.format(style),small.asDataset()['b'].values,list(rlz['b'][0] for rlz in rlzs),float)
+  os.remove(fileName)
+# netCDF files written before the metadata were base64-encoded (plain pickled attributes) are still readable
+if any(style == 'netcdf' for style,_ in binaryStyles):
+  def oldPickle(val):
+    """
+      Pickles as the previous writer did, in text (protocol 0, the Python 2 default)
+      @ In, val, object, the object to pickle
+      @ Out, oldPickle, str, the pickle text
+    """
+    if sys.version_info[0] < 3:
+      return pk.dumps(val)
+    stream = io.BytesIO()
+    pickler = pk.Pickler(stream,protocol=0)
+    # the C elements of Python 3 cannot be pickled in protocol 0, so they are rebuilt from their state
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[ET.Element] = lambda element: (ET.Element,(element.tag,),element.__getstate__())
+    pickler.dump(val)
+    return stream.getvalue().decode('utf-8')
+  old = data.asDataset().copy()
+  old.attrs = dict((key,oldPickle(val)) for key,val in data._meta.items())
+  old.to_netcdf('HSOldFormat.nc')
+  back = DataObjects.HistorySet()
+  back.messageHandler = mh
+  back._readMoreXML(xml)
+  back.load('HSOldFormat.nc',style='netcdf')
+  checkSame('HistorySet old netcdf size',len(back),5)
+  checkSame('HistorySet old netcdf meta',sorted(back._meta.keys()),sorted(data._meta.keys()))
+  for i in range(5):
+    checkRlz('HistorySet old netcdf rlz {}'.format(i),back.realization(index=i),rlzs[i],skip=['Timelike'])
+  os.remove('HSOldFormat.nc')
+
 ######################################
 #   scalar and vector meta data      #
 ######################################
@@ -33,6 +33,7 @@ sys.path.append(frameworkDir)
 
 from utils.utils import find_crow
 find_crow(frameworkDir)
+from utils import utils
 import MessageHandler
 
 import DataObjects
@@ -353,7 +354,16 @@ rlz3 = {'a': 31.0,
 formatRealization(rlz3)
 data.addRealization(rlz3)
 checkRlz('PointSet append 2 idx 0',data.realization(index=3),rlz3)
-# TODO test reading from both main and collector
+# match from both main and collector; indices count the data first
+m,match = data.realization(matchDict={'a':21.0})
+checkSame('PointSet append 2 match data index',m,2)
+checkRlz('PointSet append 2 match data',match,rlz2)
+m,match = data.realization(matchDict={'a':31.0,'prefix':'fourth'})
+checkSame('PointSet append 2 match collector index',m,3)
+checkRlz('PointSet append 2 match collector',match,rlz3)
+m,match = data.realization(matchDict={'a':31.0,'prefix':'third'})
+checkSame('PointSet append 2 mismatch index',m,4)
+checkNone('PointSet append 2 mismatch',match)
 
 data.asDataset()
 # check new sample IDs
@@ -573,6 +583,159 @@ data.setSelectiveOutput('operator','mean')
 data.addRealization(rlz0)
 checkRlz('PointSet selective default',data.realization(index=3),{'a':0.5,'x':1.34})
 
+######################################
+#      MATCHING MANY REALIZATIONS    #
+######################################
+# the indexed search must find the same realizations as searching every entry
+xml = createElement('PointSet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x'))
+data = DataObjects.PointSet()
+data.messageHandler = mh
+data._readMoreXML(xml)
+data.addExpectedMeta(['prefix'])
+np.random.seed(42)
+grid = np.random.randint(0,20,size=(500,2))*0.1
+for i,(a,b) in enumerate(grid):
+  rlz = {'a':a,'b':b,'x':a*b,'prefix':str(i%50)}
+  formatRealization(rlz)
+  data.addRealization(rlz)
+  # collapse part way through, so matches are found in both the data and the collector
+  if i == 299:
+    data.asDataset()
+requests = list(grid[::7]) + [(0.5+1e-13,0.3),(0.5,0.3+1e-3),(-1.0,0.0)]
+for tol in [1e-15,1e-10,1e-2]:
+  for a,b in requests:
+    for toMatch in [{'a':a,'b':b},{'a':a,'prefix':'7'}]:
+      indexed = data.realization(matchDict=toMatch,tol=tol)[0]
+      direct = data._getRealizationFromDataByValue(toMatch,tol=tol)[0]
+      if direct == len(data):
+        direct = data._getRealizationFromCollectorByValue(toMatch,tol=tol)[0]
+        if direct < len(data):
+          direct += len(data._data['a'])
+      checkSame('PointSet indexed match {} tol {}'.format(toMatch,tol),indexed,direct,update=indexed != direct)
+checkSame('PointSet indexed match found',data.realization(matchDict={'a':grid[10][0],'b':grid[10][1]})[1]['x'],grid[10][0]*grid[10][1])
+# changing a value must be seen by the next search
+data._changeVariableValue(400,'prefix','changed')
+checkSame('PointSet indexed match after change',data.realization(matchDict={'prefix':'changed'})[0],400)
+# removing realizations (by reloading) must not use a stale index
+subset = data.asDataset().isel(RAVEN_sample_ID=slice(0,10))
+data.reset()
+data.load(subset,style='dataset')
+checkSame('PointSet indexed match after load',data.realization(matchDict={'prefix':'changed'})[0],10)
+
+######################################
+#      ADDING MANY REALIZATIONS      #
+######################################
+# a batch of realizations must give the same data as adding them one at a time
+xml = createElement('PointSet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x'))
+single = DataObjects.PointSet()
+single.messageHandler = mh
+single._readMoreXML(xml)
+single.addExpectedMeta(['prefix'])
+batched = DataObjects.PointSet()
+batched.messageHandler = mh
+batched._readMoreXML(xml)
+batched.addExpectedMeta(['prefix'])
+rlzs = []
+for i in range(12):
+  rlz = {'a':0.5*i,'b':1.5*i,'x':float(i*i),'prefix':str(i+1),'unused':np.array([1.0,2.0])}
+  formatRealization(rlz)
+  rlzs.append(rlz)
+  single.addRealization(rlz)
+batch = utils.stackRealizations(rlzs[:5])
+checkSame('PointSet batch scalars',batch['x'].shape,(5,))
+checkSame('PointSet batch histories',batch['unused'].dtype,np.dtype(object))
+batched.addRealizationBatch(batch)
+checkSame('PointSet batch added',len(batched),5)
+# one of them with a different type: added one at a time
+rlzs[6]['a'] = np.array([3],dtype=int)
+batched.addRealizationBatch(utils.stackRealizations(rlzs[5:]))
+checkSame('PointSet batch added by realization',len(batched),12)
+for var in ['a','b','x','prefix']:
+  checkSame('PointSet batch values "{}"'.format(var),list(batched.asDataset()[var].values),list(single.asDataset()[var].values))
+checkSame('PointSet batch match',batched.realization(matchDict={'prefix':'8'})[0],7)
+checkSame('PointSet batch unstack',utils.unstackRealizations(batch)[3]['unused'][1],2.0)
+
+######################################
+#      INCREMENTAL CSV PRINTING      #
+######################################
+# printing a few realizations at a time through the light-weight writer must give the same file as pandas
+growing = DataObjects.PointSet()
+growing.messageHandler = mh
+growing._readMoreXML(xml)
+growing.addExpectedMeta(['prefix'])
+rlzs.append({'a':np.array([np.nan]),'b':np.array([1.0/3.0]),'x':np.array([1e-20]),'prefix':np.array(['a,"b"'])})
+what = 'input,output,prefix,RAVEN_sample_ID'
+openFiles = {}
+index = 0
+for first,last in [(0,4),(4,9),(9,13)]:
+  for rlz in rlzs[first:last]:
+    growing.addRealization(rlz)
+  index = growing.write('PointSetIncremental',style='CSV',firstIndex=index,openFiles=openFiles,what=what)
+checkSame('PointSet incremental index',index,13)
+checkSame('PointSet incremental open files',sorted(openFiles.keys()),['PointSetIncremental.csv','PointSetIncremental.xml'])
+for openFile in openFiles.values():
+  openFile.close()
+growing.write('PointSetPandas',style='CSV',what=what)
+lines = open('PointSetIncremental.csv','r').readlines()
+checkSame('PointSet incremental header',lines[0].strip(),'RAVEN_sample_ID,a,b,x,prefix')
+checkSame('PointSet incremental formatting',lines[-1].strip(),'12,,0.3333333333333333,1e-20,"a,""b"""')
+checkArray('PointSet incremental vs pandas',lines,open('PointSetPandas.csv','r').readlines(),str)
+for ext in ['.csv','.xml']:
+  os.remove('PointSetIncremental'+ext)
+  os.remove('PointSetPandas'+ext)
+
+######################################
+#      NETCDF AND PARQUET FILES      #
+######################################
+# writing to a binary file and reading it back must give the same data
+binaryStyles = []
+try:
+  import netCDF4
+  # NOTE: netCDF4 versions less than 1.3.1 seg fault (see TestDataSet)
+  if tuple(int(v) for v in netCDF4.__version__.split('.')[:3]) >= (1,3,1):
+    binaryStyles.append(('netcdf','PointSetBinary.nc'))
+except ImportError:
+  pass
+try:
+  import pyarrow
+  binaryStyles.append(('parquet','PointSetBinary.parquet'))
+except ImportError:
+  pass
+for style,fileName in binaryStyles:
+  growing.write(fileName,style=style,compression='zlib' if style == 'netcdf' else 'gzip',chunkSize=5)
+  back = DataObjects.PointSet()
+  back.messageHandler = mh
+  back._readMoreXML(xml)
+  back.addExpectedMeta(['prefix'])
+  back.load(fileName,style=style)
+  checkSame('PointSet {} size'.format(style),len(back),len(growing))
+  for var in ['a','b','x']:
+    checkArray('PointSet {} "{}"'.format(style,var),back.asDataset()[var].values,growing.asDataset()[var].values,float)
+  checkArray('PointSet {} prefix'.format(style),back.asDataset()['prefix'].values,growing.asDataset()['prefix'].values,str)
+  checkTrue('PointSet {} metadata'.format(style),'DataSet' in back._meta)
+  # a data object needing fewer variables only reads those
+  xmlSmall = createElement('PointSet',attrib={'name':'small'})
+  xmlSmall.append(createElement('Input',text='a'))
+  xmlSmall.append(createElement('Output',text='x'))
+  small = DataObjects.PointSet()
+  small.messageHandler = mh
+  small._readMoreXML(xmlSmall)
+  small.load(fileName,style=style)
+  checkSame('PointSet {} partial vars'.format(style),sorted(small.asDataset().data_vars.keys()),['a','prefix','x'])
+  checkArray('PointSet {} partial "x"'.format(style),small.asDataset()['x'].values,growing.asDataset()['x'].values,float)
+  # only the requested variables are written
+  growing.write(fileName,style=style,what='input')
+  small = DataObjects.PointSet()
+  small.messageHandler = mh
+  small._readMoreXML(xmlSmall)
+  checkFails('PointSet {} missing vars'.format(style),
+             'Not all variables requested for data object "{}" were found in "{}"! Missing: x'.format(small.name,fileName),
+             small.load,args=[fileName],kwargs={'style':style})
+  os.remove(fileName)
 
 # TODO more exhaustive tests are needed, but this is sufficient for initial work.
 
@@ -0,0 +1,186 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the columnar layout of the HDF5 databases.
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+
+import h5py_interface_creator
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+print('Module undergoing testing:')
+print(h5py_interface_creator.hdf5ColumnarDatabase)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkRlz(comment,first,second,update=True):
+  """
+    This method is aimed to compare two realizations
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, dict, the first realization {var:np.ndarray}
+    @ In, second, dict, the second realization {var:np.ndarray}
+    @ In, update, bool, optional, if True the results are updated
+    @ Out, res, bool, True if same
+  """
+  res = set(first.keys()) == set(second.keys())
+  if res:
+    for key in first.keys():
+      if not (np.shape(first[key]) == np.shape(second[key]) and np.all(np.asarray(first[key]) == np.asarray(second[key]))):
+        print('checking realization',comment,'|','variable "{}" does not match: {} != {}'.format(key,first[key],second[key]))
+        res = False
+  else:
+    print('checking realization',comment,'|','variables do not match:',sorted(first.keys()),sorted(second.keys()))
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+testDir = os.path.dirname(os.path.abspath(__file__))
+columnarFile = 'columnar.h5'
+hierarchicalFile = 'hierarchical.h5'
+
+##################
+# Parallel (MC) #
+##################
+rlzs = []
+for i in range(25):
+  rlzs.append({'prefix':np.array([str(i)]),
+               'x':np.array([float(i)]),
+               'n':np.array([i]),
+               'y':np.arange(4.)*i,
+               'm':np.ones((2,3))*i,
+               'tag':np.array(['run'+str(i)])})
+db = h5py_interface_creator.hdf5ColumnarDatabase('test',testDir,mh,columnarFile,False)
+db.addGroups(rlzs[:10])
+db.addGroups(rlzs[10:20])
+for rlz in rlzs[20:]:
+  db.addGroup(rlz)
+checkTrue('length',len(db) == 26)
+checkTrue('history names',sorted(db.retrieveAllHistoryNames(),key=int) == [str(i) for i in range(25)])
+expected = dict((key,np.asarray(value,dtype=float) if key in ['x','n','y','m'] else value) for key,value in rlzs[13].items())
+checkRlz('single realization',db._getRealizationByName('13')[0],expected)
+# a later realization needs a more general column (scalar => array, string => object)
+db.addGroups([{'prefix':np.array(['p']),'x':np.arange(3.),'n':np.array([1]),'y':np.array([2.]),'m':np.ones((2,3)),'tag':np.array([{'a':1}],dtype=object)}])
+checkTrue('promoted column',db._getRealizationByName('p')[0]['x'].tolist() == [0.,1.,2.])
+checkTrue('promoted object',db._getRealizationByName('p')[0]['tag'][0] == {'a':1})
+checkRlz('after promotion',db._getRealizationByName('13')[0],expected)
+# same name twice
+db.addGroup({'prefix':np.array(['p']),'x':np.array([5.])})
+checkTrue('duplicated name',db._getRealizationByName('p_p')[0]['x'].tolist() == [5.])
+db.closeDatabaseW()
+
+# reopen and read all (bulk)
+checkTrue('stored layout',h5py_interface_creator.storedLayout(os.path.join(testDir,columnarFile)) == 'columnar')
+db = h5py_interface_creator.hdf5ColumnarDatabase('test',testDir,mh,columnarFile,True)
+checkTrue('length after reopening',len(db) == 28)
+names = [str(i) for i in range(25)]
+allRlzs = db.retrieveRealizations(names)
+checkTrue('all realizations',all(checkRlz('bulk realization '+name,rlz,db._getRealizationByName(name)[0],update=False) for name,rlz in zip(names,allRlzs)))
+checkRlz('bulk realization',allRlzs[13],expected)
+db.closeDatabaseW()
+
+############################
+# Hierarchical (DET) tree #
+############################
+def branch(name,parent,start):
+  """
+    Creates a DET branch realization
+    @ In, name, str, the branch name
+    @ In, parent, str, the parent branch name
+    @ In, start, float, the starting time of the branch
+    @ Out, rlz, dict, the realization
+  """
+  return {'prefix':np.array([name]),'RAVEN_parentID':np.array([parent]),'time':np.arange(start,start+2.),'x':np.arange(start,start+2.)*2}
+
+tree = [branch('root','None',0.),branch('root-1','root',2.),branch('root-2','root',2.),branch('root-1-1','root-1',4.)]
+for cls,filename in [(h5py_interface_creator.hdf5ColumnarDatabase,columnarFile),(h5py_interface_creator.hdf5Database,hierarchicalFile)]:
+  db = cls('test',testDir,mh,filename,False)
+  db.addGroupInit('DET')
+  db.addGroups(tree)
+  db.closeDatabaseW()
+hierarchical = h5py_interface_creator.hdf5Database('test',testDir,mh,hierarchicalFile,True)
+columnar = h5py_interface_creator.hdf5ColumnarDatabase('test',testDir,mh,columnarFile,True)
+checkTrue('hierarchical stored layout',h5py_interface_creator.storedLayout(os.path.join(testDir,hierarchicalFile)) == 'hierarchical')
+checkTrue('DET history names',sorted(columnar.retrieveAllHistoryNames()) == sorted(hierarchical.retrieveAllHistoryNames()))
+checkTrue('DET history names with root',columnar.retrieveAllHistoryNames('1-1') == ['root-1-1'])
+checkRlz('DET no reconstruction',columnar._getRealizationByName('root-1-1',{'reconstruct':False})[0],branch('root-1-1','root-1',4.))
+checkRlz('DET reconstruction',columnar._getRealizationByName('root-1-1')[0],hierarchical._getRealizationByName('root-1-1')[0])
+checkRlz('DET bulk reconstruction',columnar.retrieveRealizations(['root-2'])[0],hierarchical._getRealizationByName('root-2')[0])
+# on-demand reading of some variables only
+for db in [hierarchical,columnar]:
+  checkRlz('DET selected variables '+db.__class__.__name__,db._getRealizationByName('root-1-1',{'variables':['x']})[0],{'x':np.array([8.,10.,0.,2.,4.,6.])})
+  checkTrue('DET iterator '+db.__class__.__name__,all(checkRlz('DET iterator',rlz,db._getRealizationByName(name)[0],update=False) for name,rlz in zip(['root-1','root-1-1','root-2'],db.realizationIterator(['root-1','root-1-1','root-2'],chunkSize=2))))
+hierarchical.closeDatabaseW()
+columnar.closeDatabaseW()
+
+# the group paths of the hierarchical layout are found by name, also after adding groups to an existing file
+hierarchical = h5py_interface_creator.hdf5Database('test',testDir,mh,hierarchicalFile,True)
+hierarchical.addGroup(branch('root-2-1','root-2',4.))
+checkRlz('DET added to existing file',hierarchical._getRealizationByName('root-2-1')[0],{'prefix':np.array(['root-2-1','root','root-2']),'RAVEN_parentID':np.array(['root-2','None','root']),'time':np.array([4.,5.,0.,1.,2.,3.]),'x':np.array([8.,10.,0.,2.,4.,6.])})
+checkTrue('DET added group path',hierarchical.allGroupPaths[-1].endswith(b'root/root-2/root-2-1'))
+hierarchical.closeDatabaseW()
+
+for filename in [columnarFile,hierarchicalFile]:
+  os.remove(os.path.join(testDir,filename))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.columnarDatabase</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>h5py_interface_creator.hdf5ColumnarDatabase</classesTested>
+    <description>
+       This test performs Unit Tests for the columnar layout of the HDF5 databases
+    </description>
+  </TestInfo>
+"""
@@ -1107,6 +1107,28 @@ checkAnswer("Custom1D cdf(1.9)",Custom1D.cdf(1.9), 0.971283153684)
 checkAnswer("Custom1D ppf(0.0139034475135)",Custom1D.ppf(0.0139034475135),-2.19999191499)
 checkAnswer("Custom1D ppf(00.971283440184)",Custom1D.ppf(0.971283440184),1.90000436617)
 
+# Test array evaluation: must match the scalar evaluation exactly
+from utils import randomUtils
+probabilities = np.array([[0.01,0.2,0.35],[0.5,0.75,0.99]])
+for name,dist in [('uniform',uniform),('truncNormal',truncNormal),('gamma',gamma),('beta',beta),('triangular',triangular),
+                  ('poisson',poisson),('lowLogistic',lowLogistic),('logNormal',logNormal),('upWeibull',upWeibull),
+                  ('truncExponential',truncExponential),('Categorical',Categorical),('Custom1D',Custom1D)]:
+  ppfs = dist.ppf(probabilities)
+  checkAnswer(name+' array ppf shape',ppfs.shape == probabilities.shape,True)
+  cdfs = dist.cdf(ppfs.ravel())
+  pdfs = dist.pdf(list(ppfs.ravel()))
+  for i,p in enumerate(probabilities.ravel()):
+    x = dist.ppf(p)
+    checkAnswer(name+' array ppf({})'.format(p),ppfs.ravel()[i],x,tol=0.0)
+    checkAnswer(name+' array cdf({})'.format(x),cdfs[i],dist.cdf(x),tol=0.0)
+    checkAnswer(name+' array pdf({})'.format(x),pdfs[i],dist.pdf(x),tol=0.0)
+for name,dist in [('normal',normal),('binomial',binomial),('weibull',weibull)]:
+  randomUtils.randomSeed(42)
+  many = dist.rvs(5)
+  randomUtils.randomSeed(42)
+  for i in range(5):
+    checkAnswer(name+' rvs(5) entry {}'.format(i),many[i],dist.rvs(),tol=0.0)
+
 
 print(results)
 
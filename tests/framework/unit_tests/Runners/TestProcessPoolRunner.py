@@ -0,0 +1,208 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the ProcessPoolRunner (internalParallelMethod processPool)
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import time
+import threading
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import utils
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+import MessageHandler
+import Runners
+from JobHandler import JobHandler
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, None
+  """
+  if abs(value - expected) > tol:
+    print("checking answer",comment,value,"!=",expected)
+    if updateResults:
+      results["fail"] += 1
+    return False
+  else:
+    if updateResults:
+      results["pass"] += 1
+    return True
+
+class Scaler(object):
+  """
+    Stands in for a model: counts its own evaluations, so we can tell whether it
+    persists in the workers.
+  """
+  def __init__(self,scale):
+    """
+      Constructor
+      @ In, scale, float, scaling factor
+      @ Out, None
+    """
+    self.scale = scale
+    self.calls = 0
+
+  def evaluate(self,x):
+    """
+      Evaluates a sample.
+      @ In, x, float, the sample
+      @ Out, evaluate, tuple, (scaled sample, process id, number of evaluations of this object)
+    """
+    self.calls += 1
+    return x*self.scale,os.getpid(),self.calls
+
+  def fail(self,x):
+    """
+      Fails.
+      @ In, x, float, the sample
+      @ Out, None
+    """
+    raise ValueError('failing on purpose')
+
+def square(x):
+  """
+    A plain function job.
+    @ In, x, float, a number
+    @ Out, square, float, x squared
+  """
+  return x*x
+
+def runJobs(jobHandler,jobs):
+  """
+    Submits jobs and waits for all of them.
+    @ In, jobHandler, JobHandler, the job handler
+    @ In, jobs, list, (args, function) for each job
+    @ Out, finished, dict, {identifier: runner}
+  """
+  identifiers = list(str(i) for i in range(len(jobs)))
+  for identifier,(args,function) in zip(identifiers,jobs):
+    jobHandler.addJob(args,function,identifier)
+  finished = {}
+  start = time.time()
+  while len(finished) < len(jobs) and time.time()-start < 60:
+    for run in jobHandler.getFinished():
+      if run.identifier in identifiers:
+        finished[run.identifier] = run
+    time.sleep(0.01)
+  return finished
+
+## the workers are started from a server process that imports this script (see Runners.ProcessPoolRunner._getContext),
+## so the test itself must only run in the main process
+if __name__ == '__main__':
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+  runInfo = {'maxQueueSize':100, 'batchSize':2, 'internalParallel':True, 'internalParallelMethod':'processPool',
+             'Nodes':[], 'totalNumCoresUsed':2}
+  jobHandler = JobHandler()
+  jobHandler.initialize(runInfo,mh)
+  loop = threading.Thread(target=jobHandler.startLoop)
+  loop.daemon = True
+  loop.start()
+
+  ## methods of an object: the object goes to each worker once and stays there
+  scaler = Scaler(2.0)
+  finished = runJobs(jobHandler,list(((scaler,float(i)),Scaler.evaluate) for i in range(20)))
+  checkAnswer('method jobs finished',len(finished),20)
+  checkAnswer('method jobs runner type',sum(isinstance(run,Runners.ProcessPoolRunner) for run in finished.values()),20)
+  evaluations = dict((int(k),run.getEvaluation()) for k,run in finished.items())
+  checkAnswer('method jobs values',sum(abs(evaluations[i][0]-2.0*i) for i in range(20)),0.0)
+  pids = set(evaluation[1] for evaluation in evaluations.values())
+  checkAnswer('method jobs in other processes',os.getpid() in pids,False)
+  checkAnswer('method jobs number of processes',len(pids) <= 2,True)
+  ## every worker keeps evaluating the same copy of the object
+  lastCall = dict((pid,max(evaluation[2] for evaluation in evaluations.values() if evaluation[1] == pid)) for pid in pids)
+  checkAnswer('object shipped once per worker',sum(lastCall.values()),20)
+  checkAnswer('object in parent untouched',scaler.calls,0)
+
+  ## bound methods work the same way
+  finished = runJobs(jobHandler,list(((float(i),),scaler.evaluate) for i in range(4)))
+  checkAnswer('bound method jobs values',sum(abs(run.getEvaluation()[0]-2.0*int(k)) for k,run in finished.items()),0.0)
+
+  ## plain functions are sent along with each job
+  finished = runJobs(jobHandler,list(((float(i),),square) for i in range(5)))
+  checkAnswer('function jobs values',sum(abs(run.getEvaluation()-float(k)**2) for k,run in finished.items()),0.0)
+
+  ## within a step, the objects are shipped again when their state version changes
+  scaler.scale = 4.0
+  scaler.stateVersion = 1
+  finished = runJobs(jobHandler,list(((scaler,float(i)),Scaler.evaluate) for i in range(4)))
+  checkAnswer('new state version values',sum(abs(run.getEvaluation()[0]-4.0*int(k)) for k,run in finished.items()),0.0)
+
+  ## a new step ships the current state of the objects again
+  scaler.scale = 3.0
+  jobHandler.startingNewStep()
+  finished = runJobs(jobHandler,list(((scaler,float(i)),Scaler.evaluate) for i in range(4)))
+  checkAnswer('new step values',sum(abs(run.getEvaluation()[0]-3.0*int(k)) for k,run in finished.items()),0.0)
+
+  ## failures are reported through the return code, and the pool keeps working
+  finished = runJobs(jobHandler,[((scaler,1.0),Scaler.fail),((scaler,1.0),Scaler.evaluate)])
+  checkAnswer('failed job return code',finished['0'].getReturnCode(),-1)
+  checkAnswer('failed job evaluation',isinstance(finished['0'].getEvaluation(),Runners.Error),True)
+  checkAnswer('job after failure',finished['1'].getEvaluation()[0],3.0)
+  ## jobs that cannot be pickled fail as well
+  finished = runJobs(jobHandler,[((threading.Lock(),),square)])
+  checkAnswer('unpicklable job return code',finished['0'].getReturnCode(),-1)
+
+  ## killed jobs give their worker back
+  jobHandler.addJob((1000.0,),time.sleep,'sleeper')
+  start = time.time()
+  while jobHandler.numRunning() == 0 and time.time()-start < 10:
+    time.sleep(0.01)
+  jobHandler.terminateAll()
+  finished = runJobs(jobHandler,list(((scaler,float(i)),Scaler.evaluate) for i in range(4)))
+  checkAnswer('jobs after kill',len(finished),4)
+  checkAnswer('jobs after kill values',sum(abs(run.getEvaluation()[0]-3.0*int(k)) for k,run in finished.items()),0.0)
+
+  jobHandler.shutdown()
+
+  print(results)
+
+  sys.exit(results["fail"])
+
+"""
+  <TestInfo>
+    <name>framework.processPoolRunner</name>
+    <author>maljdp</author>
+    <created>2026-10-18</created>
+    <classesTested>Runners.ProcessPoolRunner, Runners.ProcessPool</classesTested>
+    <description>
+       This test performs Unit Tests for the ProcessPoolRunner, which runs internal jobs in persistent
+       local processes (RunInfo internalParallelMethod processPool)
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,149 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the ProcessSupervisor (subprocesses of the Code models)
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import time
+import threading
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import utils
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+import Runners
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, None
+  """
+  if abs(value - expected) > tol:
+    print("checking answer",comment,value,"!=",expected)
+    if updateResults:
+      results["fail"] += 1
+    return False
+  else:
+    if updateResults:
+      results["pass"] += 1
+    return True
+
+def sleeper(seconds,returnCode=0):
+  """
+    Command of a subprocess that sleeps, then exits.
+    @ In, seconds, float, the time to sleep
+    @ In, returnCode, int, optional, the exit status
+    @ Out, sleeper, list, the command
+  """
+  return [sys.executable,'-c','import time,sys; time.sleep({}); sys.exit({})'.format(seconds,returnCode)]
+
+supervisor = Runners.getProcessSupervisor()
+checkAnswer('one supervisor per process',supervisor is Runners.getProcessSupervisor(),True)
+
+## return codes, and the time it takes to be woken up once the subprocess is done
+start = time.time()
+process = supervisor.launch(sleeper(0.5))
+returnCode = process.wait()
+elapsed = time.time() - start
+checkAnswer('return code',returnCode,0)
+checkAnswer('woken up once done',elapsed >= 0.5,True)
+checkAnswer('woken up right away',elapsed < 0.5+supervisor.backstopTime,True)
+checkAnswer('error return code',supervisor.launch(sleeper(0,3)).wait(),3)
+
+## many subprocesses are watched by one thread
+numThreads = threading.active_count()
+processes = list(supervisor.launch(sleeper(0.05*(i%10))) for i in range(40))
+checkAnswer('watched subprocesses',supervisor.numWatched() > 0,True)
+checkAnswer('one supervisor thread',threading.active_count() - numThreads <= 1,True)
+checkAnswer('many return codes',sum(process.wait() for process in processes),0)
+checkAnswer('all done',all(process.isDone() for process in processes),True)
+## the supervisor thread stops once there is nothing to watch
+start = time.time()
+while threading.active_count() > numThreads and time.time()-start < 10:
+  time.sleep(0.01)
+checkAnswer('supervisor thread stopped',threading.active_count(),numThreads)
+checkAnswer('nothing watched',supervisor.numWatched(),0)
+
+## walltime
+start = time.time()
+process = supervisor.launch(sleeper(30),walltime=0.3)
+process.wait()
+elapsed = time.time() - start
+checkAnswer('walltime exceeded',process.timedOut,True)
+checkAnswer('killed at walltime',0.3 <= elapsed < 5,True)
+process = supervisor.launch(sleeper(0.1),walltime=10)
+checkAnswer('walltime not exceeded return code',process.wait(),0)
+checkAnswer('walltime not exceeded',process.timedOut,False)
+
+## killing the subprocesses of a thread (as when a job is terminated)
+waited = {}
+def launchAndWait():
+  """
+    Launches a long subprocess and waits for it.
+    @ In, None
+    @ Out, None
+  """
+  waited['process'] = supervisor.launch(sleeper(30))
+  waited['returnCode'] = waited['process'].wait()
+thread = threading.Thread(target=launchAndWait)
+thread.start()
+other = supervisor.launch(sleeper(0.5))
+start = time.time()
+while 'process' not in waited and time.time()-start < 10:
+  time.sleep(0.01)
+supervisor.kill(thread)
+thread.join(10)
+checkAnswer('killed thread woken up',thread.is_alive(),False)
+checkAnswer('killed subprocess',waited['process'].killed,True)
+checkAnswer('killed return code',waited['returnCode'] != 0,True)
+checkAnswer('other subprocesses untouched',other.wait(),0)
+checkAnswer('other subprocesses not killed',other.killed,False)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.processSupervisor</name>
+    <author>maljdp</author>
+    <created>2026-10-18</created>
+    <classesTested>Runners.ProcessSupervisor</classesTested>
+    <description>
+       This test performs Unit Tests for the ProcessSupervisor, which launches the subprocesses of the
+       Code models and watches them (exit and walltime) from a single thread
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,255 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the generation of batches of samples by the Samplers
+  (generateInputBatch, compared with as many calls to generateInput for the same seed).
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import shutil
+import copy
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(os.path.abspath(__file__))]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+from Simulation import Simulation
+import utils.TreeStructure as TS
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+## the samplers, with the entities they need, are read from a RAVEN input
+simulationInput = """
+<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sample</Sequence>
+    <batchSize>1</batchSize>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="Dummy">dummy</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+  </Steps>
+  <Models>
+    <Dummy name="dummy" subType=""/>
+  </Models>
+  <Distributions>
+    <Uniform name="uniform">
+      <lowerBound>-1</lowerBound>
+      <upperBound>2</upperBound>
+    </Uniform>
+    <Normal name="normal">
+      <mean>0.5</mean>
+      <sigma>0.3</sigma>
+      <lowerBound>0</lowerBound>
+      <upperBound>1</upperBound>
+    </Normal>
+    <Triangular name="triangular">
+      <apex>1</apex>
+      <min>0</min>
+      <max>3</max>
+    </Triangular>
+  </Distributions>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>50</limit>
+        <initialSeed>1234</initialSeed>
+      </samplerInit>
+      <variable name="x1">
+        <distribution>uniform</distribution>
+      </variable>
+      <variable name="x2">
+        <distribution>normal</distribution>
+      </variable>
+      <variable name="x3">
+        <distribution>triangular</distribution>
+      </variable>
+    </MonteCarlo>
+    <MonteCarlo name="mcUniform">
+      <samplerInit>
+        <limit>50</limit>
+        <initialSeed>1234</initialSeed>
+        <samplingType>uniform</samplingType>
+      </samplerInit>
+      <variable name="x1">
+        <distribution>uniform</distribution>
+      </variable>
+      <variable name="x2">
+        <distribution>normal</distribution>
+      </variable>
+      <variable name="x3">
+        <distribution>triangular</distribution>
+      </variable>
+    </MonteCarlo>
+    <Stratified name="lhs">
+      <samplerInit>
+        <initialSeed>1234</initialSeed>
+      </samplerInit>
+      <variable name="x1">
+        <distribution>uniform</distribution>
+        <grid construction="equal" steps="50" type="CDF">0 1</grid>
+      </variable>
+      <variable name="x2">
+        <distribution>normal</distribution>
+        <grid construction="equal" steps="50" type="value">0.1 0.9</grid>
+      </variable>
+      <variable name="x3">
+        <distribution>triangular</distribution>
+        <grid construction="equal" steps="50" type="CDF">0.05 0.95</grid>
+      </variable>
+    </Stratified>
+  </Samplers>
+  <DataObjects>
+    <PointSet name="placeholder">
+      <Input>x1,x2,x3</Input>
+      <Output>OutputPlaceHolder</Output>
+    </PointSet>
+    <PointSet name="samples">
+      <Input>x1,x2,x3</Input>
+      <Output>OutputPlaceHolder</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+testDir = os.path.abspath('SamplerInputBatch')
+if os.path.exists(testDir):
+  shutil.rmtree(testDir)
+os.makedirs(testDir)
+inputFile = os.path.join(testDir,'samplers.xml')
+with open(inputFile,'w') as inputStream:
+  inputStream.write(simulationInput)
+
+simulation = Simulation(frameworkDir)
+simulation.setInputFiles([inputFile])
+root = TS.parse(open(inputFile,'r')).getroot()
+simulation.XMLpreprocess(root,testDir)
+simulation.XMLread(root,runInfoSkip=set(["DefaultInputFile"]),xmlFilename=inputFile)
+simulation.initialize()
+
+model = simulation.whichDict['Models']['dummy']
+inputs = [simulation.whichDict['DataObjects']['placeholder']]
+
+def sameInfo(first,second):
+  """
+    Checks that the information of two samples is identical
+    @ In, first, object, the information (or part of it) of the first sample
+    @ In, second, object, the information (or part of it) of the second sample
+    @ Out, same, bool, True if identical
+  """
+  if isinstance(first,dict):
+    return isinstance(second,dict) and set(first.keys()) == set(second.keys()) and all(sameInfo(first[key],second[key]) for key in first)
+  if isinstance(first,(list,tuple)) and not isinstance(first,np.ndarray):
+    return len(first) == len(second) and all(sameInfo(a,b) for a,b in zip(first,second))
+  return np.array_equal(np.asarray(first),np.asarray(second))
+
+def oneAtATime(sampler):
+  """
+    Generates all the samples of the sampler with a call to generateInput for each
+    @ In, sampler, Sampler, the sampler
+    @ Out, infos, list, the information (inputInfo) of each sample
+  """
+  sampler.initialize()
+  infos = []
+  while sampler.amIreadyToProvideAnInput():
+    found, _ = sampler.generateInput(model,inputs)
+    infos.append(copy.deepcopy(sampler.inputInfo))
+  return infos
+
+def byBatches(sampler,batchSize):
+  """
+    Generates all the samples of the sampler with calls to generateInputBatch
+    @ In, sampler, Sampler, the sampler
+    @ In, batchSize, int, the number of samples requested to each call
+    @ Out, infos, list, the information (inputInfo) of each sample
+    @ Out, sizes, list, the number of samples returned by each call
+  """
+  sampler.initialize()
+  infos = []
+  sizes = []
+  while sampler.amIreadyToProvideAnInput():
+    newInputs = sampler.generateInputBatch(inputs,model,batchSize)
+    sizes.append(len(newInputs))
+    infos.extend(inputInfo for _, _, inputInfo in newInputs)
+  return infos, sizes
+
+for name in ['mc','mcUniform','lhs']:
+  sampler = simulation.whichDict['Samplers'][name]
+  # link the distributions, as the steps do
+  simulation.generateAllAssemblers(sampler)
+  checkTrue(name+' generates batches of samples', sampler.canGenerateInputBatch(), True)
+  reference = oneAtATime(sampler)
+  checkTrue(name+' number of samples', len(reference), 50)
+  ## a batch per sample, batches not dividing the number of samples, all the samples (and more) in one batch
+  for batchSize in [1, 7, 50, 64]:
+    infos, sizes = byBatches(sampler,batchSize)
+    expectedSizes = [batchSize]*(50//batchSize) + ([50%batchSize] if 50%batchSize else [])
+    checkTrue(name+' batches of '+str(batchSize)+', sizes', sizes, expectedSizes)
+    checkTrue(name+' batches of '+str(batchSize)+', number of samples', len(infos), len(reference))
+    checkTrue(name+' batches of '+str(batchSize)+', samples', all(sameInfo(info,ref) for info,ref in zip(infos,reference)), True)
+  ## the samples of a batch are all different
+  checkTrue(name+' different samples', len(set(info['SampledVars']['x1'] for info in reference)), 50)
+
+simulation.jobHandler.shutdown()
+shutil.rmtree(testDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.samplerInputBatch</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>Samplers.Sampler, Samplers.MonteCarlo, Samplers.Stratified</classesTested>
+    <description>
+       This test checks that the samples generated in batches (generateInputBatch) by the MonteCarlo (random and
+       uniform sampling) and Stratified samplers are identical to the ones generated one at a time (generateInput)
+       with the same seed, for several batch sizes.
+    </description>
+  </TestInfo>
+"""
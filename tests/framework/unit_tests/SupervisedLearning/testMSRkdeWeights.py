@@ -0,0 +1,120 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the kernel density weights of the partitions of the MSR ROM
+  (computed by chunks of query points, compared with a dense computation).
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import math
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(os.path.abspath(__file__))]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+sys.path.append(os.path.join(frameworkDir,'contrib','AMSC'))
+sys.path.append(os.path.join(frameworkDir,'SupervisedLearning'))
+from SupervisedLearning import MSR
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+kernels = {'epanechnikov':lambda u: 0.75*(1.-u**2)*(np.abs(u) < 1),
+           'gaussian':lambda u: 1./np.sqrt(2*math.pi)*np.exp(-0.5*u**2)}
+
+def denseWeights(X, queries, partitions, kernel, bandwidth, knn):
+  """
+    Computes the kernel density weights of the partitions with the full matrix of the distances between
+    the query and the training points
+    @ In, X, np.array, the training points
+    @ In, queries, np.array, the query points
+    @ In, partitions, list, the partitions ({key:training point indices}) of each target
+    @ In, kernel, string, the kernel name
+    @ In, bandwidth, float or string, the bandwidth ('variable' for the distance of the knn-th closest training point)
+    @ In, knn, int, the number of neighbors of the variable bandwidth
+    @ Out, weights, list, the weights ({key:np.array}) of each target
+  """
+  dists = np.sqrt(((queries[:,np.newaxis,:]-X[np.newaxis,:,:])**2).sum(axis=-1))
+  if bandwidth == 'variable':
+    h = np.sort(dists,axis=1)[:,knn-1]
+  else:
+    h = np.full(len(queries),bandwidth)
+  values = kernels[kernel](dists/h[:,np.newaxis])
+  return [dict((key,values[:,np.asarray(indices,dtype=int)].sum(axis=1)) for key,indices in targetPartitions.items()) for targetPartitions in partitions]
+
+np.random.seed(3)
+X = np.random.rand(60,2)
+Y = {'y1':np.sin(4.*X[:,0])*np.cos(3.*X[:,1]), 'y2':(X[:,0]-0.5)**2-(X[:,1]-0.3)**2}
+queries = np.vstack([np.random.rand(41,2), X[:5], [[2.,2.]]])
+
+for kernel in ['epanechnikov','gaussian']:
+  for bandwidth in ['0.3','variable']:
+    rom = MSR.MSR(mh, Features='x1,x2', Target='y1,y2', kernel=kernel, bandwidth=bandwidth, knn='8', simplification='0.0')
+    rom.train({'x1':X[:,0],'x2':X[:,1],'y1':Y['y1'],'y2':Y['y2']})
+    partitions = [rom._MSR__amsc[index].Partitions(rom.simplification) for index in range(len(rom.target))]
+    ## the weights are computed in the normalized features (as the ROM does)
+    normalized = np.column_stack([(queries[:,f]-rom.muAndSigmaFeatures[feat][0])/rom.muAndSigmaFeatures[feat][1] for f,feat in enumerate(rom.features)])
+    reference = denseWeights(rom.X, normalized, partitions, kernel, 'variable' if bandwidth == 'variable' else float(bandwidth), 8)
+    ## one query point per chunk, a few query points per chunk, all of them at once
+    for chunkSize in [1, 7, len(queries)]:
+      rom.evaluationChunkSize = chunkSize*X.shape[0]
+      weights = rom._MSR__kdeWeights(normalized, partitions)
+      for index, target in enumerate(rom.target):
+        checkTrue('partitions of '+target, sorted(weights[index].keys()), sorted(reference[index].keys()))
+        same = all(np.allclose(weights[index][key],reference[index][key],rtol=1e-12,atol=1e-14) for key in reference[index])
+        checkTrue(kernel+' kernel, bandwidth '+bandwidth+', chunks of '+str(chunkSize)+', '+target, same, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.MSRkdeWeights</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>SupervisedLearning.MSR</classesTested>
+    <description>
+       This test checks the kernel density weights of the partitions of the MSR ROM, computed by chunks of query
+       points (only with the training points within the bandwidth for the kernels with a finite support), against
+       a dense computation, for the Epanechnikov and gaussian kernels with a fixed and a variable bandwidth.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,129 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the NDinvDistWeight ROM with a given number of neighbors
+  (weighted through a KD-tree, compared with the crow inverse distance weighting of all the training points).
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(os.path.abspath(__file__))]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+from SupervisedLearning import NDinvDistWeight
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+np.random.seed(7)
+X = np.random.rand(50,3)
+Y = {'y1':np.sin(4.*X[:,0])*np.cos(3.*X[:,1])+X[:,2], 'y2':(X[:,0]-0.5)**2-(X[:,1]-0.3)**2*X[:,2]}
+trainingSet = {'x1':X[:,0],'x2':X[:,1],'x3':X[:,2],'y1':Y['y1'],'y2':Y['y2']}
+## random points, some training points (exact values) and points outside of the training domain
+queries = np.vstack([np.random.rand(100,3), X[:5], [[2.,2.,2.],[-1.,0.5,0.5]]])
+evaluationSet = {'x1':queries[:,0],'x2':queries[:,1],'x3':queries[:,2]}
+
+## with as many neighbors as training points, the KD-tree weighting must match the crow inverse distance weighting
+for p in ['1','2','3']:
+  crowRom = NDinvDistWeight.NDinvDistWeight(mh, Features='x1,x2,x3', Target='y1,y2', p=p)
+  crowRom.train(trainingSet)
+  reference = crowRom.evaluate(evaluationSet)
+  for neighbors in [str(X.shape[0]), str(2*X.shape[0])]:
+    treeRom = NDinvDistWeight.NDinvDistWeight(mh, Features='x1,x2,x3', Target='y1,y2', p=p, n_neighbors=neighbors)
+    treeRom.train(trainingSet)
+    prediction = treeRom.evaluate(evaluationSet)
+    for target in ['y1','y2']:
+      checkTrue('p '+p+', '+neighbors+' neighbors, '+target, np.allclose(prediction[target],reference[target],rtol=1e-12,atol=1e-14), True)
+      checkTrue('p '+p+', '+neighbors+' neighbors, exact values of '+target, np.allclose(prediction[target][100:105],Y[target][:5],rtol=1e-12,atol=1e-14), True)
+
+## with fewer neighbors, only the nearest training points are weighted
+treeRom = NDinvDistWeight.NDinvDistWeight(mh, Features='x1,x2,x3', Target='y1,y2', p='2', n_neighbors='4')
+treeRom.train(trainingSet)
+prediction = treeRom.evaluate(evaluationSet)
+normalized = np.column_stack([(X[:,f]-treeRom.muAndSigmaFeatures[feat][0])/treeRom.muAndSigmaFeatures[feat][1] for f,feat in enumerate(treeRom.features)])
+normalizedQueries = np.column_stack([(queries[:,f]-treeRom.muAndSigmaFeatures[feat][0])/treeRom.muAndSigmaFeatures[feat][1] for f,feat in enumerate(treeRom.features)])
+for target in ['y1','y2']:
+  expected = np.zeros(len(queries))
+  for index, query in enumerate(normalizedQueries):
+    distances = np.sqrt(((normalized-query)**2).sum(axis=1))
+    nearest = np.argsort(distances)[:4]
+    if distances[nearest[0]] == 0.0:
+      expected[index] = Y[target][nearest[0]]
+    else:
+      weights = (1./distances[nearest])**(X.shape[1]+1)
+      expected[index] = (weights*Y[target][nearest]).sum()/weights.sum()
+  checkTrue('4 neighbors, '+target, np.allclose(prediction[target],expected,rtol=1e-12,atol=1e-14), True)
+
+## invalid power parameters
+for p, neighbors in [('0',None), ('-1',None), ('0.5','5')]:
+  kwargs = {'Features':'x1,x2,x3', 'Target':'y1,y2', 'p':p}
+  if neighbors is not None:
+    kwargs['n_neighbors'] = neighbors
+  try:
+    NDinvDistWeight.NDinvDistWeight(mh, **kwargs)
+    checkTrue('IOError for p '+p, False, True)
+  except IOError:
+    checkTrue('IOError for p '+p, True, True)
+## p lower than 1 is still accepted by the crow inverse distance weighting
+try:
+  NDinvDistWeight.NDinvDistWeight(mh, Features='x1,x2,x3', Target='y1,y2', p='0.5')
+  checkTrue('p 0.5 without neighbors', True, True)
+except IOError:
+  checkTrue('p 0.5 without neighbors', False, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.NDinvDistWeightNeighbors</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>SupervisedLearning.NDinvDistWeight</classesTested>
+    <description>
+       This test checks the NDinvDistWeight ROM with a given number of neighbors (weighted through a KD-tree):
+       with as many neighbors as training points it must match the crow inverse distance weighting, with fewer
+       neighbors it must match a weighting of the nearest training points only. It also checks the validation of
+       the power parameter.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,297 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the evaluation of many points at once of the GaussPolynomialRom and HDMRRom
+  (compared with the evaluation of each point on its own and with the sum of the expansion terms).
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import shutil
+import numpy as np
+from six.moves import cPickle as pickle
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(os.path.abspath(__file__))]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+utils.add_path(os.path.join(frameworkDir,'contrib','AMSC'))
+utils.add_path(os.path.join(frameworkDir,'contrib'))
+from Simulation import Simulation
+import utils.TreeStructure as TS
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+## the ROMs are trained by a RAVEN input: a GaussPolynomialRom on a Smolyak sparse grid, an HDMRRom on its cut points
+simulationInput = """
+<Simulation verbosity="quiet">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sampleGP,trainGP,sampleHDMR,trainHDMR</Sequence>
+    <batchSize>1</batchSize>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sampleGP">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="SparseGridCollocation">sgc</Sampler>
+      <Output class="DataObjects" type="PointSet">samplesGP</Output>
+    </MultiRun>
+    <RomTrainer name="trainGP">
+      <Input class="DataObjects" type="PointSet">samplesGP</Input>
+      <Output class="Models" type="ROM">gp</Output>
+    </RomTrainer>
+    <MultiRun name="sampleHDMR">
+      <Input class="DataObjects" type="PointSet">placeholder</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="Sobol">sobol</Sampler>
+      <Output class="DataObjects" type="PointSet">samplesHDMR</Output>
+    </MultiRun>
+    <RomTrainer name="trainHDMR">
+      <Input class="DataObjects" type="PointSet">samplesHDMR</Input>
+      <Output class="Models" type="ROM">hdmr</Output>
+    </RomTrainer>
+  </Steps>
+  <Models>
+    <ExternalModel name="model" subType="" ModuleToLoad="model">
+      <variables>x1,x2,x3,y1,y2</variables>
+    </ExternalModel>
+    <ROM name="gp" subType="GaussPolynomialRom">
+      <Target>y1,y2</Target>
+      <Features>x1,x2,x3</Features>
+      <IndexSet>TotalDegree</IndexSet>
+      <PolynomialOrder>4</PolynomialOrder>
+    </ROM>
+    <ROM name="hdmr" subType="HDMRRom">
+      <SobolOrder>2</SobolOrder>
+      <Target>y1,y2</Target>
+      <Features>x1,x2,x3</Features>
+      <IndexSet>TotalDegree</IndexSet>
+      <PolynomialOrder>3</PolynomialOrder>
+    </ROM>
+  </Models>
+  <Distributions>
+    <Uniform name="uniform">
+      <lowerBound>-1</lowerBound>
+      <upperBound>2</upperBound>
+    </Uniform>
+    <Normal name="normal">
+      <mean>0.5</mean>
+      <sigma>0.3</sigma>
+    </Normal>
+  </Distributions>
+  <Samplers>
+    <SparseGridCollocation name="sgc">
+      <variable name="x1">
+        <distribution>uniform</distribution>
+      </variable>
+      <variable name="x2">
+        <distribution>normal</distribution>
+      </variable>
+      <variable name="x3">
+        <distribution>uniform</distribution>
+      </variable>
+      <ROM class="Models" type="ROM">gp</ROM>
+    </SparseGridCollocation>
+    <Sobol name="sobol">
+      <variable name="x1">
+        <distribution>uniform</distribution>
+      </variable>
+      <variable name="x2">
+        <distribution>normal</distribution>
+      </variable>
+      <variable name="x3">
+        <distribution>uniform</distribution>
+      </variable>
+      <ROM class="Models" type="ROM">hdmr</ROM>
+    </Sobol>
+  </Samplers>
+  <DataObjects>
+    <PointSet name="placeholder">
+      <Input>x1,x2,x3</Input>
+      <Output>OutputPlaceHolder</Output>
+    </PointSet>
+    <PointSet name="samplesGP">
+      <Input>x1,x2,x3</Input>
+      <Output>y1,y2</Output>
+    </PointSet>
+    <PointSet name="samplesHDMR">
+      <Input>x1,x2,x3</Input>
+      <Output>y1,y2</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+model = '''
+import numpy as np
+def run(self,Input):
+  """
+    Model evaluated to train the ROMs
+    @ In, Input, dict, the inputs
+    @ Out, None
+  """
+  self.y1 = np.exp(0.5*self.x1)*self.x2 + self.x3**3
+  self.y2 = np.sin(self.x1 + self.x2*self.x3)
+'''
+
+testDir = os.path.abspath('PolynomialRomBatchEvaluation')
+if os.path.exists(testDir):
+  shutil.rmtree(testDir)
+os.makedirs(testDir)
+with open(os.path.join(testDir,'model.py'),'w') as modelFile:
+  modelFile.write(model)
+inputFile = os.path.join(testDir,'train.xml')
+with open(inputFile,'w') as inputStream:
+  inputStream.write(simulationInput)
+
+simulation = Simulation(frameworkDir)
+simulation.setInputFiles([inputFile])
+root = TS.parse(open(inputFile,'r')).getroot()
+simulation.XMLpreprocess(root,testDir)
+simulation.XMLread(root,runInfoSkip=set(["DefaultInputFile"]),xmlFilename=inputFile)
+simulation.initialize()
+simulation.run()
+simulation.jobHandler.shutdown()
+
+features = ['x1','x2','x3']
+targets = ['y1','y2']
+np.random.seed(42)
+points = np.column_stack([np.random.uniform(-1,2,37),np.random.normal(0.5,0.3,37),np.random.uniform(-1,2,37)])
+
+def evaluateBatch(rom):
+  """
+    Evaluates all the points with one request
+    @ In, rom, Models.ROM, the ROM
+    @ Out, values, np.array, shape (n_points,n_targets)
+  """
+  request = dict((var,points[:,v]) for v,var in enumerate(features))
+  evaluation = rom.evaluate(request)
+  return np.column_stack([evaluation[target] for target in targets])
+
+def evaluatePointwise(rom):
+  """
+    Evaluates the points one by one
+    @ In, rom, Models.ROM, the ROM
+    @ Out, values, np.array, shape (n_points,n_targets)
+  """
+  values = np.zeros((len(points),len(targets)))
+  for p,point in enumerate(points):
+    evaluation = rom.evaluate(dict((var,np.atleast_1d(point[v])) for v,var in enumerate(features)))
+    values[p] = [evaluation[target][0] for target in targets]
+  return values
+
+def expansionSum(engine,point,varNames):
+  """
+    Evaluates the polynomial expansion at a point as the sum of its terms (one polynomial product per term)
+    @ In, engine, GaussPolynomialRom, the trained engine
+    @ In, point, np.array, the values of the variables varNames
+    @ In, varNames, list, the variables of point
+    @ Out, values, list, the value of each target
+  """
+  stdPt = [engine.distDict[var].convertToQuad(engine.quads[var].type,point[varNames.index(var)]) for var in engine.sparseGrid.varNames]
+  return [sum(coeff*engine._multiDPolyBasisEval(idx,stdPt) for idx,coeff in engine.polyCoeffDict[target].items()) for target in engine.target]
+
+def hdmrSum(engine,point):
+  """
+    Evaluates the cut-HDMR expansion at a point as the sum of its cut terms
+    @ In, engine, HDMRRom, the trained engine
+    @ In, point, np.array, the values of the features
+    @ Out, values, np.array, the value of each target
+  """
+  values = np.zeros(len(engine.target))
+  for term,mult in engine.reducedTerms.items():
+    if term == ():
+      values += np.asarray([engine.refSoln[target] for target in engine.target])*mult
+    else:
+      termValues = dict(zip(engine.ROMs[term].target,expansionSum(engine.ROMs[term],point,engine.features)))
+      values += np.asarray([termValues[target] for target in engine.target])*mult
+  return values
+
+## GaussPolynomialRom
+gp = simulation.whichDict['Models']['gp']
+gpEngine = gp.supervisedEngine.supervisedContainer[0]
+batch = evaluateBatch(gp)
+checkTrue('GaussPolynomialRom one value per point',batch.shape,(len(points),len(targets)))
+checkTrue('GaussPolynomialRom batch equals pointwise',np.allclose(batch,evaluatePointwise(gp),rtol=1e-12,atol=1e-12),True)
+reference = np.asarray([expansionSum(gpEngine,point,features) for point in points])
+reference = reference[:,[gpEngine.target.index(target) for target in targets]]
+checkTrue('GaussPolynomialRom batch equals the sum of the expansion terms',np.allclose(batch,reference,rtol=1e-12,atol=1e-12),True)
+## the points are evaluated by chunks (here of 2 or 3 points)
+gpEngine.evaluationChunkSize = 3*len(gpEngine.evaluationPlan['orders'])-1
+checkTrue('GaussPolynomialRom evaluated by chunks',np.allclose(evaluateBatch(gp),batch,rtol=1e-12,atol=1e-12),True)
+## ROMs pickled before the evaluation plan was introduced build it when they are evaluated
+oldEngine = pickle.loads(pickle.dumps(gpEngine))
+del oldEngine.__dict__['evaluationPlan']
+del oldEngine.__dict__['evaluationChunkSize']
+gp.supervisedEngine.supervisedContainer[0] = oldEngine
+checkTrue('GaussPolynomialRom without evaluation plan',np.allclose(evaluateBatch(gp),batch,rtol=1e-12,atol=1e-12),True)
+checkTrue('GaussPolynomialRom evaluation plan rebuilt',oldEngine.evaluationPlan is not None,True)
+
+## HDMRRom
+hdmr = simulation.whichDict['Models']['hdmr']
+hdmrEngine = hdmr.supervisedEngine.supervisedContainer[0]
+batch = evaluateBatch(hdmr)
+checkTrue('HDMRRom one value per point',batch.shape,(len(points),len(targets)))
+checkTrue('HDMRRom batch equals pointwise',np.allclose(batch,evaluatePointwise(hdmr),rtol=1e-12,atol=1e-12),True)
+reference = np.asarray([hdmrSum(hdmrEngine,point) for point in points])
+reference = reference[:,[hdmrEngine.target.index(target) for target in targets]]
+checkTrue('HDMRRom batch equals the sum of the cut terms',np.allclose(batch,reference,rtol=1e-12,atol=1e-12),True)
+oldEngine = pickle.loads(pickle.dumps(hdmrEngine))
+for term in oldEngine.ROMs.keys():
+  del oldEngine.ROMs[term].__dict__['evaluationPlan']
+hdmr.supervisedEngine.supervisedContainer[0] = oldEngine
+checkTrue('HDMRRom without evaluation plans',np.allclose(evaluateBatch(hdmr),batch,rtol=1e-12,atol=1e-12),True)
+
+shutil.rmtree(testDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.PolynomialRomBatchEvaluation</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>SupervisedLearning.GaussPolynomialRom, SupervisedLearning.HDMRRom</classesTested>
+    <description>
+       This test checks that the GaussPolynomialRom and HDMRRom evaluate many points at once as one by one and as the
+       sum of the terms of their expansions, also by chunks of points and for ROMs pickled without evaluation plan.
+    </description>
+  </TestInfo>
+"""
@@ -99,6 +99,66 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+##################
+# cColumnarArray #
+##################
+# columns: float, int, string, history
+testColumns = cached_ndarray.cColumnarArray(width=4,length=2)
+for i in range(10):
+  testColumns.append([0.5*i, i, 'rlz{}'.format(i), np.arange(i%3+1,dtype=float)])
+checkAnswer('columnar length',len(testColumns),10)
+checkAnswer('columnar width',testColumns.width,4)
+# growth should have happened without losing anything
+checkAnswer('columnar capacity',testColumns.capacity >= 10,True)
+# typed columns
+checkAnswer('columnar float column type',testColumns.getColumn(0).dtype == np.dtype(float),True)
+checkAnswer('columnar int column type',testColumns.getColumn(1).dtype == np.dtype(int),True)
+checkAnswer('columnar string column type',testColumns.getColumn(2).dtype == np.dtype(object),True)
+checkAnswer('columnar history column ragged',testColumns.isRagged(3),True)
+# element and slice access, matching cNDarray
+checkAnswer('columnar entry [4,0]',testColumns[4,0],2.0)
+checkAnswer('columnar entry [-1,1]',testColumns[-1,1],9)
+if testColumns[3,2] == 'rlz3':
+  results['pass'] += 1
+else:
+  print('checking columnar string entry:',testColumns[3,2],'!= rlz3')
+  results['fail'] += 1
+row = testColumns[5]
+checkAnswer('columnar row length',len(row),4)
+checkAnswer('columnar row history length',len(row[3]),3)
+checkAnswer('columnar column slice',testColumns[2:5,1].sum(),9)
+checkAnswer('columnar multi-column shape',testColumns[:,(0,2)].shape[1],2)
+# ragged storage
+values,offsets = testColumns.getRagged(3)
+checkAnswer('columnar ragged values length',len(values),19)
+checkAnswer('columnar ragged offsets length',len(offsets),11)
+checkAnswer('columnar ragged row 2',testColumns[2,3][-1],2.0)
+checkAnswer('columnar nonuniform histories',testColumns.getUniformHistories(3) is None,True)
+# promotion: int column receiving a float becomes float
+testColumns.append([1, 2.5, 'last', np.array([7.0])])
+checkAnswer('columnar promoted column type',testColumns.getColumn(1).dtype == np.dtype(float),True)
+checkAnswer('columnar promoted value',testColumns[-1,1],2.5)
+checkAnswer('columnar promoted old value',testColumns[9,1],9.0)
+# change a value
+testColumns[0,0] = 42.0
+checkAnswer('columnar set value',testColumns[0,0],42.0)
+# add and remove entities
+testColumns.addEntity([1.0]*len(testColumns))
+checkAnswer('columnar add entity width',testColumns.width,5)
+checkAnswer('columnar add entity value',testColumns[3,4],1.0)
+testColumns.removeEntity(0)
+checkAnswer('columnar remove entity width',testColumns.width,4)
+checkAnswer('columnar remove entity shift',testColumns[4,0],4)
+# bulk extension with equal-length histories
+testBulk = cached_ndarray.cColumnarArray(width=2,length=1)
+testBulk.extend([np.arange(5,dtype=float),np.ones((5,3))])
+testBulk.extend([np.arange(2,dtype=float),2.0*np.ones((2,3))])
+checkAnswer('columnar extend length',len(testBulk),7)
+checkAnswer('columnar extend scalar',testBulk[6,0],1.0)
+uniform = testBulk.getUniformHistories(1)
+checkAnswer('columnar uniform histories rows',uniform.shape[0],7)
+checkAnswer('columnar uniform histories sum',uniform.sum(),27.0)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -0,0 +1,160 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the csvUtils methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import numpy as np
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+sys.path.append(os.path.join(frameworkDir,'CodeInterfaces','Utilities'))
+from utils import csvUtils
+import csvUtilities
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def checkArray(comment,value,expected):
+  """
+    Checks that two arrays have the same shape and exactly the same values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to check
+    @ In, expected, np.ndarray, the expected array
+    @ Out, None
+  """
+  if value.shape == expected.shape and np.array_equal(np.isnan(value),np.isnan(expected)) and \
+     np.array_equal(value[~np.isnan(value)],expected[~np.isnan(expected)]):
+    results["pass"] += 1
+    return True
+  else:
+    print("checking array",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def loadCsv(content,**kwargs):
+  """
+    Writes a CSV and loads it with csvUtils.loadNumericCsv
+    @ In, content, string, the content of the CSV
+    @ In, kwargs, dict, the options of loadNumericCsv
+    @ Out, loadCsv, tuple, (headers, data)
+  """
+  with open(fileName,'w') as csvFile:
+    csvFile.write(content)
+  return csvUtils.loadNumericCsv(fileName,**kwargs)
+
+fileName = 'testCsvUtils.csv'
+
+## full precision values, read in several blocks, are the same as with numpy.loadtxt
+np.random.seed(3)
+values = np.random.randn(500,4)*np.array([1.,1e-8,1e8,1.])
+values[5,2] = np.nan
+values[7,3] = np.inf
+content = 'time, x ,y,z\n'+''.join(','.join(repr(float(v)) for v in row)+'\n' for row in values)
+headers,data = loadCsv(content,blockSize=1000)
+checkTrue('headers',headers,['time','x','y','z'])
+checkArray('values in blocks',data,values)
+headers,data = loadCsv(content)
+checkArray('values in one block',data,values)
+checkArray('same as loadtxt',data,np.loadtxt(fileName,delimiter=',',skiprows=1,ndmin=2))
+
+## a single row is still 2D, and no rows at all give an empty table
+headers,data = loadCsv('a,b\n1,2')
+checkArray('single row',data,np.array([[1.,2.]]))
+headers,data = loadCsv('a,b\n')
+checkTrue('no rows',data.shape,(0,2))
+
+## Windows line endings, blanks, blank lines and comments
+headers,data = loadCsv('a,b\r\n 1.5 , 2\r\n\r\n3,4e-3\r\n')
+checkArray('windows line endings',data,np.array([[1.5,2.],[3.,4e-3]]))
+headers,data = loadCsv('a,b\n1,2\n# a comment\n3,4\n')
+checkArray('comment',data,np.array([[1.,2.],[3.,4.]]))
+
+## other delimiters, lines to skip and trailing delimiters
+headers,data = loadCsv('a;b;\nunits;units;\n1;2;\n3;4;\n',delimiter=';',skipRows=1)
+checkTrue('trailing delimiter headers',headers,['a','b'])
+checkArray('trailing delimiter',data,np.array([[1.,2.],[3.,4.]]))
+
+## selected columns
+headers,data = loadCsv('a,b,c\n1,2,3\n4,5,6\n',usecols=(0,2))
+checkArray('usecols',data,np.array([[1.,3.],[4.,6.]]))
+
+## data rows with more fields than the header: the extra fields are ignored if only the header columns are kept
+content = 'a,b\n1,2,3\n4,5,6\n'
+headers,data = loadCsv(content,headerColumns=True)
+checkTrue('extra fields headers',headers,['a','b'])
+checkArray('extra fields ignored',data,np.array([[1.,2.],[4.,5.]]))
+checkArray('extra fields ignored, same as loadtxt',data,np.loadtxt(fileName,delimiter=',',skiprows=1,usecols=(0,1),ndmin=2))
+headers,data = loadCsv(content)
+checkArray('extra fields kept, same as loadtxt',data,np.loadtxt(fileName,delimiter=',',skiprows=1,ndmin=2))
+headers,data = loadCsv('a,b\n1,2\n4,5,6\n7,8\n',headerColumns=True,blockSize=6)
+checkArray('extra fields in some rows ignored',data,np.array([[1.,2.],[4.,5.],[7.,8.]]))
+with open(fileName,'w') as csvFile:
+  csvFile.write('a;b\nunits;units\n1;2;3\n4;5;6\n')
+csvUtility = csvUtilities.csvUtilityClass([fileName],linesToSkipAfterHeader=1,delimeter=';')
+checkTrue('csvUtilityClass extra fields headers',csvUtility.dataContainer[fileName]['headers'],['a','b'])
+checkArray('csvUtilityClass extra fields ignored',csvUtility.dataContainer[fileName]['data'],np.array([[1.,2.],[4.,5.]]))
+
+## rows with a wrong number of fields are rejected as numpy.loadtxt does, even if the total number of values fits
+try:
+  loadCsv('a,b\n1,2,3\n4\n')
+  checkTrue('wrong number of fields rejected',False,True)
+except ValueError:
+  checkTrue('wrong number of fields rejected',True,True)
+
+## invalid values are rejected as numpy.loadtxt does
+try:
+  loadCsv('a,b\n1,2\n3,x\n')
+  checkTrue('invalid value rejected',False,True)
+except ValueError:
+  checkTrue('invalid value rejected',True,True)
+
+os.remove(fileName)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.csvUtils</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.csvUtils</classesTested>
+    <description>
+       This test performs Unit Tests for the csvUtils methods
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,125 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the fixedPointAcceleration methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import numpy as np
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import fixedPointAcceleration
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def iterate(function,method,relaxation=1.0,historyDepth=5,tol=1e-10,maxIterations=500):
+  """
+    Solves x = function(x) starting from zero.
+    @ In, function, callable, the fixed point map
+    @ In, method, str, the acceleration method
+    @ In, relaxation, float, optional, the relaxation factor
+    @ In, historyDepth, int, optional, the history depth
+    @ In, tol, float, optional, the tolerance on the residue
+    @ In, maxIterations, int, optional, maximum number of iterations
+    @ Out, x, np.array, the solution
+    @ Out, iterations, int, the number of evaluations of function
+  """
+  accelerator = fixedPointAcceleration.returnInstance(method,relaxation,historyDepth)
+  x = function(np.zeros(size))
+  g = function(x)
+  iterations = 2
+  while np.linalg.norm(g - x) > tol and iterations < maxIterations:
+    x = accelerator.update(x,g)
+    g = function(x)
+    iterations += 1
+  return g, iterations
+
+## linear contraction x = A x + b (spectral radius 0.95) and a non-linear perturbation of it
+size = 6
+A = np.random.RandomState(3).rand(size,size)
+A = 0.95*A/np.max(np.abs(np.linalg.eigvals(A)))
+b = np.ones(size)
+exact = np.linalg.solve(np.eye(size)-A,b)
+linear = lambda x: np.dot(A,x) + b
+nonLinear = lambda x: np.dot(A,x) + b + 0.05*np.sin(x)
+
+plainSolution, plainIterations = iterate(linear,'none')
+checkTrue('plain converges',np.allclose(plainSolution,exact,atol=1e-8),True)
+for method in ['aitken','anderson']:
+  solution, iterations = iterate(linear,method)
+  checkTrue(method+' converges',np.allclose(solution,exact,atol=1e-8),True)
+  checkTrue(method+' needs fewer iterations',iterations < plainIterations,True)
+  solution, iterations = iterate(nonLinear,method)
+  checkTrue(method+' converges (non-linear)',np.linalg.norm(nonLinear(solution)-solution) < 1e-9,True)
+# Anderson's mixing with a history covering the whole space solves linear problems in (about) size+1 iterations
+solution, iterations = iterate(linear,'anderson',historyDepth=size)
+checkTrue('anderson full history',iterations <= size+3,True)
+# under-relaxation of an oscillating iteration
+oscillating = lambda x: -0.9*x + 1.
+solution, plainIterations = iterate(oscillating,'none')
+solution, iterations = iterate(oscillating,'none',relaxation=0.5)
+checkTrue('relaxation converges',np.allclose(solution,1./1.9),True)
+checkTrue('relaxation needs fewer iterations',iterations < plainIterations,True)
+# plain iteration returns the image
+checkTrue('plain update',np.all(fixedPointAcceleration.returnInstance('none').update(np.zeros(2),np.array([1.,2.])) == np.array([1.,2.])),True)
+# more history than degrees of freedom: the ill-conditioned history is discarded
+scalarInVector = lambda x: np.array([np.cos(x[0]),np.cos(x[0]),2.*np.cos(x[0])])
+size = 3
+solution, iterations = iterate(scalarInVector,'anderson',historyDepth=5)
+checkTrue('anderson degenerate history',np.linalg.norm(scalarInVector(solution)-solution) < 1e-9 and iterations < 20,True)
+size = 6
+try:
+  fixedPointAcceleration.returnInstance('secant')
+  checkTrue('unknown method raises',False,True)
+except KeyError:
+  checkTrue('unknown method raises',True,True)
+checkTrue('known methods',sorted(fixedPointAcceleration.knownMethods()),['aitken','anderson','none'])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.fixedPointAcceleration</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.fixedPointAcceleration</classesTested>
+    <description>
+       This test performs Unit Tests for the fixedPointAcceleration methods (relaxation, Aitken and Anderson acceleration)
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
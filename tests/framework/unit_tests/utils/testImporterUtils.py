@@ -0,0 +1,106 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the importerUtils methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import importerUtils
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+## lazy modules are only imported when one of their attributes is used
+moduleName = 'xml.dom.minidom'
+checkTrue('module not imported yet',moduleName in sys.modules,False)
+lazy = importerUtils.importModuleLazy(moduleName)
+checkTrue('placeholder does not import',moduleName in sys.modules,False)
+class User(object):
+  """
+    Class holding a lazy module as class attribute (as the Code model does)
+  """
+  module = lazy
+checkTrue('class creation does not import',moduleName in sys.modules,False)
+document = User.module.parseString('<a/>')
+checkTrue('imported on first use',moduleName in sys.modules,True)
+checkTrue('attribute of the module',document.documentElement.tagName,'a')
+checkTrue('already imported module returned as is',importerUtils.importModuleLazy(moduleName) is sys.modules[moduleName],True)
+
+## classes imported from their path
+import collections
+checkTrue('importClass',importerUtils.importClass('collections.OrderedDict') is collections.OrderedDict,True)
+
+## lazy class dictionaries
+classes = importerUtils.LazyClassDict()
+classes['Ordered'] = 'collections.OrderedDict'
+classes['Fallback'] = ('aModuleThatDoesNotExist.OrderedDict','collections.NoSuchClass','collections.Counter')
+classes['Missing'] = 'aModuleThatDoesNotExist.Missing'
+checkTrue('keys',sorted(classes.keys()),['Fallback','Missing','Ordered'])
+checkTrue('registered, not loaded',classes.isLoaded('Ordered'),False)
+checkTrue('in',('Ordered' in classes) and ('Other' not in classes),True)
+checkTrue('retrieved',classes['Ordered'] is collections.OrderedDict,True)
+checkTrue('loaded after retrieval',classes.isLoaded('Ordered'),True)
+checkTrue('first importable candidate',classes['Fallback'] is collections.Counter,True)
+try:
+  classes['Missing']
+  checkTrue('missing module raises',False,True)
+except ImportError:
+  checkTrue('missing module raises',True,True)
+try:
+  classes['Other']
+  checkTrue('unknown key raises',False,True)
+except KeyError:
+  checkTrue('unknown key raises',True,True)
+del classes['Missing']
+checkTrue('values',set(classes.values()),set([collections.OrderedDict,collections.Counter]))
+checkTrue('items',dict(classes.items()),{'Ordered':collections.OrderedDict,'Fallback':collections.Counter})
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.importerUtils</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.importerUtils</classesTested>
+    <description>
+       This test performs Unit Tests for the importerUtils methods (lazy modules and lazy factory dictionaries)
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
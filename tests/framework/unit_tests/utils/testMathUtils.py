@@ -345,6 +345,59 @@ checkAnswer('InfDiff -inf   - inf'   ,mathUtils.diffWithInfinites(-n, n),-i)
 checkAnswer('InfDiff -inf   - finite',mathUtils.diffWithInfinites(-n, 0),-i)
 checkAnswer('InfDiff -inf   - (-inf)',mathUtils.diffWithInfinites(-n,-n), 0)
 
+# check gridSignChange and gridBand (limit surface extraction)
+## 1D: the last node has no following node, so its preceding node is not checked
+values = np.array([1.,1.,-1.,-1.,1.,1.,-1.])
+checkTrue('gridSignChange 1D positive',mathUtils.gridSignChange(values).tolist(),[False,True,False,False,True,True,False])
+checkTrue('gridSignChange 1D negative',mathUtils.gridSignChange(-values).tolist(),[False,False,True,True,False,False,False])
+## 2D
+values = np.ones((5,5))
+values[2,2] = -1.
+checkTrue('gridSignChange 2D',np.argwhere(mathUtils.gridSignChange(values)).tolist(),[[1,2],[2,1],[2,3],[3,2]])
+surface = np.zeros((6,6),dtype=bool)
+surface[3,3] = True
+checkTrue('gridBand thickness 1',np.any(mathUtils.gridBand(surface,1)),False)
+checkTrue('gridBand thickness 2',np.argwhere(mathUtils.gridBand(surface,2)).tolist(),[[2,3],[3,2],[3,4],[4,3]])
+## the band grows by one node at each step, but does not reach the boundary nodes
+checkTrue('gridBand thickness 3',np.argwhere(mathUtils.gridBand(surface,3)).tolist(),
+          [[1,3],[2,2],[2,3],[2,4],[3,1],[3,2],[3,4],[4,2],[4,3],[4,4]])
+## 3D, against a node by node search
+np.random.seed(5)
+values = np.random.uniform(-1.,1.,size=(4,1,6))
+expected = np.zeros(values.shape,dtype=bool)
+for node in np.ndindex(*values.shape):
+  for axis in range(values.ndim):
+    if values[node] > 0 and node[axis]+1 < values.shape[axis]:
+      for step in (1,-1):
+        neighbor = list(node)
+        neighbor[axis] += step
+        if neighbor[axis] >= 0 and values[tuple(neighbor)] <= 0:
+          expected[node] = True
+checkTrue('gridSignChange 3D',np.array_equal(mathUtils.gridSignChange(values),expected),True)
+
+# check updateNearestSamples (incremental limit surface), against a full nearest neighbor classification
+from scipy import spatial
+from sklearn.neighbors import KNeighborsClassifier
+np.random.seed(7)
+nodes = np.array(list(np.ndindex(15,12)),dtype=float)/np.array([14.,11.])
+samples = np.random.uniform(0.,1.,size=(40,2))
+labels = np.where(np.sum((samples-0.5)**2,axis=1) < 0.1,1,-1)
+nodeTree = spatial.cKDTree(nodes)
+distance, nearest = spatial.cKDTree(samples[:8]).query(nodes)
+start = 8
+for stop in [9,10,13,20,40]:
+  previous = nearest.copy()
+  changed = mathUtils.updateNearestSamples(nodeTree,nodes,samples[:stop],start,distance,nearest)
+  start = stop
+  fullDistance = np.sqrt(np.sum((nodes[:,np.newaxis,:]-samples[np.newaxis,:stop,:])**2,axis=2))
+  checkTrue('updateNearestSamples closest sample ('+str(stop)+' samples)',np.array_equal(nearest,np.argmin(fullDistance,axis=1)),True)
+  checkTrue('updateNearestSamples distance ('+str(stop)+' samples)',np.allclose(distance,np.min(fullDistance,axis=1)),True)
+  checkTrue('updateNearestSamples changed nodes ('+str(stop)+' samples)',changed.tolist(),np.nonzero(nearest != previous)[0].tolist())
+  classifier = KNeighborsClassifier(n_neighbors=1).fit(samples[:stop],labels[:stop])
+  checkTrue('updateNearestSamples classification ('+str(stop)+' samples)',np.array_equal(labels[nearest],classifier.predict(nodes)),True)
+## no new samples
+checkTrue('updateNearestSamples no new samples',len(mathUtils.updateNearestSamples(nodeTree,nodes,samples,40,distance,nearest)),0)
+
 print(results)
 
 sys.exit(results["fail"])
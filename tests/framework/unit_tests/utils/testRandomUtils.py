@@ -362,6 +362,31 @@ engine.seed(42)
 sampled = [engine.random() for _ in range(5)]
 checkArray('Independent RNG, seeded',sampled,correct)
 
+### quasi-random sequences
+## Halton: radical inverses in bases 2 and 3
+pts = randomUtils.haltonSequence(2,5)
+checkArray('Halton first dimension',pts[:,0],[0.,0.5,0.25,0.75,0.125])
+checkArray('Halton second dimension',pts[:,1],[0.,1./3.,2./3.,1./9.,4./9.])
+checkArray('Halton with offset',randomUtils.haltonSequence(2,3,start=2)[:,1],[2./3.,1./9.,4./9.])
+## Sobol: first points of the first three dimensions
+pts = randomUtils.sobolSequence(3,8)
+checkArray('Sobol first dimension',pts[:,0],[0.,0.5,0.75,0.25,0.375,0.875,0.625,0.125])
+checkArray('Sobol second dimension',pts[:,1],[0.,0.5,0.25,0.75,0.375,0.875,0.125,0.625])
+checkArray('Sobol third dimension',pts[:,2],[0.,0.5,0.25,0.75,0.625,0.125,0.875,0.375])
+checkTrue('Sobol with offset',np.array_equal(randomUtils.sobolSequence(3,5,start=3),pts[3:]),True)
+## Sobol: each dimension of the first 2^m points is stratified in 2^m intervals
+pts = randomUtils.sobolSequence(randomUtils.sobolMaxDimension,1024)
+checkTrue('Sobol stratification',all(np.array_equal(np.sort(np.floor(pts[:,d]*1024)),np.arange(1024)) for d in range(pts.shape[1])),True)
+## quasi-random integration error is much lower than the Monte Carlo one
+integrand = lambda x: np.prod(1.0 + (x - 0.5),axis=1)
+checkAnswer('Sobol integral',np.mean(integrand(randomUtils.sobolSequence(5,4096))),1.0,tol=1e-3)
+checkAnswer('Halton integral',np.mean(integrand(randomUtils.haltonSequence(5,4096))),1.0,tol=1e-2)
+try:
+  randomUtils.sobolSequence(randomUtils.sobolMaxDimension+1,10)
+  checkTrue('Sobol dimension limit',False,True)
+except IOError:
+  checkTrue('Sobol dimension limit',True,True)
+
 print(results)
 
 sys.exit(results["fail"])
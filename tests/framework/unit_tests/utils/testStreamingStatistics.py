@@ -0,0 +1,234 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the streamingStatistics accumulators
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import numpy as np
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+from utils import streamingStatistics
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment,value,expected,tol=1e-10):
+  """
+    Checks that the values are the same as the expected ones, within a relative tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float or np.ndarray, the value(s) to check
+    @ In, expected, float or np.ndarray, the expected value(s)
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, None
+  """
+  if np.allclose(value,expected,rtol=tol,atol=0.0):
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def exactMoments(x,w):
+  """
+    Computes the statistics with the (two-pass) formulas of the BasicStatistics PostProcessor
+    @ In, x, np.ndarray, the values, shaped (number of samples, number of variables)
+    @ In, w, np.ndarray, the weights (normalized, as in BasicStatistics), None for unweighted statistics
+    @ Out, stats, dict, the expected value, variance, skewness and kurtosis
+  """
+  if w is None:
+    n = x.shape[0]
+    mean = x.mean(axis=0)
+    corr = [streamingStatistics.unbiasedCorrection(order,n) for order in (2,3,4)]
+    v1 = float(n)
+    w = np.ones(n)
+  else:
+    mean = np.dot(w,x)
+    corr = [streamingStatistics.unbiasedCorrection(order,*(np.sum(w**p) for p in range(1,5))) for order in (2,3,4)]
+    v1 = w.sum()
+  dev = x - mean
+  p2 = np.dot(w,dev**2)/v1
+  variance = p2*corr[0]
+  skewness = np.dot(w,dev**3)/v1*corr[1]/variance**1.5
+  kurtosis = -3.0 + (np.dot(w,dev**4)/v1*corr[2][0] - p2**2*corr[2][1])/variance**2
+  covariance = np.dot(dev.T*w,dev)*corr[0]/v1
+  return {'expectedValue':mean,'variance':variance,'skewness':skewness,'kurtosis':kurtosis,'covariance':covariance}
+
+def zipPercentile(arrayIn,pbWeight,percent):
+  """
+    The weighted percentile, as computed by BasicStatistics._computeWeightedPercentile before it was vectorized
+    @ In, arrayIn, np.ndarray, the values
+    @ In, pbWeight, np.ndarray, the weights
+    @ In, percent, float, the percentile (between 0 and 1)
+    @ Out, result, float, the percentile
+  """
+  idxs = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+  sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
+  weightsCDF = np.cumsum(sortedWeightsAndPoints[:,0])
+  return sortedWeightsAndPoints[utils.find_le_index(weightsCDF,percent),1]
+
+np.random.seed(7)
+numSamples = 1000
+samples = np.random.randn(numSamples,3)*np.array([1.,10.,0.1]) + np.array([0.,5.,1e3])
+samples[:,2] += np.random.exponential(size=numSamples)
+weights = np.random.uniform(0.1,1.0,size=numSamples)
+weights /= weights.sum()
+chunks = [0,1,17,300,301,650,numSamples]
+
+for label,w in ('unweighted',None),('weighted',weights):
+  exact = exactMoments(samples,w)
+  ## one batch, many batches, and batches accumulated separately then merged (as parallel workers would)
+  oneShot = streamingStatistics.WeightedMoments()
+  oneShot.update(samples,w)
+  chunked = streamingStatistics.WeightedMoments()
+  merged = streamingStatistics.WeightedMoments()
+  chunkedCov = streamingStatistics.WeightedCovariance()
+  mergedCov = streamingStatistics.WeightedCovariance()
+  for start,end in zip(chunks[:-1],chunks[1:]):
+    chunkW = None if w is None else w[start:end]
+    chunked.update(samples[start:end],chunkW)
+    chunkedCov.update(samples[start:end],chunkW)
+    worker = streamingStatistics.WeightedMoments()
+    worker.update(samples[start:end],chunkW)
+    merged.merge(worker)
+    workerCov = streamingStatistics.WeightedCovariance()
+    workerCov.update(samples[start:end],chunkW)
+    mergedCov.merge(workerCov)
+  for name,acc,cov in ('one batch',oneShot,None),('chunked',chunked,chunkedCov),('merged',merged,mergedCov):
+    comment = label+' '+name+' '
+    checkTrue(comment+'count',acc.count,numSamples)
+    checkAnswer(comment+'expectedValue',acc.expectedValue(),exact['expectedValue'])
+    checkAnswer(comment+'variance',acc.variance(),exact['variance'])
+    checkAnswer(comment+'sigma',acc.sigma(),np.sqrt(exact['variance']))
+    checkAnswer(comment+'skewness',acc.skewness(),exact['skewness'],tol=1e-8)
+    checkAnswer(comment+'kurtosis',acc.kurtosis(),exact['kurtosis'],tol=1e-8)
+    checkAnswer(comment+'minimum',acc.minimum,samples.min(axis=0))
+    checkAnswer(comment+'maximum',acc.maximum,samples.max(axis=0))
+    if cov is not None:
+      checkAnswer(comment+'covariance',cov.covariance(),exact['covariance'])
+      checkAnswer(comment+'covariance diagonal',np.diag(cov.covariance()),acc.variance())
+      checkAnswer(comment+'pearson',cov.pearson(),np.corrcoef(samples.T) if w is None else
+                  exact['covariance']/np.sqrt(np.outer(exact['variance'],exact['variance'])))
+
+## covariance about other means (e.g. computed with other weights), as BasicStatistics does for the per-target weights
+means = samples.mean(axis=0)
+deviation = samples - means
+checkAnswer('covariance about other means',chunkedCov.covariance(means=means),
+            np.dot(deviation.T*weights,deviation)*streamingStatistics.unbiasedCorrection(2,*[np.sum(weights**p) for p in range(1,5)]))
+checkAnswer('covariance about own means',chunkedCov.covariance(means=chunkedCov.expectedValue()),chunkedCov.covariance())
+
+## constant entries have exactly zero central moments and co-moments, as for the full data (nan skewness and pearson)
+constant = np.column_stack((samples[:,0],np.full(numSamples,0.3)))
+acc = streamingStatistics.WeightedMoments()
+cov = streamingStatistics.WeightedCovariance()
+for start,end in zip(chunks[:-1],chunks[1:]):
+  acc.update(constant[start:end],weights[start:end])
+  cov.update(constant[start:end],weights[start:end])
+checkTrue('constant variance',acc.variance()[1],0.0)
+checkTrue('constant mean',acc.expectedValue()[1],0.3)
+checkTrue('constant covariance',np.all(cov.covariance(means=acc.expectedValue())[:,1] == 0.0),True)
+with np.errstate(divide='ignore',invalid='ignore'):
+  checkTrue('constant skewness',np.isnan(acc.skewness()[1]),True)
+
+## biased statistics and equivalent sample size
+acc = streamingStatistics.WeightedMoments()
+for start,end in zip(chunks[:-1],chunks[1:]):
+  acc.update(samples[start:end])
+checkAnswer('biased variance',acc.variance(biased=True),samples.var(axis=0))
+checkAnswer('biased skewness',acc.skewness(biased=True),((samples-samples.mean(0))**3).mean(0)/samples.std(0)**3,tol=1e-8)
+checkAnswer('biased kurtosis',acc.kurtosis(biased=True),((samples-samples.mean(0))**4).mean(0)/samples.var(0)**2-3.0,tol=1e-8)
+checkAnswer('equivalent samples',acc.equivalentSamples(),numSamples)
+
+## a time history (2D values) is accumulated entry by entry
+histories = np.random.randn(200,4,5)
+acc = streamingStatistics.WeightedMoments()
+acc.update(histories[:50])
+acc.update(histories[50:])
+checkAnswer('history variance',acc.variance(),histories.var(axis=0,ddof=1))
+
+## quantiles: exact (same as BasicStatistics) while not compressed
+sketch = streamingStatistics.QuantileSketch(compression=1000)
+for start,end in zip(chunks[:-1],chunks[1:]):
+  sketch.update(samples[start:end,2],weights[start:end])
+checkTrue('sketch exact',sketch.exact,True)
+for percent in (0.0,0.001,0.05,0.5,0.95,0.999):
+  checkTrue('weighted percentile '+str(percent),sketch.quantile(percent),zipPercentile(samples[:,2],weights,percent))
+sketch = streamingStatistics.QuantileSketch(compression=1000)
+sketch.update(samples[:500,2])
+sketch.update(samples[500:,2])
+for percent in (0.0,0.05,0.5,0.95,1.0):
+  checkTrue('unweighted percentile '+str(percent),sketch.quantile(percent),np.percentile(samples[:,2],100*percent,interpolation='lower'))
+checkTrue('unweighted median, even number of realizations',sketch.median(),np.median(samples[:,2]))
+sketch.update(samples[:1,2])
+checkTrue('unweighted median, odd number of realizations',sketch.median(),np.median(np.append(samples[:,2],samples[0,2])))
+sketch = streamingStatistics.QuantileSketch(compression=1000)
+sketch.update(samples[:,2],weights)
+checkTrue('weighted median',sketch.median(),zipPercentile(samples[:,2],weights,0.5))
+
+## quantiles: bounded rank error once compressed, bounded memory
+compression = 100
+big = np.random.lognormal(size=200000)
+bigWeights = np.random.uniform(0.5,2.0,size=200000)
+sketch = streamingStatistics.QuantileSketch(compression=compression)
+for start in range(0,len(big),10000):
+  worker = streamingStatistics.QuantileSketch(compression=compression)
+  worker.update(big[start:start+10000],bigWeights[start:start+10000])
+  sketch.merge(worker)
+checkTrue('sketch compressed',sketch.exact,False)
+checkTrue('sketch bounded memory',sketch.numCentroids() <= (sketch.bufferFactor+2)*compression,True)
+order = np.argsort(big)
+cdf = np.cumsum(bigWeights[order])/bigWeights.sum()
+for percent in (0.01,0.1,0.5,0.9,0.99):
+  value = sketch.quantile(percent)
+  rank = cdf[np.searchsorted(big[order],value)]
+  checkTrue('compressed percentile rank '+str(percent),abs(rank-percent) <= 1.0/compression,True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.streamingStatistics</name>
+    <author>alfoa</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.streamingStatistics</classesTested>
+    <description>
+       This test performs Unit Tests for the streamingStatistics accumulators (moments, covariance and
+       quantile sketch), checking batched and merged accumulations against the exact BasicStatistics formulas
+    </description>
+  </TestInfo>
+"""